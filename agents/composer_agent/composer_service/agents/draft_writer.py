@@ -8,6 +8,7 @@ from ..tools.constants import (
     CURRENT_DRAFT_KEY,
 )
 from ..llm.client import get_llm_client
+from ..llm.prompt_cache import assemble_prompt, build_llm_request, record_usage
 from google.genai.types import Content, Part, GenerateContentConfig
 from google.adk.models.llm_request import LlmRequest
 # 从 composer_service.utils 导入公用函数 (使用绝对路径)
@@ -16,14 +17,9 @@ from ..utils import wrap_event
 logger = logging.getLogger(__name__)
 
 # 提示词模板
-INITIAL_WRITING_PROMPT_TEMPLATE = """
-你是一位专业文案写手。现在，请你基于以下素材和要求，撰写一篇高质量的文章：
-
-## 素材
-{material}
-
-## 写作要求
-{requirements}
+# 评分标准和写作规范跨会话稳定，放在前面；写作要求和素材随会话变化，放在后面
+INITIAL_WRITING_PROMPT_STABLE_TEMPLATE = """
+你是一位专业文案写手。请基于后面给出的素材和要求，撰写一篇高质量的文章。
 
 ## 评分标准
 {scoring_criteria}
@@ -37,6 +33,17 @@ INITIAL_WRITING_PROMPT_TEMPLATE = """
 直接输出正文内容，无需添加标题或额外说明。
 """
 
+INITIAL_WRITING_PROMPT_VARIABLE_TEMPLATE = """
+## 写作要求
+{requirements}
+
+## 素材
+{material}
+"""
+
+# 完整写作 Prompt（稳定前缀 + 可变内容）
+INITIAL_WRITING_PROMPT_TEMPLATE = INITIAL_WRITING_PROMPT_STABLE_TEMPLATE + INITIAL_WRITING_PROMPT_VARIABLE_TEMPLATE
+
 class DraftWriter(LlmAgent):
     def __init__(self):
         super().__init__(
@@ -50,19 +57,21 @@ class DraftWriter(LlmAgent):
         material = state.get(INITIAL_MATERIAL_KEY, "")
         requirements = state.get(INITIAL_REQUIREMENTS_KEY, "")
         criteria = state.get(INITIAL_SCORING_CRITERIA_KEY, "")
-        prompt = INITIAL_WRITING_PROMPT_TEMPLATE.format(
+        prompt = assemble_prompt(
+            INITIAL_WRITING_PROMPT_STABLE_TEMPLATE,
+            INITIAL_WRITING_PROMPT_VARIABLE_TEMPLATE,
             material=material,
             requirements=requirements,
             scoring_criteria=criteria
         )
-        logger.info(f"[DraftWriter] 调用 LLM 生成初稿，Prompt 预览: {prompt[:60]}...")
+        logger.info(f"[DraftWriter] 调用 LLM 生成初稿，cache_key={prompt.cache_key}")
         try:
             # scorer.py 风格调用 LLM
             llm_client = get_llm_client()
-            config = GenerateContentConfig()
-            llm_request = LlmRequest(contents=[Content(parts=[Part(text=prompt)])], config=config)
+            llm_request = build_llm_request(prompt, GenerateContentConfig())
             draft = ""
             async for resp_chunk in llm_client.generate_content_async(llm_request):
+                record_usage(prompt, resp_chunk, self.name)
                 if (
                     resp_chunk
                     and resp_chunk.content
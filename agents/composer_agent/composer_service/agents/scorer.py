@@ -10,8 +10,13 @@ from ..tools.constants import (
     CURRENT_FEEDBACK_KEY,
 )
 # 从配置文件导入 Prompt 模板和 Agent 指令
-from .scorer_config import SCORING_PROMPT_TEMPLATE, SCORER_AGENT_INSTRUCTION
+from .scorer_config import (
+    SCORING_PROMPT_STABLE_TEMPLATE,
+    SCORING_PROMPT_DRAFT_TEMPLATE,
+    SCORER_AGENT_INSTRUCTION,
+)
 from ..llm.client import get_llm_client
+from ..llm.prompt_cache import assemble_prompt, build_llm_request, record_usage
 # 从 ..utils 导入公用函数 (使用绝对路径)
 from ..utils import wrap_event
 
@@ -36,21 +41,23 @@ class Scorer(LlmAgent):
         state = ctx.session.state
         draft = state.get(CURRENT_DRAFT_KEY, "")
         criteria = state.get(INITIAL_SCORING_CRITERIA_KEY, "")
-        # 使用导入的 Prompt 模板
-        prompt = SCORING_PROMPT_TEMPLATE.format(
+        # 评分标准作为稳定前缀，文稿作为可变后缀
+        prompt = assemble_prompt(
+            SCORING_PROMPT_STABLE_TEMPLATE,
+            SCORING_PROMPT_DRAFT_TEMPLATE,
             draft=draft,
             scoring_criteria=criteria
         )
-        logger.info(f"[Scorer] 调用 LLM 评分，Prompt 预览: {prompt[:60]}...")
+        logger.info(f"[Scorer] 调用 LLM 评分，cache_key={prompt.cache_key}，文稿长度: {len(draft)}")
         llm_client = get_llm_client()
         try:
-            # 构造 LlmRequest，并提供空的 GenerateContentConfig
-            config = GenerateContentConfig()
-            llm_request = LlmRequest(contents=[Content(parts=[Part(text=prompt)])], config=config) 
+            # 稳定前缀放入 system instruction，文稿放入 user 消息
+            llm_request = build_llm_request(prompt, GenerateContentConfig())
             
             # 使用 generate_content_async 并获取第一个响应
             resp_text = "" # 初始化为空字符串
             async for resp_chunk in llm_client.generate_content_async(llm_request):
+                record_usage(prompt, resp_chunk, self.name)
                 # 根据实际返回结构提取文本: resp_chunk.content.parts[0].text
                 if (
                     resp_chunk
@@ -1,19 +1,25 @@
 # 评分 Prompt 模板
-SCORING_PROMPT_TEMPLATE = """
-你是一位专业文稿评审，需要根据评分标准对以下文稿进行评估。
+# 稳定部分（角色、评分标准、输出格式）在前，变化的文稿在后，便于 provider 前缀缓存
+SCORING_PROMPT_STABLE_TEMPLATE = """
+你是一位专业文稿评审，需要根据评分标准对文稿进行评估。
 
 ## 评分标准
 {scoring_criteria}
 
-## 待评文稿
-{draft}
-
 请按照以下格式进行评估：
 
 分数: <0-100的整数>
 反馈: <简明扼要的评价和建议>
 """
 
+SCORING_PROMPT_DRAFT_TEMPLATE = """
+## 待评文稿
+{draft}
+"""
+
+# 完整评分 Prompt（稳定前缀 + 文稿）
+SCORING_PROMPT_TEMPLATE = SCORING_PROMPT_STABLE_TEMPLATE + SCORING_PROMPT_DRAFT_TEMPLATE
+
 # Scorer Agent 指令
 # 使用占位符 {draft_key} 和 {criteria_key}，Agent 初始化时会替换为实际的 state key
-SCORER_AGENT_INSTRUCTION = "请根据 state['{criteria_key}'] 中的评分标准对 state['{draft_key}'] 中的文稿进行评分并给出反馈。" 
\ No newline at end of file
+SCORER_AGENT_INSTRUCTION = "请根据 state['{criteria_key}'] 中的评分标准对 state['{draft_key}'] 中的文稿进行评分并给出反馈。"
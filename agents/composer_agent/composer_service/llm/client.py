@@ -6,6 +6,10 @@ from typing import Optional
 from google.adk.models.lite_llm import LiteLlm
 import logging
 
+# 让 LiteLlm 把 system 消息（Prompt 稳定前缀，见 prompt_cache.py）标记为可缓存；
+# 自动缓存或不支持缓存的 provider 会忽略该参数
+CACHE_CONTROL_INJECTION_POINTS = [{"location": "message", "role": "system"}]
+
 load_dotenv()
 
 def get_llm_client() -> 'LiteLlm':
@@ -13,6 +17,7 @@ def get_llm_client() -> 'LiteLlm':
     获取配置好的 LiteLlm 实例。
     环境变量：KINGDORA_BASE_URL, KINGDORA_API_KEY
     固定模型：openai/gpt-4.1-mini
+    system 消息（Prompt 稳定前缀）会被标记为可缓存，设置 COMPOSER_PROMPT_CACHE=false 可关闭。
     """
     kingdora_base_url = os.getenv("KINGDORA_BASE_URL")
     kingdora_api_key = os.getenv("KINGDORA_API_KEY")
@@ -21,10 +26,14 @@ def get_llm_client() -> 'LiteLlm':
         raise EnvironmentError("KINGDORA_BASE_URL 或 KINGDORA_API_KEY 环境变量未设置")
     if LiteLlm is None:
         raise ImportError("LiteLlm 包未安装，请先安装依赖")
+    extra_args = {}
+    if os.getenv("COMPOSER_PROMPT_CACHE", "true").lower() != "false":
+        extra_args["cache_control_injection_points"] = CACHE_CONTROL_INJECTION_POINTS
     return LiteLlm(
         model="openai/gpt-4.1-mini",
         api_base=kingdora_base_url,
         api_key=kingdora_api_key,
         stream=False,
-        temperature=0.2
+        temperature=0.2,
+        **extra_args
     ) 
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+Prompt 组装层：稳定内容前置，便于 provider 侧前缀缓存。
+
+评分标准、写作规范等跨迭代、跨会话不变的内容放在 system instruction 中作为稳定前缀，
+每次变化的文稿等内容放在其后的 user 消息里。稳定前缀的哈希作为 cache key，
+同一 key 的重复调用可以命中 provider 的前缀缓存（OpenAI 自动缓存，
+Anthropic 等通过 client.py 中配置的 cache_control_injection_points 标记）。
+"""
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from google.adk.models.llm_request import LlmRequest
+from google.genai.types import Content, Part, GenerateContentConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AssembledPrompt:
+    """按稳定前缀 + 可变后缀组装好的 Prompt。"""
+    stable_prefix: str
+    variable_suffix: str
+    cache_key: str
+
+    @property
+    def text(self) -> str:
+        """完整 Prompt 文本（稳定前缀在前）。"""
+        return self.stable_prefix + self.variable_suffix
+
+
+@dataclass(frozen=True)
+class PromptUsage:
+    """单次调用的 token 用量，区分缓存命中与未命中部分。"""
+    cache_key: str
+    prompt_tokens: int
+    cached_tokens: int
+
+    @property
+    def uncached_tokens(self) -> int:
+        return max(self.prompt_tokens - self.cached_tokens, 0)
+
+
+def compute_cache_key(stable_prefix: str) -> str:
+    """对稳定前缀计算 cache key。"""
+    return hashlib.sha256(stable_prefix.encode("utf-8")).hexdigest()[:16]
+
+
+def assemble_prompt(stable_template: str, variable_template: str, **values) -> AssembledPrompt:
+    """
+    用同一组变量分别填充稳定模板和可变模板。
+
+    Args:
+        stable_template: 只引用跨迭代不变变量的模板（如评分标准）
+        variable_template: 引用每次变化变量的模板（如文稿）
+        **values: 模板变量
+
+    Returns:
+        AssembledPrompt
+    """
+    stable_prefix = stable_template.format(**values)
+    variable_suffix = variable_template.format(**values)
+    return AssembledPrompt(
+        stable_prefix=stable_prefix,
+        variable_suffix=variable_suffix,
+        cache_key=compute_cache_key(stable_prefix),
+    )
+
+
+def build_llm_request(prompt: AssembledPrompt, config: Optional[GenerateContentConfig] = None) -> LlmRequest:
+    """稳定前缀作为 system instruction，可变部分作为 user 消息。"""
+    config = config or GenerateContentConfig()
+    config.system_instruction = prompt.stable_prefix
+    return LlmRequest(
+        contents=[Content(role="user", parts=[Part(text=prompt.variable_suffix)])],
+        config=config,
+    )
+
+
+class PromptCacheStats:
+    """进程内按 cache key 聚合的缓存命中统计。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def record(self, usage: PromptUsage) -> None:
+        with self._lock:
+            entry = self._stats.setdefault(
+                usage.cache_key, {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0}
+            )
+            entry["calls"] += 1
+            entry["prompt_tokens"] += usage.prompt_tokens
+            entry["cached_tokens"] += usage.cached_tokens
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                key: dict(entry, uncached_tokens=entry["prompt_tokens"] - entry["cached_tokens"])
+                for key, entry in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+prompt_cache_stats = PromptCacheStats()
+
+
+def record_usage(prompt: AssembledPrompt, llm_response, agent_name: str = "") -> Optional[PromptUsage]:
+    """
+    从 LlmResponse.usage_metadata 中提取缓存/未缓存 token 数并记录。
+
+    Returns:
+        PromptUsage，响应中没有用量信息时返回 None
+    """
+    usage_metadata = getattr(llm_response, "usage_metadata", None)
+    if usage_metadata is None:
+        return None
+    usage = PromptUsage(
+        cache_key=prompt.cache_key,
+        prompt_tokens=getattr(usage_metadata, "prompt_token_count", None) or 0,
+        cached_tokens=getattr(usage_metadata, "cached_content_token_count", None) or 0,
+    )
+    prompt_cache_stats.record(usage)
+    logger.info(
+        f"[{agent_name or 'PromptCache'}] cache_key={usage.cache_key} prompt_tokens={usage.prompt_tokens} "
+        f"cached={usage.cached_tokens} uncached={usage.uncached_tokens}"
+    )
+    return usage
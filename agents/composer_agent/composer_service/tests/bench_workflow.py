@@ -0,0 +1,233 @@
+"""
+composer 工作流吞吐基准：通过 ADK Runner + InMemorySessionService 驱动 root_agent，
+LLM 由 ReplayLlmClient 离线回放（可配置延迟分布），统计：
+
+- sessions/sec（整体吞吐）
+- 各子 Agent（DraftWriter、Scorer、各工具 Agent）的 p50/p99 耗时
+- 事件循环阻塞时间（监控协程的调度延迟之和）
+
+用法（在 agents 目录下运行）：
+    python -m composer_agent.composer_service.tests.bench_workflow --sessions 50 --concurrency 10 --latency lognormal:0.2:0.5
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import time
+import uuid
+from collections import defaultdict
+from contextlib import ExitStack
+from typing import Dict, List, Optional
+from unittest import mock
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai.types import Content, Part
+
+from ..agents import draft_writer as draft_writer_module
+from ..agents import scorer as scorer_module
+from ..tools.constants import (
+    INITIAL_MATERIAL_KEY,
+    INITIAL_REQUIREMENTS_KEY,
+    INITIAL_SCORING_CRITERIA_KEY,
+    SCORE_THRESHOLD_KEY,
+)
+from ..workflow.assembler import root_agent
+from .replay_llm import LatencyModel, ReplayLlmClient
+
+APP_NAME = "composer_bench"
+
+DEFAULT_INITIAL_STATE = {
+    INITIAL_MATERIAL_KEY: "人工智能在教育领域的应用案例与数据。",
+    INITIAL_REQUIREMENTS_KEY: "写一篇面向家长的科普文章，800字左右。",
+    INITIAL_SCORING_CRITERIA_KEY: "内容相关性、结构清晰度、语言通俗性。",
+    SCORE_THRESHOLD_KEY: 90,
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """最近秩法百分位数；空列表返回 0。"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(min(rank, len(ordered))) - 1]
+
+
+def _iter_agents(agent):
+    yield agent
+    for sub in getattr(agent, "sub_agents", None) or []:
+        yield from _iter_agents(sub)
+
+
+class AgentTimer:
+    """
+    临时给 Agent 树挂载 before/after 回调，按 (invocation_id, agent_name) 计时。
+    退出时恢复原回调。
+    """
+
+    def __init__(self, agent):
+        self.agents = list(_iter_agents(agent))
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self._started: Dict[tuple, float] = {}
+        self._saved = []
+
+    def _before(self, callback_context, **_):
+        self._started[(callback_context.invocation_id, callback_context.agent_name)] = time.perf_counter()
+        return None
+
+    def _after(self, callback_context, **_):
+        key = (callback_context.invocation_id, callback_context.agent_name)
+        started = self._started.pop(key, None)
+        if started is not None:
+            self.durations[callback_context.agent_name].append(time.perf_counter() - started)
+        return None
+
+    def __enter__(self):
+        for agent in self.agents:
+            self._saved.append((agent, agent.before_agent_callback, agent.after_agent_callback))
+            object.__setattr__(agent, "before_agent_callback", self._before)
+            object.__setattr__(agent, "after_agent_callback", self._after)
+        return self
+
+    def __exit__(self, *exc):
+        for agent, before, after in self._saved:
+            object.__setattr__(agent, "before_agent_callback", before)
+            object.__setattr__(agent, "after_agent_callback", after)
+        self._saved.clear()
+        return False
+
+
+class LoopLagMonitor:
+    """
+    周期性 sleep(interval)，把实际唤醒延迟超过 interval 的部分累计为事件循环阻塞时间。
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.blocked_seconds = 0.0
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - started - self.interval
+            if lag > 0:
+                self.blocked_seconds += lag
+                self.max_lag = max(self.max_lag, lag)
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+async def _maybe_await(value):
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _run_session(runner: Runner, session_service, initial_state: dict) -> float:
+    user_id = "bench_user"
+    session_id = uuid.uuid4().hex
+    await _maybe_await(session_service.create_session(
+        app_name=APP_NAME, user_id=user_id, session_id=session_id, state=dict(initial_state)
+    ))
+    message = Content(role="user", parts=[Part(text="开始写作")])
+    started = time.perf_counter()
+    async for _ in runner.run_async(user_id=user_id, session_id=session_id, new_message=message):
+        pass
+    return time.perf_counter() - started
+
+
+async def run_benchmark(
+    sessions: int = 10,
+    concurrency: int = 4,
+    latency: Optional[LatencyModel] = None,
+    llm_client=None,
+    initial_state: Optional[dict] = None,
+) -> dict:
+    """
+    并发运行 sessions 个完整工作流会话，返回基准报告字典。
+
+    Args:
+        sessions: 会话总数
+        concurrency: 最大并发会话数
+        latency: 回放 LLM 的延迟分布（llm_client 为空时生效）
+        llm_client: 自定义 LLM 客户端（如从录制文件加载的 ReplayLlmClient）
+        initial_state: 会话初始状态，默认使用 DEFAULT_INITIAL_STATE
+    Returns:
+        dict: sessions_per_sec、会话延迟分位数、各 Agent 分位数、事件循环阻塞时间等
+    """
+    client = llm_client or ReplayLlmClient(latency=latency)
+    session_service = InMemorySessionService()
+    runner = Runner(app_name=APP_NAME, agent=root_agent, session_service=session_service)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    state = initial_state or DEFAULT_INITIAL_STATE
+
+    async def bounded():
+        async with semaphore:
+            return await _run_session(runner, session_service, state)
+
+    monitor = LoopLagMonitor()
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(draft_writer_module, "get_llm_client", lambda: client))
+        stack.enter_context(mock.patch.object(scorer_module, "get_llm_client", lambda: client))
+        timer = stack.enter_context(AgentTimer(root_agent))
+        monitor.start()
+        started = time.perf_counter()
+        session_latencies = await asyncio.gather(*(bounded() for _ in range(sessions)))
+        elapsed = time.perf_counter() - started
+        await monitor.stop()
+
+    agents = {
+        name: {
+            "count": len(values),
+            "p50_ms": round(percentile(values, 50) * 1000, 3),
+            "p99_ms": round(percentile(values, 99) * 1000, 3),
+        }
+        for name, values in sorted(timer.durations.items())
+    }
+    return {
+        "sessions": sessions,
+        "concurrency": concurrency,
+        "elapsed_sec": round(elapsed, 4),
+        "sessions_per_sec": round(sessions / elapsed, 3) if elapsed > 0 else 0.0,
+        "session_p50_ms": round(percentile(session_latencies, 50) * 1000, 3),
+        "session_p99_ms": round(percentile(session_latencies, 99) * 1000, 3),
+        "agents": agents,
+        "llm_calls": getattr(client, "calls", None),
+        "event_loop_blocked_ms": round(monitor.blocked_seconds * 1000, 3),
+        "event_loop_max_lag_ms": round(monitor.max_lag * 1000, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="composer 工作流吞吐基准")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--latency", default="fixed:0.05", help="如 fixed:0.2 / uniform:0.1:0.5 / lognormal:0.2:0.5")
+    parser.add_argument("--recordings", default=None, help="录制的 LLM 响应 JSON 文件，缺省使用默认响应")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    latency = LatencyModel.parse(args.latency, seed=args.seed)
+    if args.recordings:
+        client = ReplayLlmClient.from_file(args.recordings, latency=latency)
+    else:
+        client = ReplayLlmClient(latency=latency)
+    report = asyncio.run(run_benchmark(args.sessions, args.concurrency, llm_client=client))
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
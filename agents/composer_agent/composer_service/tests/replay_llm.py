@@ -0,0 +1,138 @@
+"""
+可录制/回放的假 LLM 客户端，用于离线、确定性地驱动 composer 工作流。
+
+- 回放：按请求内容的哈希查找录制好的响应；未录制的请求使用 default_response_fn 生成。
+- 录制：包装真实 LLM 客户端，把每个请求的响应写入 JSON 文件，之后可离线回放。
+- 延迟：每次调用按可配置的分布 await asyncio.sleep，模拟网络与推理耗时。
+"""
+import asyncio
+import hashlib
+import json
+import os
+import random
+from types import SimpleNamespace
+from typing import Callable, Dict, Optional
+
+
+def request_key(llm_request) -> str:
+    """根据 system instruction 和所有消息文本计算请求的确定性 key。"""
+    parts = []
+    config = getattr(llm_request, "config", None)
+    system_instruction = getattr(config, "system_instruction", None)
+    if system_instruction:
+        parts.append(str(system_instruction))
+    for content in getattr(llm_request, "contents", None) or []:
+        for part in getattr(content, "parts", None) or []:
+            parts.append(getattr(part, "text", "") or "")
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()[:24]
+
+
+class LatencyModel:
+    """
+    LLM 调用延迟分布（单位：秒）。
+    kind: "fixed" | "uniform" | "lognormal"
+    """
+
+    def __init__(self, kind: str = "fixed", mean: float = 0.0, spread: float = 0.0, seed: Optional[int] = 0):
+        if kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"不支持的延迟分布: {kind}")
+        self.kind = kind
+        self.mean = mean
+        self.spread = spread
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def parse(cls, spec: str, seed: Optional[int] = 0) -> "LatencyModel":
+        """
+        解析命令行延迟描述，例如 "fixed:0.2"、"uniform:0.1:0.5"、"lognormal:0.3:0.5"。
+        uniform 的两个参数为上下界，lognormal 为中位数和 sigma。
+        """
+        kind, *args = spec.split(":")
+        values = [float(a) for a in args] + [0.0, 0.0]
+        if kind == "uniform":
+            low, high = values[0], values[1]
+            return cls("uniform", mean=(low + high) / 2, spread=(high - low) / 2, seed=seed)
+        return cls(kind, mean=values[0], spread=values[1], seed=seed)
+
+    def sample(self) -> float:
+        if self.kind == "fixed":
+            return self.mean
+        if self.kind == "uniform":
+            return self._rng.uniform(self.mean - self.spread, self.mean + self.spread)
+        # lognormal：mean 为中位数，spread 为 sigma
+        if self.mean <= 0:
+            return 0.0
+        return self.mean * self._rng.lognormvariate(0.0, self.spread)
+
+
+def _response(text: str):
+    return SimpleNamespace(content=SimpleNamespace(parts=[SimpleNamespace(text=text)]), usage_metadata=None)
+
+
+def default_response(llm_request) -> str:
+    """未录制请求的默认响应：评分请求返回固定格式的分数，其余返回一段稿件。"""
+    system_instruction = getattr(getattr(llm_request, "config", None), "system_instruction", "") or ""
+    if "评审" in system_instruction:
+        return "分数: 85\n反馈: 结构清晰，可以补充更多案例。"
+    return "这是一篇由回放 LLM 生成的稿件。" * 20
+
+
+class ReplayLlmClient:
+    """
+    与 LiteLlm 接口兼容的假客户端（只实现 generate_content_async）。
+    """
+
+    def __init__(
+        self,
+        recordings: Optional[Dict[str, str]] = None,
+        latency: Optional[LatencyModel] = None,
+        default_response_fn: Callable = default_response,
+    ):
+        self.recordings = dict(recordings or {})
+        self.latency = latency or LatencyModel()
+        self.default_response_fn = default_response_fn
+        self.calls = 0
+        self.misses = 0
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "ReplayLlmClient":
+        with open(path, encoding="utf-8") as f:
+            return cls(recordings=json.load(f), **kwargs)
+
+    async def generate_content_async(self, llm_request, stream: bool = False):
+        self.calls += 1
+        delay = self.latency.sample()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        key = request_key(llm_request)
+        text = self.recordings.get(key)
+        if text is None:
+            self.misses += 1
+            text = self.default_response_fn(llm_request)
+        yield _response(text)
+
+
+class RecordingLlmClient:
+    """
+    包装真实 LLM 客户端，录制每个请求的首个文本响应，save() 写入 JSON 文件。
+    """
+
+    def __init__(self, inner, path: str):
+        self.inner = inner
+        self.path = path
+        self.recordings: Dict[str, str] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.recordings.update(json.load(f))
+
+    async def generate_content_async(self, llm_request, stream: bool = False):
+        key = request_key(llm_request)
+        async for chunk in self.inner.generate_content_async(llm_request):
+            content = getattr(chunk, "content", None)
+            if content and content.parts and content.parts[0].text and key not in self.recordings:
+                self.recordings[key] = content.parts[0].text
+            yield chunk
+
+    def save(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.recordings, f, ensure_ascii=False, indent=2)
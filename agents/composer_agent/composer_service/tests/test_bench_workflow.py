@@ -0,0 +1,58 @@
+import pytest
+from types import SimpleNamespace
+
+from .bench_workflow import percentile, run_benchmark
+from .replay_llm import LatencyModel, RecordingLlmClient, ReplayLlmClient, request_key
+
+
+def _request(system, text):
+    return SimpleNamespace(
+        config=SimpleNamespace(system_instruction=system),
+        contents=[SimpleNamespace(parts=[SimpleNamespace(text=text)])],
+    )
+
+
+async def _collect(client, request):
+    return [c.content.parts[0].text async for c in client.generate_content_async(request)]
+
+
+def test_latency_model_parse():
+    assert LatencyModel.parse("fixed:0.2").sample() == 0.2
+    uniform = LatencyModel.parse("uniform:0.1:0.3")
+    assert all(0.1 <= uniform.sample() <= 0.3 for _ in range(50))
+    assert LatencyModel.parse("lognormal:0:0.5").sample() == 0.0
+    with pytest.raises(ValueError):
+        LatencyModel("pareto")
+
+
+def test_percentile():
+    assert percentile([], 50) == 0.0
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay(tmp_path):
+    path = str(tmp_path / "rec.json")
+    request = _request("系统", "写一篇文章")
+    recorder = RecordingLlmClient(ReplayLlmClient(default_response_fn=lambda r: "录制内容"), path)
+    assert await _collect(recorder, request) == ["录制内容"]
+    recorder.save()
+
+    replay = ReplayLlmClient.from_file(path, default_response_fn=lambda r: "未命中")
+    assert await _collect(replay, request) == ["录制内容"]
+    assert await _collect(replay, _request("系统", "其他")) == ["未命中"]
+    assert replay.calls == 2 and replay.misses == 1
+    assert request_key(request) != request_key(_request("系统2", "写一篇文章"))
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark_report():
+    report = await run_benchmark(sessions=2, concurrency=2, latency=LatencyModel("fixed", 0.0))
+    assert report["sessions"] == 2
+    assert report["sessions_per_sec"] > 0
+    assert report["agents"]["DraftWriter"]["count"] >= 2
+    assert report["agents"]["Scorer"]["count"] >= 2
+    assert "check_progress" in report["agents"]
+    assert report["event_loop_blocked_ms"] >= 0
@@ -1,10 +1,19 @@
 import pytest
 from ..tools.check_progress import check_progress
+from ..tools.convergence import convergence_stats, get_convergence_stats
 from ..tools.constants import (
+    CURRENT_DRAFT_KEY,
     CURRENT_SCORE_KEY,
+    CURRENT_FEEDBACK_KEY,
     SCORE_THRESHOLD_KEY,
     ITERATION_COUNT_KEY,
+    SCORE_HISTORY_KEY,
+    BEST_SCORE_KEY,
+    CONVERGENCE_PATIENCE_KEY,
+    CONVERGENCE_MIN_DELTA_KEY,
+    DEFAULT_MAX_ITERATIONS,
 )
+from ..workflow import loop_agent
 
 class DummyContext:
     def __init__(self, state=None):
@@ -27,4 +36,97 @@ def test_check_progress(state, expected):
     assert result["status"] == expected["status"]
     assert result["actions"]["escalate"] == expected["actions"]["escalate"]
     if result["status"] == "done":
-        assert result["reason"] == expected["reason"] 
\ No newline at end of file
+        assert result["reason"] == expected["reason"] 
+
+def _run_rounds(state, rounds):
+    """按轮次写入 (稿件, 分数) 并调用 check_progress，返回最后一次结果"""
+    ctx = DummyContext(state)
+    result = None
+    for iteration, (draft, score) in enumerate(rounds, start=1):
+        ctx.state[ITERATION_COUNT_KEY] = iteration
+        ctx.state[CURRENT_DRAFT_KEY] = draft
+        ctx.state[CURRENT_SCORE_KEY] = score
+        ctx.state[CURRENT_FEEDBACK_KEY] = f"反馈-{draft}"
+        result = check_progress(ctx)
+        if result["status"] == "done":
+            break
+    return ctx, result
+
+
+def test_check_progress_stops_on_plateau():
+    convergence_stats.reset()
+    ctx, result = _run_rounds(
+        {SCORE_THRESHOLD_KEY: 90, "max_iterations": 6, CONVERGENCE_PATIENCE_KEY: 2},
+        [("v1", 70), ("v2", 72), ("v3", 72), ("v4", 71)],
+    )
+    assert result["status"] == "done"
+    assert result["reason"] == "plateau"
+    assert result["iterations_saved"] == 2
+    assert ctx.state[SCORE_HISTORY_KEY] == [[1, 70], [2, 72], [3, 72], [4, 71]]
+    assert get_convergence_stats()["iterations_saved"] == 2
+
+
+def test_check_progress_rolls_back_on_regression():
+    ctx, result = _run_rounds(
+        {SCORE_THRESHOLD_KEY: 90, "max_iterations": 6, CONVERGENCE_PATIENCE_KEY: 2,
+         CONVERGENCE_MIN_DELTA_KEY: 2},
+        [("v1", 80), ("v2", 70), ("v3", 65)],
+    )
+    assert result["reason"] == "regression"
+    assert result["rolled_back"] is True
+    assert ctx.state[CURRENT_DRAFT_KEY] == "v1"
+    assert ctx.state[CURRENT_SCORE_KEY] == 80
+    assert ctx.state[CURRENT_FEEDBACK_KEY] == "反馈-v1"
+
+
+def test_check_progress_keeps_going_while_improving():
+    ctx, result = _run_rounds(
+        {SCORE_THRESHOLD_KEY: 90, "max_iterations": 6},
+        [("v1", 60), ("v2", 70), ("v3", 80)],
+    )
+    assert result["status"] == "continue"
+    assert ctx.state[BEST_SCORE_KEY] == 80
+
+
+def test_default_cap_matches_loop_agent_and_rolls_back():
+    assert loop_agent.max_iterations == DEFAULT_MAX_ITERATIONS
+    convergence_stats.reset()
+    ctx, result = _run_rounds(
+        {SCORE_THRESHOLD_KEY: 90, CONVERGENCE_PATIENCE_KEY: 5},
+        [("v1", 80), ("v2", 70), ("v3", 75)],
+    )
+    assert result["reason"] == "max_iterations"
+    assert result["rolled_back"] is True
+    assert ctx.state[CURRENT_DRAFT_KEY] == "v1"
+    assert "iterations_saved" not in result
+
+
+def test_early_stop_counts_iterations_saved_against_default_cap():
+    convergence_stats.reset()
+    _, result = _run_rounds(
+        {SCORE_THRESHOLD_KEY: 90, CONVERGENCE_PATIENCE_KEY: 1},
+        [("v1", 70), ("v2", 70)],
+    )
+    assert result["reason"] == "plateau"
+    assert result["iterations_saved"] == DEFAULT_MAX_ITERATIONS - 2
+
+
+def test_repeated_call_in_same_iteration_is_idempotent():
+    ctx, result = _run_rounds(
+        {SCORE_THRESHOLD_KEY: 90, CONVERGENCE_PATIENCE_KEY: 1}, [("v1", 60)]
+    )
+    result = check_progress(ctx)
+    assert result["status"] == "continue"
+    assert ctx.state[SCORE_HISTORY_KEY] == [[1, 60]]
+
+
+def test_shipped_defaults_stop_on_plateau_before_cap():
+    convergence_stats.reset()
+    ctx, result = _run_rounds(
+        {SCORE_THRESHOLD_KEY: 90},
+        [("v1", 70), ("v2", 69), ("v3", 68)],
+    )
+    assert result["reason"] == "plateau"
+    assert result["iterations_saved"] > 0
+    assert ctx.state[ITERATION_COUNT_KEY] < DEFAULT_MAX_ITERATIONS
+    assert ctx.state[CURRENT_DRAFT_KEY] == "v1"
@@ -51,7 +51,8 @@ async def test_draft_writer_llm_prompt_and_state(monkeypatch):
         # 检查 prompt 构建
         assert "素材内容ABCDEFGH" in mock_llm.captured_request.contents[0].parts[0].text
         assert "要求内容12345678" in mock_llm.captured_request.contents[0].parts[0].text
-        assert "评分标准XYZ" in mock_llm.captured_request.contents[0].parts[0].text
+        # 评分标准属于稳定前缀，放在 system instruction 中
+        assert "评分标准XYZ" in mock_llm.captured_request.config.system_instruction
         # 检查状态写入
         assert session.state[CURRENT_DRAFT_KEY] == "LLM生成的稿件内容"
         # 检查事件内容
@@ -54,4 +54,18 @@ def test_get_llm_client_missing_litellm(monkeypatch):
     with mock.patch.object(client, "LiteLlm", None):
         # 断言抛出 ImportError
         with pytest.raises(ImportError):
-            client.get_llm_client() 
\ No newline at end of file
+            client.get_llm_client() 
+# 测试：默认开启 system 消息前缀缓存标记，可通过环境变量关闭
+
+def test_get_llm_client_prompt_cache_toggle(monkeypatch):
+    class DummyLiteLlm:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+    monkeypatch.setenv("KINGDORA_BASE_URL", "http://test-url")
+    monkeypatch.setenv("KINGDORA_API_KEY", "test-key")
+    with mock.patch.object(client, "LiteLlm", DummyLiteLlm):
+        llm = client.get_llm_client()
+        assert llm.kwargs["cache_control_injection_points"] == client.CACHE_CONTROL_INJECTION_POINTS
+        monkeypatch.setenv("COMPOSER_PROMPT_CACHE", "false")
+        llm = client.get_llm_client()
+        assert "cache_control_injection_points" not in llm.kwargs
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from ..agents.scorer_config import (
+    SCORING_PROMPT_STABLE_TEMPLATE,
+    SCORING_PROMPT_DRAFT_TEMPLATE,
+    SCORING_PROMPT_TEMPLATE,
+)
+from ..llm.prompt_cache import (
+    assemble_prompt,
+    build_llm_request,
+    record_usage,
+    prompt_cache_stats,
+)
+
+
+def test_stable_prefix_and_cache_key():
+    """同一评分标准、不同文稿时，cache key 不变且文稿只出现在可变后缀中"""
+    first = assemble_prompt(SCORING_PROMPT_STABLE_TEMPLATE, SCORING_PROMPT_DRAFT_TEMPLATE,
+                            draft="第一版", scoring_criteria="标准A")
+    second = assemble_prompt(SCORING_PROMPT_STABLE_TEMPLATE, SCORING_PROMPT_DRAFT_TEMPLATE,
+                             draft="第二版", scoring_criteria="标准A")
+    other = assemble_prompt(SCORING_PROMPT_STABLE_TEMPLATE, SCORING_PROMPT_DRAFT_TEMPLATE,
+                            draft="第一版", scoring_criteria="标准B")
+    assert first.cache_key == second.cache_key
+    assert first.cache_key != other.cache_key
+    assert "第一版" not in first.stable_prefix
+    assert first.text == SCORING_PROMPT_TEMPLATE.format(draft="第一版", scoring_criteria="标准A")
+
+
+def test_build_llm_request_puts_prefix_in_system_instruction():
+    prompt = assemble_prompt(SCORING_PROMPT_STABLE_TEMPLATE, SCORING_PROMPT_DRAFT_TEMPLATE,
+                             draft="文稿", scoring_criteria="标准")
+    request = build_llm_request(prompt)
+    assert request.config.system_instruction == prompt.stable_prefix
+    assert request.contents[0].parts[0].text == prompt.variable_suffix
+
+
+def test_record_usage_accumulates_cached_tokens():
+    prompt_cache_stats.reset()
+    prompt = assemble_prompt("前缀{a}", "后缀{b}", a="1", b="2")
+    response = SimpleNamespace(usage_metadata=SimpleNamespace(
+        prompt_token_count=1200, cached_content_token_count=1024))
+    usage = record_usage(prompt, response)
+    assert usage.uncached_tokens == 176
+    record_usage(prompt, response)
+    # 没有用量信息的响应不计入统计
+    assert record_usage(prompt, SimpleNamespace()) is None
+    stats = prompt_cache_stats.snapshot()[prompt.cache_key]
+    assert stats == {"calls": 2, "prompt_tokens": 2400, "cached_tokens": 2048, "uncached_tokens": 352}
@@ -1,6 +1,6 @@
 import pytest
 from ..tools.save_score import save_score
-from ..tools.constants import CURRENT_SCORE_KEY, CURRENT_FEEDBACK_KEY
+from ..tools.constants import CURRENT_SCORE_KEY, CURRENT_FEEDBACK_KEY, ITERATION_COUNT_KEY
 
 class DummyContext:
     def __init__(self, state=None):
@@ -37,4 +37,10 @@ def test_save_score_overwrite():
     result = save_score(ctx)
     assert getattr(result, "status", result["status"]) == "success"
     assert ctx.state[CURRENT_SCORE_KEY] == 99
-    assert ctx.state[CURRENT_FEEDBACK_KEY] == "新反馈" 
\ No newline at end of file
+    assert ctx.state[CURRENT_FEEDBACK_KEY] == "新反馈" 
+
+def test_save_score_counts_iterations():
+    ctx = DummyContext({CURRENT_SCORE_KEY: 70, CURRENT_FEEDBACK_KEY: "反馈"})
+    save_score(ctx)
+    save_score(ctx)
+    assert ctx.state[ITERATION_COUNT_KEY] == 2
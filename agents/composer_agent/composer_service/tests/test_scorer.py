@@ -47,7 +47,11 @@ async def test_scorer_llm_prompt_and_state(monkeypatch):
         )
         # 从捕获的 request 中获取 prompt
         assert mock_llm.captured_request is not None, "LLM Client 未被调用"
-        captured_prompt_text = mock_llm.captured_request.contents[0].parts[0].text
+        # 稳定前缀在 system instruction 中，文稿在 user 消息中
+        captured_prompt_text = (
+            mock_llm.captured_request.config.system_instruction
+            + mock_llm.captured_request.contents[0].parts[0].text
+        )
         assert captured_prompt_text == expected_prompt
 
         # 检查状态写入
@@ -104,7 +108,11 @@ async def test_scorer_missing_inputs(monkeypatch):
             scoring_criteria="" # 缺失输入时 criteria 为空
         )
         assert mock_llm.captured_request is not None, "LLM Client 未被调用"
-        captured_prompt_text = mock_llm.captured_request.contents[0].parts[0].text
+        # 稳定前缀在 system instruction 中，文稿在 user 消息中
+        captured_prompt_text = (
+            mock_llm.captured_request.config.system_instruction
+            + mock_llm.captured_request.contents[0].parts[0].text
+        )
         assert captured_prompt_text == expected_prompt
 
         # 检查状态写入
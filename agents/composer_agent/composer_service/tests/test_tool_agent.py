@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import time
+import pytest
+from types import SimpleNamespace
+
+from ..workflow import make_tool_agent, tool_timing_stats, root_agent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.sessions import InMemorySessionService
+
+
+async def _run(agent, ctx):
+    return [event async for event in agent._run_async_impl(ctx)]
+
+
+@pytest.mark.asyncio
+async def test_sync_tool_runs_in_executor_and_escalates():
+    seen = {}
+
+    def tool(tool_context):
+        seen["thread"] = threading.current_thread().name
+        tool_context.state["touched"] = True
+        return {"status": "done", "actions": {"escalate": True}}
+
+    agent = make_tool_agent("sync_escalate_tool", tool)
+    ctx = SimpleNamespace(invocation_id="inv1", state={})
+    events = await _run(agent, ctx)
+    assert seen["thread"].startswith("composer-tool")
+    assert ctx.state["touched"] is True
+    assert len(events) == 1
+    assert events[0].author == "sync_escalate_tool"
+    assert events[0].actions.escalate is True
+
+
+@pytest.mark.asyncio
+async def test_async_tool_and_no_escalate():
+    async def tool(tool_context):
+        await asyncio.sleep(0)
+        return {"status": "continue", "actions": {"escalate": False}}
+
+    events = await _run(make_tool_agent("async_tool", tool), SimpleNamespace(invocation_id="inv2", state={}))
+    assert not events[0].actions.escalate
+
+
+@pytest.mark.asyncio
+async def test_sync_tools_do_not_block_event_loop():
+    def slow_tool(tool_context):
+        time.sleep(0.2)
+        return {"status": "ok"}
+
+    agent = make_tool_agent("slow_tool", slow_tool)
+    started = time.perf_counter()
+    await asyncio.gather(*(_run(agent, SimpleNamespace(invocation_id=f"p{i}", state={})) for i in range(4)))
+    assert time.perf_counter() - started < 0.6
+
+
+@pytest.mark.asyncio
+async def test_tool_timing_and_errors_recorded():
+    tool_timing_stats.reset()
+
+    def failing(tool_context):
+        raise ValueError("boom")
+
+    await _run(make_tool_agent("timed_tool", lambda tc: {"status": "ok"}), SimpleNamespace(invocation_id="t", state={}))
+    with pytest.raises(ValueError):
+        await _run(make_tool_agent("failing_tool", failing), SimpleNamespace(invocation_id="f", state={}))
+    stats = tool_timing_stats.snapshot()
+    assert stats["timed_tool"]["calls"] == 1 and stats["timed_tool"]["errors"] == 0
+    assert stats["failing_tool"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_state_delta_in_event_actions():
+    def tool(tool_context):
+        tool_context.state["from_tool"] = 1
+        return {"status": "ok"}
+
+    session_service = InMemorySessionService()
+    session = session_service.create_session(app_name="composer-service", user_id="test_user")
+    if asyncio.iscoroutine(session):
+        session = await session
+    ctx = InvocationContext(
+        session_service=session_service, invocation_id="delta", agent=root_agent, session=session
+    )
+    events = await _run(make_tool_agent("delta_tool", tool), ctx)
+    assert events[0].actions.state_delta.get("from_tool") == 1
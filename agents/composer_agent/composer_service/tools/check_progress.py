@@ -4,15 +4,21 @@ from .constants import (
     CURRENT_SCORE_KEY,
     SCORE_THRESHOLD_KEY,
     ITERATION_COUNT_KEY,
+    MAX_ITERATIONS_KEY,
+    DEFAULT_MAX_ITERATIONS,
 )
+from .convergence import ConvergenceController, convergence_stats
 
 logger = logging.getLogger(__name__)
 
 def check_progress(tool_context) -> dict:
     """
-    检查是否达到终止条件：分数达标或达到最大迭代次数。
-    依赖state字段：CURRENT_SCORE_KEY, SCORE_THRESHOLD_KEY, ITERATION_COUNT_KEY
+    检查是否达到终止条件：分数达标、达到最大迭代次数，或分数轨迹停滞/回退。
+    依赖state字段：CURRENT_SCORE_KEY, SCORE_THRESHOLD_KEY, ITERATION_COUNT_KEY（由 save_score 每轮加一）
+    最大轮数取 state[MAX_ITERATIONS_KEY]，缺省为与 LoopAgent 共用的 DEFAULT_MAX_ITERATIONS。
     评分采用百分制整数，默认及格线为60分。
+    每轮分数以 [轮次, 分数] 记录在 SCORE_HISTORY_KEY 中；连续 convergence_patience 轮没有提升
+    convergence_min_delta 分时提前终止，并回滚到目前为止分数最高的稿件。
     返回actions.escalate信号，供LoopAgent终止。
     Args:
         tool_context: ADK工具上下文，需有.state属性
@@ -25,7 +31,7 @@ def check_progress(tool_context) -> dict:
         score = sm.get(CURRENT_SCORE_KEY)
         threshold = sm.get(SCORE_THRESHOLD_KEY, 60)  # 默认60分及格
         iteration = sm.get(ITERATION_COUNT_KEY, 0)
-        max_iterations = tool_context.state.get("max_iterations", 5)  # 支持动态最大轮数
+        max_iterations = tool_context.state.get(MAX_ITERATIONS_KEY, DEFAULT_MAX_ITERATIONS)
 
         logger.debug(f"[check_progress] 当前状态: score={score}, threshold={threshold}, iteration={iteration}, max_iterations={max_iterations}")
 
@@ -34,35 +40,43 @@ def check_progress(tool_context) -> dict:
             logger.warning(f"[check_progress] 分数阈值类型无效 ({type(threshold)})，使用默认值 60。")
             threshold = 60
         if not isinstance(max_iterations, int) or max_iterations <= 0:
-            logger.warning(f"[check_progress] 最大迭代次数无效 ({type(max_iterations)})，使用默认值 5。")
-            max_iterations = 5
+            logger.warning(f"[check_progress] 最大迭代次数无效 ({type(max_iterations)})，使用默认值 {DEFAULT_MAX_ITERATIONS}。")
+            max_iterations = DEFAULT_MAX_ITERATIONS
+        if not isinstance(iteration, int) or isinstance(iteration, bool) or iteration < 0:
+            logger.warning(f"[check_progress] 迭代轮次无效 ({iteration})，按 0 处理。")
+            iteration = 0
+
+        controller = ConvergenceController.from_state(tool_context.state)
+        decision = None
 
         # 终止条件1：分数达标
         score_passed = False
-        if isinstance(score, (int, float)):
+        if isinstance(score, (int, float)) and not isinstance(score, bool):
+            decision = controller.observe(tool_context, iteration, score)
             if score >= threshold:
                 score_passed = True
         else:
             logger.warning(f"[check_progress] 当前分数类型无效: {score} ({type(score)})，无法判断是否达标。")
-        
+
         if score_passed:
-            result = {
-                "status": "done",
-                "reason": "score_passed",
-                "actions": {"escalate": True}
-            }
+            result = _finish(controller, tool_context, "score_passed", iteration, max_iterations)
             logger.info(f"[check_progress] 达到分数阈值: {score} >= {threshold}")
             return result
 
         # 终止条件2：达到最大轮数
         if iteration >= max_iterations:
-            result = {
-                "status": "done",
-                "reason": "max_iterations",
-                "actions": {"escalate": True}
-            }
+            result = _finish(controller, tool_context, "max_iterations", iteration, max_iterations)
             logger.info(f"[check_progress] 达到最大轮数: {iteration} >= {max_iterations}")
             return result
+
+        # 终止条件3：分数停滞或回退，提前终止
+        if decision is not None and decision.stop:
+            result = _finish(controller, tool_context, decision.reason, iteration, max_iterations)
+            logger.info(
+                f"[check_progress] 分数{'回退' if decision.reason == 'regression' else '停滞'}，提前终止: "
+                f"连续 {decision.stale_rounds} 轮无提升，最佳分数 {decision.best_score}"
+            )
+            return result
         # 否则继续
         result = {
             "status": "continue",
@@ -77,4 +91,23 @@ def check_progress(tool_context) -> dict:
             "status": "continue", 
             "actions": {"escalate": False}, 
             "error": f"检查进度时发生异常: {e}"
-        } 
\ No newline at end of file
+        } 
+
+
+def _finish(controller, tool_context, reason, iteration, max_iterations) -> dict:
+    """
+    构造终止结果：必要时回滚到最佳稿件，并记录节省的迭代轮数。
+    """
+    rolled_back = controller.rollback_to_best(tool_context)
+    iterations_saved = max(max_iterations - iteration, 0) if reason in ("plateau", "regression") else 0
+    convergence_stats.record(reason, iterations_saved)
+    result = {
+        "status": "done",
+        "reason": reason,
+        "actions": {"escalate": True}
+    }
+    if rolled_back:
+        result["rolled_back"] = True
+    if iterations_saved:
+        result["iterations_saved"] = iterations_saved
+    return result
@@ -9,4 +9,14 @@ CURRENT_FEEDBACK_KEY = "current_feedback"
 
 SCORE_THRESHOLD_KEY = "score_threshold"
 ITERATION_COUNT_KEY = "iteration_count"
-IS_COMPLETE_KEY = "is_complete" 
\ No newline at end of file
+# 最大迭代轮数：LoopAgent 的 max_iterations 与 check_progress 的默认值共用此常量
+MAX_ITERATIONS_KEY = "max_iterations"
+DEFAULT_MAX_ITERATIONS = 3
+IS_COMPLETE_KEY = "is_complete" 
+# 收敛控制：分数历史、最佳稿件及早停参数
+SCORE_HISTORY_KEY = "score_history"
+BEST_SCORE_KEY = "best_score"
+BEST_DRAFT_KEY = "best_draft"
+BEST_FEEDBACK_KEY = "best_feedback"
+CONVERGENCE_PATIENCE_KEY = "convergence_patience"
+CONVERGENCE_MIN_DELTA_KEY = "convergence_min_delta"
@@ -0,0 +1,170 @@
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .state_manager import StateManager
+from .constants import (
+    CURRENT_DRAFT_KEY,
+    CURRENT_SCORE_KEY,
+    CURRENT_FEEDBACK_KEY,
+    SCORE_HISTORY_KEY,
+    BEST_SCORE_KEY,
+    BEST_DRAFT_KEY,
+    BEST_FEEDBACK_KEY,
+    CONVERGENCE_PATIENCE_KEY,
+    CONVERGENCE_MIN_DELTA_KEY,
+)
+
+logger = logging.getLogger(__name__)
+
+# LoopAgent 只跑 DEFAULT_MAX_ITERATIONS(3) 轮，patience 必须小于轮数减一，早停才有机会先于轮数上限触发
+DEFAULT_PATIENCE = 1
+DEFAULT_MIN_DELTA = 1.0
+
+
+@dataclass
+class ConvergenceDecision:
+    """
+    一次收敛判断的结果。
+    stop 为 True 时 reason 为 "plateau"（分数停滞）或 "regression"（分数回退）。
+    """
+    stop: bool
+    reason: Optional[str]
+    best_score: Optional[float]
+    stale_rounds: int
+
+
+class ConvergenceStats:
+    """
+    进程内的早停统计：早停会话数、按原因分类的次数、节省的迭代轮数。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.sessions_finished = 0
+        self.sessions_stopped_early = 0
+        self.iterations_saved = 0
+        self.stops_by_reason: Dict[str, int] = {}
+
+    def record(self, reason: str, iterations_saved: int) -> None:
+        with self._lock:
+            self.sessions_finished += 1
+            self.stops_by_reason[reason] = self.stops_by_reason.get(reason, 0) + 1
+            if iterations_saved > 0:
+                self.sessions_stopped_early += 1
+                self.iterations_saved += iterations_saved
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sessions_finished": self.sessions_finished,
+                "sessions_stopped_early": self.sessions_stopped_early,
+                "iterations_saved": self.iterations_saved,
+                "stops_by_reason": dict(self.stops_by_reason),
+            }
+
+
+convergence_stats = ConvergenceStats()
+
+
+def get_convergence_stats() -> Dict[str, Any]:
+    """返回跨会话的早停统计快照。"""
+    return convergence_stats.snapshot()
+
+
+class ConvergenceController:
+    """
+    基于分数轨迹的收敛控制器。
+    分数历史以 [迭代轮次, 分数] 的形式保存在 state[SCORE_HISTORY_KEY]，同一轮次重复调用只会覆盖该轮分数；
+    state 中同时保留目前最佳的稿件。
+    连续 patience 轮没有比最佳分数提升至少 min_delta 时判定收敛：
+    最新分数低于最佳分数超过 min_delta 为 "regression"，否则为 "plateau"。
+    """
+
+    def __init__(self, patience: int = DEFAULT_PATIENCE, min_delta: float = DEFAULT_MIN_DELTA):
+        self.patience = patience
+        self.min_delta = min_delta
+
+    @classmethod
+    def from_state(cls, state) -> "ConvergenceController":
+        """从 state 读取 patience / min_delta 配置，缺失或无效时使用默认值。"""
+        patience = state.get(CONVERGENCE_PATIENCE_KEY, DEFAULT_PATIENCE)
+        min_delta = state.get(CONVERGENCE_MIN_DELTA_KEY, DEFAULT_MIN_DELTA)
+        if not isinstance(patience, int) or isinstance(patience, bool) or patience <= 0:
+            logger.warning(f"[convergence] patience 无效 ({patience})，使用默认值 {DEFAULT_PATIENCE}。")
+            patience = DEFAULT_PATIENCE
+        if not isinstance(min_delta, (int, float)) or isinstance(min_delta, bool) or min_delta < 0:
+            logger.warning(f"[convergence] min_delta 无效 ({min_delta})，使用默认值 {DEFAULT_MIN_DELTA}。")
+            min_delta = DEFAULT_MIN_DELTA
+        return cls(patience=patience, min_delta=float(min_delta))
+
+    def stale_rounds(self, scores: List[float]) -> int:
+        """计算自上次显著提升（>= min_delta）以来经过的轮数。"""
+        if not scores:
+            return 0
+        reference = scores[0]
+        stale = 0
+        for score in scores[1:]:
+            if score >= reference + self.min_delta:
+                reference = score
+                stale = 0
+            else:
+                stale += 1
+        return stale
+
+    def observe(self, tool_context, iteration: int, score: float) -> ConvergenceDecision:
+        """
+        记录本轮分数，更新最佳稿件，并判断是否应早停。
+        Args:
+            tool_context: 需有 .state 属性
+            iteration: 当前迭代轮次
+            score: 本轮分数
+        Returns:
+            ConvergenceDecision
+        """
+        sm = StateManager(tool_context)
+        state = tool_context.state
+        # 复制一份再写回，保证 session 能感知到 state 变化
+        history = [list(entry) for entry in (state.get(SCORE_HISTORY_KEY) or [])]
+        if history and history[-1][0] == iteration:
+            history[-1][1] = score
+        else:
+            history.append([iteration, score])
+        state[SCORE_HISTORY_KEY] = history
+
+        best_score = state.get(BEST_SCORE_KEY)
+        if not isinstance(best_score, (int, float)) or score > best_score:
+            best_score = score
+            state[BEST_SCORE_KEY] = score
+            state[BEST_DRAFT_KEY] = sm.get(CURRENT_DRAFT_KEY, "")
+            state[BEST_FEEDBACK_KEY] = sm.get(CURRENT_FEEDBACK_KEY, "")
+
+        stale = self.stale_rounds([entry[1] for entry in history])
+        if stale < self.patience:
+            return ConvergenceDecision(stop=False, reason=None, best_score=best_score, stale_rounds=stale)
+        reason = "regression" if score < best_score - self.min_delta else "plateau"
+        logger.info(f"[convergence] 判定收敛: reason={reason}, history={history}, best={best_score}")
+        return ConvergenceDecision(stop=True, reason=reason, best_score=best_score, stale_rounds=stale)
+
+    def rollback_to_best(self, tool_context) -> bool:
+        """
+        当前稿件不是最佳稿件时，把最佳稿件、分数和反馈恢复为当前值。
+        Returns:
+            bool: 是否发生了回滚
+        """
+        state = tool_context.state
+        best_score = state.get(BEST_SCORE_KEY)
+        current_score = state.get(CURRENT_SCORE_KEY)
+        if not isinstance(best_score, (int, float)):
+            return False
+        if isinstance(current_score, (int, float)) and current_score >= best_score:
+            return False
+        state[CURRENT_DRAFT_KEY] = state.get(BEST_DRAFT_KEY, "")
+        state[CURRENT_SCORE_KEY] = best_score
+        state[CURRENT_FEEDBACK_KEY] = state.get(BEST_FEEDBACK_KEY, "")
+        logger.info(f"[convergence] 回滚到最佳稿件: {current_score} -> {best_score}")
+        return True
@@ -1,12 +1,12 @@
 import logging
 from .state_manager import StateManager
-from .constants import CURRENT_SCORE_KEY, CURRENT_FEEDBACK_KEY
+from .constants import CURRENT_SCORE_KEY, CURRENT_FEEDBACK_KEY, ITERATION_COUNT_KEY
 
 logger = logging.getLogger(__name__)
 
 def save_score(tool_context) -> dict:
     """
-    保存评分和反馈到 session state。
+    保存评分和反馈到 session state，并把 ITERATION_COUNT_KEY 加一（每保存一次评分即完成一轮）。
     依赖state字段：CURRENT_SCORE_KEY, CURRENT_FEEDBACK_KEY
     Args:
         tool_context: ADK工具上下文，需有.state属性
@@ -26,11 +26,15 @@ def save_score(tool_context) -> dict:
     try:
         ok1 = sm.set(CURRENT_SCORE_KEY, score)
         ok2 = sm.set(CURRENT_FEEDBACK_KEY, feedback)
-        if ok1 and ok2:
+        iteration = tool_context.state.get(ITERATION_COUNT_KEY, 0)
+        if not isinstance(iteration, int) or isinstance(iteration, bool) or iteration < 0:
+            iteration = 0
+        ok3 = sm.set(ITERATION_COUNT_KEY, iteration + 1)
+        if ok1 and ok2 and ok3:
             logger.info(f"[save_score] 评分 ({score}) 和反馈成功保存到状态。")
             return {"actions": {"escalate": False}, "status": "success"}
         else:
-            logger.error(f"[save_score] StateManager 返回保存失败信号 (score: {ok1}, feedback: {ok2})。")
+            logger.error(f"[save_score] StateManager 返回保存失败信号 (score: {ok1}, feedback: {ok2}, iteration: {ok3})。")
             return {"actions": {"escalate": False}, "status": "error", "message": "保存评分或反馈失败"}
     except Exception as e:
         logger.exception(f"[save_score] 保存评分或反馈时发生异常: {e}")
@@ -6,7 +6,7 @@ from .tools_registry import (
     check_progress_agent,
     get_final_draft_agent,
 )
-from .agents_registry import make_tool_agent
+from .agents_registry import make_tool_agent, tool_timing_stats
 
 __all__ = [
     "root_agent",
@@ -17,4 +17,5 @@ __all__ = [
     "check_progress_agent",
     "get_final_draft_agent",
     "make_tool_agent",
+    "tool_timing_stats",
 ]
@@ -10,19 +10,106 @@ from ..tools.save_score import save_score
 from google.adk.tools import ToolContext
 from google.adk.agents.invocation_context import InvocationContext
 from types import SimpleNamespace
-import collections.abc
 import asyncio
+import contextvars
+import functools
+import inspect
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
 from ..utils import wrap_event
 from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
 
 logger = logging.getLogger(__name__)
 
+# 同步工具在有界线程池中执行，避免阻塞所有并发会话共享的事件循环
+TOOL_EXECUTOR_WORKERS = int(os.getenv("COMPOSER_TOOL_WORKERS", "8"))
+_tool_executor = ThreadPoolExecutor(
+    max_workers=max(1, TOOL_EXECUTOR_WORKERS), thread_name_prefix="composer-tool"
+)
+
+
+class ToolTimingStats:
+    """进程内按工具名聚合的执行耗时统计。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, name: str, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            entry = self._stats.setdefault(
+                name, {"calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            entry["calls"] += 1
+            entry["errors"] += int(error)
+            entry["total_ms"] += seconds * 1000
+            entry["max_ms"] = max(entry["max_ms"], seconds * 1000)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                name: dict(entry, mean_ms=entry["total_ms"] / entry["calls"])
+                for name, entry in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+tool_timing_stats = ToolTimingStats()
+
+
+async def _call_tool(func, tool_ctx, offload: bool):
+    """执行工具：协程函数直接 await，同步函数按需放入线程池（保留 contextvars）。"""
+    if inspect.iscoroutinefunction(func):
+        return await func(tool_ctx)
+    if offload:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, func, tool_ctx)
+        result = await loop.run_in_executor(_tool_executor, call)
+    else:
+        result = func(tool_ctx)
+    # 兼容返回 awaitable 的同步包装函数
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def _build_actions(result, tool_ctx) -> EventActions:
+    """把工具结果中的 actions（如 escalate）合并进 EventActions，并带上工具写入的 state_delta。"""
+    actions = getattr(tool_ctx, "actions", None)
+    if not isinstance(actions, EventActions):
+        actions = EventActions()
+    result_actions = result.get("actions") if isinstance(result, dict) else None
+    if isinstance(result_actions, dict):
+        if result_actions.get("escalate"):
+            actions.escalate = True
+        if result_actions.get("state_delta"):
+            actions.state_delta.update(result_actions["state_delta"])
+    return actions
+
+
 # 通用ToolAgent实现
-def make_tool_agent(name, func, description=None):
+def make_tool_agent(name, func, description=None, offload: bool = True):
+    """
+    把 func(tool_context) 包装为 BaseAgent。
+    Args:
+        name: Agent 名称（同时作为耗时统计的工具名）
+        func: 同步或 async 工具函数，返回 dict（可含 {"actions": {"escalate": bool}}）
+        description: Agent 描述，默认取 func.__doc__
+        offload: 同步工具是否放入线程池执行，默认 True
+    Returns:
+        BaseAgent: 每次运行产出一个携带 EventActions 的 Event
+    """
     class ToolAgent(BaseAgent):
         _func: callable = PrivateAttr()
         def __init__(self):
-            super().__init__(name=name, description=description or func.__doc__)
+            super().__init__(name=name, description=description or func.__doc__ or "")
             self._func = func
         async def _run_async_impl(self, ctx):
             invocation_id = getattr(ctx, 'invocation_id', '') # 安全获取 invocation_id
@@ -30,12 +117,17 @@ def make_tool_agent(name, func, description=None):
                 tool_ctx = ToolContext(invocation_context=ctx)
             else:
                 tool_ctx = ctx
-            result = self._func(tool_ctx)
-            # 如果是 awaitable，等待其完成
-            if asyncio.iscoroutine(result):
-                await result
-            # Yield 一个空的 Event 对象，包含 author 和 invocation_id
-            yield Event(author=self.name, invocation_id=invocation_id)
+            started = time.perf_counter()
+            try:
+                result = await _call_tool(self._func, tool_ctx, offload)
+            except Exception:
+                tool_timing_stats.record(self.name, time.perf_counter() - started, error=True)
+                raise
+            elapsed = time.perf_counter() - started
+            tool_timing_stats.record(self.name, elapsed)
+            actions = _build_actions(result, tool_ctx)
+            logger.debug(f"[{self.name}] 工具耗时 {elapsed * 1000:.2f}ms, escalate={actions.escalate}")
+            yield Event(author=self.name, invocation_id=invocation_id, actions=actions)
     return ToolAgent()
 
 draft_writer_agent = DraftWriter()
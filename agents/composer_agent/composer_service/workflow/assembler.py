@@ -1,4 +1,5 @@
 from google.adk.agents import SequentialAgent, LoopAgent
+from ..tools.constants import DEFAULT_MAX_ITERATIONS
 from .agents_registry import draft_writer_agent, scorer_agent
 from .tools_registry import (
     check_initial_data_agent,
@@ -18,7 +19,7 @@ loop_agent = LoopAgent(
         save_score_agent,
         check_progress_agent,
     ],
-    max_iterations=3,
+    max_iterations=DEFAULT_MAX_ITERATIONS,
 )
 
 root_agent = SequentialAgent(
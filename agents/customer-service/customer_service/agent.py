@@ -18,7 +18,7 @@ import logging
 import warnings
 from google.adk import Agent
 from .config import Config
-from .prompts import GLOBAL_INSTRUCTION, INSTRUCTION
+from .prompts import INSTRUCTION, global_instruction
 from .shared_libraries.callbacks import (
     rate_limit_callback,
     before_agent,
@@ -33,6 +33,7 @@ from .tools.tools import (
     modify_cart,
     get_product_recommendations,
     check_product_availability,
+    check_products_availability,
     schedule_planting_service,
     get_available_planting_times,
     send_care_instructions,
@@ -49,7 +50,7 @@ logger = logging.getLogger(__name__)
 
 root_agent = Agent(
     model=configs.agent_settings.model,
-    global_instruction=GLOBAL_INSTRUCTION,
+    global_instruction=global_instruction,
     instruction=INSTRUCTION,
     name=configs.agent_settings.name,
     tools=[
@@ -61,6 +62,7 @@ root_agent = Agent(
         modify_cart,
         get_product_recommendations,
         check_product_availability,
+        check_products_availability,
         schedule_planting_service,
         get_available_planting_times,
         send_care_instructions,
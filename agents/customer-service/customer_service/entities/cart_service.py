@@ -0,0 +1,388 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shopping carts held in memory and persisted to a write-ahead log."""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Union
+
+from .product_catalog import ProductCatalog, get_product_catalog
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPACT_THRESHOLD = 1000
+DEMO_CART = {"123": [("soil-123", 1), ("fert-456", 1)]}
+
+
+class CartConflictError(Exception):
+    """Raised when a cart changed since the version the caller read."""
+
+
+@dataclass
+class _Line:
+    name: str
+    quantity: int
+    unit_cents: int
+
+    @property
+    def cents(self) -> int:
+        return self.quantity * self.unit_cents
+
+
+@dataclass
+class _Cart:
+    lines: dict[str, _Line] = field(default_factory=dict)
+    subtotal_cents: int = 0
+    version: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def snapshot(self) -> dict:
+        return {
+            "items": [
+                {
+                    "product_id": product_id,
+                    "name": line.name,
+                    "quantity": line.quantity,
+                }
+                for product_id, line in self.lines.items()
+            ],
+            "subtotal": self.subtotal_cents / 100,
+            "version": self.version,
+        }
+
+
+def _line_record(line: Optional[_Line]) -> Optional[list]:
+    return [line.name, line.quantity, line.unit_cents] if line else None
+
+
+def _to_cents(price: float) -> int:
+    return round(price * 100)
+
+
+def _parse_quantity(item: dict, default: Optional[int]) -> Optional[int]:
+    quantity = item.get("quantity", default)
+    if quantity is None:
+        return None
+    if isinstance(quantity, float) and quantity.is_integer():
+        quantity = int(quantity)
+    if not isinstance(quantity, int) or quantity <= 0:
+        raise ValueError(f"Invalid quantity {quantity!r} for {item}")
+    return quantity
+
+
+class CartService:
+    """
+    Carts keyed by customer_id.
+
+    Every change is computed against the in-memory cart under that cart's
+    lock, appended to the write-ahead log, and only then applied in memory,
+    so concurrent sessions never lose updates and reads never touch disk.
+    Subtotals are kept in cents and adjusted by the changed lines only.
+
+    Appending and applying happen together under one commit lock, so a
+    compaction always sees carts that match the log.
+
+    The log is replayed on start-up and rewritten as one record per cart
+    once it holds `compact_threshold` records.
+    """
+
+    def __init__(
+        self,
+        wal_path: Optional[str] = None,
+        catalog: Optional[ProductCatalog] = None,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+        fsync: bool = False,
+    ):
+        self.wal_path = wal_path
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self._catalog = catalog
+        self._carts: dict[str, _Cart] = {}
+        self._carts_lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+        self._wal_records = 0
+        self._wal = None
+        if wal_path:
+            self._replay()
+            self._wal = open(wal_path, "a", encoding="utf-8")
+
+    @property
+    def catalog(self) -> ProductCatalog:
+        return self._catalog or get_product_catalog()
+
+    def __len__(self) -> int:
+        return len(self._carts)
+
+    def _cart(self, customer_id: str) -> _Cart:
+        cart = self._carts.get(customer_id)
+        if cart is None:
+            with self._carts_lock:
+                cart = self._carts.setdefault(customer_id, _Cart())
+        return cart
+
+    def get_cart(self, customer_id: str) -> dict:
+        """
+        Returns the items, subtotal and version of a customer's cart.
+
+        Args:
+            customer_id: The ID of the customer.
+        """
+        cart = self._carts.get(customer_id)
+        if cart is None:
+            return _Cart().snapshot()
+        with cart.lock:
+            return cart.snapshot()
+
+    def apply_cart_delta(
+        self,
+        customer_id: str,
+        adds: Iterable[dict] = (),
+        removes: Iterable[Union[dict, str]] = (),
+        expected_version: Optional[int] = None,
+    ) -> dict:
+        """
+        Atomically adds and removes items in a customer's cart.
+
+        Either the whole delta is applied or, if any item is invalid, none
+        of it is.
+
+        Args:
+            customer_id: The ID of the customer.
+            adds: Items to add, each with 'product_id' and an optional
+                'quantity' (default 1).
+            removes: Product IDs, or items with 'product_id' and an optional
+                'quantity'. Without a quantity the whole line is removed.
+            expected_version: If set, the version the caller last read; the
+                delta is rejected if the cart has changed since.
+
+        Returns:
+            The updated cart, as returned by get_cart.
+
+        Raises:
+            CartConflictError: If expected_version is stale.
+            ValueError: If an item is malformed or not in the catalog.
+        """
+        adds = list(adds)
+        removes = [
+            {"product_id": item} if isinstance(item, str) else item
+            for item in removes
+        ]
+        cart = self._cart(customer_id)
+        with cart.lock:
+            if (
+                expected_version is not None
+                and expected_version != cart.version
+            ):
+                raise CartConflictError(
+                    f"Cart of customer {customer_id} is at version "
+                    f"{cart.version}, not {expected_version}"
+                )
+            changed = self._changed_lines(cart, adds, removes)
+            if not changed:
+                return cart.snapshot()
+            version = cart.version + 1
+            record = {
+                "customer_id": customer_id,
+                "version": version,
+                "lines": {
+                    product_id: _line_record(line)
+                    for product_id, line in changed.items()
+                },
+            }
+            with self._commit_lock:
+                self._append(record)
+                self._apply(cart, changed, version)
+            snapshot = cart.snapshot()
+        self._maybe_compact()
+        return snapshot
+
+    def _changed_lines(
+        self, cart: _Cart, adds: list[dict], removes: list[dict]
+    ) -> dict[str, Optional[_Line]]:
+        """Returns the new state of every line the delta touches (None when
+        the line is removed), without modifying the cart."""
+        changed: dict[str, Optional[_Line]] = {}
+
+        def current(product_id: str) -> Optional[_Line]:
+            if product_id in changed:
+                return changed[product_id]
+            return cart.lines.get(product_id)
+
+        for item in adds:
+            product_id = item.get("product_id")
+            quantity = _parse_quantity(item, 1)
+            product = self.catalog.get(product_id)
+            if product is None:
+                raise ValueError(f"Unknown product {product_id}")
+            line = current(product_id)
+            changed[product_id] = _Line(
+                product.name,
+                (line.quantity if line else 0) + quantity,
+                line.unit_cents if line else _to_cents(product.price),
+            )
+        for item in removes:
+            product_id = item.get("product_id")
+            quantity = _parse_quantity(item, None)
+            line = current(product_id)
+            if line is None:
+                continue
+            if quantity is None or quantity >= line.quantity:
+                changed[product_id] = None
+            else:
+                changed[product_id] = _Line(
+                    line.name, line.quantity - quantity, line.unit_cents
+                )
+        return changed
+
+    @staticmethod
+    def _apply(
+        cart: _Cart, changed: dict[str, Optional[_Line]], version: int
+    ) -> None:
+        for product_id, line in changed.items():
+            old = cart.lines.pop(product_id, None)
+            if old is not None:
+                cart.subtotal_cents -= old.cents
+            if line is not None:
+                cart.lines[product_id] = line
+                cart.subtotal_cents += line.cents
+        cart.version = version
+
+    def _append(self, record: dict) -> None:
+        if self._wal is None:
+            return
+        self._wal.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._wal.flush()
+        if self.fsync:
+            os.fsync(self._wal.fileno())
+        self._wal_records += 1
+
+    def _replay(self) -> None:
+        if not os.path.exists(self.wal_path):
+            return
+        valid_bytes = 0
+        with open(self.wal_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                changed = {
+                    product_id: _Line(*fields) if fields else None
+                    for product_id, fields in record["lines"].items()
+                }
+                self._apply(
+                    self._cart(record["customer_id"]),
+                    changed,
+                    record["version"],
+                )
+                self._wal_records += 1
+                valid_bytes += len(line)
+        if valid_bytes < os.path.getsize(self.wal_path):
+            # A crash mid-append leaves a partial last record; cut it off so
+            # new records start on a line of their own.
+            logger.warning(
+                "Truncating unreadable cart log tail at byte %d", valid_bytes
+            )
+            os.truncate(self.wal_path, valid_bytes)
+        logger.info(
+            "Replayed %d cart log records for %d carts",
+            self._wal_records,
+            len(self._carts),
+        )
+
+    def _maybe_compact(self) -> None:
+        if (
+            self._wal is not None
+            and self._wal_records >= self.compact_threshold
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrites the log as one record per non-empty cart."""
+        if self._wal is None:
+            return
+        with self._commit_lock:
+            directory = os.path.dirname(os.path.abspath(self.wal_path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".wal")
+            records = 0
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for customer_id, cart in list(self._carts.items()):
+                    if not cart.lines:
+                        continue
+                    record = {
+                        "customer_id": customer_id,
+                        "version": cart.version,
+                        "lines": {
+                            product_id: _line_record(line)
+                            for product_id, line in cart.lines.items()
+                        },
+                    }
+                    f.write(json.dumps(record, separators=(",", ":")) + "\n")
+                    records += 1
+                f.flush()
+                os.fsync(f.fileno())
+            self._wal.close()
+            os.replace(tmp_path, self.wal_path)
+            self._wal = open(self.wal_path, "a", encoding="utf-8")
+            self._wal_records = records
+
+    def close(self) -> None:
+        with self._commit_lock:
+            if self._wal is not None:
+                self._wal.close()
+                self._wal = None
+
+
+_service: Optional[CartService] = None
+_service_lock = threading.Lock()
+
+
+def get_cart_service() -> CartService:
+    """
+    Returns the process-wide cart service.
+
+    Carts are logged to the file named by CUSTOMER_SERVICE_CART_WAL, or kept
+    in memory only if that is unset. The demo customer's cart is seeded only
+    when there is no log yet, so carts emptied in an earlier run stay empty.
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            wal_path = os.getenv("CUSTOMER_SERVICE_CART_WAL")
+            seed = not wal_path or not os.path.exists(wal_path)
+            _service = CartService(wal_path)
+            if seed:
+                for customer_id, items in DEMO_CART.items():
+                    _service.apply_cart_delta(
+                        customer_id,
+                        [
+                            {"product_id": product_id, "quantity": quantity}
+                            for product_id, quantity in items
+                        ],
+                    )
+        return _service
+
+
+def set_cart_service(service: Optional[CartService]) -> None:
+    """Replaces the process-wide cart service (None resets to the default)."""
+    global _service
+    with _service_lock:
+        _service = service
@@ -117,81 +117,95 @@ class Customer(BaseModel):
         Returns:
             The Customer object if found, None otherwise.
         """
-        # In a real application, this would involve a database lookup.
-        # For this example, we'll just return a dummy customer.
-        return Customer(
-            customer_id=current_customer_id,
-            account_number="428765091",
-            customer_first_name="Alex",
-            customer_last_name="Johnson",
-            email="alex.johnson@example.com",
-            phone_number="+1-702-555-1212",
-            customer_start_date="2022-06-10",
-            years_as_customer=2,
-            billing_address=Address(
-                street="123 Main St", city="Anytown", state="CA", zip="12345"
+        # pylint: disable=import-outside-toplevel
+        from .customer_repository import get_customer_repository
+
+        return get_customer_repository().get(current_customer_id)
+
+
+def demo_customer(customer_id: str) -> Customer:
+    """
+    Returns the demo customer used to seed an empty repository.
+
+    Args:
+        customer_id: The ID to give the demo customer.
+
+    Returns:
+        The demo Customer object.
+    """
+    return Customer(
+        customer_id=customer_id,
+        account_number="428765091",
+        customer_first_name="Alex",
+        customer_last_name="Johnson",
+        email="alex.johnson@example.com",
+        phone_number="+1-702-555-1212",
+        customer_start_date="2022-06-10",
+        years_as_customer=2,
+        billing_address=Address(
+            street="123 Main St", city="Anytown", state="CA", zip="12345"
+        ),
+        purchase_history=[  # Example purchase history
+            Purchase(
+                date="2023-03-05",
+                items=[
+                    Product(
+                        product_id="fert-111",
+                        name="All-Purpose Fertilizer",
+                        quantity=1,
+                    ),
+                    Product(
+                        product_id="trowel-222",
+                        name="Gardening Trowel",
+                        quantity=1,
+                    ),
+                ],
+                total_amount=35.98,
             ),
-            purchase_history=[  # Example purchase history
-                Purchase(
-                    date="2023-03-05",
-                    items=[
-                        Product(
-                            product_id="fert-111",
-                            name="All-Purpose Fertilizer",
-                            quantity=1,
-                        ),
-                        Product(
-                            product_id="trowel-222",
-                            name="Gardening Trowel",
-                            quantity=1,
-                        ),
-                    ],
-                    total_amount=35.98,
-                ),
-                Purchase(
-                    date="2023-07-12",
-                    items=[
-                        Product(
-                            product_id="seeds-333",
-                            name="Tomato Seeds (Variety Pack)",
-                            quantity=2,
-                        ),
-                        Product(
-                            product_id="pots-444",
-                            name="Terracotta Pots (6-inch)",
-                            quantity=4,
-                        ),
-                    ],
-                    total_amount=42.5,
-                ),
-                Purchase(
-                    date="2024-01-20",
-                    items=[
-                        Product(
-                            product_id="gloves-555",
-                            name="Gardening Gloves (Leather)",
-                            quantity=1,
-                        ),
-                        Product(
-                            product_id="pruner-666",
-                            name="Pruning Shears",
-                            quantity=1,
-                        ),
-                    ],
-                    total_amount=55.25,
-                ),
-            ],
-            loyalty_points=133,
-            preferred_store="Anytown Garden Store",
-            communication_preferences=CommunicationPreferences(
-                email=True, sms=False, push_notifications=True
+            Purchase(
+                date="2023-07-12",
+                items=[
+                    Product(
+                        product_id="seeds-333",
+                        name="Tomato Seeds (Variety Pack)",
+                        quantity=2,
+                    ),
+                    Product(
+                        product_id="pots-444",
+                        name="Terracotta Pots (6-inch)",
+                        quantity=4,
+                    ),
+                ],
+                total_amount=42.5,
             ),
-            garden_profile=GardenProfile(
-                type="backyard",
-                size="medium",
-                sun_exposure="full sun",
-                soil_type="unknown",
-                interests=["flowers", "vegetables"],
+            Purchase(
+                date="2024-01-20",
+                items=[
+                    Product(
+                        product_id="gloves-555",
+                        name="Gardening Gloves (Leather)",
+                        quantity=1,
+                    ),
+                    Product(
+                        product_id="pruner-666",
+                        name="Pruning Shears",
+                        quantity=1,
+                    ),
+                ],
+                total_amount=55.25,
             ),
-            scheduled_appointments={},
-        )
+        ],
+        loyalty_points=133,
+        preferred_store="Anytown Garden Store",
+        communication_preferences=CommunicationPreferences(
+            email=True, sms=False, push_notifications=True
+        ),
+        garden_profile=GardenProfile(
+            type="backyard",
+            size="medium",
+            sun_exposure="full sun",
+            soil_type="unknown",
+            interests=["flowers", "vegetables"],
+        ),
+        scheduled_appointments={},
+    )
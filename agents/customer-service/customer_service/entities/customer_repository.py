@@ -0,0 +1,187 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQLite-backed customer repository with an in-process LRU cache."""
+
+import collections
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from .customer import Customer, demo_customer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CUSTOMER_ID = "123"
+DEFAULT_CACHE_SIZE = 1024
+
+GLOBAL_INSTRUCTION_TEMPLATE = """
+The profile of the current customer is:  {profile}
+"""
+
+
+@dataclass(frozen=True)
+class CachedCustomer:
+    """
+    A validated customer with its pre-rendered profile strings.
+    """
+
+    customer: Customer
+    profile_json: str
+    global_instruction: str
+
+
+class CustomerRepository:
+    """
+    Stores customer profiles in SQLite, indexed by customer_id.
+
+    Recently used customers are kept as validated Customer objects together
+    with their compact JSON profile and global instruction, so serving a
+    session never re-parses or re-serializes the profile.
+    """
+
+    def __init__(
+        self, db_path: str = ":memory:", cache_size: int = DEFAULT_CACHE_SIZE
+    ):
+        self.db_path = db_path
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._cache: collections.OrderedDict[str, CachedCustomer] = (
+            collections.OrderedDict()
+        )
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS customers ("
+                " customer_id TEXT PRIMARY KEY, profile TEXT NOT NULL)"
+            )
+
+    def put_many(self, customers: Iterable[Customer]) -> None:
+        """
+        Inserts or replaces customers.
+
+        Args:
+            customers: The customers to store.
+        """
+        entries = [self._render(customer) for customer in customers]
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO customers VALUES (?, ?)",
+                    [(e.customer.customer_id, e.profile_json) for e in entries],
+                )
+            for entry in entries:
+                if entry.customer.customer_id in self._cache:
+                    self._remember(entry)
+
+    def put(self, customer: Customer) -> None:
+        """
+        Inserts or replaces a customer.
+
+        Args:
+            customer: The customer to store.
+        """
+        self.put_many([customer])
+
+    def get_entry(self, customer_id: str) -> Optional[CachedCustomer]:
+        """
+        Retrieves a customer and its pre-rendered profile strings.
+
+        Args:
+            customer_id: The ID of the customer to retrieve.
+
+        Returns:
+            The cached entry if the customer exists, None otherwise.
+        """
+        with self._lock:
+            entry = self._cache.get(customer_id)
+            if entry is not None:
+                self._cache.move_to_end(customer_id)
+                return entry
+            row = self._conn.execute(
+                "SELECT profile FROM customers WHERE customer_id = ?",
+                (customer_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            entry = self._render(Customer.model_validate_json(row[0]))
+            self._remember(entry)
+            return entry
+
+    def get(self, customer_id: str) -> Optional[Customer]:
+        """
+        Retrieves a customer based on their ID.
+
+        Args:
+            customer_id: The ID of the customer to retrieve.
+
+        Returns:
+            The Customer object if found, None otherwise.
+        """
+        entry = self.get_entry(customer_id)
+        return entry.customer if entry else None
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM customers").fetchone()[0]
+
+    @staticmethod
+    def _render(customer: Customer) -> CachedCustomer:
+        profile_json = customer.model_dump_json()
+        return CachedCustomer(
+            customer=customer,
+            profile_json=profile_json,
+            global_instruction=GLOBAL_INSTRUCTION_TEMPLATE.format(
+                profile=profile_json
+            ),
+        )
+
+    def _remember(self, entry: CachedCustomer) -> None:
+        self._cache[entry.customer.customer_id] = entry
+        self._cache.move_to_end(entry.customer.customer_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+_repository: Optional[CustomerRepository] = None
+_repository_lock = threading.Lock()
+
+
+def get_customer_repository() -> CustomerRepository:
+    """
+    Returns the process-wide repository.
+
+    The database path is read from CUSTOMER_SERVICE_DB (in memory if unset).
+    An empty database is seeded with the demo customer.
+    """
+    global _repository
+    with _repository_lock:
+        if _repository is None:
+            _repository = CustomerRepository(
+                os.getenv("CUSTOMER_SERVICE_DB", ":memory:")
+            )
+            if _repository.count() == 0:
+                _repository.put(demo_customer(DEFAULT_CUSTOMER_ID))
+                logger.info("Seeded customer repository with demo customer")
+        return _repository
+
+
+def set_customer_repository(repository: Optional[CustomerRepository]) -> None:
+    """Replaces the process-wide repository (None resets to the default)."""
+    global _repository
+    with _repository_lock:
+        _repository = repository
@@ -0,0 +1,487 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local product catalog and inventory, indexed for agent tool lookups."""
+
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Plant type under which general-purpose products are indexed.
+ANY_PLANT = "*"
+DEFAULT_RECOMMENDATIONS = 2
+DEMO_STOCK = 10
+
+
+@dataclass(frozen=True)
+class CatalogProduct:
+    """
+    A product in the catalog.
+
+    An empty `plant_types` marks a general-purpose product, and an empty
+    `sun_exposure` means the product suits any exposure. Lower `rank` sorts
+    first among otherwise equal recommendations; ties keep catalog order.
+    """
+
+    product_id: str
+    name: str
+    description: str
+    category: str
+    price: float
+    plant_types: tuple[str, ...] = ()
+    sun_exposure: tuple[str, ...] = ()
+    rank: int = 0
+
+    def recommendation(self) -> dict:
+        return {
+            "product_id": self.product_id,
+            "name": self.name,
+            "description": self.description,
+        }
+
+
+def normalize_plant_type(plant_type: str) -> str:
+    return " ".join(plant_type.lower().split())
+
+
+def _plant_type_variants(plant_type: str) -> list[str]:
+    """Returns the lookup keys for a plant type, e.g. "petunia(s)"."""
+    key = normalize_plant_type(plant_type)
+    variants = [key]
+    if key.endswith("s"):
+        variants.append(key[:-1])
+    else:
+        variants.append(key + "s")
+    return variants
+
+
+def _normalize_sun(sun_exposure: Optional[str]) -> Optional[str]:
+    if not sun_exposure:
+        return None
+    return re.sub(r"[\s_-]+", " ", sun_exposure.lower()).strip()
+
+
+@dataclass
+class _Index:
+    products: dict[str, CatalogProduct] = field(default_factory=dict)
+    # store_id -> product_id -> quantity on hand.
+    stock: dict[str, dict[str, int]] = field(default_factory=dict)
+    # (plant type, sun exposure or None) -> recommended product_ids.
+    recommendations: dict[tuple[str, Optional[str]], tuple[str, ...]] = field(
+        default_factory=dict
+    )
+
+
+def _sort_key(sun: Optional[str]):
+    """Orders products by fit for `sun`, then rank.
+
+    Products made for `sun` come first, then those suited to any exposure,
+    then those made for a different one. Ties keep catalog order, since
+    sorting is stable.
+    """
+
+    def key(product: CatalogProduct):
+        if sun is None or not product.sun_exposure:
+            fit = 1
+        else:
+            fit = 0 if sun in product.sun_exposure else 2
+        return (fit, product.rank)
+
+    return key
+
+
+def _best_per_category(
+    products: Iterable[CatalogProduct], key
+) -> list[CatalogProduct]:
+    """Returns the best product of each category, best first."""
+    best: dict[str, tuple] = {}
+    for product in products:
+        product_key = key(product)
+        current = best.get(product.category)
+        if current is None or product_key < current[0]:
+            best[product.category] = (product_key, product)
+    ranked = sorted(best.values(), key=lambda entry: entry[0])
+    return [product for _, product in ranked]
+
+
+def _build_recommendations(
+    products: Iterable[CatalogProduct], limit: int
+) -> dict[tuple[str, Optional[str]], tuple[str, ...]]:
+    """
+    Precomputes the recommendations for every plant type and sun exposure.
+
+    Each recommendation list holds at most one product per category. Plant
+    specific products come first, and categories they do not cover are
+    filled with general-purpose products.
+    """
+    by_plant: dict[str, list[CatalogProduct]] = {}
+    exposures: set[str] = set()
+    for product in products:
+        for plant_type in product.plant_types or (ANY_PLANT,):
+            by_plant.setdefault(plant_type, []).append(product)
+        exposures.update(product.sun_exposure)
+
+    index = {}
+    for sun in [None, *exposures]:
+        key = _sort_key(sun)
+        general = _best_per_category(by_plant.get(ANY_PLANT, ()), key)
+        for plant_type, candidates in by_plant.items():
+            picked = (
+                _best_per_category(candidates, key)
+                if plant_type != ANY_PLANT
+                else []
+            )
+            categories = {product.category for product in picked}
+            picked += [p for p in general if p.category not in categories]
+            index[(plant_type, sun)] = tuple(
+                product.product_id for product in picked[:limit]
+            )
+    return index
+
+
+class ProductCatalog:
+    """
+    Products and per-store stock held in memory.
+
+    Products with no stock recorded for a store, including stores the
+    catalog does not know, have `default_stock` units there.
+
+    Stock is indexed by store_id and then product_id, and recommendations
+    are precomputed per plant type and sun exposure, so every lookup is a
+    dictionary access. `load` swaps in a fully built index at once, so
+    readers never see a half-built catalog.
+    """
+
+    def __init__(
+        self,
+        products: Iterable[CatalogProduct] = (),
+        stock: Optional[Mapping[str, Mapping[str, int]]] = None,
+        recommendation_limit: int = DEFAULT_RECOMMENDATIONS,
+        default_stock: int = 0,
+    ):
+        self.recommendation_limit = recommendation_limit
+        self.default_stock = default_stock
+        self._lock = threading.Lock()
+        self._index = _Index()
+        self.load(products, stock or {})
+
+    def load(
+        self,
+        products: Iterable[CatalogProduct],
+        stock: Mapping[str, Mapping[str, int]],
+    ) -> None:
+        """
+        Replaces the catalog contents and rebuilds the indexes.
+
+        Args:
+            products: The products in the catalog.
+            stock: Quantity on hand as {store_id: {product_id: quantity}}.
+        """
+        products = {
+            product.product_id: product
+            for product in (_normalized(p) for p in products)
+        }
+        index = _Index(
+            products=products,
+            stock={store: dict(levels) for store, levels in stock.items()},
+            recommendations=_build_recommendations(
+                products.values(), self.recommendation_limit
+            ),
+        )
+        with self._lock:
+            self._index = index
+        logger.info(
+            "Loaded catalog with %d products and %d stores",
+            len(products),
+            len(index.stock),
+        )
+
+    def __len__(self) -> int:
+        return len(self._index.products)
+
+    def get(self, product_id: str) -> Optional[CatalogProduct]:
+        return self._index.products.get(product_id)
+
+    def set_stock(self, store_id: str, product_id: str, quantity: int) -> None:
+        with self._lock:
+            self._index.stock.setdefault(store_id, {})[product_id] = quantity
+
+    def check_availability(self, product_id: str, store_id: str) -> dict:
+        """
+        Checks the stock of a product at a store.
+
+        Args:
+            product_id: The ID of the product to check.
+            store_id: The ID of the store.
+
+        Returns:
+            A dictionary with `available`, `quantity` and `store`, plus an
+            `error` for products that are not in the catalog.
+        """
+        index = self._index
+        levels = index.stock.get(store_id, {})
+        quantity = self._quantity(index, levels, product_id)
+        result = {
+            "available": quantity > 0,
+            "quantity": quantity,
+            "store": store_id,
+        }
+        if product_id not in index.products:
+            result["error"] = f"Unknown product {product_id}"
+        return result
+
+    def check_availability_many(
+        self, product_ids: Iterable[str], store_id: str
+    ) -> dict:
+        """
+        Checks the stock of several products at one store.
+
+        Args:
+            product_ids: The IDs of the products to check.
+            store_id: The ID of the store.
+
+        Returns:
+            A dictionary with the store and one availability entry per
+            product, in request order.
+        """
+        index = self._index
+        levels = index.stock.get(store_id, {})
+        items = []
+        for product_id in product_ids:
+            quantity = self._quantity(index, levels, product_id)
+            item = {
+                "product_id": product_id,
+                "available": quantity > 0,
+                "quantity": quantity,
+            }
+            if product_id not in index.products:
+                item["error"] = f"Unknown product {product_id}"
+            items.append(item)
+        return {"store": store_id, "items": items}
+
+    def _quantity(
+        self, index: _Index, levels: Mapping[str, int], product_id: str
+    ) -> int:
+        if product_id not in index.products:
+            return 0
+        return levels.get(product_id, self.default_stock)
+
+    def recommend(
+        self, plant_type: str, sun_exposure: Optional[str] = None
+    ) -> list[dict]:
+        """
+        Recommends products for a plant type.
+
+        Falls back to general-purpose products when the plant type is not
+        in the catalog.
+
+        Args:
+            plant_type: The type of plant, e.g. 'Petunias'.
+            sun_exposure: The sun exposure of the customer's garden, if
+                known.
+
+        Returns:
+            A list of recommended products with id, name and description.
+        """
+        index = self._index
+        sun = _normalize_sun(sun_exposure)
+        for plant_key in _plant_type_variants(plant_type) + [ANY_PLANT]:
+            product_ids = index.recommendations.get((plant_key, sun))
+            if product_ids is None:
+                product_ids = index.recommendations.get((plant_key, None))
+            if product_ids is not None:
+                return [
+                    index.products[product_id].recommendation()
+                    for product_id in product_ids
+                ]
+        return []
+
+
+def _normalized(product: CatalogProduct) -> CatalogProduct:
+    plant_types = tuple(normalize_plant_type(p) for p in product.plant_types)
+    sun_exposure = tuple(_normalize_sun(s) for s in product.sun_exposure)
+    if (plant_types, sun_exposure) == (product.plant_types, product.sun_exposure):
+        return product
+    return CatalogProduct(
+        **{
+            **product.__dict__,
+            "plant_types": plant_types,
+            "sun_exposure": sun_exposure,
+        }
+    )
+
+
+def load_catalog_file(path: str) -> ProductCatalog:
+    """
+    Builds a catalog from a JSON file.
+
+    The file holds {"products": [...], "stock": {store_id: {product_id:
+    quantity}}, "default_stock": quantity}, where each product has the
+    fields of CatalogProduct and "stock" and "default_stock" are optional.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    products = [
+        CatalogProduct(
+            **{
+                **product,
+                "plant_types": tuple(product.get("plant_types", ())),
+                "sun_exposure": tuple(product.get("sun_exposure", ())),
+            }
+        )
+        for product in data.get("products", [])
+    ]
+    return ProductCatalog(
+        products,
+        data.get("stock", {}),
+        default_stock=data.get("default_stock", 0),
+    )
+
+
+def demo_catalog() -> ProductCatalog:
+    """
+    Returns the demo catalog, with every product stocked at every store.
+
+    It holds the products of the mock cart, recommendations and purchase
+    history, plus the olive tree used in the eval sessions.
+    """
+    products = [
+        CatalogProduct(
+            "soil-123",
+            "Standard Potting Soil",
+            "A good all-purpose potting soil.",
+            "soil",
+            12.99,
+        ),
+        CatalogProduct(
+            "fert-456",
+            "General Purpose Fertilizer",
+            "Suitable for a wide variety of plants.",
+            "fertilizer",
+            12.99,
+        ),
+        CatalogProduct(
+            "soil-456",
+            "Bloom Booster Potting Mix",
+            "Provides extra nutrients that Petunias love.",
+            "soil",
+            15.99,
+            plant_types=("petunias", "annuals"),
+        ),
+        CatalogProduct(
+            "fert-789",
+            "Flower Power Fertilizer",
+            "Specifically formulated for flowering annuals.",
+            "fertilizer",
+            14.99,
+            plant_types=("petunias", "annuals"),
+        ),
+        CatalogProduct(
+            "tree-789",
+            "Dwarf Citrus Tree",
+            "A compact lemon tree for patios and small yards.",
+            "plant",
+            49.99,
+            plant_types=("citrus",),
+            sun_exposure=("full sun",),
+        ),
+        CatalogProduct(
+            "arbequina_olive_tree",
+            "Arbequina Olive Tree",
+            "A self-pollinating olive tree that thrives in hot, dry climates.",
+            "plant",
+            59.99,
+            plant_types=("olive trees", "olives"),
+            sun_exposure=("full sun",),
+        ),
+        CatalogProduct(
+            "fert-111",
+            "All-Purpose Fertilizer",
+            "A balanced feed for lawns, shrubs and vegetables.",
+            "fertilizer",
+            15.99,
+            rank=1,
+        ),
+        CatalogProduct(
+            "trowel-222",
+            "Gardening Trowel",
+            "A stainless steel hand trowel.",
+            "tool",
+            19.99,
+        ),
+        CatalogProduct(
+            "seeds-333",
+            "Tomato Seeds (Variety Pack)",
+            "Cherry, beefsteak and heirloom tomato seeds.",
+            "seed",
+            4.25,
+            plant_types=("tomatoes",),
+        ),
+        CatalogProduct(
+            "pots-444",
+            "Terracotta Pots (6-inch)",
+            "Breathable clay pots for herbs and small plants.",
+            "pot",
+            8.5,
+        ),
+        CatalogProduct(
+            "gloves-555",
+            "Gardening Gloves (Leather)",
+            "Thorn-resistant leather gloves.",
+            "tool",
+            24.25,
+            rank=1,
+        ),
+        CatalogProduct(
+            "pruner-666",
+            "Pruning Shears",
+            "Bypass pruners for stems up to 3/4 inch.",
+            "tool",
+            31.0,
+            rank=1,
+        ),
+    ]
+    return ProductCatalog(products, default_stock=DEMO_STOCK)
+
+
+_catalog: Optional[ProductCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_product_catalog() -> ProductCatalog:
+    """
+    Returns the process-wide catalog.
+
+    The catalog is loaded from the JSON file named by CUSTOMER_SERVICE_CATALOG,
+    or is the demo catalog if that is unset.
+    """
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            path = os.getenv("CUSTOMER_SERVICE_CATALOG")
+            _catalog = load_catalog_file(path) if path else demo_catalog()
+        return _catalog
+
+
+def set_product_catalog(catalog: Optional[ProductCatalog]) -> None:
+    """Replaces the process-wide catalog (None resets to the default)."""
+    global _catalog
+    with _catalog_lock:
+        _catalog = catalog
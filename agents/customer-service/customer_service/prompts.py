@@ -14,11 +14,25 @@
 
 """Global instruction and instruction for the customer service agent."""
 
-from .entities.customer import Customer
+from google.adk.agents.readonly_context import ReadonlyContext
 
-GLOBAL_INSTRUCTION = f"""
-The profile of the current customer is:  {Customer.get_customer("123").to_json()}
-"""
+from .entities.customer_repository import (
+    DEFAULT_CUSTOMER_ID,
+    get_customer_repository,
+)
+
+
+def global_instruction(context: ReadonlyContext) -> str:
+    """Returns the pre-rendered global instruction for the session's customer.
+
+    The customer is taken from the `customer_id` state key, defaulting to the
+    demo customer.
+    """
+    customer_id = context.state.get("customer_id", DEFAULT_CUSTOMER_ID)
+    entry = get_customer_repository().get_entry(customer_id)
+    if entry is None:
+        return "\nNo profile is on file for the current customer.\n"
+    return entry.global_instruction
 
 INSTRUCTION = """
 You are "Project Pro," the primary AI assistant for Cymbal Home & Garden, a big-box retailer specializing in home improvement, gardening, and related supplies.
@@ -66,9 +80,10 @@ You have access to the following tools to assist you:
 *   `sync_ask_for_approval(type: str, value: float, reason: str) -> str`: Requests discount approval from a manager (synchronous version).
 *   `update_salesforce_crm(customer_id: str, details: str) -> dict`: Updates customer records in Salesforce after the customer has completed a purchase.
 *   `access_cart_information(customer_id: str) -> dict`: Retrieves the customer's cart contents. Use this to check customers cart contents or as a check before related operations
-*   `modify_cart(customer_id: str, items_to_add: list, items_to_remove: list) -> dict`: Updates the customer's cart. before modifying a cart first access_cart_information to see what is already in the cart
+*   `modify_cart(customer_id: str, items_to_add: list, items_to_remove: list, expected_version: int) -> dict`: Updates the customer's cart. before modifying a cart first access_cart_information to see what is already in the cart, and pass the `version` it returned as expected_version. All additions and removals in one call are applied together, and the updated cart is returned. If the cart changed in the meantime nothing is applied and an error with reason "conflict" is returned: access the cart again and retry with the new version
 *   `get_product_recommendations(plant_type: str, customer_id: str) -> dict`: Suggests suitable products for a given plant type. i.e petunias. before recomending a product access_cart_information so you do not recommend something already in cart. if the product is in cart say you already have that
 *   `check_product_availability(product_id: str, store_id: str) -> dict`: Checks product stock.
+*   `check_products_availability(product_ids: list[str], store_id: str) -> dict`: Checks the stock of several products (e.g. the whole cart) in one call. Prefer it over repeated `check_product_availability` calls.
 *   `schedule_planting_service(customer_id: str, date: str, time_range: str, details: str) -> dict`: Books a planting service appointment.
 *   `get_available_planting_times(date: str) -> list`: Retrieves available time slots.
 *   `send_care_instructions(customer_id: str, plant_type: str, delivery_method: str) -> dict`: Sends plant care information.
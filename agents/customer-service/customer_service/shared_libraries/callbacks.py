@@ -22,7 +22,10 @@ from google.adk.models import LlmRequest
 from typing import Any, Dict
 from google.adk.tools import BaseTool
 from google.adk.agents.invocation_context import InvocationContext
-from customer_service.entities.customer import Customer
+from customer_service.entities.customer_repository import (
+    DEFAULT_CUSTOMER_ID,
+    get_customer_repository,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -115,20 +118,17 @@ def before_tool(
             }
         # Add more logic checks here as needed for your tools.
 
-    if tool.name == "modify_cart":
-        if (
-            args.get("items_added") is True
-            and args.get("items_removed") is True
-        ):
-            return {"result": "I have added and removed the requested items."}
     return None
 
 
 # checking that the customer profile is loaded as state.
 def before_agent(callback_context: InvocationContext):
     if "customer_profile" not in callback_context.state:
-        callback_context.state["customer_profile"] = Customer.get_customer(
-            "123"
-        ).to_json()
+        customer_id = callback_context.state.get(
+            "customer_id", DEFAULT_CUSTOMER_ID
+        )
+        entry = get_customer_repository().get_entry(customer_id)
+        if entry is not None:
+            callback_context.state["customer_profile"] = entry.profile_json
 
     # logger.info(callback_context.state["customer_profile"])
@@ -17,6 +17,11 @@
 import logging
 import uuid
 from datetime import datetime, timedelta
+from typing import Optional
+
+from ..entities.cart_service import CartConflictError, get_cart_service
+from ..entities.customer_repository import get_customer_repository
+from ..entities.product_catalog import get_product_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -124,59 +129,66 @@ def access_cart_information(customer_id: str) -> dict:
         customer_id (str): The ID of the customer.
 
     Returns:
-        dict: A dictionary representing the cart contents.
+        dict: A dictionary representing the cart contents. 'version' changes
+        on every modification; pass it to modify_cart as expected_version.
 
     Example:
         >>> access_cart_information(customer_id='123')
-        {'items': [{'product_id': 'soil-123', 'name': 'Standard Potting Soil', 'quantity': 1}, {'product_id': 'fert-456', 'name': 'General Purpose Fertilizer', 'quantity': 1}], 'subtotal': 25.98}
+        {'items': [{'product_id': 'soil-123', 'name': 'Standard Potting Soil', 'quantity': 1}, {'product_id': 'fert-456', 'name': 'General Purpose Fertilizer', 'quantity': 1}], 'subtotal': 25.98, 'version': 1}
     """
     logger.info("Accessing cart information for customer ID: %s", customer_id)
+    return _cart_result(get_cart_service().get_cart(customer_id))
 
-    # MOCK API RESPONSE - Replace with actual API call
-    mock_cart = {
-        "items": [
-            {
-                "product_id": "soil-123",
-                "name": "Standard Potting Soil",
-                "quantity": 1,
-            },
-            {
-                "product_id": "fert-456",
-                "name": "General Purpose Fertilizer",
-                "quantity": 1,
-            },
-        ],
-        "subtotal": 25.98,
+
+def _cart_result(cart: dict) -> dict:
+    return {
+        "items": cart["items"],
+        "subtotal": cart["subtotal"],
+        "version": cart["version"],
     }
-    return mock_cart
 
 
 def modify_cart(
-    customer_id: str, items_to_add: list[dict], items_to_remove: list[dict]
+    customer_id: str,
+    items_to_add: list[dict],
+    items_to_remove: list[dict],
+    expected_version: Optional[int] = None,
 ) -> dict:
     """Modifies the user's shopping cart by adding and/or removing items.
 
+    All changes are applied together, or none are if any item is invalid.
+
     Args:
         customer_id (str): The ID of the customer.
         items_to_add (list): A list of dictionaries, each with 'product_id' and 'quantity'.
-        items_to_remove (list): A list of product_ids to remove.
+        items_to_remove (list): A list of dictionaries, each with 'product_id' and an optional 'quantity'. Without a quantity the whole item is removed.
+        expected_version (int): Optional. The cart 'version' last read with access_cart_information. If the cart changed since, nothing is applied and an error is returned; read the cart again before retrying.
 
     Returns:
-        dict: A dictionary indicating the status of the cart modification.
+        dict: A dictionary with the status and the updated cart.
     Example:
-        >>> modify_cart(customer_id='123', items_to_add=[{'product_id': 'soil-456', 'quantity': 1}, {'product_id': 'fert-789', 'quantity': 1}], items_to_remove=[{'product_id': 'fert-112', 'quantity': 1}])
-        {'status': 'success', 'message': 'Cart updated successfully.', 'items_added': True, 'items_removed': True}
+        >>> modify_cart(customer_id='123', items_to_add=[{'product_id': 'soil-456', 'quantity': 1}], items_to_remove=[{'product_id': 'soil-123'}])
+        {'status': 'success', 'message': 'Cart updated successfully.', 'cart': {'items': [{'product_id': 'fert-456', 'name': 'General Purpose Fertilizer', 'quantity': 1}, {'product_id': 'soil-456', 'name': 'Bloom Booster Potting Mix', 'quantity': 1}], 'subtotal': 28.98, 'version': 2}}
     """
 
     logger.info("Modifying cart for customer ID: %s", customer_id)
     logger.info("Adding items: %s", items_to_add)
     logger.info("Removing items: %s", items_to_remove)
-    # MOCK API RESPONSE - Replace with actual API call
+    try:
+        cart = get_cart_service().apply_cart_delta(
+            customer_id,
+            items_to_add or [],
+            items_to_remove or [],
+            expected_version=expected_version,
+        )
+    except CartConflictError as e:
+        return {"status": "error", "reason": "conflict", "message": str(e)}
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
     return {
         "status": "success",
         "message": "Cart updated successfully.",
-        "items_added": True,
-        "items_removed": True,
+        "cart": _cart_result(cart),
     }
 
 
@@ -194,44 +206,18 @@ def get_product_recommendations(plant_type: str, customer_id: str) -> dict:
             {'product_id': 'fert-789', 'name': 'Flower Power Fertilizer', 'description': '...'}
         ]}
     """
-    #
     logger.info(
         "Getting product recommendations for plant " "type: %s and customer %s",
         plant_type,
         customer_id,
     )
-    # MOCK API RESPONSE - Replace with actual API call or recommendation engine
-    if plant_type.lower() == "petunias":
-        recommendations = {
-            "recommendations": [
-                {
-                    "product_id": "soil-456",
-                    "name": "Bloom Booster Potting Mix",
-                    "description": "Provides extra nutrients that Petunias love.",
-                },
-                {
-                    "product_id": "fert-789",
-                    "name": "Flower Power Fertilizer",
-                    "description": "Specifically formulated for flowering annuals.",
-                },
-            ]
-        }
-    else:
-        recommendations = {
-            "recommendations": [
-                {
-                    "product_id": "soil-123",
-                    "name": "Standard Potting Soil",
-                    "description": "A good all-purpose potting soil.",
-                },
-                {
-                    "product_id": "fert-456",
-                    "name": "General Purpose Fertilizer",
-                    "description": "Suitable for a wide variety of plants.",
-                },
-            ]
-        }
-    return recommendations
+    customer = get_customer_repository().get(customer_id)
+    sun_exposure = customer.garden_profile.sun_exposure if customer else None
+    return {
+        "recommendations": get_product_catalog().recommend(
+            plant_type, sun_exposure
+        )
+    }
 
 
 def check_product_availability(product_id: str, store_id: str) -> dict:
@@ -254,8 +240,31 @@ def check_product_availability(product_id: str, store_id: str) -> dict:
         product_id,
         store_id,
     )
-    # MOCK API RESPONSE - Replace with actual API call
-    return {"available": True, "quantity": 10, "store": store_id}
+    return get_product_catalog().check_availability(product_id, store_id)
+
+
+def check_products_availability(product_ids: list[str], store_id: str) -> dict:
+    """Checks the availability of several products at one store in one call.
+
+    Use this to check a whole cart or recommendation list at once.
+
+    Args:
+        product_ids: The IDs of the products to check.
+        store_id: The ID of the store (or 'pickup' for pickup availability).
+
+    Returns:
+        A dictionary with the store and the availability of each product.
+
+    Example:
+        >>> check_products_availability(product_ids=['soil-456', 'fert-789'], store_id='pickup')
+        {'store': 'pickup', 'items': [{'product_id': 'soil-456', 'available': True, 'quantity': 10}, {'product_id': 'fert-789', 'available': True, 'quantity': 10}]}
+    """
+    logger.info(
+        "Checking availability of product IDs: %s at store: %s",
+        product_ids,
+        store_id,
+    )
+    return get_product_catalog().check_availability_many(product_ids, store_id)
 
 
 def schedule_planting_service(
@@ -0,0 +1,143 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Latency benchmark for the product catalog on a generated catalog.
+
+Usage:
+  python -m tests.bench_catalog --products 100000 --stores 50
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from customer_service.entities.product_catalog import (
+    CatalogProduct,
+    ProductCatalog,
+)
+
+CATEGORIES = ("soil", "fertilizer", "plant", "tool", "pest control", "seed")
+PLANT_TYPES = tuple(f"plant type {i}" for i in range(200))
+SUN_EXPOSURES = ("full sun", "partial shade", "full shade")
+
+
+def synthetic_catalog(
+    num_products: int, num_stores: int, seed: int = 0
+) -> ProductCatalog:
+    """Builds a catalog of random products stocked at random stores.
+
+    Every tenth product is general purpose; the rest suit one to three
+    plant types and possibly a sun exposure.
+    """
+    rng = random.Random(seed)
+    products = []
+    for i in range(num_products):
+        general = i % 10 == 0
+        products.append(
+            CatalogProduct(
+                product_id=f"sku-{i}",
+                name=f"Product {i}",
+                description=f"Generated product {i}.",
+                category=rng.choice(CATEGORIES),
+                price=round(rng.uniform(1, 200), 2),
+                plant_types=(
+                    ()
+                    if general
+                    else tuple(rng.sample(PLANT_TYPES, rng.randint(1, 3)))
+                ),
+                sun_exposure=(
+                    (rng.choice(SUN_EXPOSURES),) if rng.random() < 0.5 else ()
+                ),
+                rank=rng.randint(0, 100),
+            )
+        )
+    stock = {
+        f"store-{s}": {
+            product.product_id: rng.randint(0, 20)
+            for product in products
+            if rng.random() < 0.3
+        }
+        for s in range(num_stores)
+    }
+    return ProductCatalog(products, stock)
+
+
+def _timed(fn, runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def _report(name: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    print(
+        f"{name:<28} p50={statistics.median(samples):8.1f}us "
+        f"p99={samples[int(len(samples) * 0.99) - 1]:8.1f}us"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--stores", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--batch", type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    catalog = synthetic_catalog(args.products, args.stores)
+    print(
+        f"built {len(catalog)} products / {args.stores} stores "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+
+    rng = random.Random(1)
+    product_ids = [f"sku-{rng.randrange(args.products)}" for _ in range(1000)]
+    stores = [f"store-{rng.randrange(args.stores)}" for _ in range(1000)]
+    plants = [rng.choice(PLANT_TYPES) for _ in range(1000)]
+
+    i = iter(range(10**9))
+    _report(
+        "check_availability",
+        _timed(
+            lambda: catalog.check_availability(
+                product_ids[next(i) % 1000], stores[0]
+            ),
+            args.runs,
+        ),
+    )
+    _report(
+        f"check_availability_many({args.batch})",
+        _timed(
+            lambda: catalog.check_availability_many(
+                product_ids[: args.batch], stores[next(i) % 1000]
+            ),
+            args.runs,
+        ),
+    )
+    _report(
+        "recommend",
+        _timed(
+            lambda: catalog.recommend(plants[next(i) % 1000], "full sun"),
+            args.runs,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
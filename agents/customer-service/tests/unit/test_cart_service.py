@@ -0,0 +1,189 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+import pytest
+
+from customer_service.entities.cart_service import (
+    CartConflictError,
+    CartService,
+    get_cart_service,
+    set_cart_service,
+)
+from customer_service.entities.product_catalog import (
+    demo_catalog,
+    set_product_catalog,
+)
+from customer_service.tools.tools import modify_cart
+
+
+@pytest.fixture(name="catalog")
+def fixture_catalog():
+    return demo_catalog()
+
+
+def _quantities(cart):
+    return {item["product_id"]: item["quantity"] for item in cart["items"]}
+
+
+def test_apply_cart_delta_updates_lines_and_subtotal(catalog):
+    service = CartService(catalog=catalog)
+    cart = service.apply_cart_delta(
+        "c1",
+        adds=[
+            {"product_id": "soil-123", "quantity": 2},
+            {"product_id": "fert-456"},
+            {"product_id": "soil-123"},
+        ],
+    )
+    assert _quantities(cart) == {"soil-123": 3, "fert-456": 1}
+    assert cart["subtotal"] == 51.96
+    assert cart["version"] == 1
+
+    cart = service.apply_cart_delta(
+        "c1",
+        removes=["fert-456", {"product_id": "soil-123", "quantity": 1}],
+    )
+    assert _quantities(cart) == {"soil-123": 2}
+    assert cart["subtotal"] == 25.98
+    assert cart["version"] == 2
+    assert service.get_cart("c1") == cart
+    assert service.get_cart("nobody") == {
+        "items": [],
+        "subtotal": 0.0,
+        "version": 0,
+    }
+
+
+def test_invalid_delta_changes_nothing(catalog):
+    service = CartService(catalog=catalog)
+    service.apply_cart_delta("c1", adds=[{"product_id": "soil-123"}])
+    with pytest.raises(ValueError):
+        service.apply_cart_delta(
+            "c1",
+            adds=[{"product_id": "fert-456"}, {"product_id": "nope"}],
+            removes=["soil-123"],
+        )
+    with pytest.raises(ValueError):
+        service.apply_cart_delta(
+            "c1", adds=[{"product_id": "fert-456", "quantity": -1}]
+        )
+    cart = service.get_cart("c1")
+    assert _quantities(cart) == {"soil-123": 1}
+    assert cart["version"] == 1
+
+
+def test_stale_version_is_rejected(catalog):
+    service = CartService(catalog=catalog)
+    version = service.get_cart("c1")["version"]
+    service.apply_cart_delta(
+        "c1", adds=[{"product_id": "soil-123"}], expected_version=version
+    )
+    with pytest.raises(CartConflictError):
+        service.apply_cart_delta(
+            "c1", adds=[{"product_id": "fert-456"}], expected_version=version
+        )
+    assert _quantities(service.get_cart("c1")) == {"soil-123": 1}
+
+
+def test_concurrent_deltas_are_not_lost(catalog, tmp_path):
+    service = CartService(str(tmp_path / "carts.wal"), catalog=catalog)
+
+    def add_many():
+        for _ in range(200):
+            service.apply_cart_delta("c1", adds=[{"product_id": "soil-123"}])
+
+    threads = [threading.Thread(target=add_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cart = service.get_cart("c1")
+    assert _quantities(cart) == {"soil-123": 800}
+    assert cart["version"] == 800
+    assert cart["subtotal"] == pytest.approx(800 * 12.99)
+    service.close()
+
+    reopened = CartService(str(tmp_path / "carts.wal"), catalog=catalog)
+    assert reopened.get_cart("c1") == cart
+
+
+def test_log_replay_and_compaction(catalog, tmp_path):
+    wal_path = tmp_path / "carts.wal"
+    service = CartService(str(wal_path), catalog=catalog, compact_threshold=6)
+    for _ in range(4):
+        service.apply_cart_delta("c1", adds=[{"product_id": "soil-123"}])
+    service.apply_cart_delta("c2", adds=[{"product_id": "fert-456"}])
+    service.apply_cart_delta("c2", removes=["fert-456"])
+    # Compacted to one record for c1; the empty c2 cart is dropped.
+    assert len(wal_path.read_text().splitlines()) == 1
+    service.apply_cart_delta(
+        "c1", removes=[{"product_id": "soil-123", "quantity": 1}]
+    )
+    service.close()
+
+    # A partial record from a crash mid-append is skipped.
+    with open(wal_path, "a", encoding="utf-8") as f:
+        f.write('{"customer_id": "c1", "vers')
+
+    reopened = CartService(str(wal_path), catalog=catalog)
+    cart = reopened.get_cart("c1")
+    assert _quantities(cart) == {"soil-123": 3}
+    assert cart["version"] == 5
+    assert cart["subtotal"] == 38.97
+    assert reopened.get_cart("c2")["items"] == []
+    # The partial record was cut off, so new records are readable.
+    reopened.apply_cart_delta("c2", adds=[{"product_id": "fert-456"}])
+    reopened.close()
+    reopened = CartService(str(wal_path), catalog=catalog)
+    assert _quantities(reopened.get_cart("c2")) == {"fert-456": 1}
+    reopened.close()
+
+
+def test_demo_cart_is_seeded_only_without_a_log(tmp_path, monkeypatch):
+    wal_path = tmp_path / "carts.wal"
+    monkeypatch.setenv("CUSTOMER_SERVICE_CART_WAL", str(wal_path))
+    set_cart_service(None)
+    try:
+        service = get_cart_service()
+        assert _quantities(service.get_cart("123")) == {
+            "soil-123": 1,
+            "fert-456": 1,
+        }
+        service.apply_cart_delta("123", removes=["soil-123", "fert-456"])
+        service.compact()
+        service.close()
+        assert wal_path.read_text() == ""
+
+        set_cart_service(None)
+        service = get_cart_service()
+        assert service.get_cart("123")["items"] == []
+        service.close()
+    finally:
+        set_cart_service(None)
+
+
+def test_eval_olive_tree_can_be_added_to_cart():
+    set_cart_service(None)
+    set_product_catalog(None)
+    try:
+        result = modify_cart(
+            "123",
+            items_to_add=[{"product_id": "arbequina_olive_tree", "quantity": 1}],
+            items_to_remove=[],
+        )
+    finally:
+        set_cart_service(None)
+    assert result["status"] == "success"
+    assert result["cart"]["items"][-1]["product_id"] == "arbequina_olive_tree"
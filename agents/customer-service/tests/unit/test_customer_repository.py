@@ -0,0 +1,95 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+from customer_service.entities.customer import Customer, demo_customer
+from customer_service.entities.customer_repository import (
+    CustomerRepository,
+    get_customer_repository,
+    set_customer_repository,
+)
+from customer_service.prompts import global_instruction
+
+
+def test_put_and_get_round_trip(tmp_path):
+    db_path = str(tmp_path / "customers.db")
+    repository = CustomerRepository(db_path)
+    repository.put(demo_customer("c1"))
+
+    reopened = CustomerRepository(db_path)
+    customer = reopened.get("c1")
+    assert isinstance(customer, Customer)
+    assert customer.customer_first_name == "Alex"
+    assert reopened.get("missing") is None
+
+
+def test_entry_has_compact_profile_and_instruction():
+    repository = CustomerRepository()
+    repository.put(demo_customer("c1"))
+    entry = repository.get_entry("c1")
+    assert "\n" not in entry.profile_json
+    assert entry.profile_json == entry.customer.model_dump_json()
+    assert entry.profile_json in entry.global_instruction
+    # Cached entries are reused rather than re-rendered.
+    assert repository.get_entry("c1") is entry
+
+
+def test_lru_evicts_least_recently_used():
+    repository = CustomerRepository(cache_size=2)
+    repository.put_many(demo_customer(f"c{i}") for i in range(3))
+    first = repository.get_entry("c0")
+    repository.get_entry("c1")
+    repository.get_entry("c0")
+    repository.get_entry("c2")  # evicts c1
+    assert list(repository._cache) == ["c0", "c2"]
+    assert repository.get_entry("c0") is first
+
+
+def test_put_refreshes_cached_entry():
+    repository = CustomerRepository()
+    repository.put(demo_customer("c1"))
+    repository.get_entry("c1")
+    updated = demo_customer("c1")
+    updated.customer_first_name = "Sam"
+    repository.put(updated)
+    assert repository.get("c1").customer_first_name == "Sam"
+    assert '"Sam"' in repository.get_entry("c1").global_instruction
+
+
+def test_global_instruction_per_customer():
+    repository = CustomerRepository()
+    other = demo_customer("c2")
+    other.customer_first_name = "Sam"
+    repository.put_many([demo_customer("123"), other])
+    set_customer_repository(repository)
+    try:
+        default = global_instruction(SimpleNamespace(state={}))
+        sam = global_instruction(SimpleNamespace(state={"customer_id": "c2"}))
+        missing = global_instruction(SimpleNamespace(state={"customer_id": "x"}))
+    finally:
+        set_customer_repository(None)
+    assert '"Alex"' in default
+    assert '"Sam"' in sam
+    assert "No profile" in missing
+
+
+def test_default_repository_is_seeded(monkeypatch):
+    monkeypatch.delenv("CUSTOMER_SERVICE_DB", raising=False)
+    set_customer_repository(None)
+    try:
+        assert get_customer_repository().count() == 1
+        assert Customer.get_customer("123").customer_last_name == "Johnson"
+    finally:
+        set_customer_repository(None)
@@ -0,0 +1,228 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import time
+
+from customer_service.entities.customer import demo_customer
+from customer_service.entities.customer_repository import (
+    CustomerRepository,
+    set_customer_repository,
+)
+from customer_service.entities.product_catalog import (
+    CatalogProduct,
+    ProductCatalog,
+    demo_catalog,
+    load_catalog_file,
+    set_product_catalog,
+)
+from customer_service.tools.tools import (
+    check_product_availability,
+    check_products_availability,
+    get_product_recommendations,
+)
+from tests.bench_catalog import PLANT_TYPES, synthetic_catalog
+
+EVAL_SESSION = os.path.join(
+    os.path.dirname(__file__), "../../eval/sessions/123.session.json"
+)
+TOOL = "check_product_availability"
+
+
+def _ids(recommendations):
+    return [r["product_id"] for r in recommendations]
+
+
+def test_check_availability_many_preserves_order():
+    catalog = demo_catalog()
+    catalog.set_stock("Main Store", "fert-456", 0)
+    result = catalog.check_availability_many(
+        ["fert-456", "soil-123", "nope"], "Main Store"
+    )
+    assert result["store"] == "Main Store"
+    assert result["items"] == [
+        {"product_id": "fert-456", "available": False, "quantity": 0},
+        {"product_id": "soil-123", "available": True, "quantity": 10},
+        {
+            "product_id": "nope",
+            "available": False,
+            "quantity": 0,
+            "error": "Unknown product nope",
+        },
+    ]
+
+
+def test_unknown_store_uses_default_stock():
+    products = [CatalogProduct("p1", "Product", "", "soil", 1.0)]
+    catalog = ProductCatalog(products, {"s1": {"p1": 2}})
+    assert catalog.check_availability("p1", "elsewhere")["quantity"] == 0
+
+    catalog = ProductCatalog(products, {"s1": {"p1": 2}}, default_stock=5)
+    assert catalog.check_availability("p1", "s1")["quantity"] == 2
+    assert catalog.check_availability("p1", "elsewhere")["quantity"] == 5
+    assert catalog.check_availability("p2", "elsewhere")["quantity"] == 0
+
+
+def test_demo_catalog_stocks_customer_products_everywhere():
+    catalog = demo_catalog()
+    customer = demo_customer("123")
+    product_ids = [
+        product.product_id
+        for purchase in customer.purchase_history
+        for product in purchase.items
+    ]
+    result = catalog.check_availability_many(
+        product_ids + ["soil-123"], customer.preferred_store
+    )
+    assert all(
+        item["available"] and "error" not in item for item in result["items"]
+    )
+
+
+def test_replays_eval_availability_calls():
+    with open(EVAL_SESSION, encoding="utf-8") as f:
+        events = json.load(f)["events"]
+    calls, responses = [], []
+    for event in events:
+        for part in event["content"]["parts"]:
+            if part.get("function_call", {}).get("name") == TOOL:
+                calls.append(part["function_call"]["args"])
+            if part.get("function_response", {}).get("name") == TOOL:
+                responses.append(part["function_response"]["response"])
+    assert calls
+    set_product_catalog(demo_catalog())
+    try:
+        for args, response in zip(calls, responses):
+            assert check_product_availability(**args) == response
+    finally:
+        set_product_catalog(None)
+
+
+def test_recommend_matches_plural_and_falls_back_to_general():
+    catalog = demo_catalog()
+    assert _ids(catalog.recommend("Petunia")) == ["soil-456", "fert-789"]
+    assert _ids(catalog.recommend("cacti")) == ["soil-123", "fert-456"]
+    # Categories without a citrus product are filled with general products.
+    assert _ids(catalog.recommend("citrus")) == ["tree-789", "soil-123"]
+
+
+def test_recommend_prefers_products_for_sun_exposure():
+    catalog = ProductCatalog(
+        [
+            CatalogProduct(
+                "shade-soil",
+                "Shade Mix",
+                "",
+                "soil",
+                1.0,
+                plant_types=("ferns",),
+                sun_exposure=("full shade",),
+            ),
+            CatalogProduct(
+                "sun-soil",
+                "Sun Mix",
+                "",
+                "soil",
+                1.0,
+                plant_types=("ferns",),
+                sun_exposure=("Full Sun",),
+                rank=5,
+            ),
+        ]
+    )
+    assert _ids(catalog.recommend("ferns")) == ["shade-soil"]
+    assert _ids(catalog.recommend("ferns", "full_sun")) == ["sun-soil"]
+    assert _ids(catalog.recommend("ferns", "full shade")) == ["shade-soil"]
+
+
+def test_tool_uses_customer_garden_profile():
+    repository = CustomerRepository()
+    customer = demo_customer("shady")
+    customer.garden_profile.sun_exposure = "full shade"
+    repository.put(customer)
+    catalog = ProductCatalog(
+        [
+            CatalogProduct(
+                "shade-fert",
+                "Shade Feed",
+                "",
+                "fertilizer",
+                1.0,
+                sun_exposure=("full shade",),
+                rank=1,
+            ),
+            CatalogProduct("fert", "Feed", "", "fertilizer", 1.0),
+        ],
+        {"pickup": {"fert": 3}},
+    )
+    set_customer_repository(repository)
+    set_product_catalog(catalog)
+    try:
+        shady = get_product_recommendations("roses", "shady")
+        unknown = get_product_recommendations("roses", "nobody")
+        stock = check_products_availability(["fert", "shade-fert"], "pickup")
+    finally:
+        set_customer_repository(None)
+        set_product_catalog(None)
+    assert _ids(shady["recommendations"]) == ["shade-fert"]
+    assert _ids(unknown["recommendations"]) == ["fert"]
+    assert [item["quantity"] for item in stock["items"]] == [3, 0]
+
+
+def test_load_catalog_file(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(
+        json.dumps(
+            {
+                "products": [
+                    {
+                        "product_id": "p1",
+                        "name": "Rose Food",
+                        "description": "Feeds roses.",
+                        "category": "fertilizer",
+                        "price": 9.5,
+                        "plant_types": ["Roses"],
+                    }
+                ],
+                "stock": {"s1": {"p1": 4}},
+            }
+        )
+    )
+    catalog = load_catalog_file(str(path))
+    assert _ids(catalog.recommend("rose")) == ["p1"]
+    assert catalog.check_availability("p1", "s1")["quantity"] == 4
+
+
+def test_generated_catalog_of_100k_skus():
+    catalog = synthetic_catalog(100_000, num_stores=3)
+    assert len(catalog) == 100_000
+
+    product_ids = [f"sku-{i}" for i in range(0, 100_000, 997)]
+    start = time.perf_counter()
+    for _ in range(100):
+        result = catalog.check_availability_many(product_ids, "store-1")
+    batch_secs = (time.perf_counter() - start) / 100
+    assert len(result["items"]) == len(product_ids)
+    assert not any("error" in item for item in result["items"])
+
+    start = time.perf_counter()
+    for plant_type in PLANT_TYPES:
+        recommendations = catalog.recommend(plant_type, "partial shade")
+        assert len(recommendations) == catalog.recommendation_limit
+    recommend_secs = (time.perf_counter() - start) / len(PLANT_TYPES)
+
+    # Lookups are dictionary accesses, independent of catalog size. The
+    # bounds are loose so the test is not flaky on slow machines.
+    assert batch_secs < 0.01
+    assert recommend_secs < 0.001
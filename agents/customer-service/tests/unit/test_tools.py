@@ -25,6 +25,7 @@ from customer_service.tools.tools import (
     send_care_instructions,
     generate_qr_code,
 )
+from customer_service.entities.cart_service import set_cart_service
 from datetime import datetime, timedelta
 import logging
 
@@ -76,6 +77,7 @@ def test_access_cart_information():
             },
         ],
         "subtotal": 25.98,
+        "version": 1,
     }
 
 
@@ -83,15 +85,50 @@ def test_modify_cart_add_and_remove():
     customer_id = "123"
     items_to_add = [{"product_id": "tree-789", "quantity": 1}]
     items_to_remove = [{"product_id": "soil-123"}]
-    result = modify_cart(customer_id, items_to_add, items_to_remove)
+    set_cart_service(None)
+    try:
+        result = modify_cart(customer_id, items_to_add, items_to_remove)
+    finally:
+        set_cart_service(None)
     assert result == {
         "status": "success",
         "message": "Cart updated successfully.",
-        "items_added": True,
-        "items_removed": True,
+        "cart": {
+            "items": [
+                {
+                    "product_id": "fert-456",
+                    "name": "General Purpose Fertilizer",
+                    "quantity": 1,
+                },
+                {
+                    "product_id": "tree-789",
+                    "name": "Dwarf Citrus Tree",
+                    "quantity": 1,
+                },
+            ],
+            "subtotal": 62.98,
+            "version": 2,
+        },
     }
 
 
+
+def test_modify_cart_rejects_stale_version():
+    set_cart_service(None)
+    try:
+        version = access_cart_information("123")["version"]
+        add = [{"product_id": "tree-789", "quantity": 1}]
+        assert modify_cart("123", add, [], expected_version=version)[
+            "status"
+        ] == "success"
+        result = modify_cart("123", add, [], expected_version=version)
+        assert result["status"] == "error"
+        assert result["reason"] == "conflict"
+        assert access_cart_information("123")["version"] == version + 1
+    finally:
+        set_cart_service(None)
+
+
 def test_get_product_recommendations_petunias():
     plant_type = "petunias"
     customer_id = "123"
@@ -40,6 +40,7 @@ from .tools.scoring_tools import (
     save_parents_scoring_result_tool
 )
 from .tools.writing_tools import write_draft
+from .tools.prompt_cache import CACHE_CONTROL_INJECTION_POINTS
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +76,9 @@ if kingdora_base_url and kingdora_api_key:
             api_base=kingdora_base_url,
             api_key=kingdora_api_key,
             stream=False,
-            temperature=0.2
+            temperature=0.2,
+            # 将稳定的Agent指令（system消息）标记为可缓存前缀
+            cache_control_injection_points=CACHE_CONTROL_INJECTION_POINTS
         )
         logger.info("✅ 成功配置Gemini模型")
     except Exception as e:
@@ -88,7 +91,8 @@ if not model_instance and oneapi_base_url and oneapi_api_key:
             model="openai/gpt-4o", 
             api_base=oneapi_base_url,
             api_key=oneapi_api_key,
-            stream=True
+            stream=True,
+            cache_control_injection_points=CACHE_CONTROL_INJECTION_POINTS
         )
         logger.info("✅ 成功配置GPT-4o模型")
     except Exception as e:
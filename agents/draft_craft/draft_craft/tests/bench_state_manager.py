@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""StateManager 读写开销的微基准测试。
+
+对比审计模式（等价于旧实现：INFO 级结构化日志 + 写后回读校验）
+与默认低开销路径在长文稿上的单次调用耗时。
+
+用法:
+    python -m draft_craft.tests.bench_state_manager [--draft-chars 20000] [--number 2000]
+"""
+
+import argparse
+import itertools
+import logging
+import os
+import timeit
+from types import SimpleNamespace
+
+from draft_craft.tools import logging_utils, state_manager as sm_module
+from draft_craft.tools.state_manager import (
+    StateManager, CURRENT_DRAFT_KEY, ITERATION_COUNT_KEY
+)
+
+
+def _make_context(draft: str) -> SimpleNamespace:
+    return SimpleNamespace(state={CURRENT_DRAFT_KEY: draft, ITERATION_COUNT_KEY: 1})
+
+
+def _bench(label: str, audit: bool, draft: str, number: int) -> None:
+    manager = StateManager(_make_context(draft), audit=audit)
+    # 每次写入一个新的字符串对象，避免身份比较直接命中
+    drafts = [draft + "甲", draft + "乙"]
+    alternating = itertools.cycle(drafts)
+
+    cases = {
+        "get": lambda: manager.get(CURRENT_DRAFT_KEY),
+        "set": lambda: manager.set(CURRENT_DRAFT_KEY, drafts[0]),
+        "store_draft_efficiently": lambda: manager.store_draft_efficiently(
+            next(alternating)
+        ),
+    }
+    for name, func in cases.items():
+        manager.audit_log.clear()
+        seconds = timeit.timeit(func, number=number)
+        print(f"{label:<8} {name:<24} {seconds / number * 1e6:10.2f} µs/call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="StateManager 微基准测试")
+    parser.add_argument("--draft-chars", type=int, default=20000, help="文稿长度（字符）")
+    parser.add_argument("--number", type=int, default=2000, help="每个用例的调用次数")
+    args = parser.parse_args()
+
+    # 日志写入空设备，只测量格式化与序列化开销
+    handler = logging.StreamHandler(open(os.devnull, "w", encoding="utf-8"))
+    for log in (sm_module.logger, logging_utils.logger):
+        log.handlers[:] = [handler]
+        log.propagate = False
+        log.setLevel(logging.INFO)
+
+    draft = "草稿内容" * (args.draft_chars // 4)
+    print(f"文稿长度: {len(draft)} 字符, 每个用例 {args.number} 次调用")
+    _bench("before", True, draft, args.number)
+    _bench("after", False, draft, args.number)
+
+
+if __name__ == "__main__":
+    main()
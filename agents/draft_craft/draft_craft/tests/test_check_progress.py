@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from draft_craft.tools.state_tools import check_progress
+from draft_craft.tools.convergence import convergence_stats, get_convergence_stats
+from draft_craft.tools.state_manager import (
+    CURRENT_DRAFT_KEY, CURRENT_SCORE_KEY, CURRENT_FEEDBACK_KEY, SCORE_THRESHOLD_KEY,
+    ITERATION_COUNT_KEY, IS_COMPLETE_KEY, MAX_ITERATIONS_KEY, SCORE_HISTORY_KEY,
+    CONVERGENCE_PATIENCE_KEY
+)
+
+
+@pytest.fixture
+def mock_tool_context():
+    """创建模拟的ToolContext"""
+    mock_context = MagicMock()
+    mock_context.state = {SCORE_THRESHOLD_KEY: 90.0, MAX_ITERATIONS_KEY: 6}
+    return mock_context
+
+
+def _score_round(context, iteration, score):
+    context.state[ITERATION_COUNT_KEY] = iteration
+    context.state[CURRENT_DRAFT_KEY] = f"第{iteration}版"
+    context.state[CURRENT_SCORE_KEY] = float(score)
+    context.state[CURRENT_FEEDBACK_KEY] = f"第{iteration}版反馈"
+    return check_progress(context)
+
+
+def test_score_passed(mock_tool_context):
+    result = _score_round(mock_tool_context, 1, 95)
+    assert result["status"] == "done"
+    assert result["reason"] == "score_passed"
+    assert mock_tool_context.state[IS_COMPLETE_KEY] is True
+
+
+def test_regression_stops_early_and_rolls_back(mock_tool_context):
+    convergence_stats.reset()
+    assert _score_round(mock_tool_context, 1, 80)["status"] == "continue"
+    assert _score_round(mock_tool_context, 2, 75)["status"] == "continue"
+    result = _score_round(mock_tool_context, 3, 70)
+    assert result["status"] == "done"
+    assert result["reason"] == "regression"
+    assert result["rolled_back"] is True
+    assert result["iterations_saved"] == 3
+    assert mock_tool_context.state[CURRENT_DRAFT_KEY] == "第1版"
+    assert mock_tool_context.state[CURRENT_SCORE_KEY] == 80.0
+    assert get_convergence_stats()["iterations_saved"] == 3
+
+
+def test_repeated_call_in_same_iteration_is_idempotent(mock_tool_context):
+    mock_tool_context.state[CONVERGENCE_PATIENCE_KEY] = 1
+    _score_round(mock_tool_context, 1, 60)
+    result = check_progress(mock_tool_context)
+    assert result["status"] == "continue"
+    assert mock_tool_context.state[SCORE_HISTORY_KEY] == [[1, 60.0]]
+
+
+def test_small_gains_on_ten_point_scale_keep_iterating(mock_tool_context):
+    mock_tool_context.state[SCORE_THRESHOLD_KEY] = 9.0
+    assert _score_round(mock_tool_context, 1, 8.0)["status"] == "continue"
+    assert _score_round(mock_tool_context, 2, 8.3)["status"] == "continue"
+    assert _score_round(mock_tool_context, 3, 8.6)["status"] == "continue"
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+
+import pytest
+
+from draft_craft.tools.fix_llm import (
+    BackgroundEventLoop, FALLBACK_TIMEOUT, TIMEOUT_ENV_VAR, _timeout_from_env,
+    run_async_in_thread, safely_run_async, submit
+)
+
+
+async def _current_loop_and_thread():
+    return asyncio.get_running_loop(), threading.current_thread()
+
+
+def test_calls_share_one_loop_and_thread():
+    """多次同步调用复用同一个后台循环和线程"""
+    first_loop, first_thread = run_async_in_thread(_current_loop_and_thread)
+    second_loop, second_thread = run_async_in_thread(_current_loop_and_thread)
+    assert first_loop is second_loop
+    assert first_thread is second_thread
+    assert first_thread is not threading.current_thread()
+
+
+def test_submit_returns_future():
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    futures = [submit(add(i, i)) for i in range(5)]
+    assert [f.result(timeout=5) for f in futures] == [0, 2, 4, 6, 8]
+
+
+def test_per_call_timeout_and_errors():
+    async def slow():
+        await asyncio.sleep(5)
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(TimeoutError):
+        run_async_in_thread(slow, timeout=0.05)
+    with pytest.raises(ValueError):
+        run_async_in_thread(fail)
+    assert safely_run_async(fail, "fallback") == "fallback"
+
+
+def test_run_inside_loop_thread_is_rejected():
+    background = BackgroundEventLoop(name="test-loop")
+
+    async def nested():
+        async def inner():
+            return 1
+        return background.run(inner())
+
+    try:
+        with pytest.raises(RuntimeError):
+            background.submit(nested()).result(timeout=5)
+    finally:
+        background.shutdown()
+
+
+@pytest.mark.parametrize("raw,expected", [
+    (None, FALLBACK_TIMEOUT),
+    ("12.5", 12.5),
+    ("", None),
+    (" None ", None),
+    ("abc", FALLBACK_TIMEOUT),
+    ("-1", FALLBACK_TIMEOUT),
+    ("nan", FALLBACK_TIMEOUT),
+])
+def test_timeout_env_parsing(monkeypatch, raw, expected):
+    if raw is None:
+        monkeypatch.delenv(TIMEOUT_ENV_VAR, raising=False)
+    else:
+        monkeypatch.setenv(TIMEOUT_ENV_VAR, raw)
+    assert _timeout_from_env() == expected
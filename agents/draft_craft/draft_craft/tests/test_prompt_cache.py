@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+from draft_craft.tools.llm_tools import (
+    SCORING_STABLE_TEMPLATE, SCORING_VARIABLE_TEMPLATE, SCORING_PROMPT_TEMPLATE
+)
+from draft_craft.tools.prompt_cache import (
+    PromptUsage, assemble_prompt, build_messages, record_usage, prompt_cache_stats
+)
+
+
+def test_cache_key_depends_only_on_stable_prefix():
+    """相同评分标准的不同文稿共享cache key，且文稿位于提示词末尾"""
+    first = assemble_prompt(SCORING_STABLE_TEMPLATE, SCORING_VARIABLE_TEMPLATE,
+                            draft="第一版文稿", scoring_criteria="标准A")
+    second = assemble_prompt(SCORING_STABLE_TEMPLATE, SCORING_VARIABLE_TEMPLATE,
+                             draft="第二版文稿", scoring_criteria="标准A")
+    assert first.cache_key == second.cache_key
+    assert first.text.startswith(second.stable_prefix)
+    assert first.text == SCORING_PROMPT_TEMPLATE.format(draft="第一版文稿", scoring_criteria="标准A")
+    assert first.text.rstrip().endswith("第一版文稿")
+
+
+def test_build_messages_and_usage_stats():
+    prompt_cache_stats.reset()
+    prompt = assemble_prompt("评分标准{c}", "文稿{d}", c="X", d="Y")
+    assert build_messages(prompt) == [
+        {"role": "system", "content": "评分标准X"},
+        {"role": "user", "content": "文稿Y"},
+    ]
+    response = SimpleNamespace(usage={
+        "prompt_tokens": 1500, "prompt_tokens_details": {"cached_tokens": 1280}
+    })
+    usage = record_usage(prompt, response)
+    assert usage == PromptUsage(cache_key=prompt.cache_key, prompt_tokens=1500, cached_tokens=1280)
+    assert usage.uncached_tokens == 220
+    assert record_usage(prompt, SimpleNamespace()) is None
+    assert prompt_cache_stats.snapshot()[prompt.cache_key]["calls"] == 1
@@ -0,0 +1,79 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from draft_craft.tools.state_manager import (
+    StateManager, CURRENT_DRAFT_KEY, CURRENT_SCORE_KEY, ITERATION_COUNT_KEY,
+    IS_COMPLETE_KEY, STATE_AUDIT_ENV
+)
+
+
+@pytest.fixture
+def mock_tool_context():
+    """创建模拟的ToolContext"""
+    mock_context = MagicMock()
+    mock_context.state = {}
+    return mock_context
+
+
+def test_set_and_typed_getters(mock_tool_context):
+    manager = StateManager(mock_tool_context)
+    assert manager.set(CURRENT_SCORE_KEY, 8.5)
+    assert manager.set(ITERATION_COUNT_KEY, 2)
+    assert manager.set(IS_COMPLETE_KEY, False)
+
+    assert manager.get_float(CURRENT_SCORE_KEY) == 8.5
+    assert manager.get_int(ITERATION_COUNT_KEY) == 2
+    assert manager.get_bool(IS_COMPLETE_KEY) is False
+    # 类型不符时返回默认值
+    assert manager.get_str(CURRENT_SCORE_KEY, "n/a") == "n/a"
+    assert manager.get_int(IS_COMPLETE_KEY, 0) == 0
+
+
+def test_set_rejects_wrong_type(mock_tool_context):
+    manager = StateManager(mock_tool_context)
+    assert manager.set(CURRENT_SCORE_KEY, "high") is False
+    assert CURRENT_SCORE_KEY not in mock_tool_context.state
+
+
+def test_default_mode_skips_state_logging(mock_tool_context, monkeypatch, caplog):
+    calls = []
+    monkeypatch.setattr(
+        "draft_craft.tools.state_manager.log_state_operation",
+        lambda *args, **kwargs: calls.append(args) or {},
+    )
+    caplog.set_level(logging.INFO, logger="draft_craft.tools.state_manager")
+    manager = StateManager(mock_tool_context, audit=False)
+    manager.set(CURRENT_DRAFT_KEY, "文稿")
+    manager.get(CURRENT_DRAFT_KEY)
+    assert calls == []
+    assert manager.audit_log == []
+
+
+def test_audit_mode_records_operations(mock_tool_context):
+    manager = StateManager(mock_tool_context, audit=True)
+    manager.set(CURRENT_DRAFT_KEY, "文稿")
+    manager.get(CURRENT_DRAFT_KEY)
+    manager.delete(CURRENT_DRAFT_KEY)
+    assert [entry["operation"] for entry in manager.audit_log] == ["write", "read", "delete"]
+
+
+def test_audit_mode_from_env(mock_tool_context, monkeypatch):
+    monkeypatch.setenv(STATE_AUDIT_ENV, "true")
+    assert StateManager(mock_tool_context).audit is True
+    monkeypatch.setenv(STATE_AUDIT_ENV, "false")
+    assert StateManager(mock_tool_context).audit is False
+
+
+def test_store_draft_efficiently(mock_tool_context):
+    manager = StateManager(mock_tool_context)
+    draft = "第一版文稿" * 100
+    assert manager.store_draft_efficiently(draft)
+    assert mock_tool_context.state[CURRENT_DRAFT_KEY] == draft
+    assert mock_tool_context.state[ITERATION_COUNT_KEY] == 1
+
+    # 相同内容不重复写入
+    mock_tool_context.state[ITERATION_COUNT_KEY] = 3
+    assert manager.store_draft_efficiently("".join(["第一版文稿"] * 100))
+    assert mock_tool_context.state[ITERATION_COUNT_KEY] == 3
@@ -21,12 +21,12 @@ from .state_manager import StateManager
 from .state_tools import (
     check_initial_data,
     store_initial_data,
+    check_progress,
     get_final_draft
 )
 from .writing_tools import (
     write_draft,
-    score_draft,
-    check_progress
+    score_draft
 )
 
 # 设置日志配置
@@ -0,0 +1,159 @@
+"""基于分数轨迹的收敛控制，在分数停滞或回退时提前结束迭代。"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .state_manager import (
+    StateManager, CURRENT_DRAFT_KEY, CURRENT_SCORE_KEY, CURRENT_FEEDBACK_KEY,
+    SCORE_HISTORY_KEY, BEST_SCORE_KEY, BEST_DRAFT_KEY, BEST_FEEDBACK_KEY,
+    CONVERGENCE_PATIENCE_KEY, CONVERGENCE_MIN_DELTA_KEY
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATIENCE = 2
+DEFAULT_MIN_DELTA = 0.1  # 评分为0-10分，提升不足0.1分视为停滞
+
+
+@dataclass
+class ConvergenceDecision:
+    """一次收敛判断的结果，stop为True时reason为"plateau"或"regression"。"""
+    stop: bool
+    reason: Optional[str]
+    best_score: Optional[float]
+    stale_rounds: int
+
+
+class ConvergenceStats:
+    """进程内跨会话的早停统计。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.sessions_finished = 0
+        self.sessions_stopped_early = 0
+        self.iterations_saved = 0
+        self.stops_by_reason: Dict[str, int] = {}
+
+    def record(self, reason: str, iterations_saved: int) -> None:
+        with self._lock:
+            self.sessions_finished += 1
+            self.stops_by_reason[reason] = self.stops_by_reason.get(reason, 0) + 1
+            if iterations_saved > 0:
+                self.sessions_stopped_early += 1
+                self.iterations_saved += iterations_saved
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sessions_finished": self.sessions_finished,
+                "sessions_stopped_early": self.sessions_stopped_early,
+                "iterations_saved": self.iterations_saved,
+                "stops_by_reason": dict(self.stops_by_reason),
+            }
+
+
+convergence_stats = ConvergenceStats()
+
+
+def get_convergence_stats() -> Dict[str, Any]:
+    """返回跨会话的早停统计快照。"""
+    return convergence_stats.snapshot()
+
+
+class ConvergenceController:
+    """
+    收敛控制器
+    
+    分数历史以 [迭代轮次, 分数] 的形式保存在状态中，同一轮次重复调用只会覆盖该轮分数。
+    连续 patience 轮没有比最佳分数提升至少 min_delta 时判定收敛。
+    """
+
+    def __init__(self, patience: int = DEFAULT_PATIENCE, min_delta: float = DEFAULT_MIN_DELTA):
+        self.patience = patience
+        self.min_delta = min_delta
+
+    @classmethod
+    def from_state(cls, state_manager: StateManager) -> "ConvergenceController":
+        """从状态读取patience和min_delta配置，无效时使用默认值。"""
+        patience = state_manager.get_int(CONVERGENCE_PATIENCE_KEY, DEFAULT_PATIENCE)
+        min_delta = state_manager.get_float(CONVERGENCE_MIN_DELTA_KEY, DEFAULT_MIN_DELTA)
+        if patience <= 0:
+            logger.warning("收敛patience无效(%s)，使用默认值%d", patience, DEFAULT_PATIENCE)
+            patience = DEFAULT_PATIENCE
+        if min_delta < 0:
+            logger.warning("收敛min_delta无效(%s)，使用默认值%s", min_delta, DEFAULT_MIN_DELTA)
+            min_delta = DEFAULT_MIN_DELTA
+        return cls(patience=patience, min_delta=min_delta)
+
+    def stale_rounds(self, scores: List[float]) -> int:
+        """计算自上次显著提升以来经过的轮数。"""
+        if not scores:
+            return 0
+        reference = scores[0]
+        stale = 0
+        for score in scores[1:]:
+            if score >= reference + self.min_delta:
+                reference = score
+                stale = 0
+            else:
+                stale += 1
+        return stale
+
+    def observe(self, state_manager: StateManager, iteration: int, score: float) -> ConvergenceDecision:
+        """
+        记录本轮分数，更新最佳文稿，并判断是否应提前结束
+        
+        Args:
+            state_manager: 状态管理器
+            iteration: 当前迭代轮次
+            score: 本轮分数
+            
+        Returns:
+            ConvergenceDecision: 收敛判断结果
+        """
+        history = [list(entry) for entry in (state_manager.get(SCORE_HISTORY_KEY) or [])]
+        if history and history[-1][0] == iteration:
+            history[-1][1] = score
+        else:
+            history.append([iteration, score])
+        state_manager.set(SCORE_HISTORY_KEY, history)
+
+        best_score = state_manager.get_float(BEST_SCORE_KEY)
+        if best_score is None or score > best_score:
+            best_score = float(score)
+            state_manager.update({
+                BEST_SCORE_KEY: best_score,
+                BEST_DRAFT_KEY: state_manager.get_str(CURRENT_DRAFT_KEY, ""),
+                BEST_FEEDBACK_KEY: state_manager.get_str(CURRENT_FEEDBACK_KEY, ""),
+            })
+
+        stale = self.stale_rounds([entry[1] for entry in history])
+        if stale < self.patience:
+            return ConvergenceDecision(stop=False, reason=None, best_score=best_score, stale_rounds=stale)
+        reason = "regression" if score < best_score - self.min_delta else "plateau"
+        logger.info("判定收敛: reason=%s, 最佳分数=%s, 连续%d轮无提升", reason, best_score, stale)
+        return ConvergenceDecision(stop=True, reason=reason, best_score=best_score, stale_rounds=stale)
+
+    def rollback_to_best(self, state_manager: StateManager) -> bool:
+        """
+        当前文稿不是最佳文稿时，将最佳文稿、分数和反馈恢复为当前值
+        
+        Returns:
+            bool: 是否发生了回滚
+        """
+        best_score = state_manager.get_float(BEST_SCORE_KEY)
+        current_score = state_manager.get_float(CURRENT_SCORE_KEY)
+        if best_score is None or (current_score is not None and current_score >= best_score):
+            return False
+        state_manager.update({
+            CURRENT_DRAFT_KEY: state_manager.get_str(BEST_DRAFT_KEY, ""),
+            CURRENT_SCORE_KEY: best_score,
+            CURRENT_FEEDBACK_KEY: state_manager.get_str(BEST_FEEDBACK_KEY, ""),
+        })
+        logger.info("回滚到最佳文稿: %s -> %s", current_score, best_score)
+        return True
@@ -1,19 +1,158 @@
-"""解决LLM生成和ADK同步/异步调用冲突的修复脚本"""
+"""解决LLM生成和ADK同步/异步调用冲突的修复脚本
+
+同步代码通过一个常驻的后台事件循环线程执行协程。所有调用共享同一个循环，
+因此异步客户端缓存的连接池（如litellm的httpx/aiohttp会话）始终绑定在这个循环上，
+不会因为每次调用新建/关闭循环而失效。
+"""
 
 import asyncio
+import atexit
 import concurrent.futures
 import logging
-from typing import Any, Callable, Awaitable
+import math
+import os
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, Optional
 
 logger = logging.getLogger(__name__)
 
-def run_async_in_thread(async_func, *args, **kwargs):
+TIMEOUT_ENV_VAR = "DRAFT_CRAFT_ASYNC_TIMEOUT"
+FALLBACK_TIMEOUT = 30.0
+
+
+def _timeout_from_env() -> Optional[float]:
+    """读取超时环境变量：空值或none表示不限时，无效值记录警告并使用默认值。"""
+    raw = os.getenv(TIMEOUT_ENV_VAR)
+    if raw is None:
+        return FALLBACK_TIMEOUT
+    value = raw.strip()
+    if not value or value.lower() == "none":
+        return None
+    try:
+        timeout = float(value)
+    except ValueError:
+        timeout = math.nan
+    if math.isnan(timeout) or timeout <= 0:
+        logger.warning("%s无效(%r)，使用默认值%s秒", TIMEOUT_ENV_VAR, raw, FALLBACK_TIMEOUT)
+        return FALLBACK_TIMEOUT
+    return timeout
+
+
+# 默认超时（秒），可通过环境变量覆盖；None 表示不限时
+DEFAULT_TIMEOUT = _timeout_from_env()
+
+
+class BackgroundEventLoop:
+    """常驻后台线程中的asyncio事件循环。"""
+
+    def __init__(self, name: str = "draft-craft-async-loop"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """返回后台事件循环，首次访问时启动线程。"""
+        if self._loop is None or self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._loop is None or self._thread is None or not self._thread.is_alive():
+                    self._start()
+        return self._loop
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run_loop():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        thread = threading.Thread(target=run_loop, name=self._name, daemon=True)
+        thread.start()
+        ready.wait()
+        self._loop = loop
+        self._thread = thread
+        logger.debug("后台事件循环线程已启动: %s", self._name)
+
+    def in_loop_thread(self) -> bool:
+        """当前线程是否就是后台循环线程。"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """
+        将协程提交到后台循环执行
+
+        Args:
+            coro: 要执行的协程对象
+
+        Returns:
+            concurrent.futures.Future: 可在任意线程中等待的结果
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = DEFAULT_TIMEOUT) -> Any:
+        """
+        在后台循环中执行协程并同步等待结果
+
+        Args:
+            coro: 要执行的协程对象
+            timeout: 超时秒数，None 表示不限时
+
+        Returns:
+            协程的返回值
+
+        Raises:
+            RuntimeError: 在后台循环线程内调用（会导致死锁）
+            TimeoutError: 超时，超时后协程会被取消
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("不能在后台事件循环线程内同步等待协程，请直接await")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"异步函数执行超时（{timeout}秒）")
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """停止后台循环并等待线程退出。"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=timeout)
+        if not loop.is_running():
+            loop.close()
+
+
+_background_loop = BackgroundEventLoop()
+atexit.register(_background_loop.shutdown)
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """获取进程内共享的后台事件循环。"""
+    return _background_loop
+
+
+def submit(coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+    """将协程提交到共享后台循环，返回Future。"""
+    return _background_loop.submit(coro)
+
+
+def run_async_in_thread(async_func, *args, timeout: Optional[float] = DEFAULT_TIMEOUT, **kwargs):
     """
-    在单独的线程中运行异步函数并同步等待结果
+    在共享的后台事件循环中运行异步函数并同步等待结果
     
     Args:
         async_func: 异步函数
         *args, **kwargs: 传递给异步函数的参数
+        timeout: 超时秒数，None 表示不限时
         
     Returns:
         异步函数的执行结果
@@ -21,39 +160,7 @@ def run_async_in_thread(async_func, *args, **kwargs):
     Raises:
         如果发生错误，则传递原始异常
     """
-    result = [None]
-    error = [None]
-    
-    # 在线程中运行事件循环
-    def run_in_thread():
-        try:
-            # 创建一个新的事件循环
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # 运行异步函数并获取结果
-            result[0] = loop.run_until_complete(async_func(*args, **kwargs))
-            
-            # 关闭循环
-            loop.close()
-        except Exception as e:
-            error[0] = e
-    
-    # 创建并启动线程
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        future = executor.submit(run_in_thread)
-        try:
-            # 等待最多30秒
-            future.result(timeout=30)
-        except concurrent.futures.TimeoutError:
-            raise TimeoutError("异步函数执行超时")
-    
-    # 如果有错误，重新抛出
-    if error[0]:
-        raise error[0]
-    
-    # 返回执行结果
-    return result[0]
+    return _background_loop.run(async_func(*args, **kwargs), timeout=timeout)
 
 def safely_run_async(async_func: Callable[..., Awaitable[Any]], fallback_value: Any, *args, **kwargs) -> Any:
     """
@@ -62,7 +169,7 @@ def safely_run_async(async_func: Callable[..., Awaitable[Any]], fallback_value:
     Args:
         async_func: 要运行的异步函数
         fallback_value: 如果异步函数失败时返回的后备值
-        *args, **kwargs: 传递给异步函数的参数
+        *args, **kwargs: 传递给异步函数的参数（可包含timeout）
         
     Returns:
         成功时返回异步函数的结果，失败时返回后备值
@@ -71,4 +178,4 @@ def safely_run_async(async_func: Callable[..., Awaitable[Any]], fallback_value:
         return run_async_in_thread(async_func, *args, **kwargs)
     except Exception as e:
         logger.error(f"异步函数执行失败: {e}", exc_info=True)
-        return fallback_value 
\ No newline at end of file
+        return fallback_value
@@ -5,65 +5,39 @@ import os
 from typing import Any, Dict, List, Optional, Union
 from google.adk.models.lite_llm import LiteLlm
 
-logger = logging.getLogger(__name__)
-
-# 提示词模板
-INITIAL_WRITING_PROMPT_TEMPLATE = """
-你是一位专业文案写手。现在，请你基于以下素材和要求，撰写一篇高质量的文章：
-
-## 素材
-{material}
-
-## 写作要求
-{requirements}
-
-## 评分标准
-{scoring_criteria}
-
-请确保你的文稿:
-1. 符合写作要求的主题和目标
-2. 满足评分标准的要求
-3. 具有清晰的结构和流畅的逻辑
-4. 语言准确、简洁、易于理解
-
-直接输出正文内容，无需添加标题或额外说明。
-"""
-
-REVISION_PROMPT_TEMPLATE = """
-你是一位专业文案写手。请基于以下反馈，改进现有文稿：
+from .llm_tools import (
+    INITIAL_WRITING_STABLE_TEMPLATE, INITIAL_WRITING_VARIABLE_TEMPLATE,
+    REVISION_STABLE_TEMPLATE, REVISION_VARIABLE_TEMPLATE
+)
+from .prompt_cache import (
+    AssembledPrompt, CACHE_CONTROL_INJECTION_POINTS, assemble_prompt, build_messages, record_usage
+)
+from .fix_llm import DEFAULT_TIMEOUT, run_async_in_thread
 
-## 当前文稿
-{current_draft}
-
-## 评分反馈
-{feedback}
-
-## 评分标准
-{scoring_criteria}
-
-## 改进指南
-1. 认真分析评分反馈，找出需要改进的地方
-2. 保留原文稿的优点和核心内容
-3. 针对性地修改和补充内容
-4. 确保修改后的文稿更符合评分标准
+logger = logging.getLogger(__name__)
 
-请输出完整的改进后文稿，而不只是修改建议。
-"""
 
 
 class LlmContentGenerator:
     """使用LLM生成文本内容的生成器类"""
     
-    def __init__(self, model_name: Optional[str] = None, temperature: float = 0.7):
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        temperature: float = 0.7,
+        timeout: Optional[float] = DEFAULT_TIMEOUT
+    ):
         """
         初始化LLM生成器
         
         Args:
             model_name: 要使用的模型名称，如果不指定则使用环境配置
             temperature: 生成温度，控制创造性，默认0.7
+            timeout: 同步方法等待生成结果的超时秒数，None 表示不限时
         """
         self.model = self._setup_model(model_name, temperature)
         self.temperature = temperature  # 保存温度参数作为类的属性
+        self.timeout = timeout
         logger.info(f"LLM内容生成器初始化完成，使用模型: {self.model}")
     
     def _setup_model(self, model_name: Optional[str], temperature: float) -> LiteLlm:
@@ -99,6 +73,27 @@ class LlmContentGenerator:
             logger.error("未找到有效的LLM服务配置，无法初始化LLM实例。请设置KINGDORA或ONEAPI相关环境变量。")
             raise RuntimeError("未找到有效的LLM服务配置，无法初始化LLM实例。请设置KINGDORA或ONEAPI相关环境变量。")
     
+    async def _acompletion(self, prompt: AssembledPrompt):
+        """
+        异步调用litellm，稳定前缀作为system消息并标记为可缓存
+        
+        同步方法通过fix_llm的常驻后台循环执行本方法，因此litellm缓存的
+        异步HTTP连接池始终绑定在同一个事件循环上。
+        
+        Args:
+            prompt: 组装好的提示词
+            
+        Returns:
+            litellm的响应对象
+        """
+        import litellm
+        return await litellm.acompletion(
+            model=self.model.model,
+            messages=build_messages(prompt),
+            temperature=self.temperature,  # 使用类属性而不是从model获取
+            cache_control_injection_points=CACHE_CONTROL_INJECTION_POINTS
+        )
+    
     async def generate_initial_draft(
         self, 
         material: str, 
@@ -116,7 +111,9 @@ class LlmContentGenerator:
         Returns:
             生成的文稿内容
         """
-        prompt = INITIAL_WRITING_PROMPT_TEMPLATE.format(
+        prompt = assemble_prompt(
+            INITIAL_WRITING_STABLE_TEMPLATE,
+            INITIAL_WRITING_VARIABLE_TEMPLATE,
             material=material,
             requirements=requirements,
             scoring_criteria=scoring_criteria
@@ -130,28 +127,11 @@ class LlmContentGenerator:
                 response = "由于当前使用字符串模型配置，无法进行异步调用。请在实际使用时提供完整的LLM实例。"
                 logger.warning("使用了字符串模型名称，无法执行实际生成。这是一个占位实现。")
             else:
-                # 使用配置好的LiteLlm实例 - 使用litellm.completion方法
-                try:
-                    # 创建消息格式
-                    messages = [{"role": "user", "content": prompt}]
-                    
-                    # 使用litellm的completion方法(异步版)
-                    response = await self.model.completion_async(
-                        model=self.model.model,
-                        messages=messages,
-                        temperature=self.temperature  # 使用类属性而不是从model获取
-                    )
-                except AttributeError:
-                    # 如果不存在异步方法，退回到使用同步方法
-                    logger.warning("LiteLLM对象未提供异步方法，回退到同步调用")
-                    import litellm
-                    response = litellm.completion(
-                        model=self.model.model,
-                        messages=messages,
-                        temperature=self.temperature  # 使用类属性而不是从model获取
-                    )
+                # 使用配置好的LiteLlm实例 - 使用litellm.acompletion方法
+                response = await self._acompletion(prompt)
                 
                 # 从标准格式中提取文本内容
+                record_usage(prompt, response)
                 response_text = response.choices[0].message.content if hasattr(response, 'choices') else str(response)
                 response = response_text
             
@@ -178,37 +158,14 @@ class LlmContentGenerator:
         Returns:
             生成的文稿内容
         """
-        prompt = INITIAL_WRITING_PROMPT_TEMPLATE.format(
-            material=material,
-            requirements=requirements,
-            scoring_criteria=scoring_criteria
-        )
-        
         logger.info("请求LLM同步生成初始文稿")
         try:
-            # 调用LLM生成内容
-            if isinstance(self.model, str):
-                # 使用ADK自身的LLM处理机制 - 这部分需要根据ADK的具体API调整
-                response = f"由于当前使用字符串模型配置({self.model})，无法进行同步调用。请在实际使用时提供完整的LLM实例。"
-                logger.warning(f"使用了字符串模型名称({self.model})，无法执行实际生成。这是一个占位实现。")
-            else:
-                # 使用配置好的LiteLlm实例，使用litellm.completion方法
-                import litellm
-                # 创建消息格式
-                messages = [{"role": "user", "content": prompt}]
-                
-                response = litellm.completion(
-                    model=self.model.model,
-                    messages=messages,
-                    temperature=self.temperature  # 使用类属性而不是从model获取
-                )
-                
-                # 从标准格式中提取文本内容
-                response_text = response.choices[0].message.content if hasattr(response, 'choices') else str(response)
-                response = response_text
-            
-            logger.info(f"成功生成初始文稿，长度: {len(response)}字符")
-            return response
+            # 在共享的后台事件循环中执行异步版本，复用其连接池
+            return run_async_in_thread(
+                self.generate_initial_draft,
+                material, requirements, scoring_criteria,
+                timeout=self.timeout
+            )
         except Exception as e:
             logger.error(f"同步生成初始文稿时出错: {e}", exc_info=True)
             return f"生成文稿失败: {e}。请重试或检查LLM配置。"
@@ -230,7 +187,9 @@ class LlmContentGenerator:
         Returns:
             改进后的文稿
         """
-        prompt = REVISION_PROMPT_TEMPLATE.format(
+        prompt = assemble_prompt(
+            REVISION_STABLE_TEMPLATE,
+            REVISION_VARIABLE_TEMPLATE,
             current_draft=current_draft,
             feedback=feedback,
             scoring_criteria=scoring_criteria
@@ -244,28 +203,11 @@ class LlmContentGenerator:
                 response = current_draft + "\n\n[此处为改进内容的占位符 - 实际使用时会替换为真实生成内容]"
                 logger.warning("使用了字符串模型名称，无法执行实际生成。返回占位内容。")
             else:
-                # 使用配置好的LiteLlm实例 - 使用litellm.completion方法
-                try:
-                    # 创建消息格式
-                    messages = [{"role": "user", "content": prompt}]
-                    
-                    # 使用litellm的completion方法(异步版)
-                    response = await self.model.completion_async(
-                        model=self.model.model,
-                        messages=messages,
-                        temperature=self.temperature  # 使用类属性而不是从model获取
-                    )
-                except AttributeError:
-                    # 如果不存在异步方法，退回到使用同步方法
-                    logger.warning("LiteLLM对象未提供异步方法，回退到同步调用")
-                    import litellm
-                    response = litellm.completion(
-                        model=self.model.model,
-                        messages=messages,
-                        temperature=self.temperature  # 使用类属性而不是从model获取
-                    )
+                # 使用配置好的LiteLlm实例 - 使用litellm.acompletion方法
+                response = await self._acompletion(prompt)
                 
                 # 从标准格式中提取文本内容
+                record_usage(prompt, response)
                 response_text = response.choices[0].message.content if hasattr(response, 'choices') else str(response)
                 response = response_text
             
@@ -292,37 +234,14 @@ class LlmContentGenerator:
         Returns:
             改进后的文稿
         """
-        prompt = REVISION_PROMPT_TEMPLATE.format(
-            current_draft=current_draft,
-            feedback=feedback,
-            scoring_criteria=scoring_criteria
-        )
-        
         logger.info("请求LLM同步改进文稿")
         try:
-            # 调用LLM生成内容
-            if isinstance(self.model, str):
-                # 使用ADK自身的LLM处理机制 - 占位实现
-                response = current_draft + f"\n\n[此处为改进内容的占位符 - 实际使用时会通过{self.model}替换为真实生成内容]"
-                logger.warning(f"使用了字符串模型名称({self.model})，无法执行实际生成。返回占位内容。")
-            else:
-                # 使用配置好的LiteLlm实例，使用litellm.completion方法
-                import litellm
-                # 创建消息格式
-                messages = [{"role": "user", "content": prompt}]
-                
-                response = litellm.completion(
-                    model=self.model.model,
-                    messages=messages,
-                    temperature=self.temperature  # 使用类属性而不是从model获取
-                )
-                
-                # 从标准格式中提取文本内容
-                response_text = response.choices[0].message.content if hasattr(response, 'choices') else str(response)
-                response = response_text
-            
-            logger.info(f"成功改进文稿，新长度: {len(response)}字符")
-            return response
+            # 在共享的后台事件循环中执行异步版本，复用其连接池
+            return run_async_in_thread(
+                self.improve_draft,
+                current_draft, feedback, scoring_criteria,
+                timeout=self.timeout
+            )
         except Exception as e:
             logger.error(f"同步改进文稿时出错: {e}", exc_info=True)
             return current_draft + f"\n\n[文稿同步改进失败: {e}]"
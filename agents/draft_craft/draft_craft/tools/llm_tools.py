@@ -11,18 +11,15 @@ from .state_manager import (
     CURRENT_FEEDBACK_KEY, ITERATION_COUNT_KEY, SCORE_THRESHOLD_KEY, IS_COMPLETE_KEY
 )
 from .logging_utils import log_generation_event, reset_llm_log, log_llm_generation
+from .prompt_cache import assemble_prompt
 
 logger = logging.getLogger(__name__)
 
 # 提示词模板
-INITIAL_WRITING_PROMPT_TEMPLATE = """
-你是一位专业文案写手。现在，请你基于以下素材和要求，撰写一篇高质量的文章：
-
-## 素材
-{material}
-
-## 写作要求
-{requirements}
+# 每个模板拆成稳定前缀（角色、评分标准、输出要求）和可变后缀（素材、文稿、反馈），
+# 稳定内容在前，便于provider侧前缀缓存在迭代和会话之间复用。
+INITIAL_WRITING_STABLE_TEMPLATE = """
+你是一位专业文案写手。请基于后面给出的写作要求和素材，撰写一篇高质量的文章。
 
 ## 评分标准
 {scoring_criteria}
@@ -36,14 +33,16 @@ INITIAL_WRITING_PROMPT_TEMPLATE = """
 直接输出正文内容，无需添加标题或额外说明。
 """
 
-REVISION_PROMPT_TEMPLATE = """
-你是一位专业文案写手。请基于以下反馈，改进现有文稿：
+INITIAL_WRITING_VARIABLE_TEMPLATE = """
+## 写作要求
+{requirements}
 
-## 当前文稿
-{current_draft}
+## 素材
+{material}
+"""
 
-## 评分反馈
-{feedback}
+REVISION_STABLE_TEMPLATE = """
+你是一位专业文案写手。请基于后面给出的评分反馈，改进现有文稿。
 
 ## 评分标准
 {scoring_criteria}
@@ -57,15 +56,20 @@ REVISION_PROMPT_TEMPLATE = """
 请输出完整的改进后文稿，而不只是修改建议。
 """
 
-SCORING_PROMPT_TEMPLATE = """
-你是一位专业文稿评审，需要根据评分标准对以下文稿进行评估。
+REVISION_VARIABLE_TEMPLATE = """
+## 评分反馈
+{feedback}
+
+## 当前文稿
+{current_draft}
+"""
+
+SCORING_STABLE_TEMPLATE = """
+你是一位专业文稿评审，需要根据评分标准对后面给出的文稿进行评估。
 
 ## 评分标准
 {scoring_criteria}
 
-## 待评文稿
-{draft}
-
 请按照以下格式进行评估：
 
 1. 首先给出一个0-10分的总体评分，精确到小数点后一位。
@@ -76,6 +80,16 @@ SCORING_PROMPT_TEMPLATE = """
 请仅输出最终评分和评价，无需重复上述指示或其他说明。
 """
 
+SCORING_VARIABLE_TEMPLATE = """
+## 待评文稿
+{draft}
+"""
+
+# 完整模板（稳定前缀 + 可变后缀）
+INITIAL_WRITING_PROMPT_TEMPLATE = INITIAL_WRITING_STABLE_TEMPLATE + INITIAL_WRITING_VARIABLE_TEMPLATE
+REVISION_PROMPT_TEMPLATE = REVISION_STABLE_TEMPLATE + REVISION_VARIABLE_TEMPLATE
+SCORING_PROMPT_TEMPLATE = SCORING_STABLE_TEMPLATE + SCORING_VARIABLE_TEMPLATE
+
 def generate_initial_draft(tool_context: ToolContext) -> Dict[str, Any]:
     """
     生成初始文稿，基于会话状态中的素材、要求和评分标准。
@@ -118,12 +132,15 @@ def generate_initial_draft(tool_context: ToolContext) -> Dict[str, Any]:
         
         logger.info(f"准备文稿生成。素材长度:{len(material)}，要求长度:{len(requirements)}，评分标准长度:{len(criteria)}")
         
-        # 构建提示词
-        prompt = INITIAL_WRITING_PROMPT_TEMPLATE.format(
+        # 构建提示词（评分标准等稳定内容在前）
+        assembled = assemble_prompt(
+            INITIAL_WRITING_STABLE_TEMPLATE,
+            INITIAL_WRITING_VARIABLE_TEMPLATE,
             material=material,
             requirements=requirements,
             scoring_criteria=criteria
         )
+        prompt = assembled.text
         
         # 存储并记录LLM提示词
         tool_context.state['LLM_LAST_PROMPT'] = prompt
@@ -141,6 +158,7 @@ def generate_initial_draft(tool_context: ToolContext) -> Dict[str, Any]:
             # 由Agent自己的LLM机制处理生成
             
             # 直接将提示词作为结果返回，供Agent处理
+            logger.debug("提示词cache_key: %s", assembled.cache_key)
             return {
                 "status": "llm_prompt_ready",
                 "prompt": prompt,
@@ -175,29 +193,25 @@ def save_draft_result(content: str, tool_context: ToolContext) -> Dict[str, Any]
     Returns:
         dict: 包含操作状态和文稿摘要的字典
     """
-    logger.info("保存LLM生成的文稿内容...")
-    logger.info(f"接收到的文稿内容摘要: {content[:100]}..., 长度: {len(content)}")
-    logger.info(f"Tool Context 状态对象是否存在: {tool_context.state is not None}")
-    logger.info(f"Tool Context 状态类型: {type(tool_context.state)}")
-    logger.info(f"Tool Context 状态内容: {str(tool_context.state)[:200]}...")
+    logger.info("保存LLM生成的文稿内容，长度: %d", len(content))
+    logger.debug("接收到的文稿内容摘要: %.100s...", content)
     
     try:
         # 使用状态管理器
         state_manager = StateManager(tool_context)
-        logger.info(f"StateManager初始化完成，状态对象: {state_manager.state is not None}")
         
         # 获取当前迭代计数
-        iteration_count = state_manager.get(ITERATION_COUNT_KEY, 0)
+        iteration_count = state_manager.get_int(ITERATION_COUNT_KEY, 0)
         
         # 保存文稿内容
         save_result = state_manager.store_draft_efficiently(content)
-        logger.info(f"文稿保存结果: {save_result}")
+        logger.debug("文稿保存结果: %s", save_result)
         
         # 每次保存文稿都递增iteration_count
         state_manager.set(ITERATION_COUNT_KEY, iteration_count + 1)
         
         # 再次检查保存是否成功
-        current_draft = state_manager.get(CURRENT_DRAFT_KEY)
+        current_draft = state_manager.get_str(CURRENT_DRAFT_KEY)
         if not current_draft:
             # 备用保存方式：直接使用工具上下文保存
             logger.warning("使用StateManager保存失败，尝试备用直接保存方式")
@@ -215,16 +229,7 @@ def save_draft_result(content: str, tool_context: ToolContext) -> Dict[str, Any]
                 iteration_count = tool_context.state.get(ITERATION_COUNT_KEY, 1)
         
         if save_result:
-            logger.info(f"成功将文稿（{len(content)}字符）保存到状态。")
-            
-            # 再次检查保存是否成功
-            saved_draft = None
-            if state_manager.state.get(CURRENT_DRAFT_KEY):
-                saved_draft = state_manager.state.get(CURRENT_DRAFT_KEY)
-            elif tool_context.state.get(CURRENT_DRAFT_KEY):
-                saved_draft = tool_context.state.get(CURRENT_DRAFT_KEY)
-                
-            logger.info(f"验证保存: 保存后的文稿长度 = {len(saved_draft) if saved_draft else 0}")
+            logger.info("成功将文稿（%d字符）保存到状态。", len(content))
             
             # 记录生成事件
             log_generation_event("draft_saved", {
@@ -310,16 +315,19 @@ def generate_draft_scoring(tool_context: ToolContext) -> Dict[str, Any]:
         
         logger.info(f"准备文稿评分。文稿长度:{len(draft)}，评分标准长度:{len(criteria)}")
         
-        # 构建提示词
-        prompt = SCORING_PROMPT_TEMPLATE.format(
+        # 构建提示词（评分标准在前，文稿在后）
+        assembled = assemble_prompt(
+            SCORING_STABLE_TEMPLATE,
+            SCORING_VARIABLE_TEMPLATE,
             draft=draft,
             scoring_criteria=criteria
         )
         
         # 直接将提示词作为结果返回，供Agent处理
+        logger.debug("提示词cache_key: %s", assembled.cache_key)
         return {
             "status": "llm_prompt_ready",
-            "prompt": prompt,
+            "prompt": assembled.text,
             "action": "scoring"
         }
             
@@ -32,7 +32,8 @@ def log_state_operation(
     key: str, 
     value: Any = None, 
     metadata: Optional[Dict[str, Any]] = None,
-    truncate_length: int = 200
+    truncate_length: int = 200,
+    level: int = logging.INFO
 ):
     """
     记录状态操作的结构化日志
@@ -43,6 +44,7 @@ def log_state_operation(
         value: 操作的值（可选）
         metadata: 额外元数据（可选）
         truncate_length: 值截断长度，避免过长日志
+        level: 日志级别，未开启该级别时跳过JSON序列化
     """
     log_data = {
         "timestamp": datetime.now().isoformat(),
@@ -71,8 +73,9 @@ def log_state_operation(
     if metadata:
         log_data["metadata"] = metadata
     
-    # 记录结构化日志
-    logger.info(f"状态操作: {json.dumps(log_data, ensure_ascii=False)}")
+    # 记录结构化日志，仅在对应级别开启时才序列化
+    if logger.isEnabledFor(level):
+        logger.log(level, "状态操作: %s", json.dumps(log_data, ensure_ascii=False))
     
     return log_data
 
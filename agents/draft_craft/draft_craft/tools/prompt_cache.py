@@ -0,0 +1,139 @@
+"""Prompt组装层：稳定内容前置，计算前缀cache key，并统计provider侧缓存命中。"""
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 传给 LiteLlm / litellm.completion，让 system 消息（稳定前缀）被标记为可缓存。
+# OpenAI 等自动前缀缓存的 provider 会忽略该参数。
+CACHE_CONTROL_INJECTION_POINTS = [{"location": "message", "role": "system"}]
+
+
+@dataclass(frozen=True)
+class AssembledPrompt:
+    """按稳定前缀 + 可变后缀组装的提示词。"""
+    stable_prefix: str
+    variable_suffix: str
+    cache_key: str
+
+    @property
+    def text(self) -> str:
+        """完整提示词文本，稳定前缀在前。"""
+        return self.stable_prefix + self.variable_suffix
+
+
+@dataclass(frozen=True)
+class PromptUsage:
+    """单次调用的token用量，区分缓存命中与未命中部分。"""
+    cache_key: str
+    prompt_tokens: int
+    cached_tokens: int
+
+    @property
+    def uncached_tokens(self) -> int:
+        return max(self.prompt_tokens - self.cached_tokens, 0)
+
+
+def compute_cache_key(stable_prefix: str) -> str:
+    """对稳定前缀计算cache key。"""
+    return hashlib.sha256(stable_prefix.encode("utf-8")).hexdigest()[:16]
+
+
+def assemble_prompt(stable_template: str, variable_template: str, **values: Any) -> AssembledPrompt:
+    """
+    用同一组变量分别填充稳定模板和可变模板
+
+    Args:
+        stable_template: 只引用跨迭代/会话不变内容的模板（评分标准、受众画像等）
+        variable_template: 引用文稿等每次变化内容的模板
+        **values: 模板变量
+
+    Returns:
+        AssembledPrompt: 组装结果
+    """
+    stable_prefix = stable_template.format(**values)
+    return AssembledPrompt(
+        stable_prefix=stable_prefix,
+        variable_suffix=variable_template.format(**values),
+        cache_key=compute_cache_key(stable_prefix),
+    )
+
+
+def build_messages(prompt: AssembledPrompt) -> List[Dict[str, str]]:
+    """稳定前缀作为system消息，可变部分作为user消息。"""
+    return [
+        {"role": "system", "content": prompt.stable_prefix},
+        {"role": "user", "content": prompt.variable_suffix},
+    ]
+
+
+class PromptCacheStats:
+    """进程内按cache key聚合的缓存/未缓存token统计。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def record(self, usage: PromptUsage) -> None:
+        with self._lock:
+            entry = self._stats.setdefault(
+                usage.cache_key, {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0}
+            )
+            entry["calls"] += 1
+            entry["prompt_tokens"] += usage.prompt_tokens
+            entry["cached_tokens"] += usage.cached_tokens
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                key: dict(entry, uncached_tokens=entry["prompt_tokens"] - entry["cached_tokens"])
+                for key, entry in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+prompt_cache_stats = PromptCacheStats()
+
+
+def _usage_value(obj: Any, name: str) -> Any:
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def record_usage(prompt: AssembledPrompt, response: Any) -> Optional[PromptUsage]:
+    """
+    从litellm响应的usage中提取缓存与未缓存token数，记录日志和统计
+
+    Args:
+        prompt: 本次调用的提示词
+        response: litellm.completion 的返回值
+
+    Returns:
+        PromptUsage: 本次调用的token统计；响应中没有usage时返回None
+    """
+    usage = _usage_value(response, "usage")
+    if usage is None:
+        return None
+    details = _usage_value(usage, "prompt_tokens_details")
+    prompt_usage = PromptUsage(
+        cache_key=prompt.cache_key,
+        prompt_tokens=_usage_value(usage, "prompt_tokens") or 0,
+        cached_tokens=_usage_value(details, "cached_tokens") or 0,
+    )
+    prompt_cache_stats.record(prompt_usage)
+    logger.info(
+        "Prompt缓存统计: cache_key=%s prompt_tokens=%d cached=%d uncached=%d",
+        prompt_usage.cache_key, prompt_usage.prompt_tokens,
+        prompt_usage.cached_tokens, prompt_usage.uncached_tokens
+    )
+    return prompt_usage
@@ -5,6 +5,7 @@ import re
 from google.adk.tools.tool_context import ToolContext
 
 from .logging_utils import log_generation_event
+from .prompt_cache import assemble_prompt
 from .state_manager import (
     StateManager, CURRENT_SCORE_KEY, CURRENT_FEEDBACK_KEY, 
     IS_COMPLETE_KEY, SCORE_THRESHOLD_KEY
@@ -16,16 +17,18 @@ logger = logging.getLogger(__name__)
 # 评分工具：面向"中等家长"受众
 
 # 评分提示词模板
-PARENTS_SCORING_PROMPT_TEMPLATE = """
+# 受众画像、评分标准和评分要求对同一受众长期不变，作为稳定前缀放在前面；
+# 待评文稿放在最后，便于provider侧前缀缓存在迭代和会话之间复用。
+PARENTS_SCORING_STABLE_TEMPLATE = """
 你现在要扮演一位中等受教育水平、经济中等以上的家长，孩子处于小学高年级至高中一年级阶段。
-请严格按照以下要点对下方文章进行评分和反馈：
+请严格按照以下要点对最后给出的待评文稿进行评分和反馈：
+
+## 受众画像描述
+{audience_profile}
 
 ## 评分标准
 {scoring_criteria}
 
-## 待评文章
-{draft_content}
-
 【评分要求】
 - 分数（0-100之间的整数）：请基于内容相关性、案例丰富度、结构清晰度、语言实用性和家长关注点给出。
 - 详细评价（200-300字）：综合分析文章的优缺点，并给出具体可操作的改进建议，涵盖案例、结构、语言等关键方面。
@@ -34,6 +37,13 @@ PARENTS_SCORING_PROMPT_TEMPLATE = """
 请从目标家长的视角出发，以清晰、简洁的格式输出这三部分内容，不要添加其他多余说明或编号列表。
 """
 
+PARENTS_SCORING_VARIABLE_TEMPLATE = """
+## 待评文稿
+{draft_content}
+"""
+
+PARENTS_SCORING_PROMPT_TEMPLATE = PARENTS_SCORING_STABLE_TEMPLATE + PARENTS_SCORING_VARIABLE_TEMPLATE
+
 def score_for_parents(
     draft_content: str,
     audience_profile: str,
@@ -67,11 +77,14 @@ def score_for_parents(
         }
         
     # 构建提示词
-    prompt = PARENTS_SCORING_PROMPT_TEMPLATE.format(
+    assembled = assemble_prompt(
+        PARENTS_SCORING_STABLE_TEMPLATE,
+        PARENTS_SCORING_VARIABLE_TEMPLATE,
         audience_profile=audience_profile,
         scoring_criteria=scoring_criteria,
         draft_content=draft_content
     )
+    prompt = assembled.text
     
     # 如果提供了工具上下文，记录评分事件
     if tool_context:
@@ -83,6 +96,7 @@ def score_for_parents(
         })
     print("[SCORING_DEBUG] score_for_parents prompt:", prompt[:200])
     # 返回提示词，供Agent处理
+    logger.debug("提示词cache_key: %s", assembled.cache_key)
     return {
         "status": "llm_prompt_ready",
         "prompt": prompt,
@@ -1,6 +1,7 @@
 """状态管理工具，优化变量传递和数据验证。"""
 
 import logging
+import os
 from typing import Any, Dict, List, Optional, Union
 from google.adk.tools.tool_context import ToolContext
 
@@ -18,6 +19,15 @@ CURRENT_FEEDBACK_KEY = "current_feedback"
 SCORE_THRESHOLD_KEY = "score_threshold"
 ITERATION_COUNT_KEY = "iteration_count"
 IS_COMPLETE_KEY = "is_complete"
+MAX_ITERATIONS_KEY = "max_iterations"
+
+# 收敛控制相关键名
+SCORE_HISTORY_KEY = "score_history"
+BEST_SCORE_KEY = "best_score"
+BEST_DRAFT_KEY = "best_draft"
+BEST_FEEDBACK_KEY = "best_feedback"
+CONVERGENCE_PATIENCE_KEY = "convergence_patience"
+CONVERGENCE_MIN_DELTA_KEY = "convergence_min_delta"
 
 # 定义数据类型验证映射
 TYPE_VALIDATORS = {
@@ -29,21 +39,53 @@ TYPE_VALIDATORS = {
     CURRENT_FEEDBACK_KEY: str,
     SCORE_THRESHOLD_KEY: float,
     ITERATION_COUNT_KEY: int,
-    IS_COMPLETE_KEY: bool
+    IS_COMPLETE_KEY: bool,
+    MAX_ITERATIONS_KEY: int,
+    SCORE_HISTORY_KEY: list,
+    BEST_SCORE_KEY: float,
+    BEST_DRAFT_KEY: str,
+    BEST_FEEDBACK_KEY: str
 }
 
+# 审计模式开关：设置为 true 时所有 StateManager 默认开启审计
+STATE_AUDIT_ENV = "DRAFT_CRAFT_STATE_AUDIT"
+
+
+def _audit_enabled_by_env() -> bool:
+    return os.getenv(STATE_AUDIT_ENV, "false").lower() in ("1", "true", "yes")
+
+
 class StateManager:
-    """状态管理器，提供安全的状态访问和验证。"""
+    """状态管理器，提供安全的状态访问和验证。
+
+    默认走低开销路径：读写不做回读校验，状态操作日志仅在 DEBUG 级别开启时才构建。
+    审计模式（``audit=True`` 或环境变量 ``DRAFT_CRAFT_STATE_AUDIT=true``）下，
+    每次操作都会以 INFO 级别记录结构化日志，写入后回读校验，并追加到 ``audit_log``。
+    """
     
-    def __init__(self, tool_context: ToolContext):
+    def __init__(self, tool_context: ToolContext, audit: Optional[bool] = None):
         """
         初始化状态管理器
         
         Args:
             tool_context: ADK工具上下文
+            audit: 是否开启审计模式，None 时由环境变量决定
         """
         self.tool_context = tool_context
         self.state = tool_context.state
+        self.audit = _audit_enabled_by_env() if audit is None else audit
+        self.audit_log: List[Dict[str, Any]] = []
+
+    def _should_log(self) -> bool:
+        """仅在审计模式或 DEBUG 级别开启时才记录状态操作。"""
+        return self.audit or logger.isEnabledFor(logging.DEBUG)
+
+    def _record(self, operation: str, key: str, value: Any = None,
+                metadata: Optional[Dict[str, Any]] = None) -> None:
+        level = logging.INFO if self.audit else logging.DEBUG
+        log_data = log_state_operation(operation, key, value, metadata, level=level)
+        if self.audit:
+            self.audit_log.append(log_data)
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -57,13 +99,40 @@ class StateManager:
             存储的值或默认值
         """
         value = self.state.get(key, default)
-        log_state_operation("read", key, value, 
-                           {"exists": key in self.state, "type": type(value).__name__})
+        if self._should_log():
+            self._record("read", key, value,
+                         {"exists": key in self.state, "type": type(value).__name__})
+        return value
+
+    def get_str(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """读取字符串类型的状态值，类型不符时返回默认值。"""
+        value = self.state.get(key)
+        return value if isinstance(value, str) else default
+
+    def get_float(self, key: str, default: Optional[float] = None) -> Optional[float]:
+        """读取数值类型的状态值并转换为 float，类型不符时返回默认值。"""
+        value = self.state.get(key)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return default
+        return float(value)
+
+    def get_int(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        """读取整数类型的状态值，类型不符时返回默认值。"""
+        value = self.state.get(key)
+        if isinstance(value, bool) or not isinstance(value, int):
+            return default
         return value
+
+    def get_bool(self, key: str, default: Optional[bool] = None) -> Optional[bool]:
+        """读取布尔类型的状态值，类型不符时返回默认值。"""
+        value = self.state.get(key)
+        return value if isinstance(value, bool) else default
     
     def set(self, key: str, value: Any) -> bool:
         """
         设置状态值，带类型验证和日志记录
+
+        仅在审计模式下写入后回读校验。
         
         Args:
             key: 状态键名
@@ -72,31 +141,24 @@ class StateManager:
         Returns:
             bool: 操作是否成功
         """
-        # 输出更详细的日志
-        logger.info(f"设置状态值: 键='{key}', 值类型={type(value).__name__}, 值长度={len(value) if hasattr(value, '__len__') else '不可计算'}")
-        logger.info(f"状态对象类型: {type(self.state)}, 状态对象ID: {id(self.state)}")
-        
         # 类型验证
         expected_type = TYPE_VALIDATORS.get(key)
         if expected_type and not isinstance(value, expected_type):
-            logger.error(f"类型验证失败：键'{key}'预期类型{expected_type.__name__}，实际为{type(value).__name__}")
+            logger.error("类型验证失败：键'%s'预期类型%s，实际为%s",
+                         key, expected_type.__name__, type(value).__name__)
             return False
         
-        # 写入前状态
-        had_key = key in self.state
-        logger.info(f"写入前状态: 键'{key}'存在={had_key}")
-        
         # 写入状态
         self.state[key] = value
-        
-        # 验证写入
-        if self.state.get(key) == value:
-            log_state_operation("write", key, value, {"type": type(value).__name__})
-            logger.info(f"键'{key}'写入成功，验证通过")
-            return True
-        else:
-            logger.error(f"状态验证失败：键'{key}'的写入验证不匹配")
-            return False
+
+        if self.audit:
+            # 审计模式：回读验证写入
+            if self.state.get(key) != value:
+                logger.error("状态验证失败：键'%s'的写入验证不匹配", key)
+                return False
+        if self._should_log():
+            self._record("write", key, value, {"type": type(value).__name__})
+        return True
     
     def update(self, values: Dict[str, Any]) -> Dict[str, bool]:
         """
@@ -124,13 +186,13 @@ class StateManager:
         Returns:
             bool: 操作是否成功
         """
-        if key in self.state:
-            log_state_operation("delete", key, metadata={"exists": True})
+        exists = key in self.state
+        if self._should_log():
+            self._record("delete", key, metadata={"exists": exists})
+        if exists:
             del self.state[key]
             return key not in self.state
-        else:
-            log_state_operation("delete", key, metadata={"exists": False})
-            return True
+        return True
     
     def validate_required_keys(self, required_keys: List[str]) -> Dict[str, Any]:
         """
@@ -162,7 +224,8 @@ class StateManager:
         """
         高效存储文稿内容，避免重复
         
-        可以在这里添加压缩或引用优化等功能
+        先比较对象身份和长度，只有长度一致时才做完整内容比较；
+        写入后不再回读文稿（审计模式下由 set 负责校验）。
         
         Args:
             draft: 文稿内容
@@ -170,32 +233,26 @@ class StateManager:
         Returns:
             bool: 操作是否成功
         """
-        logger.info(f"开始存储文稿，长度: {len(draft)}")
+        logger.debug("开始存储文稿，长度: %d", len(draft))
         
-        # 检查当前是否已有文稿
-        current_draft = self.get(CURRENT_DRAFT_KEY)
-        if current_draft:
-            logger.info(f"当前已存在文稿，长度: {len(current_draft)}")
-            # 比较是否相同
-            if current_draft == draft:
-                logger.info("新文稿与现有文稿相同，不需要重复存储")
-                return True
+        # 检查当前是否已有相同文稿
+        current_draft = self.state.get(CURRENT_DRAFT_KEY)
+        if current_draft is draft or (
+            isinstance(current_draft, str)
+            and len(current_draft) == len(draft)
+            and current_draft == draft
+        ):
+            logger.debug("新文稿与现有文稿相同，不需要重复存储")
+            return True
         
         # 存储文稿
         result = self.set(CURRENT_DRAFT_KEY, draft)
         
         # 确保迭代计数也被正确设置
-        iteration = self.get(ITERATION_COUNT_KEY, 0)
-        if iteration == 0:
-            logger.info("首次存储文稿，设置迭代计数为1")
+        if result and not self.state.get(ITERATION_COUNT_KEY, 0):
+            logger.debug("首次存储文稿，设置迭代计数为1")
             self.set(ITERATION_COUNT_KEY, 1)
         
-        # 再次验证是否存储成功
-        if result:
-            logger.info(f"文稿存储成功，验证状态: 键'{CURRENT_DRAFT_KEY}'存在={CURRENT_DRAFT_KEY in self.state}")
-            saved_draft = self.get(CURRENT_DRAFT_KEY)
-            logger.info(f"保存后的文稿长度: {len(saved_draft) if saved_draft else 0}")
-        
         return result
     
     def get_draft_metadata(self) -> Dict[str, Any]:
@@ -205,9 +262,9 @@ class StateManager:
         Returns:
             Dict: 包含文稿元数据的字典
         """
-        draft = self.get(CURRENT_DRAFT_KEY)
+        draft = self.state.get(CURRENT_DRAFT_KEY)
         return {
             "exists": draft is not None,
             "length": len(draft) if draft else 0,
             "preview": draft[:100] + "..." if draft and len(draft) > 100 else draft
-        } 
\ No newline at end of file
+        }
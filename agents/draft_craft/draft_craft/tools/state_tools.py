@@ -20,9 +20,14 @@ from google.adk.tools import ToolContext
 from .state_manager import (
     StateManager, INITIAL_MATERIAL_KEY, INITIAL_REQUIREMENTS_KEY, 
     INITIAL_SCORING_CRITERIA_KEY, CURRENT_DRAFT_KEY, CURRENT_SCORE_KEY,
-    CURRENT_FEEDBACK_KEY, SCORE_THRESHOLD_KEY, ITERATION_COUNT_KEY, IS_COMPLETE_KEY
+    CURRENT_FEEDBACK_KEY, SCORE_THRESHOLD_KEY, ITERATION_COUNT_KEY, IS_COMPLETE_KEY,
+    MAX_ITERATIONS_KEY
 )
 from .logging_utils import log_generation_event
+from .convergence import ConvergenceController, convergence_stats
+
+# 默认最大迭代轮数
+DEFAULT_MAX_ITERATIONS = 5
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +123,70 @@ def store_initial_data(
         return {"status": "error", "message": f"由于错误无法存储初始数据: {e}"}
 
 
+def check_progress(tool_context: ToolContext) -> dict:
+    """
+    检查写作进度，决定是继续迭代还是结束流程。
+    
+    在以下任一情况下结束：分数达到阈值、达到最大迭代轮数，
+    或分数连续若干轮停滞/回退（可通过convergence_patience和convergence_min_delta配置）。
+    结束时如果当前文稿不是历史最佳，会回滚到得分最高的文稿。
+    
+    Args:
+        tool_context: ADK工具上下文，提供对会话状态的访问。
+    
+    Returns:
+        dict: 'status'为'continue'或'done'；结束时包含'reason'。
+    """
+    try:
+        state_manager = StateManager(tool_context)
+        score = state_manager.get_float(CURRENT_SCORE_KEY)
+        threshold = state_manager.get_float(SCORE_THRESHOLD_KEY, 8.5)
+        iteration = state_manager.get_int(ITERATION_COUNT_KEY, 0)
+        max_iterations = state_manager.get_int(MAX_ITERATIONS_KEY, DEFAULT_MAX_ITERATIONS)
+        if max_iterations <= 0:
+            max_iterations = DEFAULT_MAX_ITERATIONS
+
+        if score is None:
+            logger.warning("会话状态中没有有效分数，继续迭代。")
+            return {"status": "continue", "message": "尚未评分，需要继续：请先对当前文稿评分。"}
+
+        controller = ConvergenceController.from_state(state_manager)
+        decision = controller.observe(state_manager, iteration, score)
+
+        if score >= threshold:
+            reason = "score_passed"
+        elif iteration >= max_iterations:
+            reason = "max_iterations"
+        elif decision.stop:
+            reason = decision.reason
+        else:
+            logger.info("继续迭代: 第%d轮，分数%s，阈值%s", iteration, score, threshold)
+            return {
+                "status": "continue",
+                "iteration": iteration,
+                "score": score,
+                "message": f"分数{score}未达到阈值{threshold}，需要继续改进文稿。"
+            }
+
+        rolled_back = controller.rollback_to_best(state_manager)
+        iterations_saved = max(max_iterations - iteration, 0) if reason in ("plateau", "regression") else 0
+        convergence_stats.record(reason, iterations_saved)
+        state_manager.set(IS_COMPLETE_KEY, True)
+        logger.info("流程结束: reason=%s, 第%d轮, 节省%d轮", reason, iteration, iterations_saved)
+        return {
+            "status": "done",
+            "reason": reason,
+            "iteration": iteration,
+            "best_score": decision.best_score,
+            "rolled_back": rolled_back,
+            "iterations_saved": iterations_saved,
+            "message": "流程终止，请调用get_final_draft获取最终文稿。"
+        }
+    except Exception as e:
+        logger.error(f"检查进度时出错: {e}", exc_info=True)
+        return {"status": "error", "message": f"检查进度时出错: {e}"}
+
+
 def get_final_draft(tool_context: ToolContext) -> dict:
     """
     从会话状态获取最终草稿文本。
@@ -25,52 +25,14 @@ from .state_manager import (
     CURRENT_FEEDBACK_KEY, ITERATION_COUNT_KEY, IS_COMPLETE_KEY
 )
 from .logging_utils import log_generation_event, log_llm_generation # Keep log_llm_generation for prompt logging
+from .llm_tools import (
+    INITIAL_WRITING_STABLE_TEMPLATE, INITIAL_WRITING_VARIABLE_TEMPLATE,
+    REVISION_STABLE_TEMPLATE, REVISION_VARIABLE_TEMPLATE
+)
+from .prompt_cache import assemble_prompt
 
 logger = logging.getLogger(__name__)
 
-# 提示词模板 (Moved from llm_tools.py)
-INITIAL_WRITING_PROMPT_TEMPLATE = """
-你是一位专业文案写手。现在，请你基于以下素材和要求，撰写一篇高质量的文章：
-
-## 素材
-{material}
-
-## 写作要求
-{requirements}
-
-## 评分标准
-{scoring_criteria}
-
-请确保你的文稿:
-1. 符合写作要求的主题和目标
-2. 满足评分标准的要求
-3. 具有清晰的结构和流畅的逻辑
-4. 语言准确、简洁、易于理解
-
-直接输出正文内容，无需添加标题或额外说明。
-"""
-
-REVISION_PROMPT_TEMPLATE = """
-你是一位专业文案写手。请基于以下反馈，改进现有文稿：
-
-## 当前文稿
-{current_draft}
-
-## 评分反馈
-{feedback}
-
-## 评分标准
-{scoring_criteria}
-
-## 改进指南
-1. 认真分析评分反馈，找出需要改进的地方
-2. 保留原文稿的优点和核心内容
-3. 针对性地修改和补充内容
-4. 确保修改后的文稿更符合评分标准
-
-请输出完整的改进后文稿，而不只是修改建议。
-"""
-
 def write_draft(tool_context: ToolContext) -> dict:
     """
     生成写作或改进文稿的提示词。
@@ -104,11 +66,14 @@ def write_draft(tool_context: ToolContext) -> dict:
                  logger.error(f"缺少生成初始文稿提示词所需的键: {missing}")
                  return {"status": "error", "message": f"缺少初始数据: {', '.join(missing)}"}
 
-            prompt = INITIAL_WRITING_PROMPT_TEMPLATE.format(
+            assembled = assemble_prompt(
+                INITIAL_WRITING_STABLE_TEMPLATE,
+                INITIAL_WRITING_VARIABLE_TEMPLATE,
                 material=material,
                 requirements=requirements,
                 scoring_criteria=criteria
             )
+            prompt = assembled.text
             action = "initial_writing"
             log_generation_event("initial_prompt_generated", {"preview": prompt[:100]}, {"length": len(prompt)})
 
@@ -117,11 +82,14 @@ def write_draft(tool_context: ToolContext) -> dict:
             logger.info(f"生成改进文稿的提示词 (迭代 {iteration_count})...")
             criteria = state_manager.get(INITIAL_SCORING_CRITERIA_KEY, "") # 获取评分标准用于提示词
 
-            prompt = REVISION_PROMPT_TEMPLATE.format(
+            assembled = assemble_prompt(
+                REVISION_STABLE_TEMPLATE,
+                REVISION_VARIABLE_TEMPLATE,
                 current_draft=current_draft,
                 feedback=feedback if feedback else "没有具体反馈，请对文稿进行一般性改进，使其更全面、更有深度。",
                 scoring_criteria=criteria
             )
+            prompt = assembled.text
             action = "revision_writing"
             log_generation_event("revision_prompt_generated", {"preview": prompt[:100]}, {"length": len(prompt)})
 
@@ -130,6 +98,7 @@ def write_draft(tool_context: ToolContext) -> dict:
         log_llm_generation(iteration_count, prompt, "", tool_name="write_draft")
         tool_context.state['LLM_LAST_PROMPT'] = prompt # 保存最后生成的提示词，供save_draft_result记录
 
+        logger.debug("提示词cache_key: %s", assembled.cache_key)
         return {
             "status": "llm_prompt_ready",
             "prompt": prompt,
@@ -15,60 +15,38 @@
 """Callback functions for FOMC Research Agent."""
 
 import logging
-import time
 
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.models import LlmRequest
 
+from . import rate_limiter
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
-# Adjust these values to limit the rate at which the agent
-# queries the LLM API.
-RATE_LIMIT_SECS = 60
-RPM_QUOTA = 1000
-
 
-def rate_limit_callback(
+async def rate_limit_callback(
     callback_context: CallbackContext, llm_request: LlmRequest
 ) -> None:
     # pylint: disable=unused-argument
     """Callback function that implements a query rate limit.
 
+    All sessions share one token bucket per model, allowing
+    rate_limiter.RPM_QUOTA requests every rate_limiter.RATE_LIMIT_SECS. A request over quota awaits its turn
+    instead of blocking the event loop.
+
     Args:
       callback_context: A CallbackContext object representing the active
               callback context.
       llm_request: A LlmRequest object representing the active LLM request.
     """
-    now = time.time()
-    if "timer_start" not in callback_context.state:
-        callback_context.state["timer_start"] = now
-        callback_context.state["request_count"] = 1
-        logger.debug(
-            "rate_limit_callback [timestamp: %i, req_count: 1, "
-            "elapsed_secs: 0]",
-            now,
-        )
-        return
-
-    request_count = callback_context.state["request_count"] + 1
-    elapsed_secs = now - callback_context.state["timer_start"]
+    model = llm_request.model or "default"
+    limiter = rate_limiter.get_rate_limiter()
+    waited = await limiter.acquire(model)
     logger.debug(
-        "rate_limit_callback [timestamp: %i, request_count: %i,"
-        " elapsed_secs: %i]",
-        now,
-        request_count,
-        elapsed_secs,
+        "rate_limit_callback [agent: %s, model: %s, waited_secs: %.2f]",
+        callback_context.agent_name,
+        model,
+        waited,
     )
-
-    if request_count > RPM_QUOTA:
-        delay = RATE_LIMIT_SECS - elapsed_secs + 1
-        if delay > 0:
-            logger.debug("Sleeping for %i seconds", delay)
-            time.sleep(delay)
-        callback_context.state["timer_start"] = now
-        callback_context.state["request_count"] = 1
-    else:
-        callback_context.state["request_count"] = request_count
-
     return
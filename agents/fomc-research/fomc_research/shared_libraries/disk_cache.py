@@ -0,0 +1,100 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bounds for flat, file-per-entry disk caches.
+
+Each entry is one file named `<key><suffix>` in the cache directory. Use is
+tracked by the file's modification time, which readers bump on every hit
+with mark_used(). prune() drops entries unused for longer than the TTL and
+then the least recently used ones until the total size fits, like the
+eviction in http_cache.
+"""
+
+import logging
+import os
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def mark_used(path: str) -> None:
+    """Marks the entry at `path` as most recently used."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def is_expired(
+    path: str, ttl_seconds: Optional[float], now: Optional[float] = None
+) -> bool:
+    """Whether the entry at `path` has been unused for longer than the TTL."""
+    if ttl_seconds is None:
+        return False
+    try:
+        used_at = os.stat(path).st_mtime
+    except OSError:
+        return True
+    return (now if now is not None else time.time()) - used_at > ttl_seconds
+
+
+def prune(
+    cache_dir: str,
+    suffix: str,
+    max_bytes: Optional[int],
+    ttl_seconds: Optional[float],
+    keep: Optional[str] = None,
+    now: Optional[float] = None,
+) -> None:
+    """Drops expired and least recently used entries from `cache_dir`.
+
+    Args:
+      cache_dir: The cache directory.
+      suffix: File name suffix of the entries; other files are left alone.
+      max_bytes: Maximum total size of the entries, None for no limit.
+      ttl_seconds: Maximum time since last use, None for no limit.
+      keep: Path of an entry that is never dropped (the one just written).
+      now: The current time, for tests.
+    """
+    now = now if now is not None else time.time()
+    entries = []
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+    for name in names:
+        if not name.endswith(suffix):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for used_at, size, path in entries:
+        expired = ttl_seconds is not None and now - used_at > ttl_seconds
+        too_big = max_bytes is not None and total > max_bytes
+        if not (expired or too_big):
+            continue
+        if keep is not None and os.path.abspath(path) == os.path.abspath(keep):
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        logger.debug("Evicted cache entry %s", path)
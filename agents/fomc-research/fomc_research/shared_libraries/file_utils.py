@@ -16,20 +16,25 @@
 
 import base64
 import binascii
-import io
 import logging
 import mimetypes
 from collections.abc import Sequence
 
-import diff_match_patch as dmp
-import pdfplumber
 import requests
 from absl import app
 from google.adk.tools import ToolContext
 from google.genai.types import Blob, Part
 
+from . import http_cache, pdf_extraction, redline
+
 logger = logging.getLogger(__name__)
 
+_PDF_MAGIC = b"%PDF"
+_BASE64_PROBE_BYTES = 1024
+_BASE64_ALPHABET = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+)
+
 
 def download_file_from_url(
     url: str, output_filename: str, tool_context: ToolContext
@@ -46,16 +51,19 @@ def download_file_from_url(
     """
     logger.info("Downloading %s to %s", url, output_filename)
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
+        result = http_cache.get_http_client().fetch(url)
 
-        file_bytes = base64.b64encode(response.content)
-        mime_type = response.headers.get(
-            "Content-Type", mimetypes.guess_type(url)
+        mime_type = result.content_type or mimetypes.guess_type(url)[0]
+        artifact = Part(
+            inline_data=Blob(data=result.content, mime_type=mime_type)
         )
-        artifact = Part(inline_data=Blob(data=file_bytes, mime_type=mime_type))
         tool_context.save_artifact(filename=output_filename, artifact=artifact)
-        logger.info("Downloaded %s to artifact %s", url, output_filename)
+        logger.info(
+            "Downloaded %s to artifact %s (cached=%s)",
+            url,
+            output_filename,
+            result.from_cache,
+        )
         return output_filename
 
     except requests.exceptions.RequestException as e:
@@ -63,45 +71,47 @@ def download_file_from_url(
         return None
 
 
+def load_binary_artifact(artifact: Part) -> memoryview:
+    """Returns the raw bytes of a binary artifact without copying them.
+
+    Artifacts are stored as raw bytes. Artifacts saved by earlier versions of
+    download_file_from_url hold base64 text instead; those are decoded here.
+
+    Raises:
+      binascii.Error: if a legacy artifact is not valid base64.
+    """
+    data = artifact.inline_data.data
+    if isinstance(data, str):
+        data = data.encode("ascii")
+    if data.startswith(_PDF_MAGIC) or not _looks_like_base64(data):
+        return memoryview(data)
+    return memoryview(base64.b64decode(data, validate=True))
+
+
+def _looks_like_base64(data: bytes) -> bool:
+    """Cheap check on a prefix: legacy artifacts are pure base64 text."""
+    prefix = data[:_BASE64_PROBE_BYTES].rstrip(b"=")
+    return bool(prefix) and not prefix.translate(None, _BASE64_ALPHABET)
+
+
 def extract_text_from_pdf_artifact(
     pdf_path: str, tool_context: ToolContext
 ) -> str:
     """Extracts text from a PDF file stored in an artifact"""
     pdf_artifact = tool_context.load_artifact(pdf_path)
     try:
-        with io.BytesIO(
-            base64.b64decode(pdf_artifact.inline_data.data)
-        ) as pdf_file_obj:
-            pdf_text = ""
-            with pdfplumber.open(pdf_file_obj) as pdf:
-                for page in pdf.pages:
-                    pdf_text += page.extract_text()
-            return pdf_text
+        pdf_bytes = load_binary_artifact(pdf_artifact)
     except binascii.Error as e:
         logger.error("Error decoding PDF: %s", e)
         return None
+    return pdf_extraction.get_pdf_extractor().extract(pdf_bytes)
 
 
-def create_html_redline(text1: str, text2: str) -> str:
+def create_html_redline(
+    text1: str, text2: str, timeout: float = redline.DEFAULT_TIMEOUT_SECONDS
+) -> str:
     """Creates an HTML redline doc of differences between text1 and text2."""
-    d = dmp.diff_match_patch()
-    diffs = d.diff_main(text2, text1)
-    d.diff_cleanupSemantic(diffs)
-
-    html_output = ""
-    for op, text in diffs:
-        if op == -1:  # Deletion
-            html_output += (
-                f'<del style="background-color: #ffcccc;">{text}</del>'
-            )
-        elif op == 1:  # Insertion
-            html_output += (
-                f'<ins style="background-color: #ccffcc;">{text}</ins>'
-            )
-        else:  # Unchanged
-            html_output += text
-
-    return html_output
+    return redline.redline(text2, text1, timeout=timeout).html
 
 
 def save_html_to_artifact(
@@ -0,0 +1,413 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared HTTP layer with an on-disk, content-addressed document cache.
+
+Fed pages, statements and transcripts for a given meeting never change once
+published, so every tool that fetches them goes through a single pooled
+`requests.Session` and a disk cache:
+
+* Bodies are stored once under `objects/<sha256>`, so the same document
+  reached through different URLs is kept only once.
+* Per-URL metadata (`meta/<sha256(url)>.json`) records the content hash,
+  `ETag` and `Last-Modified` validators and the time of the last fetch.
+* Entries younger than the TTL are served without touching the network;
+  older entries are revalidated with a conditional GET (`If-None-Match` /
+  `If-Modified-Since`), and a `304 Not Modified` just refreshes the entry.
+* Response bodies are streamed to a temp file in the cache directory while
+  being hashed, so large PDFs are never held in memory during download.
+* When the total size of stored bodies exceeds `max_bytes`, the least
+  recently used URLs are dropped and unreferenced bodies deleted. Use is
+  tracked by the modification time of the metadata file, which is bumped
+  on every cache hit. The body just stored is never evicted, so a single
+  document larger than `max_bytes` is still returned; it is dropped by the
+  next store.
+"""
+
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "fomc_research", "http"
+)
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_TIMEOUT_SECONDS = 10
+STREAM_CHUNK_BYTES = 1024 * 1024
+USER_AGENT = "Mozilla/5.0"
+
+
+@dataclasses.dataclass
+class CacheEntry:
+    """Metadata for one cached URL."""
+
+    url: str
+    sha256: str
+    size: int
+    content_type: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+
+@dataclasses.dataclass
+class FetchResult:
+    """A fetched document and where it came from.
+
+    The body lives in the cache at `path`; `content` reads it on first use.
+    """
+
+    url: str
+    path: str
+    size: int
+    content_type: Optional[str]
+    sha256: str
+    from_cache: bool
+
+    @functools.cached_property
+    def content(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Writes `data` to `path` via a temp file so readers never see partial
+    files."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class DocumentCache:
+    """On-disk content-addressed cache with TTL and size-based eviction."""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._meta_dir, exist_ok=True)
+
+    @property
+    def _objects_dir(self) -> str:
+        return os.path.join(self.cache_dir, "objects")
+
+    @property
+    def _meta_dir(self) -> str:
+        return os.path.join(self.cache_dir, "meta")
+
+    def _meta_path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self._meta_dir, key + ".json")
+
+    def object_path(self, sha256: str) -> str:
+        return os.path.join(self._objects_dir, sha256)
+
+    def get_entry(self, url: str) -> Optional[CacheEntry]:
+        """Returns the metadata for `url`, or None if absent or its body is
+        missing."""
+        try:
+            with open(self._meta_path(url), encoding="utf-8") as f:
+                entry = CacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        if not os.path.exists(self.object_path(entry.sha256)):
+            return None
+        return entry
+
+    def is_fresh(self, entry: CacheEntry, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return now - entry.fetched_at < self.ttl_seconds
+
+    def put(
+        self,
+        url: str,
+        content: bytes,
+        content_type: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CacheEntry:
+        """Stores `content` for `url` and returns the new metadata."""
+        fd, tmp_path = tempfile.mkstemp(dir=self._objects_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        return self.put_file(
+            url,
+            tmp_path,
+            hashlib.sha256(content).hexdigest(),
+            content_type=content_type,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def new_temp_file(self) -> tuple[int, str]:
+        """Returns (fd, path) of a temp file that put_file() can adopt."""
+        return tempfile.mkstemp(dir=self._objects_dir)
+
+    def put_file(
+        self,
+        url: str,
+        tmp_path: str,
+        sha256: str,
+        content_type: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CacheEntry:
+        """Moves the already-hashed body at `tmp_path` into the cache."""
+        entry = CacheEntry(
+            url=url,
+            sha256=sha256,
+            size=os.path.getsize(tmp_path),
+            content_type=content_type,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.time(),
+        )
+        with self._lock:
+            if os.path.exists(self.object_path(sha256)):
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, self.object_path(sha256))
+            self._write_entry(entry)
+            self._evict(keep_sha256=sha256)
+        return entry
+
+    def record_use(self, entry: CacheEntry) -> None:
+        """Marks `entry` as most recently used, for eviction order."""
+        try:
+            os.utime(self._meta_path(entry.url))
+        except OSError:
+            pass
+
+    def touch(self, entry: CacheEntry) -> CacheEntry:
+        """Marks `entry` as freshly validated (after a 304 response)."""
+        entry = dataclasses.replace(entry, fetched_at=time.time())
+        with self._lock:
+            self._write_entry(entry)
+        return entry
+
+    def _write_entry(self, entry: CacheEntry) -> None:
+        _atomic_write(
+            self._meta_path(entry.url),
+            json.dumps(dataclasses.asdict(entry)).encode("utf-8"),
+        )
+
+    def _entries(self) -> list[tuple[str, CacheEntry]]:
+        """Returns (metadata path, entry) pairs, least recently used first."""
+        entries = []
+        for name in os.listdir(self._meta_dir):
+            path = os.path.join(self._meta_dir, name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entry = CacheEntry(**json.load(f))
+                used_at = os.stat(path).st_mtime_ns
+            except (OSError, ValueError, TypeError):
+                continue
+            entries.append((used_at, path, entry))
+        entries.sort(key=lambda e: e[0])
+        return [(path, entry) for _, path, entry in entries]
+
+    def _evict(self, keep_sha256: Optional[str] = None) -> None:
+        """Drops least recently used URLs until bodies fit in max_bytes.
+
+        URLs whose body is `keep_sha256` are kept.
+        """
+        entries = self._entries()
+        sizes = {entry.sha256: entry.size for _, entry in entries}
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+        refcount: dict[str, int] = {}
+        for _, entry in entries:
+            refcount[entry.sha256] = refcount.get(entry.sha256, 0) + 1
+        for path, entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.sha256 == keep_sha256:
+                continue
+            os.remove(path)
+            refcount[entry.sha256] -= 1
+            if refcount[entry.sha256] == 0:
+                try:
+                    os.remove(self.object_path(entry.sha256))
+                except OSError:
+                    pass
+                total -= sizes[entry.sha256]
+            logger.debug("Evicted cached document %s", entry.url)
+
+    def total_bytes(self) -> int:
+        return sum(
+            os.path.getsize(os.path.join(self._objects_dir, name))
+            for name in os.listdir(self._objects_dir)
+        )
+
+
+class CachedHttpClient:
+    """Pooled HTTP client that serves documents through a DocumentCache."""
+
+    def __init__(
+        self,
+        cache: Optional[DocumentCache] = None,
+        session: Optional[requests.Session] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        pool_size: int = 10,
+    ):
+        self.cache = cache or DocumentCache()
+        self.timeout = timeout
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"User-Agent": USER_AGENT})
+        self.session = session
+
+    def fetch(self, url: str) -> FetchResult:
+        """Returns the body of `url`, from cache when fresh or unchanged.
+
+        Raises:
+          requests.exceptions.RequestException: if the document is not cached
+            and cannot be fetched.
+        """
+        entry = self.cache.get_entry(url)
+        if entry is not None and self.cache.is_fresh(entry):
+            logger.debug("Cache hit for %s", url)
+            self.cache.record_use(entry)
+            return self._from_cache(entry)
+
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        logger.debug("Fetching %s (conditional=%s)", url, bool(headers))
+        with self.session.get(
+            url, headers=headers, timeout=self.timeout, stream=True
+        ) as response:
+            if response.status_code == 304 and entry is not None:
+                logger.debug("Not modified: %s", url)
+                return self._from_cache(self.cache.touch(entry))
+            response.raise_for_status()
+            entry = self._store_stream(url, response)
+        return self._from_cache(entry, from_cache=False)
+
+    def _store_stream(
+        self, url: str, response: requests.Response
+    ) -> CacheEntry:
+        """Streams the response body into the cache while hashing it."""
+        digest = hashlib.sha256()
+        fd, tmp_path = self.cache.new_temp_file()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(STREAM_CHUNK_BYTES):
+                    digest.update(chunk)
+                    f.write(chunk)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return self.cache.put_file(
+            url,
+            tmp_path,
+            digest.hexdigest(),
+            content_type=response.headers.get("Content-Type"),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def _from_cache(
+        self, entry: CacheEntry, from_cache: bool = True
+    ) -> FetchResult:
+        return FetchResult(
+            url=entry.url,
+            path=self.cache.object_path(entry.sha256),
+            size=entry.size,
+            content_type=entry.content_type,
+            sha256=entry.sha256,
+            from_cache=from_cache,
+        )
+
+
+_client: Optional[CachedHttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> CachedHttpClient:
+    """Returns the process-wide client, configured from the environment.
+
+    Environment variables:
+      FOMC_HTTP_CACHE_DIR: cache directory (default ~/.cache/fomc_research/http).
+      FOMC_HTTP_CACHE_TTL: seconds before an entry is revalidated.
+      FOMC_HTTP_CACHE_MAX_BYTES: maximum total size of cached bodies.
+      FOMC_HTTP_TIMEOUT: per-request timeout in seconds.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            cache = DocumentCache(
+                cache_dir=os.getenv("FOMC_HTTP_CACHE_DIR", DEFAULT_CACHE_DIR),
+                ttl_seconds=float(
+                    os.getenv("FOMC_HTTP_CACHE_TTL", DEFAULT_TTL_SECONDS)
+                ),
+                max_bytes=int(
+                    os.getenv("FOMC_HTTP_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+                ),
+            )
+            _client = CachedHttpClient(
+                cache=cache,
+                timeout=float(
+                    os.getenv("FOMC_HTTP_TIMEOUT", DEFAULT_TIMEOUT_SECONDS)
+                ),
+            )
+        return _client
+
+
+def set_http_client(client: Optional[CachedHttpClient]) -> None:
+    """Replaces the process-wide client (None resets to the default)."""
+    global _client
+    with _client_lock:
+        _client = client
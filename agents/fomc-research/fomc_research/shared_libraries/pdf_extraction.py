@@ -0,0 +1,248 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parallel, cached PDF text extraction.
+
+Text is cached by the SHA-256 of the PDF bytes, in memory and on disk, so
+re-analyzing a meeting whose statement or transcript was already seen skips
+extraction entirely. Long documents are split into page ranges that are
+extracted in a process pool; short ones are extracted inline, where the pool
+overhead would dominate.
+
+The pool is created lazily from whichever thread first needs it, in a process
+that already runs gRPC and HTTP threads, so workers are started with the
+forkserver method (spawn where that is unavailable) rather than forking the
+busy parent. The disk cache is bounded by size and time since last use.
+"""
+
+import atexit
+import collections
+import concurrent.futures
+import hashlib
+import io
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from typing import Optional
+
+import pdfplumber
+
+from . import disk_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "fomc_research", "pdf_text"
+)
+DEFAULT_MIN_PAGES_FOR_POOL = 8
+DEFAULT_MEMORY_ENTRIES = 32
+DEFAULT_CACHE_MAX_BYTES = 128 * 1024 * 1024
+DEFAULT_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+_CACHE_SUFFIX = ".txt"
+
+
+def _extract_page_range(pdf_bytes: bytes, start: int, end: int) -> list[str]:
+    """Extracts text from pages [start, end). Runs in a worker process."""
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return [pdf.pages[i].extract_text() or "" for i in range(start, end)]
+
+
+def _as_bytes(data) -> bytes:
+    """Returns `data` as bytes, without copying when it already wraps them."""
+    if isinstance(data, bytes):
+        return data
+    view = memoryview(data)
+    if isinstance(view.obj, bytes) and view.nbytes == len(view.obj):
+        return view.obj
+    return view.tobytes()
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _page_count(pdf_bytes: bytes) -> int:
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return len(pdf.pages)
+
+
+class PdfTextExtractor:
+    """Extracts PDF text with a content-hash cache and a page-level pool."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        max_workers: Optional[int] = None,
+        min_pages_for_pool: int = DEFAULT_MIN_PAGES_FOR_POOL,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        cache_max_bytes: Optional[int] = DEFAULT_CACHE_MAX_BYTES,
+        cache_ttl_seconds: Optional[float] = DEFAULT_CACHE_TTL_SECONDS,
+    ):
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.min_pages_for_pool = min_pages_for_pool
+        self.memory_entries = memory_entries
+        self._memory: collections.OrderedDict[str, str] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def extract(self, pdf_bytes) -> str:
+        """Returns the text of all pages of `pdf_bytes`, concatenated.
+
+        Args:
+          pdf_bytes: PDF contents as bytes or any bytes-like object.
+        """
+        pdf_bytes = _as_bytes(pdf_bytes)
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        text = self._cache_get(digest)
+        if text is not None:
+            logger.debug("PDF text cache hit for %s", digest)
+            return text
+
+        num_pages = _page_count(pdf_bytes)
+        if self.max_workers <= 1 or num_pages < self.min_pages_for_pool:
+            pages = _extract_page_range(pdf_bytes, 0, num_pages)
+        else:
+            pages = self._extract_parallel(pdf_bytes, num_pages)
+        text = "".join(pages)
+        logger.info(
+            "Extracted %d pages (%d chars) from PDF %s",
+            num_pages,
+            len(text),
+            digest,
+        )
+        self._cache_put(digest, text)
+        return text
+
+    def _extract_parallel(self, pdf_bytes: bytes, num_pages: int) -> list[str]:
+        chunk = -(-num_pages // self.max_workers)
+        ranges = [
+            (start, min(start + chunk, num_pages))
+            for start in range(0, num_pages, chunk)
+        ]
+        pool = self._get_pool()
+        futures = [
+            pool.submit(_extract_page_range, pdf_bytes, start, end)
+            for start, end in ranges
+        ]
+        pages: list[str] = []
+        for future in futures:
+            pages.extend(future.result())
+        return pages
+
+    def _get_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=_pool_context()
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _disk_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, digest + _CACHE_SUFFIX)
+
+    def _cache_get(self, digest: str) -> Optional[str]:
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                return self._memory[digest]
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(digest)
+        if disk_cache.is_expired(path, self.cache_ttl_seconds):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            return None
+        disk_cache.mark_used(path)
+        self._remember(digest, text)
+        return text
+
+    def _cache_put(self, digest: str, text: str) -> None:
+        self._remember(digest, text)
+        if not self.cache_dir:
+            return
+        path = self._disk_path(digest)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+        disk_cache.prune(
+            self.cache_dir,
+            _CACHE_SUFFIX,
+            self.cache_max_bytes,
+            self.cache_ttl_seconds,
+            keep=path,
+        )
+
+    def _remember(self, digest: str, text: str) -> None:
+        with self._lock:
+            self._memory[digest] = text
+            self._memory.move_to_end(digest)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+
+_extractor: Optional[PdfTextExtractor] = None
+_extractor_lock = threading.Lock()
+
+
+def get_pdf_extractor() -> PdfTextExtractor:
+    """Returns the process-wide extractor, configured from the environment.
+
+    Environment variables:
+      FOMC_PDF_CACHE_DIR: directory for cached text (default
+        ~/.cache/fomc_research/pdf_text).
+      FOMC_PDF_CACHE_MAX_BYTES: maximum total size of cached text.
+      FOMC_PDF_CACHE_TTL: seconds an unused entry is kept.
+      FOMC_PDF_WORKERS: worker processes for page extraction.
+    """
+    global _extractor
+    with _extractor_lock:
+        if _extractor is None:
+            workers = os.getenv("FOMC_PDF_WORKERS")
+            _extractor = PdfTextExtractor(
+                cache_dir=os.getenv("FOMC_PDF_CACHE_DIR", DEFAULT_CACHE_DIR),
+                max_workers=int(workers) if workers else None,
+                cache_max_bytes=int(
+                    os.getenv(
+                        "FOMC_PDF_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES
+                    )
+                ),
+                cache_ttl_seconds=float(
+                    os.getenv(
+                        "FOMC_PDF_CACHE_TTL", DEFAULT_CACHE_TTL_SECONDS
+                    )
+                ),
+            )
+            atexit.register(_extractor.shutdown)
+        return _extractor
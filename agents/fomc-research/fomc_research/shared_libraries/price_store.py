@@ -0,0 +1,271 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local columnar store for timeseries prices.
+
+Prices are fetched in bulk by date range from a pluggable PriceSource and
+kept per timeseries code as sorted NumPy arrays (dates as datetime64[D],
+values as float64), optionally persisted as one `.npz` file per code.
+Each code also tracks which date ranges have been fetched, so later lookups
+inside those ranges never go back to the source.
+
+Ranges that reach today or later are never marked as fetched: prices for the
+current day may not have been published yet.
+"""
+
+import abc
+import datetime
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterable, Sequence
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "fomc_research", "prices"
+)
+
+_DAY = np.timedelta64(1, "D")
+
+
+class PriceSource(abc.ABC):
+    """Source of daily timeseries prices."""
+
+    @abc.abstractmethod
+    def fetch_range(
+        self,
+        timeseries_codes: Sequence[str],
+        start: datetime.date,
+        end: datetime.date,
+    ) -> dict[str, dict[datetime.date, float]]:
+        """Returns prices for `timeseries_codes` between start and end
+        (inclusive), as {code: {date: value}}."""
+
+
+class BigQueryPriceSource(PriceSource):
+    """Reads prices from the `timeseries_data` table in BigQuery.
+
+    The client is created on first use, so constructing the source (and
+    importing this module) does not require credentials.
+    """
+
+    def __init__(self, dataset_name: str, client=None):
+        self.dataset_name = dataset_name
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            from google.cloud import bigquery  # pylint: disable=import-outside-toplevel
+
+            self._client = bigquery.Client()
+        return self._client
+
+    def fetch_range(self, timeseries_codes, start, end):
+        from google.cloud import bigquery  # pylint: disable=import-outside-toplevel
+
+        query = f"""
+SELECT DISTINCT timeseries_code, date, value
+FROM {self.dataset_name}.timeseries_data
+WHERE timeseries_code IN UNNEST(@timeseries_codes)
+  AND date BETWEEN @start_date AND @end_date
+"""
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter(
+                    "timeseries_codes", "STRING", list(timeseries_codes)
+                ),
+                bigquery.ScalarQueryParameter("start_date", "DATE", start),
+                bigquery.ScalarQueryParameter("end_date", "DATE", end),
+            ]
+        )
+        logger.debug(
+            "Fetching %s from %s to %s from BigQuery",
+            timeseries_codes,
+            start,
+            end,
+        )
+        prices: dict[str, dict[datetime.date, float]] = {}
+        for row in self.client.query(query, job_config=job_config).result():
+            prices.setdefault(row.timeseries_code, {})[row.date] = row.value
+        return prices
+
+
+class _Series:
+    """Sorted dates/values for one code plus the date ranges fetched."""
+
+    def __init__(self, dates=None, values=None, coverage=None):
+        self.dates = (
+            np.array([], dtype="datetime64[D]") if dates is None else dates
+        )
+        self.values = np.array([], dtype=np.float64) if values is None else values
+        # Inclusive [start, end] ranges, as an (n, 2) datetime64[D] array.
+        self.coverage = (
+            np.empty((0, 2), dtype="datetime64[D]")
+            if coverage is None
+            else coverage
+        )
+
+    def missing_ranges(self, start, end) -> list[tuple]:
+        """Returns the sub-ranges of [start, end] not yet fetched."""
+        missing = []
+        cursor = start
+        for cov_start, cov_end in self.coverage:
+            if cov_end < cursor:
+                continue
+            if cov_start > end:
+                break
+            if cov_start > cursor:
+                missing.append((cursor, cov_start - _DAY))
+            cursor = max(cursor, cov_end + _DAY)
+            if cursor > end:
+                break
+        if cursor <= end:
+            missing.append((cursor, end))
+        return missing
+
+    def merge(self, dates: np.ndarray, values: np.ndarray) -> None:
+        all_dates = np.concatenate([self.dates, dates])
+        all_values = np.concatenate([self.values, values])
+        # Keep the newest value for duplicate dates.
+        order = np.argsort(all_dates, kind="stable")[::-1]
+        _, first = np.unique(all_dates[order], return_index=True)
+        keep = order[first]
+        self.dates = all_dates[keep]
+        self.values = all_values[keep]
+
+    def add_coverage(self, start, end) -> None:
+        ranges = sorted(
+            [tuple(r) for r in self.coverage] + [(start, end)],
+            key=lambda r: r[0],
+        )
+        merged = [list(ranges[0])]
+        for cov_start, cov_end in ranges[1:]:
+            if cov_start <= merged[-1][1] + _DAY:
+                merged[-1][1] = max(merged[-1][1], cov_end)
+            else:
+                merged.append([cov_start, cov_end])
+        self.coverage = np.array(merged, dtype="datetime64[D]").reshape(-1, 2)
+
+    def lookup(self, dates: np.ndarray) -> np.ndarray:
+        """Values on `dates` exactly, NaN where there is no price."""
+        if not len(self.dates):
+            return np.full(len(dates), np.nan)
+        idx = np.searchsorted(self.dates, dates)
+        idx_clipped = np.minimum(idx, len(self.dates) - 1)
+        found = self.dates[idx_clipped] == dates
+        return np.where(found, self.values[idx_clipped], np.nan)
+
+
+class PriceStore:
+    """Bulk-prefetching, persistent cache in front of a PriceSource."""
+
+    def __init__(
+        self,
+        source: PriceSource,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        today: Optional[datetime.date] = None,
+    ):
+        self.source = source
+        self.cache_dir = cache_dir
+        self._today = today
+        self._series: dict[str, _Series] = {}
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def today(self) -> np.datetime64:
+        return np.datetime64(self._today or datetime.date.today(), "D")
+
+    def _path(self, code: str) -> str:
+        return os.path.join(self.cache_dir, f"{code}.npz")
+
+    def _get_series(self, code: str) -> _Series:
+        series = self._series.get(code)
+        if series is None:
+            series = _Series()
+            if self.cache_dir and os.path.exists(self._path(code)):
+                with np.load(self._path(code)) as data:
+                    series = _Series(
+                        data["dates"], data["values"], data["coverage"]
+                    )
+            self._series[code] = series
+        return series
+
+    def _save(self, code: str, series: _Series) -> None:
+        if not self.cache_dir:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".npz")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(
+                f,
+                dates=series.dates,
+                values=series.values,
+                coverage=series.coverage,
+            )
+        os.replace(tmp_path, self._path(code))
+
+    def prefetch(
+        self,
+        timeseries_codes: Iterable[str],
+        start: datetime.date,
+        end: datetime.date,
+    ) -> None:
+        """Makes sure prices for [start, end] are held locally.
+
+        Only the sub-ranges not fetched before are requested from the source,
+        in one request per distinct sub-range.
+        """
+        start = np.datetime64(start, "D")
+        end = np.datetime64(end, "D")
+        with self._lock:
+            codes_by_range: dict[tuple, list[str]] = {}
+            for code in timeseries_codes:
+                for missing in self._get_series(code).missing_ranges(
+                    start, end
+                ):
+                    codes_by_range.setdefault(missing, []).append(code)
+
+            for (range_start, range_end), codes in codes_by_range.items():
+                prices = self.source.fetch_range(
+                    codes, range_start.item(), range_end.item()
+                )
+                # Today's prices may still be incomplete; refetch them later.
+                last_final = min(range_end, self.today - _DAY)
+                for code in codes:
+                    series = self._series[code]
+                    by_date = prices.get(code, {})
+                    if by_date:
+                        series.merge(
+                            np.array(list(by_date), dtype="datetime64[D]"),
+                            np.array(list(by_date.values()), dtype=np.float64),
+                        )
+                    if last_final >= range_start:
+                        series.add_coverage(range_start, last_final)
+                    self._save(code, series)
+
+    def lookup(self, code: str, dates) -> np.ndarray:
+        """Returns prices for `code` on `dates` (NaN where missing).
+
+        Does not fetch; call prefetch() first.
+        """
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        with self._lock:
+            return self._get_series(code).lookup(dates)
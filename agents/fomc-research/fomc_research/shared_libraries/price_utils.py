@@ -18,12 +18,15 @@ import datetime
 import logging
 import math
 import os
-from collections.abc import Sequence
+import threading
+from collections.abc import Iterable, Sequence
+from typing import Optional
 
+import numpy as np
 from absl import app
-from google.cloud import bigquery
 
-bqclient = bigquery.Client()
+from . import price_store
+
 logger = logging.getLogger(__name__)
 
 MOVE_SIZE_BP = 25
@@ -33,6 +36,31 @@ if not DATASET_NAME:
 TIMESERIES_CODES = os.getenv("GOOGLE_GENAI_FOMC_AGENT_TIMESERIES_CODES")
 if not TIMESERIES_CODES:
     TIMESERIES_CODES = "SFRH5,SFRZ5"
+PRICE_CACHE_DIR = os.getenv(
+    "FOMC_PRICE_CACHE_DIR", price_store.DEFAULT_CACHE_DIR
+)
+
+_store: Optional[price_store.PriceStore] = None
+_store_lock = threading.Lock()
+
+
+def get_price_store() -> price_store.PriceStore:
+    """Returns the process-wide price store, backed by BigQuery by default."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = price_store.PriceStore(
+                price_store.BigQueryPriceSource(DATASET_NAME),
+                cache_dir=PRICE_CACHE_DIR,
+            )
+        return _store
+
+
+def set_price_store(store: Optional[price_store.PriceStore]) -> None:
+    """Replaces the process-wide price store (None resets to the default)."""
+    global _store
+    with _store_lock:
+        _store = store
 
 
 def fetch_prices_from_bq(
@@ -40,6 +68,9 @@ def fetch_prices_from_bq(
 ) -> dict[dict[datetime.date, float]]:
     """Fetches prices from Bigquery.
 
+    Prices are served from the local price store, which fetches the date
+    range spanning `dates` in one request when it is not already held.
+
     Args:
       timeseries_codes: List of timeseries codes to fetch.
       dates: List of dates to fetch.
@@ -51,45 +82,26 @@ def fetch_prices_from_bq(
     logger.debug("fetch_prices_from_bq: timeseries_codes: %s", timeseries_codes)
     logger.debug("fetch_prices_from_bq: dates: %s", dates)
 
-    query = f"""
-SELECT DISTINCT timeseries_code, date, value
-FROM {DATASET_NAME}.timeseries_data
-WHERE timeseries_code IN UNNEST(@timeseries_codes)
-  AND date IN UNNEST(@dates)
-"""
-
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ArrayQueryParameter(
-                "timeseries_codes", "STRING", timeseries_codes
-            ),
-            bigquery.ArrayQueryParameter("dates", "DATE", dates),
-        ]
-    )
-
+    store = get_price_store()
+    store.prefetch(timeseries_codes, min(dates), max(dates))
     prices = {}
-    query_job = bqclient.query(query, job_config=job_config)
-    results = query_job.result()
-    for row in results:
-        logger.debug(
-            "code: %s, date: %s, value: %s",
-            row.timeseries_code,
-            row.date,
-            row.value,
-        )
-        if row.timeseries_code not in prices:
-            prices[row.timeseries_code] = {row.date: row.value}
-        else:
-            prices[row.timeseries_code][row.date] = row.value
-
+    for code in timeseries_codes:
+        values = store.lookup(code, dates)
+        found = {
+            date: float(value)
+            for date, value in zip(dates, values)
+            if not np.isnan(value)
+        }
+        if found:
+            prices[code] = found
     return prices
 
 
-def number_of_moves(
-    front_ff_future_px: float, back_ff_future_px: float
-) -> float:
+def number_of_moves(front_ff_future_px, back_ff_future_px):
     """Computes the expected number of rate moves between two prices.
 
+    Works element-wise on NumPy arrays as well as on floats.
+
     Args:
       front_ff_future_px: Front fed funds future price.
       back_ff_future_px: Back fed funds future price.
@@ -127,65 +139,110 @@ def fed_meeting_probabilities(nmoves: float) -> dict:
     return output
 
 
-def compute_probabilities(meeting_date_str: str) -> dict:
-    """Computes the probabilities of a rate move for a specific date.
+def fed_meeting_probabilities_batch(nmoves: np.ndarray) -> list[dict]:
+    """Applies fed_meeting_probabilities to each move count of an array.
+
+    The move counts themselves come from the vectorized number_of_moves();
+    labelling and rounding stay in fed_meeting_probabilities() alone.
+    """
+    return [
+        fed_meeting_probabilities(n)
+        for n in np.asarray(nmoves, dtype=np.float64).tolist()
+    ]
+
+
+def _format_output(probs_pre: dict, probs_post: dict) -> dict:
+    return {
+        (
+            "Odds of a rate move within the next year ",
+            "(computed before Fed meeting):",
+        ): (probs_pre),
+        (
+            "Odds of a rate move within the next year ",
+            "(computed after Fed meeting)",
+        ): (probs_post),
+    }
+
+
+def compute_probabilities_batch(meeting_dates: Iterable[str]) -> dict:
+    """Computes rate move probabilities for many meetings at once.
+
+    Prices for the whole span of meetings are prefetched with one range
+    request per timeseries (skipped when already cached), then the number of
+    moves before and after every meeting is computed on arrays.
 
     Args:
-      meeting_date_str: Date of the Fed meeting.
+      meeting_dates: Dates of the Fed meetings, as ISO strings.
 
     Returns:
-      Dictionary of probabilities.
+      Dictionary mapping each meeting date string to the same result
+      compute_probabilities() returns for it.
     """
-    meeting_date = datetime.date.fromisoformat(meeting_date_str)
-    meeting_date_day_before = meeting_date - datetime.timedelta(days=1)
+    meeting_date_strs = list(meeting_dates)
+    if not meeting_date_strs:
+        return {}
     timeseries_codes = [x.strip() for x in TIMESERIES_CODES.split(",")]
-
-    prices = fetch_prices_from_bq(
-        timeseries_codes, [meeting_date, meeting_date_day_before]
+    post = np.array(
+        [datetime.date.fromisoformat(d) for d in meeting_date_strs],
+        dtype="datetime64[D]",
     )
+    pre = post - np.timedelta64(1, "D")
 
-    error = None
-    for code in timeseries_codes:
-        if code not in prices:
-            error = f"No data for {code}"
-            break
-        elif meeting_date not in prices[code]:
-            error = f"No data for {code} on {meeting_date}"
-            break
-        elif meeting_date_day_before not in prices[code]:
-            error = f"No data for {code} on {meeting_date_day_before}"
-            break
-
-    logger.debug("compute_probabilities: found prices: %s", prices)
-
-    if error:
-        return {"status": "ERROR", "message": error}
+    store = get_price_store()
+    store.prefetch(timeseries_codes, pre.min().item(), post.max().item())
+    post_px = {code: store.lookup(code, post) for code in timeseries_codes}
+    pre_px = {code: store.lookup(code, pre) for code in timeseries_codes}
 
     near_code = timeseries_codes[0]
     far_code = timeseries_codes[1]
-    num_moves_post = number_of_moves(
-        prices[near_code][meeting_date], prices[far_code][meeting_date]
+    with np.errstate(invalid="ignore"):
+        num_moves_post = number_of_moves(post_px[near_code], post_px[far_code])
+        num_moves_pre = number_of_moves(pre_px[near_code], pre_px[far_code])
+    valid = ~(np.isnan(num_moves_post) | np.isnan(num_moves_pre))
+
+    probs_post = fed_meeting_probabilities_batch(
+        np.where(valid, num_moves_post, 0.0)
     )
-    num_moves_pre = number_of_moves(
-        prices[near_code][meeting_date_day_before],
-        prices[far_code][meeting_date_day_before],
+    probs_pre = fed_meeting_probabilities_batch(
+        np.where(valid, num_moves_pre, 0.0)
     )
 
-    probs_pre = fed_meeting_probabilities(num_moves_pre)
-    probs_post = fed_meeting_probabilities(num_moves_post)
+    results = {}
+    for i, date_str in enumerate(meeting_date_strs):
+        if valid[i]:
+            results[date_str] = {
+                "status": "OK",
+                "output": _format_output(probs_pre[i], probs_post[i]),
+            }
+            continue
+        error = None
+        for code in timeseries_codes:
+            missing_post = np.isnan(post_px[code][i])
+            missing_pre = np.isnan(pre_px[code][i])
+            if missing_post and missing_pre:
+                error = f"No data for {code}"
+            elif missing_post:
+                error = f"No data for {code} on {post[i].item()}"
+            elif missing_pre:
+                error = f"No data for {code} on {pre[i].item()}"
+            if error:
+                break
+        results[date_str] = {"status": "ERROR", "message": error}
+    return results
 
-    output = {
-        (
-            "Odds of a rate move within the next year ",
-            "(computed before Fed meeting):",
-        ): (probs_pre),
-        (
-            "Odds of a rate move within the next year ",
-            "(computed after Fed meeting)",
-        ): (probs_post),
-    }
 
-    return {"status": "OK", "output": output}
+def compute_probabilities(meeting_date_str: str) -> dict:
+    """Computes the probabilities of a rate move for a specific date.
+
+    Args:
+      meeting_date_str: Date of the Fed meeting.
+
+    Returns:
+      Dictionary of probabilities.
+    """
+    result = compute_probabilities_batch([meeting_date_str])[meeting_date_str]
+    logger.debug("compute_probabilities: %s", result)
+    return result
 
 
 def main(argv: Sequence[str]) -> None:
@@ -0,0 +1,216 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-wide async token-bucket rate limiter keyed by model.
+
+Each key (model name) has a bucket that refills at `rate` tokens per second
+up to `capacity`. A request reserves a token immediately, letting the bucket
+go negative, and then awaits until its reservation is covered. Concurrent
+sessions therefore queue fairly without blocking the event loop, and the
+aggregate request rate per model stays within quota.
+
+By default buckets live in memory. With a SQLite backend the same buckets
+are shared by every process that points at the same database file, e.g.
+several agent servers on one host.
+"""
+
+import abc
+import asyncio
+import dataclasses
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Adjust these values to limit the rate at which the agent
+# queries the LLM API.
+RATE_LIMIT_SECS = 60
+RPM_QUOTA = 1000
+
+
+class BucketBackend(abc.ABC):
+    """Storage for token-bucket state."""
+
+    @abc.abstractmethod
+    def reserve(
+        self, key: str, rate: float, capacity: float, now: float
+    ) -> float:
+        """Takes one token from `key`'s bucket.
+
+        Returns:
+          Seconds the caller must wait before its token is available.
+        """
+
+
+def _refill_and_take(
+    tokens: float, updated_at: float, rate: float, capacity: float, now: float
+) -> tuple[float, float]:
+    """Returns (tokens left after taking one, seconds to wait)."""
+    tokens = min(capacity, tokens + max(0.0, now - updated_at) * rate) - 1
+    wait = -tokens / rate if tokens < 0 else 0.0
+    return tokens, wait
+
+
+class InMemoryBucketBackend(BucketBackend):
+    """Buckets shared by all threads and event loops of this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def reserve(self, key, rate, capacity, now):
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens, wait = _refill_and_take(
+                tokens, updated_at, rate, capacity, now
+            )
+            self._buckets[key] = (tokens, now)
+            return wait
+
+
+class SqliteBucketBackend(BucketBackend):
+    """Buckets stored in a SQLite file, shared across processes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                " key TEXT PRIMARY KEY, tokens REAL, updated_at REAL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def reserve(self, key, rate, capacity, now):
+        conn = self._connect()
+        try:
+            # IMMEDIATE takes the write lock up front, so read-modify-write
+            # is atomic across processes.
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated_at = row if row else (capacity, now)
+            tokens, wait = _refill_and_take(
+                tokens, updated_at, rate, capacity, now
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)",
+                (key, tokens, now),
+            )
+            conn.execute("COMMIT")
+            return wait
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+
+@dataclasses.dataclass
+class WaitStats:
+    requests: int = 0
+    delayed_requests: int = 0
+    total_wait_secs: float = 0.0
+    max_wait_secs: float = 0.0
+
+
+class RateLimiter:
+    """Async token-bucket limiter, one bucket per key."""
+
+    def __init__(
+        self,
+        requests_per_period: float,
+        period_secs: float = 60.0,
+        capacity: Optional[float] = None,
+        backend: Optional[BucketBackend] = None,
+    ):
+        self.rate = requests_per_period / period_secs
+        self.capacity = requests_per_period if capacity is None else capacity
+        self.backend = backend or InMemoryBucketBackend()
+        self._stats_lock = threading.Lock()
+        self._stats: dict[str, WaitStats] = {}
+
+    async def acquire(self, key: str) -> float:
+        """Waits until a request for `key` is allowed.
+
+        Returns:
+          Seconds spent waiting.
+        """
+        now = time.time()
+        if isinstance(self.backend, InMemoryBucketBackend):
+            wait = self.backend.reserve(key, self.rate, self.capacity, now)
+        else:
+            wait = await asyncio.to_thread(
+                self.backend.reserve, key, self.rate, self.capacity, now
+            )
+        if wait > 0:
+            logger.debug("Rate limit for %s: waiting %.2f seconds", key, wait)
+            await asyncio.sleep(wait)
+        self._record(key, wait)
+        return wait
+
+    def _record(self, key: str, wait: float) -> None:
+        with self._stats_lock:
+            stats = self._stats.setdefault(key, WaitStats())
+            stats.requests += 1
+            if wait > 0:
+                stats.delayed_requests += 1
+                stats.total_wait_secs += wait
+                stats.max_wait_secs = max(stats.max_wait_secs, wait)
+
+    def metrics(self) -> dict[str, dict]:
+        """Returns wait-time metrics per key."""
+        with self._stats_lock:
+            return {
+                key: dataclasses.asdict(stats)
+                for key, stats in self._stats.items()
+            }
+
+    def reset_metrics(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Returns the process-wide limiter, created on first use.
+
+    It allows RPM_QUOTA requests per model every RATE_LIMIT_SECS. Set
+    FOMC_RATE_LIMIT_DB to a SQLite file path to share the quota with other
+    processes on the same host.
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            db_path = os.getenv("FOMC_RATE_LIMIT_DB")
+            backend = SqliteBucketBackend(db_path) if db_path else None
+            _limiter = RateLimiter(RPM_QUOTA, RATE_LIMIT_SECS, backend=backend)
+        return _limiter
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Replaces the process-wide limiter (None resets to the default)."""
+    global _limiter
+    with _limiter_lock:
+        _limiter = limiter
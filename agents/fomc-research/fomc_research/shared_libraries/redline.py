@@ -0,0 +1,250 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Hierarchical redline engine for comparing Fed documents.
+
+Character-level diffs of whole statements, minutes or transcripts are slow
+and produce unreadable output. This engine diffs paragraphs first, then
+re-diffs only the changed paragraphs sentence by sentence, and only the
+changed sentences word by word. Each level maps its tokens to single
+characters so diff_match_patch compares token sequences rather than raw text.
+
+When the overall deadline expires, the remaining changed regions are emitted
+as whole-token replacements instead of being refined further.
+
+PDF text wraps lines mid-sentence, so soft line breaks (a single newline
+not ending a sentence) are joined into spaces first. Sentences then split
+at their punctuation rather than at line ends, and re-wrapped but otherwise
+equal text compares equal.
+"""
+
+import dataclasses
+import html
+import io
+import os
+import re
+import time
+from typing import Optional
+
+import diff_match_patch as dmp
+
+DELETE = -1
+EQUAL = 0
+INSERT = 1
+
+DEFAULT_TIMEOUT_SECONDS = float(os.getenv("FOMC_REDLINE_TIMEOUT", "2.0"))
+
+# Separators are captured as their own tokens, so a sentence followed by a
+# space and the same sentence at the end of the text still compare equal.
+_PARAGRAPH_SPLIT_RE = re.compile(r"(\n[ \t]*\n\s*)")
+_SENTENCE_SPLIT_RE = re.compile(
+    r"((?:(?<=[.!?])|(?<=[.!?][\"')\]]))\s+|\n\s*)"
+)
+_WORD_RE = re.compile(r"\S+|\s+")
+# A newline with its surrounding spaces, unless it is part of a blank line.
+_LINE_BREAK_RE = re.compile(r"[ \t]*(?<!\n)\n(?![ \t]*\n)[ \t]*")
+_SENTENCE_END_RE = re.compile(r"[.!?][\"')\]]?$")
+
+_DEL_OPEN = '<del style="background-color: #ffcccc;">'
+_INS_OPEN = '<ins style="background-color: #ccffcc;">'
+
+
+def join_soft_line_breaks(text: str) -> str:
+    """Replaces line breaks inside sentences with single spaces."""
+
+    def join(match: re.Match) -> str:
+        before = text[: match.start()].rstrip(" \t")
+        if not before or before.endswith("\n") or _SENTENCE_END_RE.search(
+            before[-2:]
+        ):
+            return match.group(0)
+        return " "
+
+    return _LINE_BREAK_RE.sub(join, text)
+
+
+def split_paragraphs(text: str) -> list[str]:
+    return [p for p in _PARAGRAPH_SPLIT_RE.split(text) if p]
+
+
+def split_sentences(text: str) -> list[str]:
+    return [s for s in _SENTENCE_SPLIT_RE.split(text) if s]
+
+
+def split_words(text: str) -> list[str]:
+    return _WORD_RE.findall(text)
+
+
+_LEVELS = (split_paragraphs, split_sentences, split_words)
+_SENTENCE_LEVEL = 1
+
+
+@dataclasses.dataclass
+class RedlineResult:
+    """Diff operations plus the sentences added to and removed from a text."""
+
+    ops: list[tuple[int, str]]
+    added_sentences: list[str]
+    removed_sentences: list[str]
+    timed_out: bool = False
+
+    @property
+    def html(self) -> str:
+        out = io.StringIO()
+        for op, text in self.ops:
+            escaped = html.escape(text, quote=False)
+            if op == DELETE:
+                out.write(_DEL_OPEN)
+                out.write(escaped)
+                out.write("</del>")
+            elif op == INSERT:
+                out.write(_INS_OPEN)
+                out.write(escaped)
+                out.write("</ins>")
+            else:
+                out.write(escaped)
+        return out.getvalue()
+
+    def summary(self) -> dict:
+        """Compact structured diff for agents that don't need the HTML."""
+        return {
+            "added_sentences": self.added_sentences,
+            "removed_sentences": self.removed_sentences,
+            "inserted_chars": sum(len(t) for op, t in self.ops if op == INSERT),
+            "deleted_chars": sum(len(t) for op, t in self.ops if op == DELETE),
+            "timed_out": self.timed_out,
+        }
+
+
+def _diff_tokens(
+    old: list[str], new: list[str], deadline: float
+) -> Optional[list[tuple[int, list[str]]]]:
+    """Diffs two token lists; returns None if the deadline has passed."""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return None
+    codes: dict[str, str] = {}
+
+    def encode(tokens: list[str]) -> str:
+        return "".join(
+            codes.setdefault(token, chr(0x100 + len(codes))) for token in tokens
+        )
+
+    differ = dmp.diff_match_patch()
+    differ.Diff_Timeout = remaining
+    diffs = differ.diff_main(encode(old), encode(new), False)
+
+    result = []
+    i = j = 0
+    for op, chars in diffs:
+        n = len(chars)
+        if op == INSERT:
+            result.append((op, new[j : j + n]))
+            j += n
+        else:
+            result.append((op, old[i : i + n]))
+            i += n
+            if op == EQUAL:
+                j += n
+    return result
+
+
+class _Engine:
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+        self.ops: list[tuple[int, str]] = []
+        self.added: list[str] = []
+        self.removed: list[str] = []
+        self.timed_out = False
+
+    def emit(self, op: int, text: str) -> None:
+        if not text:
+            return
+        if self.ops and self.ops[-1][0] == op:
+            self.ops[-1] = (op, self.ops[-1][1] + text)
+        else:
+            self.ops.append((op, text))
+
+    def record_sentences(self, level: int, op: int, tokens: list[str]):
+        """Records whole sentences added or removed at or above sentence
+        level."""
+        if level > _SENTENCE_LEVEL:
+            return
+        target = self.added if op == INSERT else self.removed
+        for token in tokens:
+            for sentence in split_sentences(token):
+                if sentence.strip():
+                    target.append(" ".join(sentence.split()))
+
+    def diff(self, old: str, new: str, level: int = 0) -> None:
+        old_tokens = _LEVELS[level](old)
+        new_tokens = _LEVELS[level](new)
+        diffs = _diff_tokens(old_tokens, new_tokens, self.deadline)
+        if diffs is None:
+            self.timed_out = True
+            self.record_sentences(level, DELETE, old_tokens)
+            self.record_sentences(level, INSERT, new_tokens)
+            self.emit(DELETE, old)
+            self.emit(INSERT, new)
+            return
+
+        pending_del: list[str] = []
+        pending_ins: list[str] = []
+        for op, tokens in diffs + [(EQUAL, [])]:
+            if op == DELETE:
+                pending_del.extend(tokens)
+            elif op == INSERT:
+                pending_ins.extend(tokens)
+            else:
+                self.flush(level, pending_del, pending_ins)
+                pending_del, pending_ins = [], []
+                self.emit(EQUAL, "".join(tokens))
+
+    def flush(self, level: int, deleted: list[str], inserted: list[str]):
+        if deleted and inserted and level + 1 < len(_LEVELS):
+            if level + 1 > _SENTENCE_LEVEL:
+                # Changed sentences are reported whole, then refined by word.
+                self.record_sentences(_SENTENCE_LEVEL, DELETE, deleted)
+                self.record_sentences(_SENTENCE_LEVEL, INSERT, inserted)
+            self.diff("".join(deleted), "".join(inserted), level + 1)
+            return
+        self.record_sentences(level, DELETE, deleted)
+        self.record_sentences(level, INSERT, inserted)
+        self.emit(DELETE, "".join(deleted))
+        self.emit(INSERT, "".join(inserted))
+
+
+def redline(
+    old: str, new: str, timeout: float = DEFAULT_TIMEOUT_SECONDS
+) -> RedlineResult:
+    """Computes a paragraph -> sentence -> word redline from `old` to `new`.
+
+    Args:
+      old: The earlier text.
+      new: The later text.
+      timeout: Overall time budget in seconds for refining changes.
+
+    Returns:
+      A RedlineResult with diff ops, HTML and added/removed sentences. The
+      ops spell out both texts with soft line breaks joined.
+    """
+    engine = _Engine(time.monotonic() + timeout)
+    engine.diff(join_soft_line_breaks(old), join_soft_line_breaks(new))
+    return RedlineResult(
+        ops=engine.ops,
+        added_sentences=engine.added,
+        removed_sentences=engine.removed,
+        timed_out=engine.timed_out,
+    )
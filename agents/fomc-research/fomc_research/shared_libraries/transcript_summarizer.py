@@ -0,0 +1,365 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Map-reduce summarization of long press conference transcripts.
+
+The transcript is split into chunks at speaker turns. Chunks are summarized
+concurrently (each model call goes through the shared rate limiter), and the
+chunk summaries are reduced in groups, level by level, until one summary is
+left. Every summary is cached by a hash of its prompt, model and input, so
+re-runs and overlapping questions reuse earlier work.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+from google.adk.agents.callback_context import CallbackContext
+
+from .. import MODEL
+from . import disk_cache, rate_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "fomc_research", "summaries"
+)
+DEFAULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+DEFAULT_CHUNK_CHARS = 12000
+DEFAULT_FAN_IN = 5
+DEFAULT_MAX_CONCURRENCY = 8
+
+# A speaker turn starts with an upper-case name followed by a period, e.g.
+# "CHAIR POWELL." or "MICHELLE SMITH." at the start of a line.
+_SPEAKER_RE = re.compile(r"^([A-Z][A-Z.'\- ]{1,60}[A-Z])\.\s", re.M)
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+MAP_PROMPT = """
+You are a financial analyst. Below is an excerpt from the press conference
+after an FOMC meeting. Summarize what each speaker said in this excerpt, with
+attention to policy signals, economic assessments and the tone (hawkish or
+dovish) of the answers. Keep specific numbers. Use at most 200 words.
+
+<EXCERPT>
+{text}
+</EXCERPT>
+"""
+
+REDUCE_PROMPT = """
+You are a financial analyst. Below are summaries of consecutive parts of the
+press conference after an FOMC meeting. Combine them into one summary of the
+content and sentiment of the press conference, keeping specific numbers and
+policy signals. Use at most 400 words.
+
+<PART_SUMMARIES>
+{text}
+</PART_SUMMARIES>
+"""
+
+SummarizeFn = Callable[[str], Awaitable[str]]
+
+
+def split_turns(text: str) -> list[str]:
+    """Splits a transcript into speaker turns (text before the first
+    speaker label is kept as its own turn)."""
+    starts = [m.start() for m in _SPEAKER_RE.finditer(text)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    bounds = starts + [len(text)]
+    turns = [text[a:b].strip() for a, b in zip(bounds, bounds[1:])]
+    return [t for t in turns if t]
+
+
+def _split_long_turn(turn: str, max_chars: int) -> list[str]:
+    """Splits one turn at sentence ends, repeating the speaker label."""
+    match = _SPEAKER_RE.match(turn)
+    label = match.group(0) if match else ""
+    continued = f"{match.group(1)} (cont.) " if match else ""
+    pieces, current = [], label
+    for sentence in _SENTENCE_END_RE.split(turn[len(label):]):
+        has_body = current not in (label, continued)
+        if has_body and len(current) + len(sentence) + 1 > max_chars:
+            pieces.append(current.strip())
+            current = continued
+        current += sentence + " "
+    if current.strip():
+        pieces.append(current.strip())
+    return pieces
+
+
+def chunk_transcript(
+    text: str, max_chars: int = DEFAULT_CHUNK_CHARS
+) -> list[str]:
+    """Packs whole speaker turns into chunks of at most ~max_chars."""
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for turn in split_turns(text):
+        pieces = (
+            [turn] if len(turn) <= max_chars
+            else _split_long_turn(turn, max_chars)
+        )
+        for piece in pieces:
+            if current and size + len(piece) > max_chars:
+                chunks.append("\n\n".join(current))
+                current, size = [], 0
+            current.append(piece)
+            size += len(piece) + 2
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+class SummaryCache:
+    """Summaries keyed by content hash, in memory and optionally on disk.
+
+    The disk cache is created on the first put() and bounded by size and
+    time since last use, see disk_cache.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        max_bytes: Optional[int] = DEFAULT_CACHE_MAX_BYTES,
+        ttl_seconds: Optional[float] = DEFAULT_CACHE_TTL_SECONDS,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._memory: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        if disk_cache.is_expired(path, self.ttl_seconds):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                summary = json.load(f)["summary"]
+        except (OSError, ValueError, KeyError):
+            return None
+        disk_cache.mark_used(path)
+        with self._lock:
+            self._memory[key] = summary
+        return summary
+
+    def put(self, key: str, summary: str) -> None:
+        with self._lock:
+            self._memory[key] = summary
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"summary": summary}, f)
+        os.replace(tmp_path, path)
+        disk_cache.prune(
+            self.cache_dir, ".json", self.max_bytes, self.ttl_seconds, keep=path
+        )
+
+
+async def _gemini_summarize(prompt: str, model: str) -> str:
+    from google import genai  # pylint: disable=import-outside-toplevel
+
+    response = await genai.Client().aio.models.generate_content(
+        model=model, contents=prompt
+    )
+    return response.text or ""
+
+
+class TranscriptSummarizer:
+    """Chunked, concurrent, cached map-reduce summarizer."""
+
+    def __init__(
+        self,
+        summarize_fn: Optional[SummarizeFn] = None,
+        model: str = MODEL,
+        cache: Optional[SummaryCache] = None,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+        fan_in: int = DEFAULT_FAN_IN,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        limiter: Optional[rate_limiter.RateLimiter] = None,
+    ):
+        if fan_in < 2:
+            raise ValueError("fan_in must be at least 2")
+        self.model = model
+        self.summarize_fn = summarize_fn or (
+            lambda prompt: _gemini_summarize(prompt, model)
+        )
+        self.cache = cache if cache is not None else SummaryCache()
+        self.chunk_chars = chunk_chars
+        self.fan_in = fan_in
+        self.max_concurrency = max_concurrency
+        self.limiter = limiter
+        self.model_calls = 0
+        self.cache_hits = 0
+
+    def _limiter(self) -> rate_limiter.RateLimiter:
+        return self.limiter or rate_limiter.get_rate_limiter()
+
+    async def _summarize(
+        self, template: str, text: str, semaphore: asyncio.Semaphore
+    ) -> str:
+        key = self.cache.key(template, self.model, text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+        async with semaphore:
+            await self._limiter().acquire(self.model)
+            self.model_calls += 1
+            summary = await self.summarize_fn(template.format(text=text))
+        self.cache.put(key, summary)
+        return summary
+
+    async def _reduce(
+        self, group: list[str], semaphore: asyncio.Semaphore
+    ) -> str:
+        if len(group) == 1:
+            # A leftover summary moves up a level as is.
+            return group[0]
+        text = "\n\n".join(
+            f"[Part {n + 1}]\n{summary}" for n, summary in enumerate(group)
+        )
+        return await self._summarize(REDUCE_PROMPT, text, semaphore)
+
+    async def summarize(self, transcript: str) -> str:
+        """Returns one summary of `transcript`."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        chunks = chunk_transcript(transcript, self.chunk_chars)
+        logger.info("Summarizing transcript in %d chunks", len(chunks))
+        summaries = await asyncio.gather(
+            *(self._summarize(MAP_PROMPT, c, semaphore) for c in chunks)
+        )
+        level = 0
+        while len(summaries) > 1:
+            level += 1
+            groups = [
+                summaries[i : i + self.fan_in]
+                for i in range(0, len(summaries), self.fan_in)
+            ]
+            logger.info(
+                "Reduce level %d: %d summaries in %d groups",
+                level,
+                len(summaries),
+                len(groups),
+            )
+            summaries = await asyncio.gather(
+                *(self._reduce(group, semaphore) for group in groups)
+            )
+        return summaries[0] if summaries else ""
+
+
+_summarizer: Optional[TranscriptSummarizer] = None
+_summarizer_lock = threading.Lock()
+
+
+def get_transcript_summarizer() -> TranscriptSummarizer:
+    """Returns the process-wide summarizer.
+
+    Environment variables:
+      FOMC_SUMMARY_CACHE_DIR: cache directory (default
+        ~/.cache/fomc_research/summaries).
+      FOMC_SUMMARY_CACHE_MAX_BYTES: maximum total size of cached summaries.
+      FOMC_SUMMARY_CACHE_TTL: seconds an unused summary is kept.
+    """
+    global _summarizer
+    with _summarizer_lock:
+        if _summarizer is None:
+            _summarizer = TranscriptSummarizer(
+                cache=SummaryCache(
+                    os.getenv("FOMC_SUMMARY_CACHE_DIR", DEFAULT_CACHE_DIR),
+                    max_bytes=int(
+                        os.getenv(
+                            "FOMC_SUMMARY_CACHE_MAX_BYTES",
+                            DEFAULT_CACHE_MAX_BYTES,
+                        )
+                    ),
+                    ttl_seconds=float(
+                        os.getenv(
+                            "FOMC_SUMMARY_CACHE_TTL", DEFAULT_CACHE_TTL_SECONDS
+                        )
+                    ),
+                )
+            )
+        return _summarizer
+
+
+def set_transcript_summarizer(
+    summarizer: Optional[TranscriptSummarizer],
+) -> None:
+    """Replaces the process-wide summarizer (None resets to the default)."""
+    global _summarizer
+    with _summarizer_lock:
+        _summarizer = summarizer
+
+
+TRANSCRIPT_ARTIFACT = "transcript_fulltext"
+SUMMARY_STATE_KEY = "transcript_summary"
+
+
+async def summarize_transcript_callback(callback_context: CallbackContext):
+    """before_agent_callback that map-reduces the transcript artifact.
+
+    Stores the result in state["transcript_summary"], which the agent prompt
+    reads instead of the full transcript. If summarization fails, the full
+    transcript is stored so the agent can still do the work itself.
+
+    Args:
+      callback_context: The callback context of SummarizeMeetingAgent.
+
+    Returns:
+      None, so the agent always runs afterwards.
+    """
+    artifact = callback_context.load_artifact(TRANSCRIPT_ARTIFACT)
+    if inspect.isawaitable(artifact):
+        artifact = await artifact
+    transcript = (artifact.text or "") if artifact else ""
+    if not transcript:
+        logger.warning("No %s artifact to summarize", TRANSCRIPT_ARTIFACT)
+        callback_context.state[SUMMARY_STATE_KEY] = ""
+        return None
+    try:
+        summary = await get_transcript_summarizer().summarize(transcript)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.exception("Transcript summarization failed; using full text")
+        summary = transcript
+    callback_context.state[SUMMARY_STATE_KEY] = summary
+    return None
@@ -21,6 +21,7 @@ from ..shared_libraries.callbacks import rate_limit_callback
 from ..tools.compare_statements import compare_statements_tool
 from ..tools.compute_rate_move_probability import compute_rate_move_probability_tool
 from ..tools.fetch_transcript import fetch_transcript_tool
+from ..tools.prefetch_research import prefetch_research_callback
 from ..tools.store_state import store_state_tool
 from . import research_agent_prompt
 from .summarize_meeting_agent import SummarizeMeetingAgent
@@ -41,5 +42,6 @@ ResearchAgent = Agent(
         fetch_transcript_tool,
         compute_rate_move_probability_tool,
     ],
+    before_agent_callback=prefetch_research_callback,
     before_model_callback=rate_limit_callback,
 )
@@ -18,6 +18,9 @@ from google.adk.agents import Agent
 
 from ..agent import MODEL
 from ..shared_libraries.callbacks import rate_limit_callback
+from ..shared_libraries.transcript_summarizer import (
+    summarize_transcript_callback,
+)
 from ..tools.store_state import store_state_tool
 from . import summarize_meeting_agent_prompt
 
@@ -31,5 +34,6 @@ SummarizeMeetingAgent = Agent(
     tools=[
         store_state_tool,
     ],
+    before_agent_callback=summarize_transcript_callback,
     before_model_callback=rate_limit_callback,
 )
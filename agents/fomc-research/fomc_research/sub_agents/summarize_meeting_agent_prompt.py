@@ -16,14 +16,15 @@
 
 PROMPT = """
 You are a financial analyst experienced in understanding the meaning, sentiment
-and sub-text of financial meeting transcripts. Below is the transcript
-of the latest FOMC meeting press conference.
+and sub-text of financial meeting transcripts. Below are condensed notes on the
+transcript of the latest FOMC meeting press conference, prepared by reading
+the transcript section by section.
 
-<TRANSCRIPT>
-{artifact.transcript_fulltext}
-</TRANSCRIPT>
+<TRANSCRIPT_NOTES>
+{transcript_summary}
+</TRANSCRIPT_NOTES>
 
-Read this transcript and create a summary of the content and sentiment of this
+Read these notes and create a summary of the content and sentiment of this
 meeting. Call the store_state tool with key 'meeting_summary' and the value as your
 meeting summary. Tell the user what you are doing but do not output your summary
 to the user.
@@ -19,7 +19,7 @@ import logging
 from google.adk.tools import ToolContext
 from google.genai.types import Part
 
-from ..shared_libraries import file_utils
+from ..shared_libraries import file_utils, redline
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +27,9 @@ logger = logging.getLogger(__name__)
 def compare_statements_tool(tool_context: ToolContext) -> dict[str, str]:
     """Compares requested and previous statements and generates HTML redline.
 
+    A compact list of added and removed sentences is stored in
+    state["statement_diff"].
+
     Args:
       tool_context: ToolContext object.
 
@@ -84,9 +87,10 @@ def compare_statements_tool(tool_context: ToolContext) -> dict[str, str]:
         artifact=Part(text=prev_pdf_text),
     )
 
-    redline_html = file_utils.create_html_redline(reqd_pdf_text, prev_pdf_text)
+    statement_diff = redline.redline(prev_pdf_text, reqd_pdf_text)
     file_utils.save_html_to_artifact(
-        redline_html, "statement_redline", tool_context
+        statement_diff.html, "statement_redline", tool_context
     )
+    tool_context.state.update({"statement_diff": statement_diff.summary()})
 
     return {"status": "ok"}
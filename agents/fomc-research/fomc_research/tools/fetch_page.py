@@ -15,10 +15,12 @@
 """'fetch_page' tool for FOMC Research sample agent"""
 
 import logging
-import urllib.request
 
+import requests
 from google.adk.tools import ToolContext
 
+from ..shared_libraries import http_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,15 +34,11 @@ def fetch_page_tool(url: str, tool_context: ToolContext) -> dict[str, str]:
     Returns:
       A dict with "status" and (optional) "error_message" keys.
     """
-    opener = urllib.request.build_opener()
-    opener.addheaders = [("User-Agent", "Mozilla/5.0")]
-    urllib.request.install_opener(opener)
     logger.debug("Fetching page: %s", url)
     try:
-        page = urllib.request.urlopen(url)
-        page_text = page.read().decode("utf-8")
-    except urllib.error.HTTPError as err:
-        errmsg = "Failed to fetch page %s: %s", url, err
+        page_text = http_cache.get_http_client().fetch(url).text
+    except requests.exceptions.RequestException as err:
+        errmsg = f"Failed to fetch page {url}: {err}"
         logger.error(errmsg)
         return {"status": "ERROR", "message": errmsg}
     tool_context.state.update({"page_contents": page_text})
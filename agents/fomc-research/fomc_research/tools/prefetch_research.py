@@ -0,0 +1,202 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent prefetch of independent research tools for ResearchAgent.
+
+The tools are blocking (HTTP, PDF parsing, BigQuery), so each runs in a
+worker thread. A worker never touches the shared callback context: it gets a
+private _PrefetchToolContext holding a snapshot of the session state, and its
+state changes and saved artifacts are buffered there. Once every tool has
+finished, the buffers are committed back on the event loop, one tool after
+another, with a single state update.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.genai.types import Part
+
+from .compare_statements import compare_statements_tool
+from .compute_rate_move_probability import compute_rate_move_probability_tool
+from .fetch_transcript import fetch_transcript_tool
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_STATE_KEY = "research_prefetch"
+
+# Once RetrieveMeetingDataAgent has stored the meeting URLs and dates, these
+# tools only read state and do network/BigQuery I/O, so they can run at once.
+PREFETCH_TOOLS = {
+    "compare_statements": compare_statements_tool,
+    "fetch_transcript": fetch_transcript_tool,
+    "compute_rate_move_probability": compute_rate_move_probability_tool,
+}
+
+# State keys each tool needs before it can run.
+_REQUIRED_STATE = {
+    "compare_statements": (
+        "requested_meeting_statement_pdf_url",
+        "previous_meeting_statement_pdf_url",
+    ),
+    "fetch_transcript": ("transcript_url",),
+    "compute_rate_move_probability": ("requested_meeting_date",),
+}
+
+
+class _BufferedState(dict):
+    """State snapshot that remembers the keys a tool wrote."""
+
+    def __init__(self, snapshot: dict[str, Any]):
+        super().__init__(snapshot)
+        self.delta: dict[str, Any] = {}
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.delta[key] = value
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+
+class _PrefetchToolContext:
+    """The part of ToolContext the research tools use, run in isolation.
+
+    Reads see the session state as it was when the prefetch started plus the
+    tool's own writes. Artifacts saved by the tool can be loaded back by the
+    same tool (the downloaded PDFs are parsed this way) and are handed to the
+    real artifact service only after all tools are done.
+    """
+
+    def __init__(self, snapshot: dict[str, Any]):
+        self.state = _BufferedState(snapshot)
+        self.artifacts: dict[str, list[Part]] = {}
+
+    def save_artifact(self, filename: str, artifact: Part) -> int:
+        versions = self.artifacts.setdefault(filename, [])
+        versions.append(artifact)
+        return len(versions) - 1
+
+    def load_artifact(
+        self, filename: str, version: Optional[int] = None
+    ) -> Optional[Part]:
+        versions = self.artifacts.get(filename)
+        if not versions:
+            return None
+        return versions[-1 if version is None else version]
+
+
+def _run_tool(name: str, tool, context: _PrefetchToolContext) -> dict:
+    missing = [k for k in _REQUIRED_STATE[name] if k not in context.state]
+    if missing:
+        return {
+            "status": "error",
+            "error_message": f"Missing state: {', '.join(missing)}",
+        }
+    start = time.monotonic()
+    try:
+        result = tool(context)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.exception("Prefetch of %s failed", name)
+        result = {"status": "error", "error_message": str(e)}
+    result = dict(result)
+    result["elapsed_secs"] = round(time.monotonic() - start, 3)
+    logger.info(
+        "Prefetched %s: %s in %.2fs",
+        name,
+        result.get("status"),
+        result["elapsed_secs"],
+    )
+    return result
+
+
+async def _save_artifacts(
+    callback_context: CallbackContext,
+    context: _PrefetchToolContext,
+) -> None:
+    for filename, versions in context.artifacts.items():
+        for artifact in versions:
+            saved = callback_context.save_artifact(
+                filename=filename, artifact=artifact
+            )
+            if inspect.isawaitable(saved):
+                await saved
+
+
+def _already_prefetched(context: CallbackContext) -> bool:
+    prefetch = context.state.get(PREFETCH_STATE_KEY)
+    return bool(
+        prefetch
+        and prefetch.get("requested_meeting_date")
+        == context.state.get("requested_meeting_date")
+        and all(
+            str(r.get("status", "")).lower() == "ok"
+            for r in prefetch.get("results", {}).values()
+        )
+    )
+
+
+async def prefetch_research_callback(callback_context: CallbackContext):
+    """before_agent_callback that runs the research tools concurrently.
+
+    Results (status and timing per tool) are stored in
+    state["research_prefetch"], next to the state values and artifacts the
+    tools themselves produce. Runs again only if the requested meeting
+    changed or a previous attempt failed.
+
+    Args:
+      callback_context: The callback context of the research agent.
+
+    Returns:
+      None, so the agent always runs afterwards.
+    """
+    if _already_prefetched(callback_context):
+        return None
+    start = time.monotonic()
+    state = callback_context.state
+    snapshot = dict(state.to_dict() if hasattr(state, "to_dict") else state)
+    contexts = {name: _PrefetchToolContext(snapshot) for name in PREFETCH_TOOLS}
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(_run_tool, name, tool, contexts[name])
+            for name, tool in PREFETCH_TOOLS.items()
+        )
+    )
+    results = dict(zip(PREFETCH_TOOLS, results))
+
+    delta = {}
+    for name, context in contexts.items():
+        try:
+            await _save_artifacts(callback_context, context)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.exception("Saving prefetched artifacts of %s failed", name)
+            results[name] = {
+                "status": "error",
+                "error_message": f"Saving artifacts failed: {e}",
+            }
+            continue
+        delta.update(context.state.delta)
+    delta[PREFETCH_STATE_KEY] = {
+        "requested_meeting_date": callback_context.state.get(
+            "requested_meeting_date"
+        ),
+        "results": results,
+        "elapsed_secs": round(time.monotonic() - start, 3),
+    }
+    callback_context.state.update(delta)
+    return None
@@ -0,0 +1,115 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for the redline engine on large synthetic documents.
+
+Compares the hierarchical engine against a character-level
+diff_match_patch diff of the whole text (the previous implementation).
+
+Usage:
+  python -m tests.bench_redline --paragraphs 400 --edit-rate 0.05
+"""
+
+import argparse
+import random
+import time
+
+import diff_match_patch as dmp
+
+from fomc_research.shared_libraries import redline
+
+VOCABULARY = (
+    "inflation employment committee federal funds rate target range policy "
+    "labor market economic activity outlook uncertainty balance sheet "
+    "securities treasury mortgage-backed percent growth risks goals"
+).split()
+
+
+def synthetic_document(rng: random.Random, paragraphs: int) -> list[list[str]]:
+    doc = []
+    for _ in range(paragraphs):
+        sentences = []
+        for _ in range(rng.randint(3, 8)):
+            words = rng.choices(VOCABULARY, k=rng.randint(8, 25))
+            sentences.append(" ".join(words).capitalize() + ".")
+        doc.append(sentences)
+    return doc
+
+
+def mutate(
+    rng: random.Random, doc: list[list[str]], edit_rate: float
+) -> list[list[str]]:
+    mutated = []
+    for sentences in doc:
+        new_sentences = []
+        for sentence in sentences:
+            roll = rng.random()
+            if roll < edit_rate / 3:
+                continue
+            if roll < 2 * edit_rate / 3:
+                words = sentence.split()
+                words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+                sentence = " ".join(words)
+            elif roll < edit_rate:
+                new_sentences.append(sentence)
+                sentence = " ".join(rng.choices(VOCABULARY, k=12)) + "."
+            new_sentences.append(sentence)
+        mutated.append(new_sentences)
+    return mutated
+
+
+def render(doc: list[list[str]]) -> str:
+    return "\n\n".join(" ".join(sentences) for sentences in doc)
+
+
+def legacy_redline(old: str, new: str, timeout: float) -> int:
+    d = dmp.diff_match_patch()
+    d.Diff_Timeout = timeout
+    diffs = d.diff_main(old, new)
+    d.diff_cleanupSemantic(diffs)
+    return len(diffs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paragraphs", type=int, default=400)
+    parser.add_argument("--edit-rate", type=float, default=0.05)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    doc = synthetic_document(rng, args.paragraphs)
+    old, new = render(doc), render(mutate(rng, doc, args.edit_rate))
+    print(f"old: {len(old):,} chars, new: {len(new):,} chars")
+
+    start = time.perf_counter()
+    result = redline.redline(old, new, timeout=args.timeout)
+    html = result.html
+    elapsed = time.perf_counter() - start
+    print(
+        f"hierarchical: {elapsed:.3f}s, {len(result.ops)} ops, "
+        f"{len(html):,} html chars, +{len(result.added_sentences)}"
+        f"/-{len(result.removed_sentences)} sentences, "
+        f"timed_out={result.timed_out}"
+    )
+
+    start = time.perf_counter()
+    ops = legacy_redline(old, new, args.timeout)
+    elapsed = time.perf_counter() - start
+    print(f"character-level: {elapsed:.3f}s, {ops} ops")
+
+
+if __name__ == "__main__":
+    main()
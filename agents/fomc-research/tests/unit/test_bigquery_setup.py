@@ -0,0 +1,137 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the chunked Parquet loader in deployment/bigquery_setup.py."""
+
+import datetime
+import os
+import threading
+
+import pyarrow.parquet as pq
+import pytest
+from google.cloud import bigquery
+
+from deployment import bigquery_setup
+
+SCHEMA = [
+    bigquery.SchemaField("timeseries_code", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
+    bigquery.SchemaField("value", "FLOAT", mode="REQUIRED"),
+]
+
+
+class _FakeJob:
+
+    errors = None
+
+    def result(self):
+        return self
+
+
+class FakeClient:
+    """Records rows from Parquet load jobs; can fail on chosen calls."""
+
+    def __init__(self, fail_on_calls=()):
+        self.rows = []
+        self.dispositions = []
+        self.calls = 0
+        self.fail_on_calls = set(fail_on_calls)
+        self._lock = threading.Lock()
+
+    def load_table_from_file(self, file_obj, table, job_config):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call in self.fail_on_calls:
+            raise RuntimeError(f"load failed on call {call}")
+        assert job_config.source_format == bigquery.SourceFormat.PARQUET
+        rows = pq.read_table(file_obj).to_pylist()
+        with self._lock:
+            self.rows.extend(rows)
+            self.dispositions.append(job_config.write_disposition)
+        return _FakeJob()
+
+
+def _write_csv(path, n):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("timeseries_code,date,value\n")
+        for i in range(n):
+            day = datetime.date(2020, 1, 1) + datetime.timedelta(days=i)
+            f.write(f"SFRH5,{day.isoformat()},{95 + i / 1000}\n")
+
+
+@pytest.fixture(name="table")
+def fixture_table():
+    return bigquery.Table("proj.dataset.timeseries_data", schema=SCHEMA)
+
+
+def test_loads_all_rows_in_typed_chunks(tmp_path, table):
+    csv_path = str(tmp_path / "data.csv")
+    _write_csv(csv_path, 1050)
+    client = FakeClient()
+    bigquery_setup.insert_csv_to_bigquery(
+        client,
+        table,
+        csv_path,
+        write_disposition="WRITE_TRUNCATE",
+        chunk_rows=100,
+        max_workers=3,
+    )
+    assert client.calls == 11
+    assert client.dispositions[0] == "WRITE_TRUNCATE"
+    assert set(client.dispositions[1:]) == {"WRITE_APPEND"}
+    rows = sorted(client.rows, key=lambda r: r["date"])
+    assert len(rows) == 1050
+    assert rows[0] == {
+        "timeseries_code": "SFRH5",
+        "date": datetime.date(2020, 1, 1),
+        "value": 95.0,
+    }
+    assert not os.path.exists(csv_path + ".bqprogress.json")
+
+
+def test_resumes_after_failure(tmp_path, table):
+    csv_path = str(tmp_path / "data.csv")
+    _write_csv(csv_path, 500)
+    failing = FakeClient(fail_on_calls={3})
+    with pytest.raises(RuntimeError):
+        bigquery_setup.insert_csv_to_bigquery(
+            failing, table, csv_path, chunk_rows=100, max_workers=1
+        )
+    assert os.path.exists(csv_path + ".bqprogress.json")
+    loaded_before = len(failing.rows)
+
+    client = FakeClient()
+    bigquery_setup.insert_csv_to_bigquery(
+        client, table, csv_path, chunk_rows=100, max_workers=2
+    )
+    assert loaded_before + len(client.rows) == 500
+    dates = {r["date"] for r in failing.rows} | {r["date"] for r in client.rows}
+    assert len(dates) == 500
+
+
+def test_empty_csv_and_invalid_disposition(tmp_path, table):
+    csv_path = str(tmp_path / "empty.csv")
+    _write_csv(csv_path, 0)
+    client = FakeClient()
+    bigquery_setup.insert_csv_to_bigquery(client, table, csv_path)
+    assert client.calls == 0
+    with pytest.raises(ValueError):
+        bigquery_setup.insert_csv_to_bigquery(
+            client, table, csv_path, write_disposition="WRITE_SOMETIMES"
+        )
+    with pytest.raises(FileNotFoundError):
+        bigquery_setup.insert_csv_to_bigquery(
+            client, table, str(tmp_path / "missing.csv")
+        )
@@ -0,0 +1,93 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for binary artifact handling in file_utils."""
+
+import base64
+
+import pytest
+from google.genai.types import Blob, Part
+
+from fomc_research.shared_libraries import file_utils, http_cache
+
+PDF_BYTES = b"%PDF-1.4\n" + bytes(range(256))
+
+
+class _FakeToolContext:
+
+    def __init__(self):
+        self.artifacts = {}
+
+    def save_artifact(self, filename, artifact):
+        self.artifacts[filename] = artifact
+        return 0
+
+    def load_artifact(self, filename):
+        return self.artifacts[filename]
+
+
+class _FakeHttpClient:
+
+    def __init__(self, tmp_path):
+        self.cache = http_cache.DocumentCache(str(tmp_path))
+
+    def fetch(self, url):
+        entry = self.cache.put(url, PDF_BYTES, content_type="application/pdf")
+        return http_cache.FetchResult(
+            url=url,
+            path=self.cache.object_path(entry.sha256),
+            size=entry.size,
+            content_type=entry.content_type,
+            sha256=entry.sha256,
+            from_cache=False,
+        )
+
+
+@pytest.fixture(name="tool_context")
+def fixture_tool_context(tmp_path):
+    http_cache.set_http_client(_FakeHttpClient(tmp_path))
+    yield _FakeToolContext()
+    http_cache.set_http_client(None)
+
+
+def test_download_stores_raw_bytes(tool_context):
+    name = file_utils.download_file_from_url(
+        "https://example.com/a.pdf", "a.pdf", tool_context
+    )
+    blob = tool_context.artifacts[name].inline_data
+    assert blob.data == PDF_BYTES
+    assert blob.mime_type == "application/pdf"
+    loaded = file_utils.load_binary_artifact(tool_context.artifacts[name])
+    assert bytes(loaded) == PDF_BYTES
+
+
+def test_raw_artifact_is_not_copied():
+    artifact = Part(
+        inline_data=Blob(data=PDF_BYTES, mime_type="application/pdf")
+    )
+    view = file_utils.load_binary_artifact(artifact)
+    assert view.obj is artifact.inline_data.data
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [PDF_BYTES, b"\x00\x01binary\xff" * 10, b"plain text with spaces"],
+)
+def test_legacy_base64_artifact_still_loads(payload):
+    artifact = Part(
+        inline_data=Blob(
+            data=base64.b64encode(payload), mime_type="application/pdf"
+        )
+    )
+    assert bytes(file_utils.load_binary_artifact(artifact)) == payload
@@ -0,0 +1,143 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the shared HTTP layer, run against a local http.server."""
+
+import http.server
+import threading
+import time
+
+import pytest
+import requests
+
+from fomc_research.shared_libraries import http_cache
+
+DOCUMENTS = {
+    "/statement.pdf": b"%PDF-1.4 statement body",
+    "/mirror.pdf": b"%PDF-1.4 statement body",
+    "/page.htm": "<html>FOMC calendar</html>".encode("utf-8"),
+}
+ETAG = '"v1"'
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    requests_seen: list = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        _Handler.requests_seen.append(
+            (self.path, self.headers.get("If-None-Match"))
+        )
+        body = DOCUMENTS.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(name="server_url")
+def fixture_server_url():
+    _Handler.requests_seen = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _client(tmp_path, ttl=3600, max_bytes=1 << 20):
+    cache = http_cache.DocumentCache(
+        str(tmp_path), ttl_seconds=ttl, max_bytes=max_bytes
+    )
+    return http_cache.CachedHttpClient(cache=cache, timeout=5)
+
+
+def test_fresh_entry_served_without_network(tmp_path, server_url):
+    client = _client(tmp_path)
+    first = client.fetch(server_url + "/statement.pdf")
+    second = client.fetch(server_url + "/statement.pdf")
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.content == DOCUMENTS["/statement.pdf"]
+    assert second.content_type == "application/pdf"
+    assert len(_Handler.requests_seen) == 1
+
+
+def test_stale_entry_revalidated_with_etag(tmp_path, server_url):
+    client = _client(tmp_path, ttl=0)
+    client.fetch(server_url + "/statement.pdf")
+    result = client.fetch(server_url + "/statement.pdf")
+    assert result.from_cache
+    assert _Handler.requests_seen[-1] == ("/statement.pdf", ETAG)
+
+
+def test_identical_bodies_stored_once(tmp_path, server_url):
+    client = _client(tmp_path)
+    a = client.fetch(server_url + "/statement.pdf")
+    b = client.fetch(server_url + "/mirror.pdf")
+    assert a.sha256 == b.sha256
+    assert client.cache.total_bytes() == len(DOCUMENTS["/statement.pdf"])
+
+
+def test_size_eviction_drops_oldest(tmp_path, server_url):
+    client = _client(tmp_path, max_bytes=len(DOCUMENTS["/page.htm"]) + 1)
+    client.fetch(server_url + "/statement.pdf")
+    client.fetch(server_url + "/page.htm")
+    assert client.cache.get_entry(server_url + "/statement.pdf") is None
+    assert client.cache.get_entry(server_url + "/page.htm") is not None
+
+
+def test_size_eviction_drops_least_recently_used(tmp_path, server_url):
+    sizes = len(DOCUMENTS["/statement.pdf"]) + len(DOCUMENTS["/page.htm"])
+    client = _client(tmp_path, max_bytes=sizes)
+    client.fetch(server_url + "/statement.pdf")
+    client.fetch(server_url + "/page.htm")
+    # A hit makes the statement more recently used than the page.
+    time.sleep(0.01)
+    client.fetch(server_url + "/statement.pdf")
+    DOCUMENTS["/other.htm"] = b"<html>other</html>"
+    try:
+        client.fetch(server_url + "/other.htm")
+    finally:
+        del DOCUMENTS["/other.htm"]
+    assert client.cache.get_entry(server_url + "/page.htm") is None
+    assert client.cache.get_entry(server_url + "/statement.pdf") is not None
+
+
+def test_oversized_body_is_still_returned(tmp_path, server_url):
+    client = _client(tmp_path, max_bytes=4)
+    result = client.fetch(server_url + "/statement.pdf")
+    assert result.content == DOCUMENTS["/statement.pdf"]
+    # It is evicted by the next store.
+    client.fetch(server_url + "/page.htm")
+    assert client.cache.get_entry(server_url + "/statement.pdf") is None
+
+
+def test_http_error_raises(tmp_path, server_url):
+    client = _client(tmp_path)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.fetch(server_url + "/missing.pdf")
@@ -0,0 +1,130 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for parallel, cached PDF text extraction."""
+
+from unittest import mock
+
+from fomc_research.shared_libraries import pdf_extraction
+
+
+def make_pdf(page_texts: list[str]) -> bytes:
+    """Builds a minimal PDF with one line of Helvetica text per page."""
+    n = len(page_texts)
+    font_id = 3 + 2 * n
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: (
+            "<< /Type /Pages /Kids [%s] /Count %d >>"
+            % (" ".join(f"{3 + 2 * i} 0 R" for i in range(n)), n)
+        ).encode(),
+        font_id: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects[3 + 2 * i] = (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>"
+        ).encode()
+        objects[4 + 2 * i] = (
+            b"<< /Length %d >>\nstream\n" % len(stream)
+            + stream
+            + b"\nendstream"
+        )
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for num in sorted(objects):
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n" % num + objects[num] + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for num in sorted(objects):
+        out += b"%010d 00000 n \n" % offsets[num]
+    out += (
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, xref)
+    )
+    return bytes(out)
+
+
+def test_serial_extraction_joins_pages(tmp_path):
+    extractor = pdf_extraction.PdfTextExtractor(
+        cache_dir=str(tmp_path), max_workers=1
+    )
+    assert extractor.extract(make_pdf(["Alpha", "Beta"])) == "AlphaBeta"
+
+
+def test_parallel_extraction_preserves_page_order(tmp_path):
+    texts = [f"Page{i}" for i in range(10)]
+    extractor = pdf_extraction.PdfTextExtractor(
+        cache_dir=str(tmp_path), max_workers=3, min_pages_for_pool=2
+    )
+    try:
+        assert extractor.extract(make_pdf(texts)) == "".join(texts)
+    finally:
+        extractor.shutdown()
+
+
+def test_cached_text_skips_extraction(tmp_path):
+    pdf = make_pdf(["Statement"])
+    pdf_extraction.PdfTextExtractor(
+        cache_dir=str(tmp_path), max_workers=1
+    ).extract(pdf)
+
+    # A fresh extractor (new process) still hits the on-disk cache.
+    extractor = pdf_extraction.PdfTextExtractor(
+        cache_dir=str(tmp_path), max_workers=1
+    )
+    with mock.patch.object(
+        pdf_extraction, "_page_count", side_effect=AssertionError
+    ):
+        assert extractor.extract(pdf) == "Statement"
+
+
+def test_pool_does_not_fork(tmp_path):
+    extractor = pdf_extraction.PdfTextExtractor(
+        cache_dir=str(tmp_path), max_workers=2
+    )
+    try:
+        method = extractor._get_pool()._mp_context.get_start_method()
+    finally:
+        extractor.shutdown()
+    assert method in ("forkserver", "spawn")
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    extractor = pdf_extraction.PdfTextExtractor(
+        cache_dir=str(tmp_path), max_workers=1, cache_max_bytes=12
+    )
+    first, second = make_pdf(["Statement1"]), make_pdf(["Statement2"])
+    extractor.extract(first)
+    extractor.extract(second)
+    files = list(tmp_path.glob("*.txt"))
+    assert [f.read_text() for f in files] == ["Statement2"]
+
+
+def test_expired_disk_entry_is_extracted_again(tmp_path):
+    pdf = make_pdf(["Statement"])
+    pdf_extraction.PdfTextExtractor(
+        cache_dir=str(tmp_path), max_workers=1
+    ).extract(pdf)
+    extractor = pdf_extraction.PdfTextExtractor(
+        cache_dir=str(tmp_path), max_workers=1, cache_ttl_seconds=-1
+    )
+    with mock.patch.object(
+        pdf_extraction, "_page_count", wraps=pdf_extraction._page_count
+    ) as page_count:
+        assert extractor.extract(pdf) == "Statement"
+    page_count.assert_called_once()
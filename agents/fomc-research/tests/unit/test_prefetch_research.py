@@ -0,0 +1,155 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the concurrent research prefetch stage."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from google.genai.types import Part
+
+from fomc_research.sub_agents.research_agent import ResearchAgent
+from fomc_research.tools import prefetch_research
+
+STATE = {
+    "requested_meeting_date": "2025-01-29",
+    "requested_meeting_statement_pdf_url": "/curr.pdf",
+    "previous_meeting_statement_pdf_url": "/prev.pdf",
+    "transcript_url": "/transcript.pdf",
+}
+
+
+@pytest.fixture(name="calls")
+def fixture_calls(monkeypatch):
+    calls = []
+
+    def slow_tool(name, status="ok"):
+        def tool(context):
+            calls.append(name)
+            time.sleep(0.2)
+            context.state[f"{name}_done"] = True
+            return {"status": status}
+
+        return tool
+
+    monkeypatch.setattr(
+        prefetch_research,
+        "PREFETCH_TOOLS",
+        {
+            "compare_statements": slow_tool("compare_statements"),
+            "fetch_transcript": slow_tool("fetch_transcript"),
+            "compute_rate_move_probability": slow_tool(
+                "compute_rate_move_probability", status="OK"
+            ),
+        },
+    )
+    return calls
+
+
+def test_tools_run_concurrently_and_store_results(calls):
+    context = SimpleNamespace(state=dict(STATE))
+    start = time.monotonic()
+    asyncio.run(prefetch_research.prefetch_research_callback(context))
+    assert time.monotonic() - start < 0.5
+    assert sorted(calls) == sorted(prefetch_research.PREFETCH_TOOLS)
+    prefetch = context.state["research_prefetch"]
+    assert prefetch["requested_meeting_date"] == "2025-01-29"
+    assert {r["status"] for r in prefetch["results"].values()} == {"ok", "OK"}
+    assert context.state["fetch_transcript_done"]
+
+
+def test_second_run_for_same_meeting_is_skipped(calls):
+    context = SimpleNamespace(state=dict(STATE))
+    asyncio.run(prefetch_research.prefetch_research_callback(context))
+    asyncio.run(prefetch_research.prefetch_research_callback(context))
+    assert len(calls) == 3
+
+    context.state["requested_meeting_date"] = "2025-03-19"
+    asyncio.run(prefetch_research.prefetch_research_callback(context))
+    assert len(calls) == 6
+
+
+def test_missing_state_and_errors_are_reported(calls, monkeypatch):
+    def broken(context):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(
+        prefetch_research.PREFETCH_TOOLS, "compare_statements", broken
+    )
+    state = dict(STATE)
+    del state["transcript_url"]
+    context = SimpleNamespace(state=state)
+    asyncio.run(prefetch_research.prefetch_research_callback(context))
+    results = context.state["research_prefetch"]["results"]
+    assert results["compare_statements"]["error_message"] == "boom"
+    assert "transcript_url" in results["fetch_transcript"]["error_message"]
+
+
+def test_research_agent_uses_prefetch_callback():
+    assert (
+        ResearchAgent.before_agent_callback
+        is prefetch_research.prefetch_research_callback
+    )
+
+
+class _RecordingContext(SimpleNamespace):
+    """Callback context stand-in that records where artifacts were saved."""
+
+    def __init__(self, state):
+        super().__init__(state=state, saved=[])
+
+    async def save_artifact(self, filename, artifact):
+        self.saved.append((filename, artifact, threading.get_ident()))
+        return len(self.saved) - 1
+
+
+def test_tools_write_to_isolated_contexts(monkeypatch):
+    seen = {}
+
+    def writer(name):
+        def tool(context):
+            time.sleep(0.05)
+            seen[name] = dict(context.state)
+            context.state.update({f"{name}_done": True})
+            version = context.save_artifact(
+                filename=f"{name}.txt", artifact=Part(text=name)
+            )
+            assert context.load_artifact(f"{name}.txt").text == name
+            return {"status": "ok", "version": version}
+
+        return tool
+
+    monkeypatch.setattr(
+        prefetch_research,
+        "PREFETCH_TOOLS",
+        {name: writer(name) for name in prefetch_research.PREFETCH_TOOLS},
+    )
+    context = _RecordingContext(dict(STATE))
+
+    async def run():
+        await prefetch_research.prefetch_research_callback(context)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    # No tool sees another tool's writes while they run.
+    assert all(not any(k.endswith("_done") for k in s) for s in seen.values())
+    assert all(context.state[f"{name}_done"] for name in seen)
+    # Artifacts reach the artifact service afterwards, on the event loop.
+    assert [f for f, _, _ in context.saved] == [
+        f"{name}.txt" for name in prefetch_research.PREFETCH_TOOLS
+    ]
+    assert {t for _, _, t in context.saved} == {loop_thread}
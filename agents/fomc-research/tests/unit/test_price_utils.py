@@ -0,0 +1,146 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the price store and batched probability computation."""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from fomc_research.shared_libraries import price_store, price_utils
+
+D = datetime.date
+
+
+class FakePriceSource(price_store.PriceSource):
+
+    def __init__(self, prices):
+        self.prices = prices
+        self.calls = []
+
+    def fetch_range(self, timeseries_codes, start, end):
+        self.calls.append((tuple(timeseries_codes), start, end))
+        return {
+            code: {
+                d: v for d, v in self.prices.get(code, {}).items()
+                if start <= d <= end
+            }
+            for code in timeseries_codes
+        }
+
+
+def _prices():
+    near, far = {}, {}
+    day = D(2024, 1, 1)
+    while day <= D(2024, 12, 31):
+        offset = (day - D(2024, 1, 1)).days / 1000
+        near[day] = 95.0 + offset
+        far[day] = 95.4 - offset
+        day += datetime.timedelta(days=1)
+    return {"SFRH5": near, "SFRZ5": far}
+
+
+@pytest.fixture(name="source")
+def fixture_source(tmp_path):
+    source = FakePriceSource(_prices())
+    price_utils.set_price_store(
+        price_store.PriceStore(
+            source, cache_dir=str(tmp_path), today=D(2025, 6, 1)
+        )
+    )
+    yield source
+    price_utils.set_price_store(None)
+
+
+def _scalar_probabilities(near_post, far_post, near_pre, far_pre):
+    return price_utils._format_output(  # pylint: disable=protected-access
+        price_utils.fed_meeting_probabilities(
+            price_utils.number_of_moves(near_pre, far_pre)
+        ),
+        price_utils.fed_meeting_probabilities(
+            price_utils.number_of_moves(near_post, far_post)
+        ),
+    )
+
+
+def test_batch_matches_scalar_formulas(source):
+    meetings = ["2024-01-31", "2024-03-20", "2024-06-12", "2024-12-18"]
+    results = price_utils.compute_probabilities_batch(meetings)
+    prices = source.prices
+    for meeting in meetings:
+        post = D.fromisoformat(meeting)
+        pre = post - datetime.timedelta(days=1)
+        assert results[meeting]["status"] == "OK"
+        assert results[meeting]["output"] == _scalar_probabilities(
+            prices["SFRH5"][post],
+            prices["SFRZ5"][post],
+            prices["SFRH5"][pre],
+            prices["SFRZ5"][pre],
+        )
+    # One range request covers every meeting.
+    assert source.calls == [(("SFRH5", "SFRZ5"), D(2024, 1, 30), D(2024, 12, 18))]
+
+
+def test_cached_ranges_are_not_refetched(source, tmp_path):
+    price_utils.compute_probabilities_batch(["2024-03-20", "2024-06-12"])
+    price_utils.compute_probabilities("2024-05-01")
+    assert len(source.calls) == 1
+
+    # A new store over the same cache directory reads the persisted arrays.
+    price_utils.set_price_store(
+        price_store.PriceStore(
+            source, cache_dir=str(tmp_path), today=D(2025, 6, 1)
+        )
+    )
+    assert price_utils.compute_probabilities("2024-04-10")["status"] == "OK"
+    assert len(source.calls) == 1
+
+    price_utils.compute_probabilities("2024-07-10")
+    assert source.calls[-1] == (
+        ("SFRH5", "SFRZ5"), D(2024, 7, 9), D(2024, 7, 10)
+    )
+
+
+def test_missing_prices_report_errors(source):
+    del source.prices["SFRZ5"][D(2024, 3, 19)]
+    results = price_utils.compute_probabilities_batch(
+        ["2024-03-20", "2025-02-01"]
+    )
+    assert results["2024-03-20"] == {
+        "status": "ERROR",
+        "message": "No data for SFRZ5 on 2024-03-19",
+    }
+    assert results["2025-02-01"] == {
+        "status": "ERROR",
+        "message": "No data for SFRH5",
+    }
+
+
+def test_recent_ranges_are_refetched(tmp_path):
+    source = FakePriceSource(_prices())
+    store = price_store.PriceStore(
+        source, cache_dir=str(tmp_path), today=D(2024, 6, 1)
+    )
+    store.prefetch(["SFRH5"], D(2024, 5, 1), D(2024, 6, 1))
+    store.prefetch(["SFRH5"], D(2024, 5, 1), D(2024, 6, 1))
+    assert source.calls[-1] == (("SFRH5",), D(2024, 6, 1), D(2024, 6, 1))
+    assert np.isnan(store.lookup("SFRH5", [D(2023, 1, 1)]))[0]
+
+
+def test_fed_meeting_probabilities_batch_matches_scalar():
+    nmoves = np.array([-2.37, -0.5, 0.0, 0.25, 1.0, 1.75, 3.5])
+    assert price_utils.fed_meeting_probabilities_batch(nmoves) == [
+        price_utils.fed_meeting_probabilities(float(n)) for n in nmoves
+    ]
@@ -0,0 +1,93 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the shared token-bucket rate limiter."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from fomc_research.shared_libraries import callbacks, rate_limiter
+
+
+def test_burst_up_to_capacity_then_waits():
+    backend = rate_limiter.InMemoryBucketBackend()
+    waits = [
+        backend.reserve("m", rate=10, capacity=3, now=100.0) for _ in range(5)
+    ]
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.1)
+    assert waits[4] == pytest.approx(0.2)
+    # Tokens refill over time.
+    assert backend.reserve("m", rate=10, capacity=3, now=101.0) == 0.0
+
+
+def test_keys_are_independent():
+    backend = rate_limiter.InMemoryBucketBackend()
+    assert backend.reserve("a", rate=1, capacity=1, now=0.0) == 0.0
+    assert backend.reserve("b", rate=1, capacity=1, now=0.0) == 0.0
+    assert backend.reserve("a", rate=1, capacity=1, now=0.0) == 1.0
+
+
+def test_sqlite_backend_shared_between_instances(tmp_path):
+    path = str(tmp_path / "buckets.db")
+    first = rate_limiter.SqliteBucketBackend(path)
+    second = rate_limiter.SqliteBucketBackend(path)
+    assert first.reserve("m", rate=1, capacity=1, now=0.0) == 0.0
+    assert second.reserve("m", rate=1, capacity=1, now=0.0) == 1.0
+
+
+def test_concurrent_acquires_await_without_blocking():
+    limiter = rate_limiter.RateLimiter(20, period_secs=1.0, capacity=1)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        waits = await asyncio.gather(*(limiter.acquire("m") for _ in range(5)))
+        task.cancel()
+        return waits, ticks
+
+    start = time.monotonic()
+    waits, ticks = asyncio.run(run())
+    elapsed = time.monotonic() - start
+    assert sorted(waits)[-1] == pytest.approx(0.2, abs=0.02)
+    assert 0.15 < elapsed < 0.5
+    assert ticks >= 10
+    metrics = limiter.metrics()["m"]
+    assert metrics["requests"] == 5
+    assert metrics["delayed_requests"] == 4
+    assert metrics["max_wait_secs"] == pytest.approx(0.2, abs=0.02)
+
+
+def test_rate_limit_callback_uses_shared_limiter():
+    limiter = rate_limiter.RateLimiter(1000, period_secs=60)
+    rate_limiter.set_rate_limiter(limiter)
+    try:
+        context = SimpleNamespace(agent_name="analysis_agent", state={})
+        request = SimpleNamespace(model="gemini-test")
+        for _ in range(3):
+            asyncio.run(callbacks.rate_limit_callback(context, request))
+        assert limiter.metrics()["gemini-test"]["requests"] == 3
+        assert context.state == {}
+    finally:
+        rate_limiter.set_rate_limiter(None)
@@ -0,0 +1,100 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the hierarchical redline engine."""
+
+from fomc_research.shared_libraries import file_utils, redline
+
+OLD = (
+    "The Committee decided to maintain the target range at 5 percent. "
+    "Inflation remains elevated.\n\n"
+    "Job gains have been strong. The unemployment rate has remained low.\n\n"
+    "The Committee will continue reducing its holdings."
+)
+NEW = (
+    "The Committee decided to lower the target range to 4-3/4 percent. "
+    "Inflation remains elevated.\n\n"
+    "Job gains have been strong. The unemployment rate has remained low.\n\n"
+    "The Committee will continue reducing its holdings. "
+    "Risks to <both> goals are roughly in balance."
+)
+
+
+def _apply(ops, side):
+    skip = redline.INSERT if side == "old" else redline.DELETE
+    return "".join(text for op, text in ops if op != skip)
+
+
+def test_ops_reconstruct_both_texts():
+    result = redline.redline(OLD, NEW)
+    assert _apply(result.ops, "old") == OLD
+    assert _apply(result.ops, "new") == NEW
+    assert not result.timed_out
+
+
+def test_changes_are_word_level():
+    result = redline.redline(OLD, NEW)
+    deleted = [t for op, t in result.ops if op == redline.DELETE]
+    assert "maintain" in deleted
+    assert all("Job gains" not in t for op, t in result.ops if op != 0)
+
+
+def test_summary_lists_changed_sentences():
+    summary = redline.redline(OLD, NEW).summary()
+    assert summary["added_sentences"] == [
+        "The Committee decided to lower the target range to 4-3/4 percent.",
+        "Risks to <both> goals are roughly in balance.",
+    ]
+    assert summary["removed_sentences"] == [
+        "The Committee decided to maintain the target range at 5 percent."
+    ]
+
+
+def test_html_is_escaped():
+    html = file_utils.create_html_redline(NEW, OLD)
+    assert "&lt;both&gt;" in html
+    assert "<both>" not in html
+    assert '<ins style="background-color: #ccffcc;">' in html
+
+
+def test_timeout_falls_back_to_coarse_replacement():
+    result = redline.redline(OLD, NEW, timeout=0)
+    assert result.timed_out
+    assert result.ops == [(redline.DELETE, OLD), (redline.INSERT, NEW)]
+
+
+def test_rewrapped_text_compares_equal():
+    wrapped = (
+        "The Committee decided to maintain\nthe target range at 5 percent. "
+        "Inflation\nremains elevated.\n\n"
+        "Job gains have been strong. The unemployment rate\n"
+        "has remained low.\n\n"
+        "The Committee will continue reducing its holdings."
+    )
+    result = redline.redline(OLD, wrapped)
+    assert all(op == 0 for op, _ in result.ops)
+    assert not result.added_sentences and not result.removed_sentences
+
+
+def test_summary_reports_whole_sentences_from_wrapped_text():
+    old = "Job gains have been\nstrong.\nThe unemployment rate has\nremained low."
+    new = (
+        "Job gains have been\nstrong. Growth in economic activity\n"
+        "has moderated.\nThe unemployment rate has\nremained low."
+    )
+    summary = redline.redline(old, new).summary()
+    assert summary["added_sentences"] == [
+        "Growth in economic activity has moderated."
+    ]
+    assert summary["removed_sentences"] == []
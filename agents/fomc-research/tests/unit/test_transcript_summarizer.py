@@ -0,0 +1,207 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the map-reduce transcript summarizer."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from google.genai import types
+
+from fomc_research.shared_libraries import rate_limiter
+from fomc_research.shared_libraries import transcript_summarizer as ts
+from fomc_research.sub_agents.summarize_meeting_agent import (
+    SummarizeMeetingAgent,
+)
+
+TRANSCRIPT = (
+    "CHAIR POWELL. Good afternoon. Inflation has eased substantially. "
+    "The labor market remains solid.\n"
+    "MICHELLE SMITH. Let's go to questions.\n"
+    "JOHN DOE. Thank you, Chair Powell. Will you cut in March?\n"
+    "CHAIR POWELL. We will take it meeting by meeting. "
+    "No decision has been made.\n"
+)
+
+
+class FakeModel:
+    """Records prompts; answers with a short summary after a delay."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, prompt):
+        self.prompts.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return f"summary {len(self.prompts)}"
+
+
+def make_summarizer(model, tmp_path, **kwargs):
+    kwargs.setdefault("chunk_chars", 80)
+    return ts.TranscriptSummarizer(
+        summarize_fn=model,
+        model="test-model",
+        cache=ts.SummaryCache(str(tmp_path)),
+        limiter=rate_limiter.RateLimiter(1000),
+        **kwargs,
+    )
+
+
+def test_split_turns_on_speaker_labels():
+    turns = ts.split_turns("Preamble.\n" + TRANSCRIPT)
+    assert turns[0] == "Preamble."
+    assert [t.split(".")[0] for t in turns[1:]] == [
+        "CHAIR POWELL",
+        "MICHELLE SMITH",
+        "JOHN DOE",
+        "CHAIR POWELL",
+    ]
+
+
+def test_chunks_keep_turns_whole_and_split_long_ones():
+    chunks = ts.chunk_transcript(TRANSCRIPT, max_chars=80)
+    for chunk in chunks:
+        assert chunk.split(".")[0].split(" (cont")[0] in (
+            "CHAIR POWELL",
+            "MICHELLE SMITH",
+            "JOHN DOE",
+        )
+    # The opening statement is longer than 80 chars and is split at a
+    # sentence end, with the speaker repeated.
+    assert chunks[0] == (
+        "CHAIR POWELL. Good afternoon. Inflation has eased substantially."
+    )
+    assert chunks[1] == "CHAIR POWELL (cont.) The labor market remains solid."
+    assert ts.chunk_transcript(TRANSCRIPT, max_chars=10_000) == [
+        "\n\n".join(ts.split_turns(TRANSCRIPT))
+    ]
+
+
+def test_map_runs_concurrently_within_limit(tmp_path):
+    model = FakeModel(delay=0.1)
+    summarizer = make_summarizer(model, tmp_path, max_concurrency=3)
+    chunks = ts.chunk_transcript(TRANSCRIPT, 80)
+    start = time.monotonic()
+    asyncio.run(summarizer.summarize(TRANSCRIPT))
+    assert len(chunks) > 3
+    assert model.max_active == 3
+    assert time.monotonic() - start < 0.1 * (len(chunks) + 1)
+
+
+def test_hierarchical_reduce(tmp_path):
+    model = FakeModel()
+    summarizer = make_summarizer(model, tmp_path, chunk_chars=20, fan_in=2)
+    num_chunks = len(ts.chunk_transcript(TRANSCRIPT, 20))
+    summary = asyncio.run(summarizer.summarize(TRANSCRIPT))
+    reduce_prompts = [p for p in model.prompts if "<PART_SUMMARIES>" in p]
+    # A binary tree over n leaves has n - 1 internal nodes.
+    assert len(reduce_prompts) == num_chunks - 1
+    assert summary == f"summary {len(model.prompts)}"
+
+
+def test_single_chunk_needs_no_reduce(tmp_path):
+    model = FakeModel()
+    summarizer = make_summarizer(model, tmp_path, chunk_chars=10_000)
+    assert asyncio.run(summarizer.summarize(TRANSCRIPT)) == "summary 1"
+    assert len(model.prompts) == 1
+
+
+def test_summaries_are_cached_by_content(tmp_path):
+    model = FakeModel()
+    asyncio.run(make_summarizer(model, tmp_path).summarize(TRANSCRIPT))
+    calls = len(model.prompts)
+
+    # A new summarizer sharing the disk cache makes no model calls.
+    again = make_summarizer(model, tmp_path)
+    asyncio.run(again.summarize(TRANSCRIPT))
+    assert len(model.prompts) == calls
+    assert again.model_calls == 0 and again.cache_hits > 0
+
+    # Changing one turn only re-summarizes its chunk and the reduce path.
+    edited = TRANSCRIPT.replace("March", "May")
+    asyncio.run(again.summarize(edited))
+    assert 0 < again.model_calls < calls
+
+
+def test_calls_go_through_rate_limiter(tmp_path):
+    limiter = rate_limiter.RateLimiter(1000)
+    summarizer = make_summarizer(FakeModel(), tmp_path)
+    summarizer.limiter = limiter
+    asyncio.run(summarizer.summarize(TRANSCRIPT))
+    assert limiter.metrics()["test-model"]["requests"] == summarizer.model_calls
+
+
+class FakeContext(SimpleNamespace):
+
+    async def load_artifact(self, filename):
+        return self.artifacts.get(filename)
+
+
+@pytest.fixture(name="summarizer")
+def fixture_summarizer(tmp_path):
+    summarizer = make_summarizer(FakeModel(), tmp_path, chunk_chars=10_000)
+    ts.set_transcript_summarizer(summarizer)
+    yield summarizer
+    ts.set_transcript_summarizer(None)
+
+
+def test_callback_stores_summary(summarizer):
+    context = FakeContext(
+        state={},
+        artifacts={
+            "transcript_fulltext": types.Part(text=TRANSCRIPT),
+        },
+    )
+    asyncio.run(ts.summarize_transcript_callback(context))
+    assert context.state["transcript_summary"] == "summary 1"
+
+
+def test_callback_falls_back_to_full_transcript(summarizer):
+    async def broken(prompt):
+        raise RuntimeError("quota")
+
+    summarizer.summarize_fn = broken
+    context = FakeContext(
+        state={},
+        artifacts={"transcript_fulltext": types.Part(text=TRANSCRIPT)},
+    )
+    asyncio.run(ts.summarize_transcript_callback(context))
+    assert context.state["transcript_summary"] == TRANSCRIPT
+
+
+def test_agent_uses_summary():
+    assert (
+        SummarizeMeetingAgent.before_agent_callback
+        is ts.summarize_transcript_callback
+    )
+    assert "{transcript_summary}" in SummarizeMeetingAgent.instruction
+
+
+def test_summary_cache_creates_dir_lazily_and_is_bounded(tmp_path):
+    cache_dir = tmp_path / "summaries"
+    cache = ts.SummaryCache(str(cache_dir), max_bytes=80)
+    assert not cache_dir.exists()
+    for i in range(3):
+        cache.put(f"k{i}", "x" * 20)
+    assert sorted(p.stem for p in cache_dir.glob("*.json")) == ["k1", "k2"]
+    assert ts.SummaryCache(str(cache_dir)).get("k2") == "x" * 20
+    assert ts.SummaryCache(str(cache_dir), ttl_seconds=-1).get("k2") is None
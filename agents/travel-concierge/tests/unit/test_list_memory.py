@@ -0,0 +1,151 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ordered-set list memory and the memorize tools."""
+
+from types import SimpleNamespace
+import unittest
+
+from travel_concierge.shared_libraries import list_memory
+from travel_concierge.tools import memory
+
+
+class RecordingState(dict):
+    """Session state stand-in that records every write, like a state delta."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writes = []
+
+    def __setitem__(self, key, value):
+        self.writes.append(key)
+        super().__setitem__(key, value)
+
+
+def make_context(state, session_id="s1"):
+    return SimpleNamespace(
+        state=state,
+        _invocation_context=SimpleNamespace(session=SimpleNamespace(id=session_id)),
+    )
+
+
+class TestListMemory(unittest.TestCase):
+    """Test cases for ListMemory."""
+
+    def setUp(self):
+        self.memory = list_memory.ListMemory(compact_threshold=4)
+        self.state = RecordingState()
+
+    def items(self):
+        return self.memory.items("s1", self.state, "poi")
+
+    def test_add_remove_keeps_order_and_uniqueness(self):
+        for value in ("a", "b", "a", "c"):
+            self.memory.add("s1", self.state, "poi", value)
+        self.assertTrue(self.memory.remove("s1", self.state, "poi", "b"))
+        self.assertFalse(self.memory.remove("s1", self.state, "poi", "x"))
+        self.assertEqual(self.items(), ["a", "c"])
+        self.assertTrue(self.memory.contains("s1", self.state, "poi", "a"))
+
+    def test_changes_write_only_the_log_until_compaction(self):
+        self.state["poi"] = [f"old{i}" for i in range(1000)]
+        self.state.writes.clear()
+        for value in ("a", "b", "c"):
+            self.memory.add("s1", self.state, "poi", value)
+        self.assertEqual(
+            self.state.writes,
+            ["_memlog:poi", "_memlog_pending", "_memlog:poi", "_memlog:poi"],
+        )
+        self.assertEqual(len(self.state["poi"]), 1000)
+        self.assertEqual(self.items()[-3:], ["a", "b", "c"])
+
+        # The fourth record reaches the threshold and compacts.
+        self.memory.remove("s1", self.state, "poi", "old0")
+        self.assertEqual(self.state["poi"][-3:], ["a", "b", "c"])
+        self.assertEqual(len(self.state["poi"]), 1002)
+        self.assertEqual(self.state["_memlog:poi"], {"base": 4, "records": []})
+        self.assertEqual(self.state["_memlog_pending"], [])
+
+    def test_view_is_reused_and_rebuilt_when_state_moves_on(self):
+        for value in ("a", "b"):
+            self.memory.add("s1", self.state, "poi", value)
+        self.assertEqual(self.memory.rebuilds, 1)
+
+        # Another process appends to the log.
+        other = list_memory.ListMemory(compact_threshold=4)
+        other.add("s1", self.state, "poi", "c")
+        self.assertEqual(self.items(), ["a", "b", "c"])
+        self.assertEqual(self.memory.rebuilds, 2)
+
+    def test_reset_invalidates_view_without_log(self):
+        self.state["poi"] = ["a"]
+        self.assertEqual(self.items(), ["a"])
+        self.state["poi"] = ["b"]
+        self.memory.reset("s1", self.state, "poi")
+        self.assertNotIn("_memlog:poi", self.state)
+        self.assertEqual(self.items(), ["b"])
+        self.memory.add("s1", self.state, "poi", "c")
+        self.memory.compact("s1", self.state)
+        self.assertEqual(self.state["poi"], ["b", "c"])
+
+    def test_reset_moves_logged_list_on_for_other_processes(self):
+        self.memory.add("s1", self.state, "poi", "a")
+        other = list_memory.ListMemory(compact_threshold=4)
+        self.assertEqual(other.items("s1", self.state, "poi"), ["a"])
+        self.state["poi"] = ["b"]
+        self.memory.reset("s1", self.state, "poi")
+        self.assertEqual(other.items("s1", self.state, "poi"), ["b"])
+        self.assertEqual(self.state["_memlog_pending"], [])
+
+    def test_compact(self):
+        self.memory.add("s1", self.state, "poi", "a")
+        self.memory.add("s1", self.state, "likes", "b")
+        self.memory.compact("s1", self.state)
+        self.assertEqual(self.state["poi"], ["a"])
+        self.assertEqual(self.state["likes"], ["b"])
+        self.assertEqual(self.state["_memlog:poi"]["records"], [])
+        self.assertEqual(self.state["_memlog_pending"], [])
+
+    def test_compact_touches_only_pending_lists(self):
+        self.memory.add("s1", self.state, "poi", "a")
+        self.memory.compact("s1", self.state)
+        self.state.writes.clear()
+        self.memory.compact("s1", self.state)
+        self.assertEqual(self.state.writes, [])
+
+
+class TestMemoryTools(unittest.TestCase):
+    """Test cases for memorize_list, forget and recall_list."""
+
+    def test_tools(self):
+        context = make_context(RecordingState({"likes": ["museums"]}))
+        memory.memorize_list("likes", "hiking", context)
+        memory.memorize_list("likes", "museums", context)
+        memory.forget("likes", "museums", context)
+        self.assertEqual(
+            memory.recall_list("likes", context), {"status": "ok", "likes": ["hiking"]}
+        )
+        memory.compact_memory(context)
+        self.assertEqual(context.state["likes"], ["hiking"])
+
+    def test_memorize_scalar_writes_only_the_key(self):
+        context = make_context(RecordingState())
+        memory.memorize("origin", "SFO", context)
+        self.assertEqual(context.state.writes, ["origin"])
+
+    def test_memorize_overwrites_list(self):
+        context = make_context(RecordingState())
+        memory.memorize_list("likes", "hiking", context)
+        memory.memorize("likes", ["food"], context)
+        self.assertEqual(memory.recall_list("likes", context)["likes"], ["food"])
@@ -0,0 +1,111 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the monitor_itinerary tool."""
+
+import asyncio
+import copy
+import json
+import time
+from types import SimpleNamespace
+import unittest
+
+from travel_concierge.shared_libraries import constants
+from travel_concierge.sub_agents.in_trip import monitor
+from travel_concierge.sub_agents.in_trip.agent import trip_monitor_agent
+
+with open("eval/itinerary_seattle_example.json", "r") as file:
+    SCENARIO = json.load(file)["state"]
+
+
+class SlowProvider(monitor.FakeMonitorProvider):
+    """Fake provider that takes a while per check and fails for one item."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.checked = []
+
+    async def check(self, item):
+        self.checked.append((item.kind, item.name))
+        await asyncio.sleep(self.delay)
+        if item.name == "UA5678":
+            raise ConnectionError("provider down")
+        return await super().check(item)
+
+
+class TestMonitor(unittest.TestCase):
+    """Test cases for extracting and checking itinerary items."""
+
+    def setUp(self):
+        self.state = copy.deepcopy(SCENARIO)
+        self.tool_context = SimpleNamespace(state=self.state)
+
+    def tearDown(self):
+        monitor.set_monitor_provider(monitor.FakeMonitorProvider())
+
+    def test_extract_items(self):
+        items = monitor.extract_monitor_items(self.state[constants.ITIN_KEY])
+        self.assertEqual(
+            [(item.kind, item.name) for item in items],
+            [
+                ("flight", "AA1234"),
+                ("weather", "Pike Place Market"),
+                ("booking", "Space Needle"),
+                ("weather", "Space Needle"),
+                ("booking", "Museum of Pop Culture (MoPOP)"),
+                ("flight", "UA5678"),
+            ],
+        )
+        self.assertEqual(
+            items[0].details, {"checkin_time": "07:30", "departure_time": "08:00"}
+        )
+        self.assertEqual(items[2].details["location"], "400 Broad St, Seattle, WA 98109")
+
+    def test_report_with_fake_provider(self):
+        report = asyncio.run(monitor.monitor_itinerary(self.tool_context))
+        self.assertEqual(len(report["checks"]), 6)
+        self.assertEqual(
+            [item["name"] for item in report["attention"]],
+            ["Space Needle"],
+        )
+        self.assertEqual(report["attention"][0]["kind"], "booking")
+
+    def test_checks_run_concurrently_and_errors_are_reported(self):
+        provider = SlowProvider(delay=0.2)
+        monitor.set_monitor_provider(provider)
+        start = time.monotonic()
+        report = asyncio.run(monitor.monitor_itinerary(self.tool_context))
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertEqual(len(provider.checked), 6)
+        failed = [c for c in report["checks"] if c["name"] == "UA5678"][0]
+        self.assertTrue(failed["needs_attention"])
+        self.assertIn("provider down", failed["status"])
+
+    def test_timeout(self):
+        checks = asyncio.run(
+            monitor.run_checks(
+                [monitor.MonitorItem("weather", "Hike", "2025-06-16", {"location": "x"})],
+                provider=SlowProvider(delay=1),
+                timeout=0.05,
+            )
+        )
+        self.assertTrue(checks[0]["needs_attention"])
+
+    def test_empty_itinerary(self):
+        self.tool_context.state = {}
+        report = asyncio.run(monitor.monitor_itinerary(self.tool_context))
+        self.assertEqual(report["checks"], [])
+
+    def test_agent_uses_single_tool(self):
+        self.assertEqual(trip_monitor_agent.tools, [monitor.monitor_itinerary])
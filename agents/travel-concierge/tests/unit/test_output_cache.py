@@ -0,0 +1,147 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the output_schema agent cache."""
+
+import asyncio
+import json
+from typing import AsyncGenerator
+import unittest
+
+from google.adk.agents import Agent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types as genai_types
+
+from travel_concierge.shared_libraries import output_cache
+from travel_concierge.shared_libraries import types
+from travel_concierge.sub_agents.planning import tools
+
+ROOMS = {"rooms": [{"is_available": True, "price_in_usd": 260, "room_type": "King"}]}
+
+
+class FakeLlm(BaseLlm):
+    """Answers every request with a fixed JSON response."""
+
+    response: dict
+    calls: int = 0
+
+    async def generate_content_async(
+        self, llm_request, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.calls += 1
+        yield LlmResponse(
+            content=genai_types.Content(
+                role="model",
+                parts=[genai_types.Part(text=json.dumps(self.response))],
+            )
+        )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestOutputCache(unittest.TestCase):
+    """Test cases for OutputCache and enable_output_cache."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = output_cache.OutputCache(ttl=60, clock=self.clock)
+        self.llm = FakeLlm(model="fake", response=ROOMS)
+        self.agent = self.make_agent(
+            'Rooms for <hotel>{hotel}</hotel>, like {{ "rooms": [] }}.'
+        )
+
+    def make_agent(self, instruction):
+        return output_cache.enable_output_cache(
+            Agent(
+                model=self.llm,
+                name="hotel_room_selection_agent",
+                instruction=instruction,
+                output_schema=types.RoomsSelection,
+                output_key="room",
+            ),
+            cache=self.cache,
+        )
+
+    def run_agent(self, request, state):
+        return asyncio.run(tools.run_structured_agent(self.agent, request, state))
+
+    def test_canonical_request(self):
+        self.assertEqual(
+            output_cache.canonical_request("  Rooms at  the Hilton, please!"),
+            "rooms at the hilton please",
+        )
+        self.assertEqual(
+            output_cache.template_vars('{a} {b?} {user:c} {{ "d": 1 }} {artifact.e}'),
+            ["a", "b", "user:c"],
+        )
+
+    def test_repeated_request_is_served_from_cache(self):
+        state = {"hotel": {"name": "Hilton"}}
+        self.assertEqual(self.run_agent("Rooms at the Hilton", state), ROOMS)
+        self.assertEqual(self.run_agent("rooms at the  hilton.", state), ROOMS)
+        self.assertEqual(self.llm.calls, 1)
+        self.assertEqual(
+            self.cache.metrics()["hotel_room_selection_agent"],
+            {"hits": 1, "misses": 1, "hit_rate": 0.5},
+        )
+
+    def test_key_includes_instruction_state(self):
+        self.run_agent("Rooms", {"hotel": {"name": "Hilton"}})
+        self.run_agent("Rooms", {"hotel": {"name": "Conrad"}})
+        self.assertEqual(self.llm.calls, 2)
+        # State the instruction does not use does not matter.
+        self.run_agent("Rooms", {"hotel": {"name": "Hilton"}, "other": 1})
+        self.assertEqual(self.llm.calls, 2)
+
+    def test_entries_expire(self):
+        state = {"hotel": {"name": "Hilton"}}
+        self.run_agent("Rooms", state)
+        self.clock.now = 61
+        self.run_agent("Rooms", state)
+        self.assertEqual(self.llm.calls, 2)
+
+    def test_stale_output_is_not_cached(self):
+        self.llm.response = {"not": "rooms"}
+        state = {"hotel": {"name": "Hilton"}, "room": ROOMS}
+        with self.assertRaises(Exception):
+            self.run_agent("Rooms", state)
+        self.llm.response = ROOMS
+        self.run_agent("Rooms", state)
+        self.assertEqual(self.llm.calls, 2)
+
+    def test_lru_bound(self):
+        cache = output_cache.OutputCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, types.RoomsSelection(rooms=[]))
+        self.assertIsNone(cache.get("agent", "a"))
+        self.assertIsNotNone(cache.get("agent", "c"))
+
+    def test_requires_output_schema(self):
+        with self.assertRaises(ValueError):
+            output_cache.enable_output_cache(Agent(model=self.llm, name="plain"))
+
+    def test_session_time_only_counts_by_day(self):
+        self.agent = self.make_agent("Rooms for {hotel} after {_time}.")
+        self.run_agent("Rooms", {"hotel": "Hilton", "_time": "2025-06-01 10:00:00"})
+        self.run_agent("Rooms", {"hotel": "Hilton", "_time": "2025-06-01 18:30:00"})
+        self.assertEqual(self.llm.calls, 1)
+        self.run_agent("Rooms", {"hotel": "Hilton", "_time": "2025-06-02 09:00:00"})
+        self.assertEqual(self.llm.calls, 2)
@@ -0,0 +1,215 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the Places client, run against a local HTTP stub."""
+
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+import unittest
+from urllib.parse import parse_qs, urlparse
+
+from travel_concierge.tools import places
+
+STUB_DELAY = 0.2
+
+
+class PlacesStub(BaseHTTPRequestHandler):
+    """Answers findplacefromtext with a candidate derived from the input."""
+
+    requests = []
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)["input"][0]
+        cls = type(self)
+        with cls.lock:
+            cls.requests.append(query)
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        time.sleep(STUB_DELAY)
+        with cls.lock:
+            cls.active -= 1
+        if url.path != "/findplacefromtext/json":
+            self.send_response(404)
+            self.end_headers()
+            return
+        candidates = []
+        if not query.lower().startswith("nowhere"):
+            candidates.append(
+                {
+                    "place_id": "id-" + query.split(",")[0].lower(),
+                    "name": query.split(",")[0],
+                    "formatted_address": query,
+                    "photos": [{"photo_reference": "ref1"}],
+                    "geometry": {"location": {"lat": 1.5, "lng": -2.5}},
+                }
+            )
+        body = json.dumps({"candidates": candidates}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPlacesService(unittest.TestCase):
+    """Test cases for the async Places client and map_tool."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), PlacesStub)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        PlacesStub.requests = []
+        PlacesStub.max_active = 0
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = f"{self.tmp.name}/geocode.db"
+        self.service = self.make_service()
+        self.service.places_api_key = "test-key"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_service(self, ttl=3600, max_concurrency=8):
+        return places.PlacesService(
+            base_url=self.base_url,
+            cache=places.GeocodeCache(self.cache_path, ttl=ttl),
+            max_concurrency=max_concurrency,
+        )
+
+    def run_async(self, coro):
+        async def run():
+            try:
+                return await coro
+            finally:
+                await self.service.aclose()
+
+        return asyncio.run(run())
+
+    def test_normalize_query(self):
+        self.assertEqual(
+            places.normalize_query("  Eiffel   Tower ,Paris!  "),
+            "eiffel tower, paris",
+        )
+
+    def test_find_place(self):
+        result = self.run_async(
+            self.service.afind_place_from_text("Louvre, Paris")
+        )
+        self.assertEqual(result["place_id"], "id-louvre")
+        self.assertEqual(result["lat"], "1.5")
+        self.assertEqual(result["lng"], "-2.5")
+        self.assertIn("photoreference=ref1", result["photos"][0])
+        self.assertIn("key=test-key", result["photos"][0])
+
+    def test_no_candidates_and_http_errors(self):
+        result = self.run_async(self.service.afind_place_from_text("Nowhere"))
+        self.assertEqual(result, {"error": "No places found."})
+        self.service.base_url = self.base_url + "/missing"
+        result = self.run_async(self.service.afind_place_from_text("Louvre"))
+        self.assertIn("Error fetching place data", result["error"])
+
+    def test_lookups_run_concurrently_and_bounded(self):
+        queries = [f"Place {i}, City" for i in range(6)]
+        self.service.max_concurrency = 3
+        start = time.monotonic()
+        results = self.run_async(self.service.find_places(queries))
+        elapsed = time.monotonic() - start
+        self.assertEqual(
+            [r["place_id"] for r in results],
+            [f"id-place {i}" for i in range(6)],
+        )
+        self.assertEqual(PlacesStub.max_active, 3)
+        self.assertLess(elapsed, STUB_DELAY * 6)
+
+    def test_cache_is_persistent_and_normalized(self):
+        self.run_async(self.service.find_places(["Louvre, Paris"]))
+        self.service = self.make_service()
+        self.service.places_api_key = "other-key"
+        results = self.run_async(
+            self.service.find_places(["louvre ,  PARIS", "Louvre, Paris"])
+        )
+        self.assertEqual(PlacesStub.requests, ["Louvre, Paris"])
+        self.assertEqual(self.service.api_calls, 0)
+        # URLs are rebuilt with the current key, not the cached one.
+        self.assertIn("key=other-key", results[0]["photos"][0])
+
+    def test_cache_entries_expire(self):
+        self.run_async(self.service.find_places(["Louvre, Paris"]))
+        self.service = self.make_service(ttl=0)
+        self.service.places_api_key = "test-key"
+        self.run_async(self.service.find_places(["Louvre, Paris"]))
+        self.assertEqual(len(PlacesStub.requests), 2)
+        self.assertEqual(self.service.cache.purge_expired(), 1)
+
+    def test_map_tool_resolves_all_pois(self):
+        original = places.places_service
+        places.places_service = self.service
+        try:
+            tool_context = SimpleNamespace(
+                state={
+                    "poi": {
+                        "places": [
+                            {"place_name": "Louvre", "address": "Paris"},
+                            {"place_name": "Nowhere", "address": "Atlantis"},
+                        ]
+                    }
+                }
+            )
+            pois = self.run_async(places.map_tool("poi", tool_context))
+        finally:
+            places.places_service = original
+        self.assertEqual(pois[0]["place_id"], "id-louvre")
+        self.assertEqual(pois[0]["long"], "-2.5")
+        self.assertIsNone(pois[1]["place_id"])
+        self.assertIs(pois, tool_context.state["poi"]["places"])
+
+    def test_each_event_loop_keeps_its_own_client(self):
+        async def get_client():
+            return self.service._get_client()
+
+        first_loop = asyncio.new_event_loop()
+        second_loop = asyncio.new_event_loop()
+        try:
+            first = first_loop.run_until_complete(get_client())
+            second = second_loop.run_until_complete(get_client())
+            self.assertIsNot(first, second)
+            # Switching loops neither drops nor replaces the first client.
+            self.assertIs(first_loop.run_until_complete(get_client()), first)
+            first_loop.run_until_complete(self.service.aclose())
+            self.assertTrue(first.is_closed)
+            self.assertFalse(second.is_closed)
+            second_loop.run_until_complete(self.service.aclose())
+        finally:
+            first_loop.close()
+            second_loop.close()
+        self.assertEqual(len(self.service._clients), 0)
@@ -0,0 +1,214 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for concurrent planning searches and speculative prefetch."""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from typing import AsyncGenerator
+import unittest
+from unittest import mock
+
+from google.adk.agents import Agent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.adk.tools.agent_tool import AgentTool
+from google.genai import types as genai_types
+
+from travel_concierge.shared_libraries import types
+from travel_concierge.sub_agents.planning import tools
+from travel_concierge.sub_agents.planning.agent import planning_agent
+
+SCOPE_S1 = {tools.PREFETCH_SCOPE: "s1"}
+SEATS = {"seats": [[{"is_available": True, "price_in_usd": 60, "seat_number": "1A"}]]}
+
+
+class FakeLlm(BaseLlm):
+    """Answers every request with a fixed JSON response after a delay."""
+
+    response: dict
+    delay: float = 0.0
+    calls: int = 0
+
+    async def generate_content_async(
+        self, llm_request, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        yield LlmResponse(
+            content=genai_types.Content(
+                role="model",
+                parts=[genai_types.Part(text=json.dumps(self.response))],
+            )
+        )
+
+
+def make_seat_agent(llm):
+    return Agent(
+        model=llm,
+        name="flight_seat_selection_agent",
+        instruction="Simulate seats.",
+        output_schema=types.SeatsSelection,
+        output_key="seat",
+        before_agent_callback=tools.serve_prefetched("seat"),
+    )
+
+
+class TestPlanningTools(unittest.TestCase):
+    """Test cases for the planning tools."""
+
+    def setUp(self):
+        tools.prefetcher = tools.SpeculativePrefetch()
+
+    def test_run_structured_agent(self):
+        llm = FakeLlm(model="fake", response=SEATS)
+        result = asyncio.run(
+            tools.run_structured_agent(make_seat_agent(llm), "Flight AA1", {})
+        )
+        self.assertEqual(result, SEATS)
+
+    def test_prefetched_output_is_served_without_model_call(self):
+        llm = FakeLlm(model="fake", response=SEATS, delay=0.1)
+        seat_agent = make_seat_agent(llm)
+
+        async def run():
+            tools.prefetcher.schedule(
+                "s1", seat_agent, "AA1234", "Flight AA1234", {}
+            )
+            # The user's pick arrives while the prefetch is still running.
+            served = await tools.run_structured_agent(
+                seat_agent, "Show seats for flight aa1234 please", SCOPE_S1
+            )
+            missed = await tools.run_structured_agent(
+                seat_agent, "Show seats for flight UA5678", SCOPE_S1
+            )
+            other_session = await tools.run_structured_agent(
+                seat_agent,
+                "Show seats for flight AA1234",
+                {tools.PREFETCH_SCOPE: "s2"},
+            )
+            return served, missed, other_session
+
+        served, missed, other_session = asyncio.run(run())
+        self.assertEqual(served, SEATS)
+        self.assertEqual(missed, SEATS)
+        self.assertEqual(other_session, SEATS)
+        # One prefetch run, plus one run for the flight not prefetched and
+        # one for the other session.
+        self.assertEqual(llm.calls, 3)
+        self.assertEqual((tools.prefetcher.hits, tools.prefetcher.misses), (1, 2))
+
+    def test_prefetched_output_expires(self):
+        now = [0.0]
+        tools.prefetcher = tools.SpeculativePrefetch(ttl=60, clock=lambda: now[0])
+
+        async def result():
+            return SEATS
+
+        async def run():
+            with mock.patch.object(tools, "run_structured_agent", lambda *a: result()):
+                tools.prefetcher.schedule(
+                    "s1",
+                    SimpleNamespace(name="flight_seat_selection_agent"),
+                    "AA1234",
+                    "Flight AA1234",
+                    {},
+                )
+                fresh = await tools.prefetcher.lookup(
+                    "s1", "flight_seat_selection_agent", "flight AA1234"
+                )
+                now[0] = 61.0
+                expired = await tools.prefetcher.lookup(
+                    "s1", "flight_seat_selection_agent", "flight AA1234"
+                )
+            return fresh, expired
+
+        self.assertEqual(asyncio.run(run()), (SEATS, None))
+
+    def test_failed_prefetch_falls_back_to_model(self):
+        async def broken(*args):
+            raise RuntimeError("quota")
+
+        async def run():
+            with mock.patch.object(tools, "run_structured_agent", broken):
+                tools.prefetcher.schedule(
+                    "s1",
+                    SimpleNamespace(name="flight_seat_selection_agent"),
+                    "AA1234",
+                    "Flight AA1234",
+                    {},
+                )
+                await asyncio.sleep(0)
+            return await tools.prefetcher.lookup(
+                "s1",
+                "flight_seat_selection_agent", "flight AA1234"
+            )
+
+        self.assertIsNone(asyncio.run(run()))
+
+    def test_searches_run_concurrently_and_prefetch_top_options(self):
+        results = {
+            "flight_search_agent": {
+                "flights": [{"flight_number": f"AA{i}"} for i in range(4)]
+            },
+            "hotel_search_agent": {"hotels": [{"name": "Hotel One"}]},
+        }
+
+        async def fake_run_async(self, *, args, tool_context):
+            await asyncio.sleep(0.2)
+            tool_context.state[self.agent.output_key] = results[self.agent.name]
+            return results[self.agent.name]
+
+        class State(dict):
+            def to_dict(self):
+                return dict(self)
+
+        tool_context = SimpleNamespace(
+            state=State(origin="SAN"),
+            _invocation_context=SimpleNamespace(session=SimpleNamespace(id="s1")),
+        )
+        scheduled = []
+
+        async def run():
+            return await tools.search_flights_and_hotels(
+                "SAN to SEA", "Seattle", tool_context
+            )
+
+        with mock.patch.object(AgentTool, "run_async", fake_run_async), mock.patch.object(
+            tools.prefetcher,
+            "schedule",
+            lambda scope, agent, key, request, state: scheduled.append(
+                (scope, agent.name, key, state[tools.PREFETCH_SCOPE])
+            ),
+        ):
+            start = time.monotonic()
+            result = asyncio.run(run())
+            elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.35)
+        self.assertEqual(result["hotel"], results["hotel_search_agent"])
+        self.assertEqual(tool_context.state["flight"], results["flight_search_agent"])
+        self.assertEqual(
+            scheduled,
+            [
+                ("s1", "flight_seat_selection_agent", "AA0", "s1"),
+                ("s1", "flight_seat_selection_agent", "AA1", "s1"),
+                ("s1", "hotel_room_selection_agent", "Hotel One", "s1"),
+            ],
+        )
+
+    def test_planning_agent_has_search_tool(self):
+        self.assertIn(tools.search_flights_and_hotels, planning_agent.tools)
@@ -0,0 +1,110 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the scenario store and the initial state callback."""
+
+import json
+import os
+import shutil
+import tempfile
+from types import SimpleNamespace
+import unittest
+from unittest import mock
+
+from travel_concierge.shared_libraries import constants
+from travel_concierge.shared_libraries import scenarios
+from travel_concierge.tools import memory
+
+SEATTLE = "eval/itinerary_seattle_example.json"
+EMPTY = "eval/itinerary_empty_default.json"
+
+
+def make_context(state, user_id="traveler0115"):
+    return SimpleNamespace(
+        state=state,
+        _invocation_context=SimpleNamespace(user_id=user_id),
+    )
+
+
+class TestScenarioStore(unittest.TestCase):
+    """Test cases for ScenarioStore."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_shipped_scenarios_are_valid(self):
+        for path in (SEATTLE, EMPTY):
+            state = scenarios.ScenarioStore(path).get()
+            self.assertIn(constants.PROF_KEY, state)
+
+    def test_loads_once_and_returns_copies(self):
+        store = scenarios.ScenarioStore(SEATTLE)
+        first = store.get()
+        first[constants.ITIN_KEY]["days"].clear()
+        second = store.get()
+        self.assertEqual(store.loads, 1)
+        self.assertTrue(second[constants.ITIN_KEY]["days"])
+
+    def test_reloads_when_file_changes(self):
+        path = os.path.join(self.tmp, "scenario.json")
+        shutil.copy(EMPTY, path)
+        store = scenarios.ScenarioStore(path)
+        self.assertEqual(store.get()["origin"], "")
+
+        with open(path) as file:
+            data = json.load(file)
+        data["state"]["origin"] = "San Diego"
+        with open(path, "w") as file:
+            json.dump(data, file)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(store.get()["origin"], "San Diego")
+        self.assertEqual(store.loads, 2)
+
+    def test_invalid_scenario(self):
+        path = os.path.join(self.tmp, "scenario.json")
+        with open(path, "w") as file:
+            json.dump({"state": {"itinerary": {"trip_name": "x"}}}, file)
+        with self.assertRaises(scenarios.ScenarioError):
+            scenarios.ScenarioStore(path).get()
+
+    def test_directory_per_user(self):
+        shutil.copy(EMPTY, os.path.join(self.tmp, "default.json"))
+        shutil.copy(SEATTLE, os.path.join(self.tmp, "alice.json"))
+        store = scenarios.ScenarioStore(self.tmp)
+        self.assertTrue(store.get("alice")[constants.ITIN_KEY])
+        self.assertEqual(store.get("bob")[constants.ITIN_KEY], {})
+        self.assertEqual(store.get("../alice")[constants.ITIN_KEY], {})
+        os.remove(os.path.join(self.tmp, "default.json"))
+        self.assertEqual(store.get("bob"), {})
+
+
+class TestLoadPrecreatedItinerary(unittest.TestCase):
+    """Test cases for the root agent's before_agent_callback."""
+
+    def test_initializes_once_without_further_io(self):
+        store = scenarios.ScenarioStore(SEATTLE)
+        context = make_context({})
+        with mock.patch.object(memory, "scenario_store", store):
+            memory._load_precreated_itinerary(context)
+            self.assertTrue(context.state[constants.ITIN_INITIALIZED])
+            self.assertEqual(context.state[constants.ITIN_DATETIME], "2025-06-15")
+            self.assertIn(constants.ITIN_TIMELINE, context.state)
+
+            with mock.patch.object(store, "get") as get:
+                memory._load_precreated_itinerary(context)
+                get.assert_not_called()
@@ -0,0 +1,190 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the itinerary timeline index and find_segment."""
+
+import asyncio
+import copy
+import inspect
+import json
+from types import MappingProxyType, SimpleNamespace
+import unittest
+from unittest import mock
+
+from google.adk.agents import Agent
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types as genai_types
+
+from tests.unit.test_planning_tools import FakeLlm
+from travel_concierge.shared_libraries import constants
+from travel_concierge.shared_libraries import timeline
+from travel_concierge.shared_libraries import types
+from travel_concierge.sub_agents.in_trip import tools
+from travel_concierge.tools.memory import index_itinerary, memorize
+
+with open("eval/itinerary_seattle_example.json", "r") as file:
+    SCENARIO = json.load(file)["state"]
+
+
+class TestTimeline(unittest.TestCase):
+    """Test cases for the timeline index."""
+
+    def setUp(self):
+        self.state = copy.deepcopy(SCENARIO)
+        self.itinerary = self.state[constants.ITIN_KEY]
+        self.profile = self.state[constants.PROF_KEY]
+
+    def segment(self, current_datetime):
+        return tools.find_segment(self.profile, self.itinerary, current_datetime)
+
+    def test_keys_are_sorted(self):
+        index = timeline.build_timeline(self.itinerary)
+        self.assertEqual(index["keys"], sorted(index["keys"]))
+        self.assertEqual(index["keys"][0], "2025-06-15 07:30")
+        self.assertEqual(len(index["positions"]), 7)
+
+    def test_before_trip_travels_from_home_to_first_flight(self):
+        travel_from, travel_to, _, arrive_by = self.segment("2025-06-15 04:00")
+        self.assertIn(self.profile["home"]["address"], travel_from)
+        self.assertEqual(travel_to, "SAN Airport")
+        self.assertEqual(arrive_by, "An hour before 07:30")
+
+    def test_between_events(self):
+        travel_from, travel_to, leave_by, arrive_by = self.segment(
+            "2025-06-16 10:00"
+        )
+        first, second = self.itinerary["days"][1]["events"][:2]
+        self.assertTrue(travel_from.startswith(first["description"]))
+        self.assertEqual(leave_by, first["end_time"])
+        self.assertTrue(travel_to.startswith(second["description"]))
+        self.assertEqual(arrive_by, second["start_time"])
+
+    def test_next_day_event_earlier_in_the_day(self):
+        # 10:00 on the 17th is after 19:00 on the 16th, even though the
+        # time of day is earlier.
+        _, travel_to, _, _ = self.segment("2025-06-16 20:00")
+        event = self.itinerary["days"][2]["events"][0]
+        self.assertTrue(travel_to.startswith(event["description"]))
+
+    def test_after_trip_returns_last_segment(self):
+        _, travel_to, _, _ = self.segment("2025-07-01 00:00")
+        self.assertEqual(travel_to, "SEA Airport")
+
+    def test_memorize_updates_only_changed_days(self):
+        tool_context = SimpleNamespace(
+            state=self.state,
+            _invocation_context=SimpleNamespace(session=SimpleNamespace(id="s1")),
+        )
+        memorize(constants.ITIN_KEY, self.itinerary, tool_context)
+        first = self.state[constants.ITIN_TIMELINE]
+
+        itinerary = copy.deepcopy(self.itinerary)
+        itinerary["days"][1]["events"][0]["start_time"] = "08:00"
+        memorize(constants.ITIN_KEY, itinerary, tool_context)
+        second = self.state[constants.ITIN_TIMELINE]
+        self.assertEqual(second["day_hashes"][0], first["day_hashes"][0])
+        self.assertNotEqual(second["day_hashes"][1], first["day_hashes"][1])
+        self.assertIn("2025-06-16 08:00", second["keys"])
+        self.assertNotIn("2025-06-16 09:00", second["keys"])
+
+    def test_stored_timeline_is_trusted_when_version_matches(self):
+        tool_context = SimpleNamespace(
+            state=self.state,
+            _invocation_context=SimpleNamespace(session=SimpleNamespace(id="s1")),
+        )
+        memorize(constants.ITIN_KEY, self.itinerary, tool_context)
+        stored = self.state[constants.ITIN_TIMELINE]
+        self.assertEqual(stored["version"], self.state[constants.ITIN_VERSION])
+        with mock.patch.object(timeline, "_day_hash") as day_hash:
+            self.assertIs(timeline.get_timeline(self.state), stored)
+        day_hash.assert_not_called()
+
+        # An itinerary written without refresh_timeline is indexed on the fly.
+        itinerary = copy.deepcopy(self.itinerary)
+        itinerary["days"][1]["events"][0]["start_time"] = "08:00"
+        self.state[constants.ITIN_KEY] = itinerary
+        self.state[constants.ITIN_VERSION] += 1
+        fresh = timeline.get_timeline(self.state)
+        self.assertIn("2025-06-16 08:00", fresh["keys"])
+
+    def test_itinerary_agent_output_is_indexed(self):
+        itinerary = {
+            "trip_name": "Weekend",
+            "start_date": "2025-06-15",
+            "end_date": "2025-06-15",
+            "origin": "San Diego",
+            "days": [
+                {
+                    "day_number": 1,
+                    "date": "2025-06-15",
+                    "events": [
+                        {
+                            "event_type": "visit",
+                            "description": "Zoo",
+                            "address": "Zoo Pl",
+                            "start_time": "10:00",
+                            "end_time": "12:00",
+                            "price": None,
+                        }
+                    ],
+                }
+            ],
+        }
+        llm = FakeLlm(model="fake", response=itinerary)
+        agent = Agent(
+            model=llm,
+            name="itinerary_agent",
+            instruction="Write the itinerary.",
+            output_schema=types.Itinerary,
+            output_key=constants.ITIN_KEY,
+            after_agent_callback=index_itinerary,
+        )
+
+        async def run():
+            session_service = InMemorySessionService()
+            runner = Runner(
+                app_name="app", agent=agent, session_service=session_service
+            )
+            session = session_service.create_session(
+                app_name="app", user_id="u", state={}
+            )
+            if inspect.isawaitable(session):
+                session = await session
+            async for _ in runner.run_async(
+                user_id="u",
+                session_id=session.id,
+                new_message=genai_types.Content(
+                    role="user", parts=[genai_types.Part(text="Go")]
+                ),
+            ):
+                pass
+            session = session_service.get_session(
+                app_name="app", user_id="u", session_id=session.id
+            )
+            if inspect.isawaitable(session):
+                session = await session
+            return session.state
+
+        state = asyncio.run(run())
+        stored = state[constants.ITIN_TIMELINE]
+        self.assertEqual(stored["version"], state[constants.ITIN_VERSION])
+        self.assertEqual(stored["keys"], ["2025-06-15 10:00"])
+
+    def test_transit_coordination_with_read_only_state(self):
+        self.state[constants.ITIN_DATETIME] = "2025-06-16 10:00"
+        context = SimpleNamespace(state=MappingProxyType(self.state))
+        instruction = tools.transit_coordination(context)
+        self.assertIn("2025-06-16 10:00", instruction)
+        self.assertNotIn(constants.ITIN_TIMELINE, self.state)
@@ -25,7 +25,10 @@ from travel_concierge.sub_agents.planning.agent import planning_agent
 from travel_concierge.sub_agents.post_trip.agent import post_trip_agent
 from travel_concierge.sub_agents.pre_trip.agent import pre_trip_agent
 
-from travel_concierge.tools.memory import _load_precreated_itinerary
+from travel_concierge.tools.memory import (
+    _load_precreated_itinerary,
+    compact_memory,
+)
 
 
 root_agent = Agent(
@@ -42,4 +45,5 @@ root_agent = Agent(
         post_trip_agent,
     ],
     before_agent_callback=_load_precreated_itinerary,
+    after_agent_callback=compact_memory,
 )
@@ -18,6 +18,8 @@ SYSTEM_TIME = "_time"
 ITIN_INITIALIZED = "_itin_initialized"
 
 ITIN_KEY = "itinerary"
+ITIN_TIMELINE = "_itin_timeline"
+ITIN_VERSION = "_itin_version"
 PROF_KEY = "user_profile"
 
 ITIN_START_DATE = "itinerary_start_date"
@@ -0,0 +1,193 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ordered-set list memory with an append-only change log.
+
+A remembered list is kept in session state as two entries:
+
+- `state[key]`: the snapshot, a plain list as before.
+- `state["_memlog:" + key]`: {"base": n, "records": [[op, value], ...]}, the
+  changes made since the snapshot, where n counts all changes folded into
+  the snapshot so far.
+
+A change rewrites only the short log, so the state delta the session service
+persists stays small however long the list grows. Once the log reaches
+COMPACT_THRESHOLD records it is folded into the snapshot. The keys with
+pending records are listed in `state["_memlog_pending"]`, so compacting
+after a turn touches only those lists.
+
+Keys written only by `memorize` never get a log entry.
+
+Membership tests use an ordered set (a dict) materialized per session and
+cached in process, so adding or removing a value is O(1) as long as the
+cached view is current. A view is rebuilt from the snapshot and the log
+only when the state has moved on without it, e.g. in another process.
+Views are cached only for lists that have a log, whose change count tells
+when they are stale.
+
+Until a list is compacted, `state[key]` alone is stale. Read lists through
+ListMemory.items() (the `recall_list` tool), or compact first; the root
+agent compacts all lists after each of its turns.
+"""
+
+import collections
+import threading
+from typing import Any, Dict, Hashable, List, Optional
+
+LOG_PREFIX = "_memlog:"
+PENDING_KEY = "_memlog_pending"
+ADD = "add"
+REMOVE = "remove"
+COMPACT_THRESHOLD = 32
+MAX_CACHED_VIEWS = 1024
+
+
+class _View:
+    """Materialized ordered set for one list, at change number `seq`."""
+
+    def __init__(self, seq: int, members: Dict[Hashable, None]):
+        self.seq = seq
+        self.members = members
+
+
+class ListMemory:
+    """Ordered-set operations over lists kept in session state."""
+
+    def __init__(
+        self,
+        compact_threshold: int = COMPACT_THRESHOLD,
+        max_cached_views: int = MAX_CACHED_VIEWS,
+    ):
+        self.compact_threshold = compact_threshold
+        self.max_cached_views = max_cached_views
+        self._lock = threading.Lock()
+        self._views: collections.OrderedDict[tuple, _View] = (
+            collections.OrderedDict()
+        )
+        self.rebuilds = 0
+
+    @staticmethod
+    def _log(state, key: str) -> Dict[str, Any]:
+        log = state.get(LOG_PREFIX + key)
+        return log if log else {"base": 0, "records": []}
+
+    def _view(self, session: str, state, key: str, log: Dict[str, Any]) -> _View:
+        seq = log["base"] + len(log["records"])
+        view = self._views.get((session, key))
+        if view is None or view.seq != seq:
+            members = dict.fromkeys(state.get(key) or [])
+            for op, value in log["records"]:
+                if op == ADD:
+                    members[value] = None
+                else:
+                    members.pop(value, None)
+            view = _View(seq, members)
+            self._views[(session, key)] = view
+            self.rebuilds += 1
+        self._views.move_to_end((session, key))
+        while len(self._views) > self.max_cached_views:
+            self._views.popitem(last=False)
+        return view
+
+    def _read_view(self, session: str, state, key: str) -> _View:
+        if LOG_PREFIX + key not in state:
+            # Without a log a cached view cannot tell a direct overwrite.
+            self._views.pop((session, key), None)
+            return _View(0, dict.fromkeys(state.get(key) or []))
+        return self._view(session, state, key, self._log(state, key))
+
+    @staticmethod
+    def _set_pending(state, key: str, pending: bool):
+        keys = list(state.get(PENDING_KEY) or [])
+        if (key in keys) == pending:
+            return
+        if pending:
+            keys.append(key)
+        else:
+            keys.remove(key)
+        state[PENDING_KEY] = keys
+
+    def _apply(self, session: str, state, key: str, op: str, value) -> bool:
+        with self._lock:
+            log = self._log(state, key)
+            view = self._view(session, state, key, log)
+            if (value in view.members) == (op == ADD):
+                return False
+            if op == ADD:
+                view.members[value] = None
+            else:
+                del view.members[value]
+            view.seq += 1
+            records = log["records"] + [[op, value]]
+            if len(records) >= self.compact_threshold:
+                state[key] = list(view.members)
+                state[LOG_PREFIX + key] = {"base": view.seq, "records": []}
+                self._set_pending(state, key, False)
+            else:
+                state[LOG_PREFIX + key] = {"base": log["base"], "records": records}
+                self._set_pending(state, key, True)
+            return True
+
+    def add(self, session: str, state, key: str, value: Hashable) -> bool:
+        """Appends `value` to the list unless present; returns if it was added."""
+        return self._apply(session, state, key, ADD, value)
+
+    def remove(self, session: str, state, key: str, value: Hashable) -> bool:
+        """Removes `value` from the list; returns if it was present."""
+        return self._apply(session, state, key, REMOVE, value)
+
+    def contains(self, session: str, state, key: str, value: Hashable) -> bool:
+        with self._lock:
+            return value in self._read_view(session, state, key).members
+
+    def items(self, session: str, state, key: str) -> List[Any]:
+        """Returns the current list, snapshot and log combined."""
+        with self._lock:
+            return list(self._read_view(session, state, key).members)
+
+    def reset(self, session: str, state, key: str):
+        """Drops pending records after `state[key]` was overwritten directly.
+
+        Only lists that already have a log are touched; moving their change
+        count on invalidates views cached in other processes.
+        """
+        with self._lock:
+            self._views.pop((session, key), None)
+            if LOG_PREFIX + key not in state:
+                return
+            log = self._log(state, key)
+            seq = log["base"] + len(log["records"]) + 1
+            state[LOG_PREFIX + key] = {"base": seq, "records": []}
+            self._set_pending(state, key, False)
+
+    def compact(self, session: str, state, key: Optional[str] = None):
+        """Folds pending change records into the snapshot.
+
+        Args:
+            session: The session the state belongs to.
+            state: The session state.
+            key: The list to compact; all lists with pending records if None.
+        """
+        with self._lock:
+            keys = list(state.get(PENDING_KEY) or []) if key is None else [key]
+            for k in keys:
+                log = self._log(state, k)
+                if log["records"]:
+                    view = self._view(session, state, k, log)
+                    state[k] = list(view.members)
+                    state[LOG_PREFIX + k] = {"base": view.seq, "records": []}
+                self._set_pending(state, k, False)
+
+
+list_memory = ListMemory()
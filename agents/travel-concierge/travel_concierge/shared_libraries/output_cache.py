@@ -0,0 +1,252 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache for agents with an output_schema.
+
+The mock inventory agents (flights, hotels, seats, rooms) produce the same
+kind of answer for the same question. Their outputs are cached, keyed by the
+agent, a canonical form of the request text and the state values the
+agent's instruction refers to. A hit is served by the agent's
+before_agent_callback without a model call. Entries are validated pydantic
+objects and expire after a TTL.
+"""
+
+import collections
+import dataclasses
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from google.adk.agents import Agent
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+from pydantic import BaseModel, ValidationError
+
+from travel_concierge.shared_libraries import constants
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_CACHE_TTL = float(os.getenv("TRAVEL_CONCIERGE_OUTPUT_CACHE_TTL", "900"))
+OUTPUT_CACHE_MAX_ENTRIES = 1024
+
+# Placeholders as ADK's instruction templating finds them: any braces around
+# a state key, optionally suffixed with "?"; other brace blocks (e.g. JSON
+# examples) are left alone.
+_TEMPLATE_RE = re.compile(r"{+[^{}]*}+")
+_STATE_KEY_RE = re.compile(r"^(?:(?:app|user|temp):)?[A-Za-z_]\w*$")
+
+# Canonical forms of state values whose exact value does not matter. The
+# session start time is only used to pick dates, so only its day counts.
+_STATE_CANONICALIZERS: Dict[str, Callable[[Any], Any]] = {
+    constants.SYSTEM_TIME: lambda value: str(value)[:10],
+}
+
+
+def canonical_request(text: str) -> str:
+    """Lower case, punctuation-insensitive, single-spaced request text."""
+    return " ".join(re.sub(r"[^\w\s:/-]", " ", text.lower()).split())
+
+
+def template_vars(instruction: Any) -> list[str]:
+    """Returns the state keys an instruction template refers to."""
+    if not isinstance(instruction, str):
+        return []
+    names = set()
+    for match in _TEMPLATE_RE.findall(instruction):
+        name = match.strip("{}").strip().removesuffix("?")
+        if _STATE_KEY_RE.match(name):
+            names.add(name)
+    return sorted(names)
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class OutputCache:
+    """LRU cache of validated agent outputs with a time-to-live."""
+
+    def __init__(
+        self,
+        ttl: float = OUTPUT_CACHE_TTL,
+        max_entries: int = OUTPUT_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, output)
+        self._entries: collections.OrderedDict[str, tuple[float, BaseModel]] = (
+            collections.OrderedDict()
+        )
+        self._stats: Dict[str, CacheStats] = {}
+
+    @staticmethod
+    def key(agent_name: str, request: str, state_values: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            [agent_name, canonical_request(request), state_values],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, agent_name: str, key: str) -> Optional[BaseModel]:
+        with self._lock:
+            stats = self._stats.setdefault(agent_name, CacheStats())
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self.clock():
+                self._entries.move_to_end(key)
+                stats.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            stats.misses += 1
+            return None
+
+    def put(self, key: str, output: BaseModel):
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, output)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Returns hits, misses and hit rate per agent."""
+        with self._lock:
+            return {
+                name: {
+                    "hits": stats.hits,
+                    "misses": stats.misses,
+                    "hit_rate": stats.hit_rate,
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+
+output_cache = OutputCache()
+
+
+def _request_text(callback_context: CallbackContext) -> str:
+    content = callback_context.user_content
+    if not content or not content.parts:
+        return ""
+    return "".join(part.text or "" for part in content.parts)
+
+
+async def _call(callback, callback_context: CallbackContext):
+    result = callback(callback_context)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def enable_output_cache(agent: Agent, cache: Optional[OutputCache] = None) -> Agent:
+    """Serves `agent`'s outputs from a cache when the same request repeats.
+
+    The agent must have an output_schema and an output_key. Existing
+    before/after agent callbacks still run: the before callback first, the
+    cache lookup only if it did not answer.
+
+    Args:
+        agent: The agent to cache.
+        cache: The cache to use; defaults to the process-wide output_cache.
+
+    Returns:
+        The same agent, for chaining.
+    """
+    if agent.output_schema is None or not agent.output_key:
+        raise ValueError(f"{agent.name} needs an output_schema and an output_key")
+    schema = agent.output_schema
+    output_key = agent.output_key
+    state_keys = [k for k in template_vars(agent.instruction) if k != output_key]
+    original_before = agent.before_agent_callback
+    original_after = agent.after_agent_callback
+
+    def cache_key(callback_context: CallbackContext) -> str:
+        state = callback_context.state
+        return OutputCache.key(
+            agent.name,
+            _request_text(callback_context),
+            {
+                k: _STATE_CANONICALIZERS.get(k, lambda v: v)(state.get(k))
+                for k in state_keys
+            },
+        )
+
+    def get_cache() -> OutputCache:
+        return cache or output_cache
+
+    # invocation id -> (cache key, output_key value before the run)
+    pending: Dict[str, tuple[str, str]] = {}
+
+    async def before_agent_callback(callback_context: CallbackContext):
+        if original_before is not None:
+            result = await _call(original_before, callback_context)
+            if result is not None:
+                return result
+        key = cache_key(callback_context)
+        output = get_cache().get(agent.name, key)
+        if output is None:
+            previous = json.dumps(callback_context.state.get(output_key), default=str)
+            pending[callback_context.invocation_id] = (key, previous)
+            while len(pending) > OUTPUT_CACHE_MAX_ENTRIES:  # runs that failed
+                pending.pop(next(iter(pending)))
+            return None
+        logger.debug("Serving %s from the output cache", agent.name)
+        callback_context.state[output_key] = output.model_dump(exclude_none=True)
+        return types.Content(
+            role="model",
+            parts=[types.Part(text=output.model_dump_json(exclude_none=True))],
+        )
+
+    async def after_agent_callback(callback_context: CallbackContext):
+        key, previous = pending.pop(callback_context.invocation_id, (None, None))
+        value = callback_context.state.get(output_key)
+        # Only cache what this run produced, not a value left by an earlier one.
+        if key and value is not None and json.dumps(value, default=str) != previous:
+            try:
+                if isinstance(value, str):
+                    output = schema.model_validate_json(value)
+                else:
+                    output = schema.model_validate(value)
+            except ValidationError as e:
+                logger.warning("Not caching invalid %s output: %s", agent.name, e)
+            else:
+                get_cache().put(key, output)
+        if original_after is not None:
+            return await _call(original_after, callback_context)
+        return None
+
+    agent.before_agent_callback = before_agent_callback
+    agent.after_agent_callback = after_agent_callback
+    return agent
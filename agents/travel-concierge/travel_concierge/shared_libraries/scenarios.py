@@ -0,0 +1,143 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Store of premade scenarios (user profile and itinerary) for demos.
+
+A scenario file is parsed and validated once per process and reloaded only
+when its modification time or size changes. The scenario path may also be a
+directory holding one `<user_id>.json` per user, with `default.json` used
+for users without their own file.
+"""
+
+import copy
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCENARIO_NAME = "default.json"
+
+_DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+_USER_ID_RE = re.compile(r"^[A-Za-z0-9_.@-]+$")
+
+
+class ScenarioError(ValueError):
+    """Raised when a scenario file cannot be parsed or is invalid."""
+
+
+# The scenario models check the fields the agents rely on. Premade
+# itineraries are hand-written and carry more (or fewer) details per event
+# than the LLM output schema in types.py, so extra fields are allowed.
+class ScenarioHome(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    event_type: str = Field(default="home")
+    address: str
+    local_prefer_mode: str
+
+
+class ScenarioProfile(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    passport_nationality: str
+    home: ScenarioHome
+
+
+class ScenarioEvent(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    event_type: str
+
+
+class ScenarioDay(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    date: str = Field(pattern=_DATE_PATTERN)
+    events: list[ScenarioEvent] = Field(default_factory=list)
+
+
+class ScenarioItinerary(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    trip_name: str
+    start_date: str = Field(pattern=_DATE_PATTERN)
+    end_date: str = Field(pattern=_DATE_PATTERN)
+    days: list[ScenarioDay] = Field(default_factory=list)
+
+
+class ScenarioState(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    user_profile: ScenarioProfile
+    itinerary: Optional[ScenarioItinerary] = None
+
+    @field_validator("itinerary", mode="before")
+    @classmethod
+    def _empty_itinerary(cls, value):
+        return value or None
+
+
+class Scenario(BaseModel):
+    state: ScenarioState
+
+
+class ScenarioStore:
+    """Process-wide cache of validated scenarios, invalidated by mtime."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # file path -> ((mtime_ns, size), state)
+        self._cache: Dict[str, tuple[tuple[int, int], Dict[str, Any]]] = {}
+        self.loads = 0
+
+    def resolve(self, user_id: Optional[str] = None) -> Optional[str]:
+        """Returns the scenario file for `user_id`, or None if there is none."""
+        if not os.path.isdir(self.path):
+            return self.path
+        if user_id and _USER_ID_RE.match(user_id):
+            user_path = os.path.join(self.path, f"{user_id}.json")
+            if os.path.isfile(user_path):
+                return user_path
+        default_path = os.path.join(self.path, DEFAULT_SCENARIO_NAME)
+        return default_path if os.path.isfile(default_path) else None
+
+    def _load(self, file_path: str) -> Dict[str, Any]:
+        try:
+            with open(file_path, "r") as file:
+                data = json.load(file)
+            Scenario.model_validate(data)
+        except (ValueError, ValidationError) as e:
+            raise ScenarioError(f"Invalid scenario {file_path}: {e}") from e
+        self.loads += 1
+        logger.info("Loaded scenario %s", file_path)
+        return data["state"]
+
+    def get(self, user_id: Optional[str] = None) -> Dict[str, Any]:
+        """Returns a copy of the scenario state for `user_id`.
+
+        The copy can be put into a session and mutated freely.
+        """
+        file_path = self.resolve(user_id)
+        if file_path is None:
+            logger.warning("No scenario for user %s in %s", user_id, self.path)
+            return {}
+        stat = os.stat(file_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._cache.get(file_path)
+            if cached is None or cached[0] != version:
+                cached = (version, self._load(file_path))
+                self._cache[file_path] = cached
+            return copy.deepcopy(cached[1])
@@ -0,0 +1,202 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sorted timeline index over the events of an itinerary.
+
+The index is kept in the session state next to the itinerary, as plain
+JSON-serializable data. Each entry's key is "YYYY-MM-DD HH:MM", so string
+order is chronological and the next event after a point in time is found
+with a bisect. Entries are grouped per day with a hash of that day's JSON;
+when the itinerary changes only the days that changed are re-indexed.
+
+Everything that writes the itinerary calls refresh_timeline, which bumps
+state[ITIN_VERSION] and stores the index tagged with that version. Readers
+call get_timeline, which trusts a stored index whose version matches
+without looking at the itinerary again.
+"""
+
+import bisect
+from datetime import datetime
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from travel_concierge.shared_libraries import constants
+
+logger = logging.getLogger(__name__)
+
+# Events without a time happen "some time that day", so they stay upcoming
+# until the day is over.
+END_OF_DAY = "23:59"
+
+
+def event_time(event: Dict[str, Any]) -> Optional[str]:
+    """Returns the HH:MM time by which one must be at the event, if any."""
+    match event.get("event_type"):
+        case "flight":
+            return event.get("boarding_time")
+        case "hotel":
+            return event.get("check_in_time")
+        case "visit":
+            return event.get("start_time")
+        case _:
+            return None
+
+
+def to_key(current_datetime: str) -> str:
+    """Converts an ISO date or date-time to a timeline key."""
+    return datetime.fromisoformat(current_datetime).strftime("%Y-%m-%d %H:%M")
+
+
+def _day_hash(day: Dict[str, Any]) -> str:
+    return hashlib.sha1(
+        json.dumps(day, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _index_day(day_index: int, day: Dict[str, Any]) -> List[list]:
+    """Returns [key, day_index, event_index] entries for one day."""
+    entries = []
+    for event_index, event in enumerate(day.get("events", [])):
+        time = event_time(event) or END_OF_DAY
+        entries.append([f"{day['date']} {time}", day_index, event_index])
+    return entries
+
+
+def build_timeline(
+    itinerary: Dict[str, Any], previous: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Indexes all events of `itinerary`.
+
+    Args:
+        itinerary: An itinerary following types.Itinerary.
+        previous: An earlier index of the same itinerary, whose entries are
+            reused for days that did not change.
+
+    Returns:
+        The timeline: {"day_hashes", "day_entries", "keys", "positions"}.
+    """
+    old_entries = {}
+    if previous:
+        old_entries = dict(zip(previous["day_hashes"], previous["day_entries"]))
+
+    day_hashes, day_entries = [], []
+    reused = 0
+    for day_index, day in enumerate(itinerary.get("days", [])):
+        digest = _day_hash(day)
+        entries = old_entries.get(digest)
+        if entries is not None:
+            # The day may have moved; its keys are still valid.
+            entries = [[key, day_index, i] for key, _, i in entries]
+            reused += 1
+        else:
+            entries = _index_day(day_index, day)
+        day_hashes.append(digest)
+        day_entries.append(entries)
+
+    logger.debug(
+        "Indexed %d days (%d days unchanged)", len(day_hashes), reused
+    )
+    return {
+        "day_hashes": day_hashes,
+        "day_entries": day_entries,
+        **_merge(day_entries),
+    }
+
+
+def _merge(day_entries: List[List[list]]) -> Dict[str, list]:
+    merged = sorted(entry for entries in day_entries for entry in entries)
+    return {
+        "keys": [entry[0] for entry in merged],
+        "positions": [entry[1:] for entry in merged],
+    }
+
+
+def refresh_timeline(state) -> Optional[Dict[str, Any]]:
+    """Re-indexes the itinerary in `state` and stores the index.
+
+    Call this whenever state[ITIN_KEY] is written. Only days that changed
+    since the stored index are re-indexed.
+
+    Args:
+        state: The session state (or any dict-like object), writable.
+
+    Returns:
+        The timeline, or None if there is no itinerary.
+    """
+    itinerary = state.get(constants.ITIN_KEY)
+    if not isinstance(itinerary, dict):
+        return None
+    version = state.get(constants.ITIN_VERSION, 0) + 1
+    timeline = build_timeline(
+        itinerary, previous=state.get(constants.ITIN_TIMELINE)
+    )
+    timeline["version"] = version
+    state[constants.ITIN_VERSION] = version
+    state[constants.ITIN_TIMELINE] = timeline
+    return timeline
+
+
+def get_timeline(state) -> Optional[Dict[str, Any]]:
+    """Returns the timeline of the itinerary in `state` without storing it.
+
+    The stored index is used as is if its version is current. Otherwise,
+    e.g. for an itinerary written without refresh_timeline, the events are
+    indexed on the fly.
+
+    Args:
+        state: The session state (or any dict-like object); may be
+            read-only.
+
+    Returns:
+        The timeline, or None if there is no itinerary.
+    """
+    itinerary = state.get(constants.ITIN_KEY)
+    if not isinstance(itinerary, dict):
+        return None
+    timeline = state.get(constants.ITIN_TIMELINE)
+    if timeline and timeline.get("version") == state.get(
+        constants.ITIN_VERSION
+    ):
+        return timeline
+    logger.debug("No current timeline stored; indexing on the fly")
+    return _merge(
+        [
+            _index_day(day_index, day)
+            for day_index, day in enumerate(itinerary.get("days", []))
+        ]
+    )
+
+
+def find_next_event(
+    timeline: Dict[str, Any], current_datetime: str
+) -> Tuple[Optional[List[int]], Optional[List[int]]]:
+    """Finds the next event at or after `current_datetime`.
+
+    Args:
+        timeline: A timeline from build_timeline.
+        current_datetime: An ISO date or date-time, e.g. '2024-03-15 04:00'.
+
+    Returns:
+        The (day_index, event_index) positions of the event before and of
+        the next event; either is None if there is no such event. After the
+        last event, the last two events are returned.
+    """
+    keys = timeline["keys"]
+    if not keys:
+        return None, None
+    i = min(bisect.bisect_left(keys, to_key(current_datetime)), len(keys) - 1)
+    previous = timeline["positions"][i - 1] if i > 0 else None
+    return previous, timeline["positions"][i]
@@ -18,12 +18,8 @@ from google.adk.agents import Agent
 from google.adk.tools.agent_tool import AgentTool
 
 from travel_concierge.sub_agents.in_trip import prompt
-from travel_concierge.sub_agents.in_trip.tools import (
-    transit_coordination,
-    flight_status_check,
-    event_booking_check,
-    weather_impact_check,
-)
+from travel_concierge.sub_agents.in_trip.monitor import monitor_itinerary
+from travel_concierge.sub_agents.in_trip.tools import transit_coordination
 
 from travel_concierge.tools.memory import memorize
 
@@ -42,7 +38,7 @@ trip_monitor_agent = Agent(
     name="trip_monitor_agent",
     description="Monitor aspects of a itinerary and bring attention to items that necessitate changes",
     instruction=prompt.TRIP_MONITOR_INSTR,
-    tools=[flight_status_check, event_booking_check, weather_impact_check],
+    tools=[monitor_itinerary],
     output_key="daily_checks",  # can be sent via email.
 )
 
@@ -0,0 +1,247 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The 'monitor_itinerary' tool for the trip_monitor agent.
+
+Every checkable item (flights, bookings, outdoor activities) is extracted
+from the itinerary deterministically, all checks run concurrently through a
+MonitorProvider, and the results come back as one report. The agent then
+needs a single turn to summarize it.
+"""
+
+import abc
+import asyncio
+import dataclasses
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from google.adk.tools import ToolContext
+
+from travel_concierge.shared_libraries import constants
+from travel_concierge.sub_agents.in_trip import tools
+
+logger = logging.getLogger(__name__)
+
+FLIGHT = "flight"
+BOOKING = "booking"
+WEATHER = "weather"
+
+CHECK_TIMEOUT_SECS = 10.0
+MAX_CONCURRENT_CHECKS = 16
+
+# Visits whose description mentions one of these words are considered indoors and
+# are not checked for weather.
+INDOOR_KEYWORDS = (
+    "museum",
+    "gallery",
+    "restaurant",
+    "breakfast",
+    "lunch",
+    "dinner",
+    "theater",
+    "theatre",
+    "aquarium",
+    "mall",
+    "spa",
+)
+_INDOOR_RE = re.compile(r"\b(" + "|".join(INDOOR_KEYWORDS) + r")\b")
+
+
+@dataclasses.dataclass
+class MonitorItem:
+    """One thing to check, e.g. a flight or a booked visit."""
+
+    kind: str
+    name: str
+    date: str
+    details: Dict[str, str] = dataclasses.field(default_factory=dict)
+
+
+def _location(event: Dict[str, Any]) -> str:
+    if event.get("address"):
+        return event["address"]
+    location = event.get("location") or {}
+    return location.get("address") or location.get("name") or ""
+
+
+def _is_outdoor(event: Dict[str, Any]) -> bool:
+    return not _INDOOR_RE.search(event.get("description", "").lower())
+
+
+def extract_monitor_items(itinerary: Dict[str, Any]) -> List[MonitorItem]:
+    """Returns the items of an itinerary that need checking, in order."""
+    items = []
+    for day in itinerary.get("days", []):
+        date = day["date"]
+        for event in day.get("events", []):
+            event_type = event.get("event_type")
+            if event_type == "flight":
+                items.append(
+                    MonitorItem(
+                        FLIGHT,
+                        event["flight_number"],
+                        date,
+                        {
+                            "checkin_time": event.get("boarding_time", ""),
+                            "departure_time": event.get("departure_time", ""),
+                        },
+                    )
+                )
+                continue
+            location = _location(event)
+            # Prefer the venue name, e.g. "Space Needle" for "Visit the Space Needle".
+            name = (event.get("location") or {}).get("name") or event.get(
+                "description", ""
+            )
+            if event.get("booking_required"):
+                items.append(
+                    MonitorItem(BOOKING, name, date, {"location": location})
+                )
+            if event_type == "visit" and _is_outdoor(event):
+                items.append(
+                    MonitorItem(WEATHER, name, date, {"location": location})
+                )
+    return items
+
+
+class MonitorProvider(abc.ABC):
+    """Source of flight, booking and weather status.
+
+    Each check returns {"status": str, "needs_attention": bool}.
+    """
+
+    @abc.abstractmethod
+    async def flight_status(self, item: MonitorItem) -> Dict[str, Any]:
+        """Checks a flight for delays or cancellations."""
+
+    @abc.abstractmethod
+    async def event_booking(self, item: MonitorItem) -> Dict[str, Any]:
+        """Checks that a booked event is still on."""
+
+    @abc.abstractmethod
+    async def weather_impact(self, item: MonitorItem) -> Dict[str, Any]:
+        """Checks whether the weather may affect an outdoor activity."""
+
+    async def check(self, item: MonitorItem) -> Dict[str, Any]:
+        match item.kind:
+            case "flight":
+                return await self.flight_status(item)
+            case "booking":
+                return await self.event_booking(item)
+            case "weather":
+                return await self.weather_impact(item)
+            case _:
+                raise ValueError(f"Unknown item kind: {item.kind}")
+
+
+class FakeMonitorProvider(MonitorProvider):
+    """Local provider backed by the mock check tools."""
+
+    @staticmethod
+    def _result(result: Dict[str, str]) -> Dict[str, Any]:
+        status = result["status"]
+        return {"status": status, "needs_attention": not status.endswith("checked")}
+
+    async def flight_status(self, item):
+        return self._result(
+            tools.flight_status_check(
+                item.name,
+                item.date,
+                item.details["checkin_time"],
+                item.details["departure_time"],
+            )
+        )
+
+    async def event_booking(self, item):
+        return self._result(
+            tools.event_booking_check(item.name, item.date, item.details["location"])
+        )
+
+    async def weather_impact(self, item):
+        return self._result(
+            tools.weather_impact_check(item.name, item.date, item.details["location"])
+        )
+
+
+_provider: MonitorProvider = FakeMonitorProvider()
+
+
+def get_monitor_provider() -> MonitorProvider:
+    return _provider
+
+
+def set_monitor_provider(provider: MonitorProvider):
+    """Replaces the provider used by monitor_itinerary."""
+    global _provider
+    _provider = provider
+
+
+async def run_checks(
+    items: List[MonitorItem],
+    provider: Optional[MonitorProvider] = None,
+    timeout: float = CHECK_TIMEOUT_SECS,
+    max_concurrency: int = MAX_CONCURRENT_CHECKS,
+) -> List[Dict[str, Any]]:
+    """Runs the checks for all items concurrently.
+
+    A check that fails or times out is reported as needing attention rather
+    than failing the whole report.
+    """
+    provider = provider or get_monitor_provider()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item: MonitorItem) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                result = await asyncio.wait_for(provider.check(item), timeout)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("Check of %s %s failed: %r", item.kind, item.name, e)
+                result = {
+                    "status": f"Could not check {item.name}: {e!r}",
+                    "needs_attention": True,
+                }
+        return {
+            "kind": item.kind,
+            "name": item.name,
+            "date": item.date,
+            **item.details,
+            **result,
+        }
+
+    return await asyncio.gather(*(run(item) for item in items))
+
+
+async def monitor_itinerary(tool_context: ToolContext):
+    """
+    Checks every flight, booking and outdoor activity in the itinerary at once.
+
+    Args:
+        tool_context: The ADK tool context.
+
+    Returns:
+        A report with the status of each item and the items that need the user's attention.
+    """
+    itinerary = tool_context.state.get(constants.ITIN_KEY)
+    if not isinstance(itinerary, dict) or not itinerary.get("days"):
+        return {"status": "No itinerary to monitor.", "checks": [], "attention": []}
+
+    checks = await run_checks(extract_monitor_items(itinerary))
+    attention = [check for check in checks if check["needs_attention"]]
+    logger.info("Checked %d items, %d need attention", len(checks), len(attention))
+    return {
+        "status": f"Checked {len(checks)} items, {len(attention)} need attention.",
+        "checks": checks,
+        "attention": attention,
+    }
@@ -14,24 +14,29 @@
 
 """Tools for the in_trip, trip_monitor and day_of agents."""
 
-from datetime import datetime
-from typing import Dict, Any
+import logging
+from typing import Dict, Any, Optional
 
 from google.adk.agents.readonly_context import ReadonlyContext
 
 from travel_concierge.sub_agents.in_trip import prompt
 from travel_concierge.shared_libraries import constants
+from travel_concierge.shared_libraries import timeline as timeline_lib
+
+logger = logging.getLogger(__name__)
 
 
 def flight_status_check(flight_number: str, flight_date: str, checkin_time: str, departure_time: str):
     """Checks the status of a flight, given its flight_number, date, checkin_time and departure_time."""
-    print("Checking", flight_number, flight_date, checkin_time, departure_time)
+    logger.info(
+        "Checking %s %s %s %s", flight_number, flight_date, checkin_time, departure_time
+    )
     return {"status": f"Flight {flight_number} checked"}
 
 
 def event_booking_check(event_name: str, event_date: str, event_location: str):
     """Checks the status of an event that requires booking, given its event_name, date, and event_location."""
-    print("Checking", event_name, event_date, event_location)
+    logger.info("Checking %s %s %s", event_name, event_date, event_location)
     if event_name.startswith("Space Needle"):  # Mocking an exception to illustrate
         return {"status": f"{event_name} is closed."}
     return {"status": f"{event_name} checked"}
@@ -49,21 +54,13 @@ def weather_impact_check(activity_name: str, activity_date: str, activity_locati
     Returns:
         A dictionary containing the status of the activity.
     """
-    print("Checking", activity_name, activity_date, activity_location)
+    logger.info("Checking %s %s %s", activity_name, activity_date, activity_location)
     return {"status": f"{activity_name} checked"}
 
 
 def get_event_time_as_destination(destin_json: Dict[str, Any], default_value: str):
     """Returns an event time appropriate for the location type."""
-    match destin_json["event_type"]:
-        case "flight":
-            return destin_json["boarding_time"]
-        case "hotel":
-            return destin_json["check_in_time"]
-        case "visit":
-            return destin_json["start_time"]
-        case _:
-            return default_value
+    return timeline_lib.event_time(destin_json) or default_value
 
 
 def parse_as_origin(origin_json: Dict[str, Any]):
@@ -124,7 +121,12 @@ def parse_as_destin(destin_json: Dict[str, Any]):
             return "Local in the region", "as soon as possible"
 
 
-def find_segment(profile: Dict[str, Any], itinerary: Dict[str, Any], current_datetime: str):
+def find_segment(
+    profile: Dict[str, Any],
+    itinerary: Dict[str, Any],
+    current_datetime: str,
+    timeline: Optional[Dict[str, Any]] = None,
+):
     """
     Find the events to travel from A to B
     This follows the itinerary schema in types.Itinerary.
@@ -136,6 +138,8 @@ def find_segment(profile: Dict[str, Any], itinerary: Dict[str, Any], current_dat
         profile: A dictionary containing the user's profile.
         itinerary: A dictionary containing the user's itinerary.
         current_datetime: A string containing the current date and time.   
+        timeline: The timeline index of the itinerary, see
+            shared_libraries.timeline. Built on the fly if not given.
 
     Returns:
       from - capture information about the origin of this segment.
@@ -143,41 +147,18 @@ def find_segment(profile: Dict[str, Any], itinerary: Dict[str, Any], current_dat
       arrive_by - an indication of the time we shall arrive at the destination.
     """
     # Expects current_datetime is in '2024-03-15 04:00:00' format
-    datetime_object = datetime.fromisoformat(current_datetime)
-    current_date = datetime_object.strftime("%Y-%m-%d")
-    current_time = datetime_object.strftime("%H:%M")
-    event_date = current_date
-    event_time = current_time
+    if timeline is None:
+        timeline = timeline_lib.get_timeline({constants.ITIN_KEY: itinerary})
+    previous, upcoming = timeline_lib.find_next_event(timeline, current_datetime)
+    logger.debug("Segment at %s: %s -> %s", current_datetime, previous, upcoming)
 
-    print("-----")
-    print("MATCH DATE", current_date, current_time)
-    print("-----")
+    def event_at(position):
+        day_index, event_index = position
+        return itinerary["days"][day_index]["events"][event_index]
 
     # defaults
-    origin_json = profile["home"]
-    destin_json = profile["home"]
-
-    leave_by = "No movement required"
-    arrive_by = "No movement required"
-
-    # Go through the itinerary to find where we are base on the current date and time
-    for day in itinerary.get("days", []):
-        event_date = day["date"]
-        for event in day["events"]:
-            # for every event we update the origin and destination until
-            # we find one we need to pay attention
-            origin_json = destin_json
-            destin_json = event
-            event_time = get_event_time_as_destination(destin_json, current_time)
-            # The moment we find an event that's in the immediate future we stop to handle it
-            print(
-                event["event_type"], event_date, current_date, event_time, current_time
-            )
-            if event_date >= current_date and event_time >= current_time:
-                break
-        else:  # if inner loop not break, continue
-            continue
-        break  # else break too.
+    origin_json = event_at(previous) if previous else profile["home"]
+    destin_json = event_at(upcoming) if upcoming else profile["home"]
 
     #
     # Construct prompt descriptions for travel_from, travel_to, arrive_by
@@ -189,16 +170,17 @@ def find_segment(profile: Dict[str, Any], itinerary: Dict[str, Any], current_dat
 
 
 def _inspect_itinerary(state: dict[str: Any]):
-    """Identifies and returns the itinerary, profile and current datetime from the session state."""
+    """Identifies and returns the itinerary, profile, current datetime and
+    timeline index from the session state."""
 
     itinerary = state[constants.ITIN_KEY]
     profile = state[constants.PROF_KEY]
-    print("itinerary", itinerary)
     current_datetime = itinerary["start_date"] + " 00:00"
     if state.get(constants.ITIN_DATETIME, ""):
         current_datetime = state[constants.ITIN_DATETIME]
+    timeline = timeline_lib.get_timeline(state)
 
-    return itinerary, profile, current_datetime
+    return itinerary, profile, current_datetime, timeline
 
 
 def transit_coordination(readonly_context: ReadonlyContext):
@@ -210,20 +192,20 @@ def transit_coordination(readonly_context: ReadonlyContext):
     if constants.ITIN_KEY not in state:
         return prompt.NEED_ITIN_INSTR
 
-    itinerary, profile, current_datetime = _inspect_itinerary(state)
+    itinerary, profile, current_datetime, timeline = _inspect_itinerary(state)
     travel_from, travel_to, leave_by, arrive_by = find_segment(
-        profile, itinerary, current_datetime
+        profile, itinerary, current_datetime, timeline
     )
 
-    print("-----")
-    print(itinerary["trip_name"])
-    print(current_datetime)
-    print("-----")
-    print("-----")
-    print("TRIP EVENT")
-    print("FROM", travel_from, leave_by)
-    print("TO", travel_to, arrive_by)
-    print("-----")
+    logger.debug(
+        "Trip %s at %s: from %s (%s) to %s (%s)",
+        itinerary["trip_name"],
+        current_datetime,
+        travel_from,
+        leave_by,
+        travel_to,
+        arrive_by,
+    )
 
     return prompt.LOGISTIC_INSTR_TEMPLATE.format(
         CURRENT_TIME=current_datetime,
@@ -18,8 +18,13 @@ from google.adk.agents import Agent
 from google.adk.tools.agent_tool import AgentTool
 from google.genai.types import GenerateContentConfig
 from travel_concierge.shared_libraries import types
+from travel_concierge.shared_libraries.output_cache import enable_output_cache
 from travel_concierge.sub_agents.planning import prompt
-from travel_concierge.tools.memory import memorize
+from travel_concierge.sub_agents.planning.tools import (
+    search_flights_and_hotels,
+    serve_prefetched,
+)
+from travel_concierge.tools.memory import index_itinerary, memorize
 
 
 itinerary_agent = Agent(
@@ -32,6 +37,7 @@ itinerary_agent = Agent(
     output_schema=types.Itinerary,
     output_key="itinerary",
     generate_content_config=types.json_response_config,
+    after_agent_callback=index_itinerary,
 )
 
 
@@ -45,6 +51,7 @@ hotel_room_selection_agent = Agent(
     output_schema=types.RoomsSelection,
     output_key="room",
     generate_content_config=types.json_response_config,
+    before_agent_callback=serve_prefetched("room"),
 )
 
 hotel_search_agent = Agent(
@@ -70,6 +77,7 @@ flight_seat_selection_agent = Agent(
     output_schema=types.SeatsSelection,
     output_key="seat",
     generate_content_config=types.json_response_config,
+    before_agent_callback=serve_prefetched("seat"),
 )
 
 flight_search_agent = Agent(
@@ -85,12 +93,23 @@ flight_search_agent = Agent(
 )
 
 
+# Identical searches and seat/room requests are served from the output cache.
+for _agent in (
+    flight_search_agent,
+    flight_seat_selection_agent,
+    hotel_search_agent,
+    hotel_room_selection_agent,
+):
+    enable_output_cache(_agent)
+
+
 planning_agent = Agent(
     model="gemini-2.0-flash-001",
     description="""Helps users with travel planning, complete a full itinerary for their vacation, finding best deals for flights and hotels.""",
     name="planning_agent",
     instruction=prompt.PLANNING_AGENT_INSTR,
     tools=[
+        search_flights_and_hotels,
         AgentTool(agent=flight_search_agent),
         AgentTool(agent=flight_seat_selection_agent),
         AgentTool(agent=hotel_search_agent),
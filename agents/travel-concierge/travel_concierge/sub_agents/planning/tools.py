@@ -0,0 +1,290 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent flight and hotel search with speculative seat and room maps.
+
+`search_flights_and_hotels` runs the flight and hotel search agents at the
+same time, each writing its own output_key. Right after, it starts
+generating seat maps for the top flights and room maps for the top hotels in
+the background. When the user picks one of them, the seat or room selection
+agent is served the prefetched map by its before_agent_callback instead of
+calling the model again.
+
+Prefetched maps are generated from one session's state, so they are only
+served to that session: the search stores its session id in the state
+under PREFETCH_SCOPE, which the selection agents' sub-sessions inherit.
+Maps older than PREFETCH_TTL_SECS are dropped.
+"""
+
+import asyncio
+import collections
+import contextvars
+import inspect
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, Optional
+
+from google.adk.agents import Agent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.adk.tools import ToolContext
+from google.adk.tools.agent_tool import AgentTool
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_TOP_N = 2
+PREFETCH_WAIT_SECS = 30.0
+PREFETCH_MAX_ENTRIES = 64
+PREFETCH_TTL_SECS = float(os.getenv("TRAVEL_CONCIERGE_PREFETCH_TTL", "600"))
+PREFETCH_SCOPE = "_prefetch_scope"
+
+# Set while a speculative run is in progress, so that the agent being
+# prefetched does not wait for its own result.
+_prefetching = contextvars.ContextVar("prefetching", default=False)
+
+
+async def run_structured_agent(
+    agent: Agent, request: str, state: Dict[str, Any], user_id: str = "prefetch"
+) -> Dict[str, Any]:
+    """Runs an output_schema agent once, outside of any user session.
+
+    Args:
+        agent: An agent with an output_schema.
+        request: The user message for the agent.
+        state: Session state for the agent's instruction template.
+        user_id: The user the run is made for.
+
+    Returns:
+        The validated output as a dict.
+    """
+    session_service = InMemorySessionService()
+    runner = Runner(
+        app_name=agent.name, agent=agent, session_service=session_service
+    )
+    session = session_service.create_session(
+        app_name=agent.name, user_id=user_id, state=state
+    )
+    if inspect.isawaitable(session):
+        session = await session
+    text = ""
+    async for event in runner.run_async(
+        user_id=user_id,
+        session_id=session.id,
+        new_message=types.Content(role="user", parts=[types.Part(text=request)]),
+    ):
+        if event.content and event.content.parts:
+            text = "".join(part.text or "" for part in event.content.parts) or text
+    return agent.output_schema.model_validate_json(text).model_dump()
+
+
+class SpeculativePrefetch:
+    """Background runs of output_schema agents, keyed by session scope,
+    agent and item."""
+
+    def __init__(
+        self,
+        max_entries: int = PREFETCH_MAX_ENTRIES,
+        ttl: float = PREFETCH_TTL_SECS,
+        clock=time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        # (scope, agent name, key) -> (task, scheduled at)
+        self._tasks: collections.OrderedDict[
+            tuple[str, str, str], tuple[asyncio.Task, float]
+        ] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def schedule(
+        self,
+        scope: str,
+        agent: Agent,
+        key: str,
+        request: str,
+        state: Dict[str, Any],
+    ):
+        """Starts generating `agent`'s output for `key` in the background.
+
+        Args:
+            scope: The session the output is generated for.
+            agent: The output_schema agent to run.
+            key: The item, e.g. a flight number, the user may pick.
+            request: The request to run the agent with.
+            state: The session state to run the agent with.
+        """
+        self._expire()
+        entry = (scope, agent.name, key)
+        task, _ = self._tasks.get(entry, (None, None))
+        if task is not None and not (task.done() and task.exception()):
+            return
+
+        async def run():
+            token = _prefetching.set(True)
+            try:
+                return await run_structured_agent(agent, request, state)
+            finally:
+                _prefetching.reset(token)
+
+        self._tasks[entry] = (
+            asyncio.get_running_loop().create_task(run()),
+            self.clock(),
+        )
+        self._tasks.move_to_end(entry)
+        while len(self._tasks) > self.max_entries:
+            _, (oldest, _) = self._tasks.popitem(last=False)
+            oldest.cancel()
+        logger.info("Prefetching %s for %s", agent.name, key)
+
+    def _expire(self) -> None:
+        """Drops entries older than the TTL; entries are in schedule order."""
+        deadline = self.clock() - self.ttl
+        while self._tasks:
+            entry, (task, scheduled_at) = next(iter(self._tasks.items()))
+            if scheduled_at > deadline:
+                break
+            del self._tasks[entry]
+            task.cancel()
+
+    def _find(
+        self, scope: str, agent_name: str, text: str
+    ) -> Optional[asyncio.Task]:
+        self._expire()
+        loop = asyncio.get_running_loop()
+        text = text.lower()
+        for (entry_scope, name, key), (task, _) in reversed(self._tasks.items()):
+            if (
+                entry_scope == scope
+                and name == agent_name
+                and task.get_loop() is loop
+                and re.search(r"\b" + re.escape(key.lower()) + r"\b", text)
+            ):
+                return task
+        return None
+
+    async def lookup(
+        self,
+        scope: str,
+        agent_name: str,
+        text: str,
+        timeout: float = PREFETCH_WAIT_SECS,
+    ) -> Optional[Dict[str, Any]]:
+        """Returns the output prefetched in `scope` for an item named in
+        `text`.
+
+        Waits for a run still in progress, up to `timeout` seconds. Returns
+        None if nothing was prefetched, the run failed or it expired.
+        """
+        task = self._find(scope, agent_name, text)
+        if task is None:
+            self.misses += 1
+            return None
+        try:
+            result = await asyncio.wait_for(asyncio.shield(task), timeout)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Prefetched %s unavailable: %r", agent_name, e)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+
+prefetcher = SpeculativePrefetch()
+
+
+def _request_text(callback_context: CallbackContext) -> str:
+    content = callback_context.user_content
+    if not content or not content.parts:
+        return ""
+    return "".join(part.text or "" for part in content.parts)
+
+
+def serve_prefetched(output_key: str):
+    """Returns a before_agent_callback serving prefetched outputs.
+
+    Args:
+        output_key: The output_key of the agent the callback is set on.
+    """
+
+    async def callback(callback_context: CallbackContext):
+        scope = callback_context.state.get(PREFETCH_SCOPE)
+        if _prefetching.get() or not scope:
+            return None
+        result = await prefetcher.lookup(
+            scope, callback_context.agent_name, _request_text(callback_context)
+        )
+        if result is None:
+            return None
+        callback_context.state[output_key] = result
+        return types.Content(
+            role="model", parts=[types.Part(text=json.dumps(result))]
+        )
+
+    return callback
+
+
+async def search_flights_and_hotels(
+    flight_request: str, hotel_request: str, tool_context: ToolContext
+):
+    """
+    Searches for flights and hotels at the same time.
+
+    Args:
+        flight_request: What to search flights for: origin, destination, dates and preferences.
+        hotel_request: What to search hotels for: location, dates and preferences.
+        tool_context: The ADK tool context.
+
+    Returns:
+        The flight choices under "flight" and the hotel choices under "hotel".
+    """
+    # pylint: disable=import-outside-toplevel
+    from travel_concierge.sub_agents.planning import agent
+
+    flight, hotel = await asyncio.gather(
+        AgentTool(agent=agent.flight_search_agent).run_async(
+            args={"request": flight_request}, tool_context=tool_context
+        ),
+        AgentTool(agent=agent.hotel_search_agent).run_async(
+            args={"request": hotel_request}, tool_context=tool_context
+        ),
+    )
+
+    scope = tool_context._invocation_context.session.id  # pylint: disable=protected-access
+    tool_context.state[PREFETCH_SCOPE] = scope
+    state = dict(tool_context.state.to_dict())
+    state.update({"flight": flight, "hotel": hotel})
+    for option in (flight or {}).get("flights", [])[:PREFETCH_TOP_N]:
+        prefetcher.schedule(
+            scope,
+            agent.flight_seat_selection_agent,
+            option["flight_number"],
+            f"Flight number {option['flight_number']}",
+            state,
+        )
+    for option in (hotel or {}).get("hotels", [])[:PREFETCH_TOP_N]:
+        prefetcher.schedule(
+            scope,
+            agent.hotel_room_selection_agent,
+            option["name"],
+            f"Rooms at {option['name']}",
+            state,
+        )
+
+    return {"flight": flight, "hotel": hotel}
@@ -38,7 +38,9 @@ From user's answers, extract the following types of information and use it in th
 - Acitivities preferences
 - Business reviews and recommendations
 
-For every individually identified preferences, store their values using the `memorize` tool.
+For every individually identified preferences, add the value to the list of its type using the `memorize_list` tool, e.g. `memorize_list("food_preference", "vegetarian")`.
+If the user no longer holds a preference stored earlier, remove it with the `forget` tool. Use the `recall_list` tool to read a list back before deciding.
+Use the `memorize` tool only for single values.
 
 Finally, thank the user, and express that these feedback will be incorporated into their preferences for next time!
 """
@@ -15,7 +15,7 @@
 """The 'memorize' tool for several agents to affect session states."""
 
 from datetime import datetime
-import json
+import logging
 import os
 from typing import Dict, Any
 
@@ -24,10 +24,20 @@ from google.adk.sessions.state import State
 from google.adk.tools import ToolContext
 
 from travel_concierge.shared_libraries import constants
+from travel_concierge.shared_libraries.list_memory import list_memory
+from travel_concierge.shared_libraries import scenarios
+from travel_concierge.shared_libraries import timeline
+
+logger = logging.getLogger(__name__)
 
 SAMPLE_SCENARIO_PATH = os.getenv(
     "TRAVEL_CONCIERGE_SCENARIO", "eval/itinerary_empty_default.json"
 )
+scenario_store = scenarios.ScenarioStore(SAMPLE_SCENARIO_PATH)
+
+
+def _session_id(context: CallbackContext | ToolContext) -> str:
+    return context._invocation_context.session.id  # pylint: disable=protected-access
 
 
 def memorize_list(key: str, value: str, tool_context: ToolContext):
@@ -42,14 +52,27 @@ def memorize_list(key: str, value: str, tool_context: ToolContext):
     Returns:
         A status message.
     """
-    mem_dict = tool_context.state
-    if key not in mem_dict:
-        mem_dict[key] = []
-    if value not in mem_dict[key]:
-        mem_dict[key].append(value)
+    list_memory.add(_session_id(tool_context), tool_context.state, key, value)
     return {"status": f'Stored "{key}": "{value}"'}
 
 
+def recall_list(key: str, tool_context: ToolContext):
+    """
+    Recall a list of information stored with memorize_list.
+
+    Args:
+        key: the label indexing the memory.
+        tool_context: The ADK tool context.
+
+    Returns:
+        The stored values, in the order they were stored.
+    """
+    return {
+        "status": "ok",
+        key: list_memory.items(_session_id(tool_context), tool_context.state, key),
+    }
+
+
 def memorize(key: str, value: str, tool_context: ToolContext):
     """
     Memorize pieces of information, one key-value pair at a time.
@@ -64,6 +87,9 @@ def memorize(key: str, value: str, tool_context: ToolContext):
     """
     mem_dict = tool_context.state
     mem_dict[key] = value
+    list_memory.reset(_session_id(tool_context), mem_dict, key)
+    if key == constants.ITIN_KEY:
+        timeline.refresh_timeline(mem_dict)
     return {"status": f'Stored "{key}": "{value}"'}
 
 
@@ -79,13 +105,34 @@ def forget(key: str, value: str, tool_context: ToolContext):
     Returns:
         A status message.
     """
-    if tool_context.state[key] is None:
-        tool_context.state[key] = []
-    if value in tool_context.state[key]:
-        tool_context.state[key].remove(value)
+    list_memory.remove(_session_id(tool_context), tool_context.state, key, value)
     return {"status": f'Removed "{key}": "{value}"'}
 
 
+def compact_memory(callback_context: CallbackContext):
+    """
+    Folds pending list changes into the stored lists.
+    Set as the root agent's after_agent_callback, so lists in state are
+    current after each root turn; in between, read them with recall_list.
+
+    Args:
+        callback_context: The callback context.
+    """
+    list_memory.compact(_session_id(callback_context), callback_context.state)
+
+
+def index_itinerary(callback_context: CallbackContext):
+    """
+    Stores the timeline index of the itinerary in the state.
+    Set as the after_agent_callback of agents that write the itinerary
+    through their output_key.
+
+    Args:
+        callback_context: The callback context.
+    """
+    timeline.refresh_timeline(callback_context.state)
+
+
 def _set_initial_states(source: Dict[str, Any], target: State | dict[str, Any]):
     """
     Setting the initial session state given a JSON object of states.
@@ -107,6 +154,7 @@ def _set_initial_states(source: Dict[str, Any], target: State | dict[str, Any]):
             target[constants.ITIN_START_DATE] = itinerary[constants.START_DATE]
             target[constants.ITIN_END_DATE] = itinerary[constants.END_DATE]
             target[constants.ITIN_DATETIME] = itinerary[constants.START_DATE]
+            timeline.refresh_timeline(target)
 
 
 def _load_precreated_itinerary(callback_context: CallbackContext):
@@ -114,13 +162,16 @@ def _load_precreated_itinerary(callback_context: CallbackContext):
     Sets up the initial state.
     Set this as a callback as before_agent_call of the root_agent.
     This gets called before the system instruction is contructed.
+    Once the session is initialized this returns without any I/O.
 
     Args:
         callback_context: The callback context.
-    """    
-    data = {}
-    with open(SAMPLE_SCENARIO_PATH, "r") as file:
-        data = json.load(file)
-        print(f"\nLoading Initial State: {data}\n")
+    """
+    if constants.ITIN_INITIALIZED in callback_context.state:
+        return
+
+    user_id = callback_context._invocation_context.user_id  # pylint: disable=protected-access
+    data = scenario_store.get(user_id)
+    logger.debug("Loading Initial State for %s: %s", user_id, data)
 
-    _set_initial_states(data["state"], callback_context.state)
+    _set_initial_states(data, callback_context.state)
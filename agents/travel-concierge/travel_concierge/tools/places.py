@@ -12,18 +12,123 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Wrapper to Google Maps Places API."""
+"""Wrapper to Google Maps Places API.
 
+Lookups go through a pooled async HTTP client with bounded concurrency, and
+results are kept in a persistent geocode cache keyed by the normalized query,
+so revisiting a destination does not hit the Places API again.
+"""
+
+import asyncio
+import json
 import os
-from typing import Dict, List, Any
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Any, Optional
+import weakref
 
 from google.adk.tools import ToolContext
-import requests
+import httpx
+
+PLACES_API_URL = "https://maps.googleapis.com/maps/api/place"
+GEOCODE_CACHE_PATH = os.getenv(
+    "TRAVEL_CONCIERGE_GEOCODE_CACHE",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "travel_concierge", "geocode.db"
+    ),
+)
+GEOCODE_CACHE_TTL = float(
+    os.getenv("TRAVEL_CONCIERGE_GEOCODE_TTL", str(30 * 24 * 3600))
+)
+PLACES_MAX_CONCURRENCY = int(
+    os.getenv("TRAVEL_CONCIERGE_PLACES_CONCURRENCY", "8")
+)
+PLACES_TIMEOUT = float(os.getenv("TRAVEL_CONCIERGE_PLACES_TIMEOUT", "10"))
+
+
+def normalize_query(query: str) -> str:
+    """Canonical cache key: lower case, single spaces, no stray punctuation."""
+    query = re.sub(r"[^\w\s,]", " ", query.lower())
+    return ", ".join(
+        " ".join(part.split()) for part in query.split(",") if part.strip()
+    )
+
+
+class GeocodeCache:
+    """Persistent SQLite cache of place lookups with a time-to-live.
+
+    Only the first candidate's fields are stored, never URLs carrying the
+    API key; photo and map URLs are built when a result is read.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = GEOCODE_CACHE_PATH,
+        ttl: float = GEOCODE_CACHE_TTL,
+    ):
+        self.path = path or ":memory:"
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS places ("
+                " query TEXT PRIMARY KEY, candidate TEXT, stored_at REAL)"
+            )
+
+    def get(self, query: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached candidate, or None if absent or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT candidate, stored_at FROM places WHERE query = ?",
+                (normalize_query(query),),
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def put(self, query: str, candidate: Dict[str, Any]):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO places VALUES (?, ?, ?)",
+                (normalize_query(query), json.dumps(candidate), time.time()),
+            )
+
+    def purge_expired(self) -> int:
+        """Deletes expired entries; returns how many were removed."""
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "DELETE FROM places WHERE stored_at < ?",
+                (time.time() - self.ttl,),
+            ).rowcount
 
 
 class PlacesService:
     """Wrapper to Placees API."""
 
+    def __init__(
+        self,
+        base_url: str = PLACES_API_URL,
+        cache: Optional[GeocodeCache] = None,
+        max_concurrency: int = PLACES_MAX_CONCURRENCY,
+        timeout: float = PLACES_TIMEOUT,
+    ):
+        self.base_url = base_url
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.api_calls = 0
+        # One pooled client per event loop: an httpx.AsyncClient cannot be
+        # used from another loop, and dropping a client without closing it
+        # would leak its pool. An entry goes away with its loop.
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+
     def _check_key(self):
         if (
             not hasattr(self, "places_api_key") or not self.places_api_key
@@ -31,48 +136,124 @@ class PlacesService:
             # https://developers.google.com/maps/documentation/places/web-service/get-api-key
             self.places_api_key = os.getenv("GOOGLE_PLACES_API_KEY")
 
-    def find_place_from_text(self, query: str) -> Dict[str, str]:
-        """Fetches place details using a text query."""
-        self._check_key()
-        places_url = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
+    def _get_cache(self) -> GeocodeCache:
+        if self.cache is None:
+            self.cache = GeocodeCache()
+        return self.cache
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Returns the pooled client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self):
+        """Closes the client of the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def _fetch_candidate(self, query: str) -> Optional[Dict[str, Any]]:
+        """Looks up the first candidate for `query` in the Places API."""
         params = {
             "input": query,
             "inputtype": "textquery",
             "fields": "place_id,formatted_address,name,photos,geometry",
             "key": self.places_api_key,
         }
+        self.api_calls += 1
+        response = await self._get_client().get(
+            f"{self.base_url}/findplacefromtext/json", params=params
+        )
+        response.raise_for_status()
+        candidates = response.json().get("candidates")
+        if not candidates:
+            return None
+        place = candidates[0]
+        location = place["geometry"]["location"]
+        return {
+            "place_id": place["place_id"],
+            "place_name": place["name"],
+            "place_address": place["formatted_address"],
+            "photo_references": [
+                photo["photo_reference"] for photo in place.get("photos", [])
+            ],
+            "lat": str(location["lat"]),
+            "lng": str(location["lng"]),
+        }
 
-        try:
-            response = requests.get(places_url, params=params)
-            response.raise_for_status()
-            place_data = response.json()
+    def _to_result(self, candidate: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "place_id": candidate["place_id"],
+            "place_name": candidate["place_name"],
+            "place_address": candidate["place_address"],
+            "photos": self.get_photo_urls(
+                [{"photo_reference": ref} for ref in candidate["photo_references"]],
+                maxwidth=400,
+            ),
+            "map_url": self.get_map_url(candidate["place_id"]),
+            "lat": candidate["lat"],
+            "lng": candidate["lng"],
+        }
 
-            if not place_data.get("candidates"):
+    async def afind_place_from_text(self, query: str) -> Dict[str, Any]:
+        """Fetches place details using a text query, via the cache."""
+        self._check_key()
+        cache = self._get_cache()
+        candidate = await asyncio.to_thread(cache.get, query)
+        if candidate is None:
+            try:
+                candidate = await self._fetch_candidate(query)
+            except (httpx.HTTPError, ValueError, KeyError) as e:
+                return {"error": f"Error fetching place data: {e}"}
+            if candidate is None:
                 return {"error": "No places found."}
+            await asyncio.to_thread(cache.put, query, candidate)
+        return self._to_result(candidate)
+
+    async def find_places(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """Resolves several queries concurrently, at most max_concurrency
+        requests in flight; duplicate queries are looked up once."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        unique: Dict[str, str] = {}
+        for query in queries:
+            unique.setdefault(normalize_query(query), query)
+
+        async def bounded(query: str):
+            async with semaphore:
+                return await self.afind_place_from_text(query)
+
+        results = dict(
+            zip(
+                unique,
+                await asyncio.gather(*(bounded(q) for q in unique.values())),
+            )
+        )
+        return [results[normalize_query(q)] for q in queries]
+
+    def find_place_from_text(self, query: str) -> Dict[str, str]:
+        """Fetches place details using a text query.
+
+        Synchronous convenience wrapper; do not call from a running event
+        loop, use afind_place_from_text there instead.
+        """
+
+        async def run():
+            try:
+                return await self.afind_place_from_text(query)
+            finally:
+                await self.aclose()
 
-            # Extract data for the first candidate
-            place_details = place_data["candidates"][0]
-            place_id = place_details["place_id"]
-            place_name = place_details["name"]
-            place_address = place_details["formatted_address"]
-            photos = self.get_photo_urls(place_details.get("photos", []), maxwidth=400)
-            map_url = self.get_map_url(place_id)
-            location = place_details["geometry"]["location"]
-            lat = str(location["lat"])
-            lng = str(location["lng"])
-
-            return {
-                "place_id": place_id,
-                "place_name": place_name,
-                "place_address": place_address,
-                "photos": photos,
-                "map_url": map_url,
-                "lat": lat,
-                "lng": lng,
-            }
-
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Error fetching place data: {e}"}
+        return asyncio.run(run())
 
     def get_photo_urls(self, photos: List[Dict[str, Any]], maxwidth: int = 400) -> List[str]:
         """Extracts photo URLs from the 'photos' list."""
@@ -91,10 +272,11 @@ class PlacesService:
 places_service = PlacesService()
 
 
-def map_tool(key: str, tool_context: ToolContext):
+async def map_tool(key: str, tool_context: ToolContext):
     """
     This is going to inspect the pois stored under the specified key in the state.
-    One by one it will retrieve the accurate Lat/Lon from the Map API, if the Map API is available for use.
+    It retrieves the accurate Lat/Lon for all of them from the Map API at once,
+    if the Map API is available for use.
 
     Args:
         key: The key under which the POIs are stored.
@@ -108,9 +290,10 @@ def map_tool(key: str, tool_context: ToolContext):
 
     # The pydantic object types.POISuggestions
     pois = tool_context.state[key]["places"]
-    for poi in pois:  # The pydantic object types.POI
-        location = poi["place_name"] + ", " + poi["address"]
-        result = places_service.find_place_from_text(location)
+    results = await places_service.find_places(
+        [poi["place_name"] + ", " + poi["address"] for poi in pois]
+    )
+    for poi, result in zip(pois, results):  # The pydantic object types.POI
         # Fill the place holders with verified information.
         poi["place_id"] = result["place_id"] if "place_id" in result else None
         poi["map_url"] = result["map_url"] if "map_url" in result else None